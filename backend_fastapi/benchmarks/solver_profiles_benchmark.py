@@ -0,0 +1,208 @@
+"""
+Solver Profile Benchmark
+========================
+
+Solves synthetic networks sized like the Kerala model (a few regional buses,
+~40 generators, battery/pumped storage, up to a full year of hourly
+snapshots) under every HiGHS profile in ``models/solver_profiles.py`` and
+reports wall time, solver iterations and the objective delta against the
+first profile.
+
+The networks are generated from a fixed seed, so runs are comparable across
+machines and commits.
+
+Usage::
+
+    python backend_fastapi/benchmarks/solver_profiles_benchmark.py
+    python backend_fastapi/benchmarks/solver_profiles_benchmark.py --snapshots 2208 --committable
+    python backend_fastapi/benchmarks/solver_profiles_benchmark.py --profiles fast-dispatch large-LP-ipm --json out.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+import pypsa
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'models'))
+
+from solver_profiles import SOLVER_PROFILES, get_solver_options  # noqa: E402
+
+REGIONS = ['North', 'Central', 'South', 'Idukki', 'Import']
+
+# carrier: (units per region, unit size MW, marginal cost, p_min_pu when committable)
+EXISTING_FLEET = {
+    'Hydro': (3, 120, 2.0, 0.0),
+    'Coal': (2, 250, 38.0, 0.4),
+    'Gas': (2, 180, 65.0, 0.3),
+    'Diesel': (1, 60, 120.0, 0.2),
+}
+
+# carrier: (capital cost per MW-year, marginal cost)
+NEW_CAPACITY = {
+    'Solar': (52000.0, 0.0),
+    'Wind': (78000.0, 0.0),
+}
+
+
+def build_network(snapshots: int = 8760, committable: bool = False, seed: int = 42) -> pypsa.Network:
+    """
+    Build a reproducible Kerala-sized capacity expansion + dispatch network.
+
+    Args:
+        snapshots: Number of hourly snapshots (8760 for a full year)
+        committable: Make existing thermal units committable (MIP)
+        seed: Random seed for profiles
+
+    Returns:
+        pypsa.Network: Unsolved network
+    """
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2030-04-01', periods=snapshots, freq='h')
+    hours = np.arange(snapshots)
+    hour_of_day = hours % 24
+    day_of_year = hours / 24
+
+    n = pypsa.Network()
+    n.set_snapshots(index)
+    n.add('Carrier', ['AC', 'Hydro', 'Coal', 'Gas', 'Diesel', 'Solar', 'Wind', 'Battery', 'Market'],
+          co2_emissions=[0, 0, 0.95, 0.45, 0.7, 0, 0, 0, 0.8])
+    n.add('Bus', REGIONS, carrier='AC')
+
+    # Radial corridor to the import bus plus a north-south backbone
+    corridors = list(zip(REGIONS[:-2], REGIONS[1:-1])) + [(region, 'Import') for region in REGIONS[:-1]]
+    for bus0, bus1 in corridors:
+        n.add('Link', f'{bus0}-{bus1}', bus0=bus0, bus1=bus1, p_nom=800 if bus1 != 'Import' else 400,
+              p_min_pu=-1, efficiency=0.98, carrier='AC')
+
+    # Demand: evening peak, seasonal swing and noise (~5 GW system peak)
+    daily = 0.75 + 0.25 * np.exp(-((hour_of_day - 19.5) ** 2) / 6) + 0.08 * np.exp(-((hour_of_day - 11) ** 2) / 8)
+    seasonal = 1 + 0.08 * np.sin(2 * np.pi * (day_of_year - 30) / 365)
+    shares = {'North': 0.3, 'Central': 0.35, 'South': 0.3, 'Idukki': 0.05}
+    for region, share in shares.items():
+        noise = rng.normal(1, 0.03, snapshots)
+        n.add('Load', f'Demand {region}', bus=region, p_set=4200 * share * daily * seasonal * noise)
+
+    solar = np.clip(np.sin(np.pi * (hour_of_day - 6) / 12), 0, None)
+    monsoon = 1 - 0.35 * np.exp(-((day_of_year - 90) ** 2) / 900)
+    wind = np.clip(0.35 + 0.25 * np.sin(2 * np.pi * (day_of_year - 60) / 365) + rng.normal(0, 0.12, snapshots), 0, 1)
+
+    for region in REGIONS[:-1]:
+        for carrier, (units, size, cost, p_min) in EXISTING_FLEET.items():
+            if carrier == 'Hydro' and region not in ('Idukki', 'Central'):
+                continue
+            for unit in range(units):
+                name = f'{carrier} {region} {unit + 1}'
+                attrs = dict(bus=region, carrier=carrier, p_nom=size,
+                             marginal_cost=cost * rng.uniform(0.95, 1.05))
+                if committable and carrier != 'Hydro':
+                    attrs.update(committable=True, p_min_pu=p_min, min_up_time=4, min_down_time=4,
+                                 start_up_cost=size * 40)
+                n.add('Generator', name, **attrs)
+
+        for carrier, (capital_cost, cost) in NEW_CAPACITY.items():
+            profile = solar * monsoon if carrier == 'Solar' else wind
+            n.add('Generator', f'{carrier} {region} new', bus=region, carrier=carrier,
+                  p_nom_extendable=True, p_nom_max=3000, capital_cost=capital_cost,
+                  marginal_cost=cost, p_max_pu=np.clip(profile * rng.uniform(0.9, 1.1), 0, 1))
+
+        n.add('StorageUnit', f'Battery {region}', bus=region, carrier='Battery',
+              p_nom_extendable=True, max_hours=4, capital_cost=60000,
+              efficiency_store=0.95, efficiency_dispatch=0.95, cyclic_state_of_charge=True)
+
+    n.add('Generator', 'Market Import', bus='Import', carrier='Market',
+          p_nom_extendable=True, marginal_cost=150)
+
+    return n
+
+
+def solver_iterations(network: pypsa.Network) -> Dict[str, int]:
+    """Iteration counters reported by HiGHS for the last solve."""
+    solver_model = getattr(network.model, 'solver_model', None)
+    if solver_model is None or not hasattr(solver_model, 'getInfo'):
+        return {}
+    info = solver_model.getInfo()
+    return {
+        'simplex': int(info.simplex_iteration_count),
+        'ipm': int(info.ipm_iteration_count),
+        'crossover': int(info.crossover_iteration_count),
+        'mip_nodes': int(max(info.mip_node_count, 0)),
+    }
+
+
+def run_benchmark(profiles: List[str], snapshots: int, committable: bool, seed: int) -> List[Dict]:
+    """Solve a fresh copy of the network under each profile and collect timings."""
+    results = []
+    for profile in profiles:
+        network = build_network(snapshots, committable, seed)
+        options = get_solver_options(profile, {'output_flag': False})
+
+        start = time.perf_counter()
+        status, condition = network.optimize(solver_name='highs', solver_options=options,
+                                             include_objective_constant=False)
+        wall_time = time.perf_counter() - start
+
+        results.append({
+            'profile': profile,
+            'status': status,
+            'condition': condition,
+            'wall_time_s': round(wall_time, 3),
+            'objective': float(network.objective) if status == 'ok' else None,
+            'iterations': solver_iterations(network),
+        })
+
+    reference = next((r['objective'] for r in results if r['objective'] is not None), None)
+    for result in results:
+        if reference and result['objective'] is not None:
+            result['objective_delta_pct'] = round(100 * (result['objective'] - reference) / abs(reference), 4)
+        else:
+            result['objective_delta_pct'] = None
+    return results
+
+
+def format_table(results: List[Dict]) -> str:
+    header = f"{'profile':<18}{'status':<22}{'wall [s]':>10}{'simplex':>10}{'ipm':>6}{'xover':>7}{'nodes':>7}{'objective':>18}{'delta %':>10}"
+    lines = [header, '-' * len(header)]
+    for r in results:
+        it = r['iterations']
+        objective = f"{r['objective']:,.0f}" if r['objective'] is not None else '-'
+        delta = f"{r['objective_delta_pct']:+.4f}" if r['objective_delta_pct'] is not None else '-'
+        lines.append(
+            f"{r['profile']:<18}{r['status'] + '/' + str(r['condition']):<22}{r['wall_time_s']:>10.2f}"
+            f"{it.get('simplex', 0):>10}{it.get('ipm', 0):>6}{it.get('crossover', 0):>7}"
+            f"{it.get('mip_nodes', 0):>7}{objective:>18}{delta:>10}"
+        )
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--profiles', nargs='+', default=list(SOLVER_PROFILES),
+                        choices=list(SOLVER_PROFILES), help='Profiles to compare (first is the reference)')
+    parser.add_argument('--snapshots', type=int, default=8760, help='Hourly snapshots per network')
+    parser.add_argument('--committable', action='store_true', help='Make thermal units committable (MIP)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', dest='json_path', help='Also write results to this JSON file')
+    args = parser.parse_args()
+
+    logging.getLogger('pypsa').setLevel(logging.WARNING)
+    logging.getLogger('linopy').setLevel(logging.WARNING)
+
+    print(f"Synthetic network: {args.snapshots} snapshots, committable={args.committable}, seed={args.seed}")
+    results = run_benchmark(args.profiles, args.snapshots, args.committable, args.seed)
+    print(format_table(results))
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump({'snapshots': args.snapshots, 'committable': args.committable,
+                       'seed': args.seed, 'results': results}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""
+Backend Startup Benchmark
+=========================
+
+Measures how quickly a fresh backend process can serve the desktop shell:
+
+- **import profile**: ``python -X importtime -c "import main"`` in a clean
+  interpreter; reports total import time, the slowest top-level imports and
+  which heavy modules (pypsa, pandas, plotly, ...) were loaded eagerly.
+- **time to first request**: spawns ``uvicorn main:app`` and polls
+  ``POST /project/load`` on a scratch project until it answers, as the
+  Electron shell does after starting the backend.
+
+Heavy modules are bound through ``models/lazy_imports.py``; any of them
+showing up in the eager list is a regression. ``--check`` turns the report
+into a gate (non-zero exit when a heavy module is loaded eagerly or the
+median time to first request exceeds the budget).
+
+Usage::
+
+    python backend_fastapi/benchmarks/startup_benchmark.py
+    python backend_fastapi/benchmarks/startup_benchmark.py --runs 5 --check 1.0
+    python backend_fastapi/benchmarks/startup_benchmark.py --json out.json
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must only load on first use of the routes needing them
+HEAVY_MODULES = ['pypsa', 'linopy', 'scipy', 'matplotlib', 'plotly', 'pandas', 'numpy', 'openpyxl', 'pyarrow',
+                 'sklearn', 'statsmodels']
+
+
+def import_profile(top: int = 10) -> Dict:
+    """Import ``main`` in a fresh interpreter with ``-X importtime``."""
+    probe = f"import json, sys; import main; print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    started = time.perf_counter()
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', probe],
+                          cwd=BACKEND_DIR, capture_output=True, text=True, check=True)
+    wall = time.perf_counter() - started
+
+    # Lines look like "import time:  self [us] | cumulative | <indent>package"
+    imports = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        imports.append((name.strip(), int(cumulative), depth))
+
+    main_us = next((us for name, us, _ in imports if name == 'main'), 0)
+    children = sorted(((name, us) for name, us, depth in imports if depth == 1), key=lambda x: -x[1])
+    return {
+        'wall_s': wall,
+        'import_main_s': main_us / 1e6,
+        'eager_heavy_modules': json.loads(proc.stdout.strip().splitlines()[-1]),
+        'slowest_imports': [{'module': name, 'cumulative_s': us / 1e6} for name, us in children[:top]],
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def time_to_first_request(project_path: str, timeout: float = 60.0) -> float:
+    """Seconds from spawning uvicorn until ``POST /project/load`` succeeds."""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/project/load"
+    body = json.dumps({'project_path': project_path}).encode()
+
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', 'main:app', '--host', '127.0.0.1', '--port', str(port),
+         '--log-level', 'warning'],
+        cwd=BACKEND_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if server.poll() is not None:
+                raise RuntimeError(f"Backend exited with code {server.returncode}")
+            request = urllib.request.Request(url, data=body, headers={'Content-Type': 'application/json'})
+            try:
+                with urllib.request.urlopen(request, timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - started
+            except urllib.error.HTTPError as e:
+                raise RuntimeError(f"/project/load answered {e.code}") from e
+            except (urllib.error.URLError, ConnectionError, TimeoutError):
+                time.sleep(0.01)
+        raise TimeoutError(f"Backend did not answer within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def run_benchmark(runs: int) -> Dict:
+    profile = import_profile()
+    with tempfile.TemporaryDirectory() as project:
+        os.makedirs(os.path.join(project, 'inputs'))
+        os.makedirs(os.path.join(project, 'results'))
+        first_request = [time_to_first_request(project) for _ in range(runs)]
+    return {
+        **profile,
+        'first_request_s': first_request,
+        'first_request_median_s': statistics.median(first_request),
+    }
+
+
+def format_report(result: Dict) -> str:
+    lines = [
+        f"import main:            {result['import_main_s']:.3f} s (interpreter wall {result['wall_s']:.3f} s)",
+        f"time to first request:  {result['first_request_median_s']:.3f} s median of "
+        f"{len(result['first_request_s'])} ({', '.join(f'{t:.3f}' for t in result['first_request_s'])})",
+        f"eager heavy modules:    {', '.join(result['eager_heavy_modules']) or 'none'}",
+        '',
+        f"{'slowest top-level imports':<40}{'cumulative [s]':>16}",
+    ]
+    lines += [f"{r['module']:<40}{r['cumulative_s']:>16.3f}" for r in result['slowest_imports']]
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=3, help='Backend launches for time to first request')
+    parser.add_argument('--check', type=float, metavar='SECONDS',
+                        help='Fail if a heavy module loads eagerly or the median exceeds SECONDS')
+    parser.add_argument('--json', dest='json_path', help='Also write results to this JSON file')
+    args = parser.parse_args()
+
+    result = run_benchmark(args.runs)
+    print(format_report(result))
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+
+    if args.check is not None:
+        failures: List[str] = []
+        if result['eager_heavy_modules']:
+            failures.append(f"heavy modules imported at startup: {', '.join(result['eager_heavy_modules'])}")
+        if result['first_request_median_s'] > args.check:
+            failures.append(f"time to first request {result['first_request_median_s']:.3f} s > {args.check} s")
+        if failures:
+            print('\nFAILED: ' + '; '.join(failures))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
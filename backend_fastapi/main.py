@@ -23,8 +23,13 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import logging
+import multiprocessing
+import sys
 
 # Import route modules
+# Routers register eagerly; pypsa, pandas, openpyxl, plotly and the model
+# modules built on them are bound via models/lazy_imports.py and load on the
+# first request that needs them (see benchmarks/startup_benchmark.py).
 from routers import (
     project_routes,
     sector_routes,
@@ -46,6 +51,9 @@ from routers import (
 # Import PyPSA model execution routes
 from routers import pypsa_model_routes  # Model execution (configuration and running)
 
+from models.http_cache import install_http_cache
+from models.forecast_worker import get_forecast_pool, shutdown_forecast_pool
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -65,10 +73,18 @@ async def lifespan(app: FastAPI):
     logger.info("✅ All route modules loaded successfully")
     logger.info("📊 PyPSA routes: CONSOLIDATED (2 route files + 2 model files)")
 
+    # Forecasting workers import pandas/scikit-learn in their own processes
+    # now, so the first forecast starts reporting progress right away
+    try:
+        get_forecast_pool().start()
+    except Exception as e:
+        logger.warning(f"Forecasting workers not started: {e}")
+
     yield
 
     # Shutdown
     logger.info("🛑 Shutting down KSEB FastAPI Backend...")
+    shutdown_forecast_pool()
 
 
 # Initialize FastAPI application
@@ -89,8 +105,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Last-Modified", "X-Cache"],
 )
 
+# ETag / 304 handling and server-side response cache for file-derived GET routes
+install_http_cache(app)
+
 # ============================================================================
 # REGISTER ROUTE MODULES
 # ============================================================================
@@ -237,6 +257,11 @@ async def api_info():
 
 
 if __name__ == "__main__":
+    # In the frozen build (kseb-backend.exe) each spawned forecasting worker
+    # starts the executable again; this runs the worker and exits there
+    # instead of falling through to a second server on :8000
+    multiprocessing.freeze_support()
+
     import uvicorn
 
     # Run the application
@@ -245,6 +270,6 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,  # Auto-reload on code changes (development)
+        reload=not getattr(sys, 'frozen', False),  # Auto-reload on code changes (development only)
         log_level="info"
     )
\ No newline at end of file
@@ -0,0 +1,305 @@
+"""
+Network Analysis Memo Cache
+===========================
+
+Result networks never change once a model run has written them, so the
+output of an analysis (capacities, energy mix, availability, ...) can be
+computed once per file and reused.
+
+Entries are keyed by (network file fingerprint, analysis name, normalized
+params). They are kept in a small in-memory LRU of encoded JSON and persisted
+as gzip'd JSON files in ``.analysis_cache/<network stem>/`` next to the
+``.nc`` file, so a restarted server answers from disk without loading the
+network at all. The fingerprint is the file size plus modification time; a
+rewritten network gets a new fingerprint and its stale entries are ignored
+and removed.
+
+``warm_analysis_cache`` computes the default set of analyses for freshly
+exported networks on a background thread (called at the end of a model run).
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_NAME = '.analysis_cache'
+# Bump when an analysis changes its output so persisted results are recomputed
+ANALYSIS_CACHE_VERSION = 1
+MAX_MEMORY_ENTRIES = 256
+
+# Analyses computed by warm_analysis_cache: name -> (component, method name).
+# Names double as cache keys, so routes must use the same names.
+WARM_ANALYSES = {
+    'get_full_availability': ('inspector', 'get_full_availability'),
+    'get_total_capacities': ('analyzer', 'get_total_capacities'),
+    'get_energy_mix': ('analyzer', 'get_energy_mix'),
+    'get_capacity_factors': ('analyzer', 'get_capacity_factors'),
+    'get_emissions_tracking': ('analyzer', 'get_emissions_tracking'),
+}
+
+
+def network_fingerprint(network_path: Union[str, Path]) -> str:
+    """Cheap identity of a network file's contents: size and mtime in ns."""
+    stat = Path(network_path).stat()
+    return f"{stat.st_size:x}-{stat.st_mtime_ns:x}"
+
+
+def normalize_params(params: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Drop unset (None) params and sort keys, so equivalent calls share an entry."""
+    return {key: params[key] for key in sorted(params or {}) if params[key] is not None}
+
+
+def _params_key(params: Dict[str, Any]) -> str:
+    if not params:
+        return ''
+    encoded = json.dumps(params, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha1(encoded).hexdigest()[:12]
+
+
+def _json_default(value):
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return pd.Timestamp(value).isoformat()
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    return str(value)
+
+
+def _encode(result: Any) -> bytes:
+    return json.dumps(result, default=_json_default, separators=(',', ':')).encode('utf-8')
+
+
+class AnalysisCache:
+    """
+    Two-level (memory, disk) cache of analysis results per network file.
+
+    Results are stored encoded, and every hit returns a freshly decoded copy,
+    so callers may mutate what they get back.
+    """
+
+    def __init__(self, max_entries: int = MAX_MEMORY_ENTRIES):
+        self.max_entries = max_entries
+        self._memory: OrderedDict[Tuple[str, str, str, str], bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        # One lock per entry so concurrent requests (or a request racing the
+        # warmer) compute a result only once
+        self._key_locks: Dict[Tuple[str, str, str, str], threading.Lock] = {}
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0}
+
+    @staticmethod
+    def entry_path(network_path: Path, name: str, params_key: str) -> Path:
+        suffix = f"-{params_key}" if params_key else ''
+        return network_path.parent / CACHE_DIR_NAME / network_path.stem / f"{name}{suffix}.json.gz"
+
+    def _memory_get(self, key) -> Optional[bytes]:
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+            return payload
+
+    def _memory_put(self, key, payload: bytes):
+        with self._lock:
+            self._memory[key] = payload
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _key_lock(self, key) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _disk_get(self, path: Path, fingerprint: str) -> Optional[bytes]:
+        try:
+            with gzip.open(path, 'rb') as handle:
+                envelope = json.loads(handle.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as error:
+            logger.warning(f"Discarding unreadable analysis cache entry {path.name}: {error}")
+            path.unlink(missing_ok=True)
+            return None
+
+        if envelope.get('fingerprint') != fingerprint or envelope.get('version') != ANALYSIS_CACHE_VERSION:
+            path.unlink(missing_ok=True)
+            return None
+        return _encode(envelope['result'])
+
+    def _disk_put(self, path: Path, fingerprint: str, name: str, params: Dict[str, Any], payload: bytes):
+        envelope = (
+            b'{"version":' + str(ANALYSIS_CACHE_VERSION).encode() +
+            b',"fingerprint":' + json.dumps(fingerprint).encode() +
+            b',"analysis":' + json.dumps(name).encode() +
+            b',"params":' + json.dumps(params, default=str).encode() +
+            b',"result":' + payload + b'}'
+        )
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + '.tmp')
+            with gzip.open(tmp_path, 'wb', compresslevel=5) as handle:
+                handle.write(envelope)
+            tmp_path.replace(path)
+        except OSError as error:
+            logger.warning(f"Could not persist analysis cache entry {path.name}: {error}")
+
+    def get_or_compute(self, network_path: Union[str, Path], name: str, compute: Callable[[], Any],
+                       params: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Return the cached result of an analysis, computing it on a miss.
+
+        Args:
+            network_path: Path to the ``.nc`` file the analysis reads
+            name: Analysis name (e.g. ``get_total_capacities``)
+            compute: Zero-argument callable producing the result; only called
+                     on a miss, so it should load the network itself
+            params: Analysis parameters that change the result
+
+        Returns:
+            The (decoded) analysis result
+        """
+        network_path = Path(network_path).resolve()
+        params = normalize_params(params)
+        params_key = _params_key(params)
+        fingerprint = network_fingerprint(network_path)
+        key = (str(network_path), fingerprint, name, params_key)
+
+        payload = self._memory_get(key)
+        if payload is not None:
+            self._stats['memory_hits'] += 1
+            return json.loads(payload)
+
+        with self._key_lock(key):
+            payload = self._memory_get(key)
+            if payload is None:
+                path = self.entry_path(network_path, name, params_key)
+                payload = self._disk_get(path, fingerprint)
+                if payload is not None:
+                    self._stats['disk_hits'] += 1
+                else:
+                    self._stats['misses'] += 1
+                    payload = _encode(compute())
+                    self._disk_put(path, fingerprint, name, params, payload)
+                self._memory_put(key, payload)
+            else:
+                self._stats['memory_hits'] += 1
+
+        with self._lock:
+            self._key_locks.pop(key, None)
+        return json.loads(payload)
+
+    def contains(self, network_path: Union[str, Path], name: str, params: Optional[Dict[str, Any]] = None) -> bool:
+        """True if a valid entry exists in memory or on disk."""
+        network_path = Path(network_path).resolve()
+        params_key = _params_key(normalize_params(params))
+        fingerprint = network_fingerprint(network_path)
+        if self._memory_get((str(network_path), fingerprint, name, params_key)) is not None:
+            return True
+        path = self.entry_path(network_path, name, params_key)
+        return path.exists() and self._disk_get(path, fingerprint) is not None
+
+    def invalidate(self, network_path: Optional[Union[str, Path]] = None):
+        """Drop entries for one network (memory and disk), or the whole memory cache."""
+        with self._lock:
+            if network_path is None:
+                self._memory.clear()
+                return
+            network_path = Path(network_path).resolve()
+            for key in [k for k in self._memory if k[0] == str(network_path)]:
+                del self._memory[key]
+
+        entry_dir = network_path.parent / CACHE_DIR_NAME / network_path.stem
+        for path in entry_dir.glob('*.json.gz'):
+            path.unlink(missing_ok=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            total = sum(self._stats.values())
+            hits = self._stats['memory_hits'] + self._stats['disk_hits']
+            return {
+                'size': len(self._memory),
+                'max_size': self.max_entries,
+                **self._stats,
+                'hit_rate_percent': round(hits / total * 100, 2) if total else 0
+            }
+
+
+_global_analysis_cache = AnalysisCache()
+
+
+def get_analysis_cache() -> AnalysisCache:
+    """Get the process-wide analysis cache."""
+    return _global_analysis_cache
+
+
+def cached_analysis(network_path: Union[str, Path], name: str, compute: Callable[[], Any],
+                    params: Optional[Dict[str, Any]] = None) -> Any:
+    """Memoized analysis result; see ``AnalysisCache.get_or_compute``."""
+    return _global_analysis_cache.get_or_compute(network_path, name, compute, params)
+
+
+def _warm(network_paths: Iterable[Path], analyses: Dict[str, Tuple[str, str]]):
+    import pypsa
+    from pypsa_analyzer import NetworkInspector, PyPSASingleNetworkAnalyzer
+
+    cache = get_analysis_cache()
+    for network_path in network_paths:
+        try:
+            pending = {name: spec for name, spec in analyses.items() if not cache.contains(network_path, name)}
+            if not pending:
+                continue
+
+            network = pypsa.Network(str(network_path))
+            components = {}
+            for name, (component, method) in pending.items():
+                if component not in components:
+                    components[component] = (
+                        NetworkInspector(network) if component == 'inspector'
+                        else PyPSASingleNetworkAnalyzer(network)
+                    )
+                try:
+                    cache.get_or_compute(network_path, name, getattr(components[component], method))
+                except Exception as error:
+                    logger.warning(f"Analysis cache warm-up: {name} failed for {network_path.name}: {error}")
+            logger.info(f"Analysis cache warmed for {network_path.name} ({len(pending)} analyses)")
+        except Exception as error:
+            logger.warning(f"Analysis cache warm-up failed for {network_path}: {error}")
+
+
+def warm_analysis_cache(network_paths: Iterable[Union[str, Path]],
+                        analyses: Optional[Dict[str, Tuple[str, str]]] = None) -> threading.Thread:
+    """
+    Precompute the default analyses for the given networks on a daemon thread.
+
+    Args:
+        network_paths: ``.nc`` files to warm
+        analyses: Override of ``WARM_ANALYSES``
+
+    Returns:
+        The started thread (join it to wait for completion)
+    """
+    paths = [Path(p).resolve() for p in network_paths]
+    thread = threading.Thread(
+        target=_warm,
+        args=(paths, analyses or WARM_ANALYSES),
+        name='analysis-cache-warmup',
+        daemon=True
+    )
+    thread.start()
+    return thread
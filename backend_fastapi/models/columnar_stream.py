@@ -0,0 +1,242 @@
+"""
+Columnar Streaming Responses
+============================
+
+Streams large time-series results as columnar chunks instead of one big
+JSON document. Clients opt in through the ``Accept`` header:
+
+- ``application/x-ndjson``: newline-delimited JSON. The first line is a
+  ``meta`` record, followed by ``chunk`` records holding column slices and a
+  final ``end`` record.
+- ``application/vnd.apache.arrow.stream``: Arrow IPC stream with one record
+  batch per chunk (requires ``pyarrow``). Route metadata is attached to the
+  schema under the ``kseb`` key as JSON.
+
+Chunks are encoded lazily from NumPy arrays, so only one chunk is ever held
+as Python objects and the first bytes leave the server before the whole
+response has been encoded.
+"""
+
+import io
+import json
+import math
+import logging
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Union
+
+import numpy as np
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+
+try:
+    import pyarrow as pa
+    ARROW_AVAILABLE = True
+except ImportError:
+    pa = None
+    ARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+DEFAULT_CHUNK_ROWS = 4096
+
+ColumnValues = Union[np.ndarray, Sequence[Any]]
+ColumnChunk = Mapping[str, ColumnValues]
+
+
+def negotiate_stream_format(accept: Optional[str]) -> Optional[str]:
+    """
+    Pick a streaming format from an ``Accept`` header.
+
+    Args:
+        accept: Raw Accept header value (may be None)
+
+    Returns:
+        'arrow', 'ndjson', or None when the client wants the regular JSON body
+    """
+    if not accept:
+        return None
+
+    media_types = [part.split(';')[0].strip().lower() for part in accept.split(',')]
+    if ARROW_STREAM_MEDIA_TYPE in media_types:
+        return 'arrow'
+    if NDJSON_MEDIA_TYPE in media_types:
+        return 'ndjson'
+    return None
+
+
+def coerce_column(values: ColumnValues) -> np.ndarray:
+    """Convert a list of cell values to a float array when possible, otherwise an object array."""
+    if isinstance(values, np.ndarray):
+        return values
+    try:
+        return np.asarray(values, dtype=float)
+    except (TypeError, ValueError):
+        return np.asarray([None if v is None else str(v) for v in values], dtype=object)
+
+
+def chunk_columns(columns: Mapping[str, ColumnValues], chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[Dict[str, np.ndarray]]:
+    """
+    Slice equally long columns into row chunks (views, no copies).
+
+    Args:
+        columns: Ordered mapping of column name to 1-D array
+        chunk_rows: Rows per chunk
+
+    Yields:
+        Dict of column name to array slice
+    """
+    arrays = {name: np.asarray(values) for name, values in columns.items()}
+    lengths = {len(values) for values in arrays.values()}
+    if len(lengths) > 1:
+        raise ValueError(f"Columns must have equal length, got {sorted(lengths)}")
+
+    total = lengths.pop() if lengths else 0
+    for start in range(0, total, chunk_rows):
+        yield {name: values[start:start + chunk_rows] for name, values in arrays.items()}
+
+
+def _json_values(values: ColumnValues) -> List[Any]:
+    """Convert one column slice to JSON-safe Python values (NaN/NaT -> null)."""
+    array = np.asarray(values)
+
+    if np.issubdtype(array.dtype, np.datetime64):
+        strings = np.datetime_as_string(array, unit='s')
+        return [None if s == 'NaT' else s for s in strings.tolist()]
+
+    if np.issubdtype(array.dtype, np.floating):
+        result = array.tolist()
+        missing = np.isnan(array)
+        if missing.any():
+            result = [None if m else v for v, m in zip(result, missing.tolist())]
+        return result
+
+    if array.dtype == object:
+        return [
+            None if v is None or (isinstance(v, float) and math.isnan(v))
+            else v if isinstance(v, (str, int, float, bool))
+            else str(v)
+            for v in array.tolist()
+        ]
+
+    return array.tolist()
+
+
+def iter_ndjson(chunks: Iterable[ColumnChunk], meta: Optional[Dict[str, Any]] = None) -> Iterator[bytes]:
+    """
+    Encode column chunks as NDJSON lines.
+
+    Args:
+        chunks: Iterable of column-name -> values mappings
+        meta: Extra fields for the leading meta record
+
+    Yields:
+        UTF-8 encoded lines
+    """
+    yield (json.dumps({'type': 'meta', **(meta or {})}) + '\n').encode('utf-8')
+
+    offset = 0
+    for chunk in chunks:
+        data = {name: _json_values(values) for name, values in chunk.items()}
+        rows = len(next(iter(data.values()))) if data else 0
+        if rows == 0:
+            continue
+        yield (json.dumps({'type': 'chunk', 'offset': offset, 'rows': rows, 'data': data}) + '\n').encode('utf-8')
+        offset += rows
+
+    yield (json.dumps({'type': 'end', 'rows': offset}) + '\n').encode('utf-8')
+
+
+def _arrow_array(values: ColumnValues, field_type=None):
+    """Build an Arrow array from a column slice."""
+    array = np.asarray(values)
+    if array.dtype == object:
+        return pa.array(array.tolist(), type=field_type, from_pandas=True)
+    return pa.array(array, type=field_type, from_pandas=True)
+
+
+def iter_arrow_ipc(chunks: Iterable[ColumnChunk], meta: Optional[Dict[str, Any]] = None) -> Iterator[bytes]:
+    """
+    Encode column chunks as an Arrow IPC stream, one record batch per chunk.
+
+    The schema is taken from the first chunk; later chunks are cast to it.
+
+    Args:
+        chunks: Iterable of column-name -> values mappings
+        meta: Metadata stored on the schema under the ``kseb`` key
+
+    Yields:
+        Raw IPC stream bytes
+    """
+    if not ARROW_AVAILABLE:
+        raise RuntimeError("pyarrow is required for Arrow IPC streaming")
+
+    schema_metadata = {'kseb': json.dumps(meta or {})}
+    sink = io.BytesIO()
+    writer = None
+    schema = None
+
+    def drain() -> bytes:
+        data = sink.getvalue()
+        sink.seek(0)
+        sink.truncate(0)
+        return data
+
+    try:
+        for chunk in chunks:
+            if schema is None:
+                arrays = [_arrow_array(values) for values in chunk.values()]
+                schema = pa.schema(
+                    [pa.field(name, array.type) for name, array in zip(chunk.keys(), arrays)],
+                    metadata=schema_metadata
+                )
+                writer = pa.ipc.new_stream(sink, schema)
+            else:
+                arrays = [_arrow_array(values, field.type) for values, field in zip(chunk.values(), schema)]
+
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            yield drain()
+
+        if writer is None:
+            schema = pa.schema([], metadata=schema_metadata)
+            writer = pa.ipc.new_stream(sink, schema)
+        writer.close()
+        writer = None
+        yield drain()
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def columnar_response(
+    fmt: str,
+    chunks: Iterable[ColumnChunk],
+    meta: Optional[Dict[str, Any]] = None
+) -> StreamingResponse:
+    """
+    Wrap column chunks in a StreamingResponse for the negotiated format.
+
+    Args:
+        fmt: 'ndjson' or 'arrow' (from negotiate_stream_format)
+        chunks: Iterable of column chunks, consumed lazily
+        meta: Route-specific metadata
+
+    Returns:
+        StreamingResponse
+
+    Raises:
+        HTTPException: 406 if Arrow is requested but pyarrow is not installed
+    """
+    if fmt == 'arrow':
+        if not ARROW_AVAILABLE:
+            raise HTTPException(
+                status_code=406,
+                detail="Arrow IPC streaming requires pyarrow; request application/x-ndjson instead."
+            )
+        return StreamingResponse(iter_arrow_ipc(chunks, meta), media_type=ARROW_STREAM_MEDIA_TYPE)
+
+    return StreamingResponse(
+        iter_ndjson(chunks, meta),
+        media_type=NDJSON_MEDIA_TYPE,
+        headers={"X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,337 @@
+"""
+Plot Rendering and Figure Cache
+===============================
+
+Encodes the Plotly figures built by ``PyPSAVisualizer`` for the plot routes
+and keeps the results so repeated requests skip the network load and the
+figure build:
+
+- ``json``: the compact figure spec (``fig.to_plotly_json()``) rendered
+  client-side with ``Plotly.react``. Float data arrays are sent as float32
+  typed arrays (``{"dtype": "f4", "bdata": <base64>}``, understood by
+  plotly.js >= 2.28) and evenly spaced timestamp axes as a start and a step
+  (``x0`` / ``dx`` in milliseconds) instead of one date string per point.
+- ``html``: standalone page loading plotly.js from the CDN (unchanged)
+- ``png`` / ``pdf``: rendered by Kaleido on one long-lived worker thread
+
+``FigureCache`` keys encoded figures by (network fingerprint, plot type,
+output format, normalized filters including the time resolution); a rewritten
+network gets a new fingerprint, so stale figures are never served.
+
+Kaleido pays a browser (or, before Kaleido 1.0, subprocess) start-up of
+about a second on its first export. ``ImageRenderer`` owns a single worker
+thread that starts that session once (``kaleido.start_sync_server`` where
+available), warms it with a one-point figure and then renders every image,
+one at a time, on the same session.
+"""
+
+import atexit
+import base64
+import json
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    from .analysis_cache import _params_key, network_fingerprint, normalize_params
+except ImportError:
+    from analysis_cache import _params_key, network_fingerprint, normalize_params
+
+logger = logging.getLogger(__name__)
+
+FIGURE_FORMATS = ('json', 'html', 'png', 'pdf')
+IMAGE_FORMATS = ('png', 'pdf')
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+MAX_CACHE_ENTRIES = 512
+
+# Float arrays shorter than this stay plain JSON lists
+MIN_TYPED_ARRAY_LENGTH = 16
+# Trace types whose coordinates can be given as start + step
+STEP_TRACE_TYPES = ('scatter', 'scattergl', 'bar', 'heatmap')
+
+HTML_CONFIG = {'responsive': True, 'displayModeBar': True}
+
+
+# =============================================================================
+# FIGURE ENCODING
+# =============================================================================
+
+def _float32_array(values: np.ndarray) -> Dict[str, Any]:
+    array = np.ascontiguousarray(values, dtype='<f4')
+    encoded = {'dtype': 'f4', 'bdata': base64.b64encode(array.tobytes()).decode('ascii')}
+    if array.ndim > 1:
+        encoded['shape'] = ','.join(str(size) for size in array.shape)
+    return encoded
+
+
+def _float_values(value: Any) -> Optional[np.ndarray]:
+    """The value as a float array if it is a long enough float data array."""
+    if isinstance(value, dict):
+        if value.get('dtype') not in ('f8', 'f4') or 'bdata' not in value:
+            return None
+        array = np.frombuffer(base64.b64decode(value['bdata']), dtype=np.dtype(value['dtype']).newbyteorder('<'))
+        if 'shape' in value:
+            array = array.reshape([int(size) for size in str(value['shape']).split(',')])
+        return array
+    if isinstance(value, np.ndarray):
+        return value if value.dtype.kind == 'f' and value.size >= MIN_TYPED_ARRAY_LENGTH else None
+    if isinstance(value, (list, tuple)) and len(value) >= MIN_TYPED_ARRAY_LENGTH:
+        if all(isinstance(item, (float, np.floating)) for item in value):
+            return np.asarray(value, dtype=float)
+    return None
+
+
+def _compact(value: Any) -> Any:
+    """Replace float data arrays in a trace (recursively) by float32 typed arrays."""
+    array = _float_values(value)
+    if array is not None:
+        return _float32_array(array)
+    if isinstance(value, dict):
+        return {key: _compact(item) for key, item in value.items()}
+    if isinstance(value, list) and value and isinstance(value[0], dict):
+        return [_compact(item) for item in value]
+    return value
+
+
+def _step_axis(trace: Dict[str, Any], axis: str):
+    """Replace an evenly spaced datetime coordinate array by ``<axis>0`` and ``d<axis>``."""
+    values = trace.get(axis)
+    if not isinstance(values, np.ndarray) or values.dtype.kind != 'M' or len(values) < MIN_TYPED_ARRAY_LENGTH:
+        return
+    milliseconds = values.astype('datetime64[ms]').astype(np.int64)
+    steps = np.diff(milliseconds)
+    if steps[0] <= 0 or np.any(steps != steps[0]) or f'{axis}0' in trace or f'd{axis}' in trace:
+        return
+    del trace[axis]
+    trace[f'{axis}0'] = np.datetime_as_string(values[0], unit='ms')
+    trace[f'd{axis}'] = int(steps[0])
+
+
+def _compact_trace(trace: Dict[str, Any]) -> Dict[str, Any]:
+    trace = dict(trace)
+    if trace.get('type', 'scatter') in STEP_TRACE_TYPES:
+        for axis in ('x', 'y'):
+            _step_axis(trace, axis)
+    return _compact(trace)
+
+
+def figure_to_json(fig) -> bytes:
+    """
+    Compact JSON spec of a Plotly figure.
+
+    Trace float arrays become float32 typed arrays and evenly spaced
+    timestamps a start and step; the layout is kept as is.
+
+    Returns:
+        UTF-8 encoded ``{"data": [...], "layout": {...}}``
+    """
+    from plotly.utils import PlotlyJSONEncoder
+
+    spec = fig.to_plotly_json()
+    spec['data'] = [_compact_trace(trace) for trace in spec.get('data', [])]
+    return json.dumps(spec, cls=PlotlyJSONEncoder, separators=(',', ':')).encode('utf-8')
+
+
+def encode_figure(fig, output_format: str) -> bytes:
+    """
+    Encode a figure in one of ``FIGURE_FORMATS``.
+
+    Raises:
+        ValueError: For an unsupported format
+    """
+    if output_format == 'json':
+        return figure_to_json(fig)
+    if output_format == 'html':
+        return fig.to_html(include_plotlyjs='cdn', config=HTML_CONFIG).encode('utf-8')
+    if output_format in IMAGE_FORMATS:
+        return get_image_renderer().render(fig, output_format)
+    raise ValueError(f"Unsupported output format: {output_format}")
+
+
+# =============================================================================
+# IMAGE RENDERER
+# =============================================================================
+
+class ImageRenderer:
+    """
+    Renders static images on one worker thread that keeps Kaleido running.
+
+    Kaleido is not safe to drive from several threads at once, so renders
+    are queued on the worker; the first one (or ``warm``) starts the session.
+    """
+
+    def __init__(self):
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._warmed: Optional[Future] = None
+        self._sync_server = False
+        self._lock = threading.Lock()
+
+    def _start(self):
+        """Start the Kaleido session and render a throwaway figure (worker thread)."""
+        import plotly.graph_objects as go
+        import plotly.io as pio
+
+        try:
+            import kaleido
+            start_sync_server = getattr(kaleido, 'start_sync_server', None)
+            if start_sync_server is not None:
+                start_sync_server(silence_warnings=True)
+                self._sync_server = True
+        except ImportError:
+            logger.warning("Kaleido is not installed; static plot export will fail")
+            raise
+
+        pio.to_image(go.Figure(go.Scatter(x=[0], y=[0])), format='png', width=10, height=10)
+        logger.info("Plot image renderer started")
+
+    def warm(self) -> Future:
+        """Start the worker and its Kaleido session in the background (once)."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='plot-render')
+                atexit.register(self.close)
+            if self._warmed is None or (self._warmed.done() and self._warmed.exception() is not None):
+                self._warmed = self._executor.submit(self._start)
+            return self._warmed
+
+    def render(self, fig, output_format: str, width: Optional[int] = None, height: Optional[int] = None,
+               scale: Optional[float] = None) -> bytes:
+        """Render a figure to PNG/PDF bytes on the warm worker."""
+        import plotly.io as pio
+
+        self.warm().result()
+        return self._executor.submit(
+            pio.to_image, fig, format=output_format, width=width, height=height, scale=scale
+        ).result()
+
+    def close(self):
+        """Stop the Kaleido session and the worker thread."""
+        with self._lock:
+            executor, self._executor, self._warmed = self._executor, None, None
+        if executor is None:
+            return
+        if self._sync_server:
+            try:
+                import kaleido
+                executor.submit(kaleido.stop_sync_server, silence_warnings=True).result()
+            except Exception as error:
+                logger.debug(f"Stopping Kaleido failed: {error}")
+            self._sync_server = False
+        executor.shutdown(wait=False)
+
+
+_image_renderer = ImageRenderer()
+
+
+def get_image_renderer() -> ImageRenderer:
+    """Get the process-wide image renderer."""
+    return _image_renderer
+
+
+# =============================================================================
+# FIGURE CACHE
+# =============================================================================
+
+FigureKey = Tuple[str, str, str, str, str]
+
+
+class FigureCache:
+    """
+    In-memory LRU of encoded figures, bounded by entry count and total bytes.
+    """
+
+    def __init__(self, max_bytes: int = MAX_CACHE_BYTES, max_entries: int = MAX_CACHE_ENTRIES):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._entries: OrderedDict[FigureKey, bytes] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(network_path: Union[str, Path], plot_type: str, output_format: str,
+            params: Optional[Dict[str, Any]] = None) -> FigureKey:
+        network_path = Path(network_path).resolve()
+        return (str(network_path), network_fingerprint(network_path), plot_type, output_format,
+                _params_key(normalize_params(params)))
+
+    def get(self, key: FigureKey) -> Optional[bytes]:
+        with self._lock:
+            content = self._entries.get(key)
+            if content is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return content
+
+    def put(self, key: FigureKey, content: bytes):
+        if len(content) > self.max_bytes:
+            return
+        with self._lock:
+            # Figures of a rewritten network are never asked for again
+            for stale in [k for k in self._entries if k[0] == key[0] and k[1] != key[1]]:
+                self._bytes -= len(self._entries.pop(stale))
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = content
+            self._bytes += len(content)
+            while self._entries and (self._bytes > self.max_bytes or len(self._entries) > self.max_entries):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def invalidate(self, network_path: Optional[Union[str, Path]] = None):
+        """Drop one network's figures, or all of them."""
+        with self._lock:
+            if network_path is None:
+                self._entries.clear()
+                self._bytes = 0
+                return
+            path = str(Path(network_path).resolve())
+            for key in [k for k in self._entries if k[0] == path]:
+                self._bytes -= len(self._entries.pop(key))
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'entries': len(self._entries), 'bytes': self._bytes, 'hits': self.hits, 'misses': self.misses}
+
+
+_figure_cache = FigureCache()
+
+
+def get_figure_cache() -> FigureCache:
+    """Get the process-wide figure cache."""
+    return _figure_cache
+
+
+def cached_figure(network_path: Union[str, Path], plot_type: str, output_format: str,
+                  params: Optional[Dict[str, Any]], build: Callable[[], Any]) -> bytes:
+    """
+    Encoded figure for a plot request, built on a cache miss.
+
+    Args:
+        network_path: Network the figure is drawn from
+        plot_type: Plot type name
+        output_format: One of ``FIGURE_FORMATS``
+        params: Plot filters (resolution, dates, carriers, ...)
+        build: Called without arguments on a miss; returns the Plotly figure
+
+    Returns:
+        Encoded figure bytes (JSON spec, HTML page or image)
+    """
+    if output_format not in FIGURE_FORMATS:
+        raise ValueError(f"Unsupported output format: {output_format}")
+
+    key = FigureCache.key(network_path, plot_type, output_format, params)
+    content = _figure_cache.get(key)
+    if content is None:
+        content = encode_figure(build(), output_format)
+        _figure_cache.put(key, content)
+    return content
@@ -0,0 +1,356 @@
+"""
+Scenario Forecast Cube
+======================
+
+Consolidated demand used to reopen every sector workbook of a scenario on
+each request, walk its rows in Python and total one ``demandType`` at a
+time. Switching gross -> net -> on-grid repeated all of it.
+
+``ForecastCube`` loads a scenario once into a ``sector x model x year``
+array (plus solar shares and T&D loss points) and is cached per scenario
+fingerprint (size/mtime of the columnar results store or sector workbooks,
+``td_losses.json`` and the solar share input file). ``ForecastCube.consolidate`` computes gross, net and
+on-grid values, totals and interpolated T&D losses for a model selection in
+one set of array operations; the result is memoized, so demand-type changes
+only re-slice it.
+
+Usage::
+
+    cube = get_forecast_cube(scenario_dir, solar_share_file, read_solar_shares)
+    result = cube.consolidate(2025, 2040, {'Domestic': 'MLR'}, is_solar_sector)
+    rows = result.records('net')
+"""
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import openpyxl
+
+try:
+    from .forecast_store import FORECAST_STORE_FILE, get_forecast_store
+except ImportError:
+    from forecast_store import FORECAST_STORE_FILE, get_forecast_store
+
+logger = logging.getLogger(__name__)
+
+CONSOLIDATED_FILE_STEM = 'Consolidated_Results'
+RESULTS_SHEET = 'Results'
+TD_LOSSES_FILE = 'td_losses.json'
+DEFAULT_TD_LOSS = 0.10
+
+MAX_CACHED_CUBES = 8
+MAX_CACHED_CONSOLIDATIONS = 32
+
+
+# =============================================================================
+# HELPERS
+# =============================================================================
+
+def sector_files(scenario_dir: Union[str, Path]) -> List[Path]:
+    """Sector result workbooks of a scenario (no consolidated/temporary files)."""
+    return sorted(
+        f for f in Path(scenario_dir).glob('*.xlsx')
+        if f.stem != CONSOLIDATED_FILE_STEM and not f.name.startswith('~$')
+    )
+
+
+def td_loss_fractions(years: np.ndarray, loss_points: List[Dict]) -> np.ndarray:
+    """
+    T&D loss per year as a fraction, linearly interpolated between points.
+
+    Years outside the configured range use the nearest point; without points
+    ``DEFAULT_TD_LOSS`` applies.
+    """
+    points = sorted(
+        (float(p['year']), float(p['loss'])) for p in loss_points
+        if isinstance(p.get('year'), (int, float)) and isinstance(p.get('loss'), (int, float))
+    )
+    if not points:
+        return np.full(len(years), DEFAULT_TD_LOSS)
+    xp, fp = np.array(points).T
+    return np.interp(np.asarray(years, dtype=float), xp, fp) / 100
+
+
+def _to_float(value) -> float:
+    if value is None or isinstance(value, bool):
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _to_year(value) -> Optional[int]:
+    try:
+        year = int(float(value))
+    except (TypeError, ValueError):
+        return None
+    return year or None
+
+
+def _read_results_sheet(file_path: Path) -> Tuple[List[str], Dict[int, List[float]]]:
+    """Model names and ``{year: [value per model]}`` from a sector's Results sheet."""
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        if RESULTS_SHEET not in workbook.sheetnames:
+            return [], {}
+        rows = workbook[RESULTS_SHEET].iter_rows(values_only=True)
+        headers = list(next(rows, None) or [])
+        if 'Year' not in headers:
+            return [], {}
+        year_idx = headers.index('Year')
+        model_idx = [i for i, h in enumerate(headers) if h and i != year_idx]
+        models = [str(headers[i]) for i in model_idx]
+
+        values = {}
+        for row in rows:
+            if not row or year_idx >= len(row):
+                continue
+            year = _to_year(row[year_idx])
+            if year is None:
+                continue
+            values[year] = [_to_float(row[i]) if i < len(row) else np.nan for i in model_idx]
+        return models, values
+    finally:
+        workbook.close()
+
+
+# =============================================================================
+# CONSOLIDATION RESULT
+# =============================================================================
+
+class ConsolidatedDemand:
+    """
+    Gross, net and on-grid demand for one model selection and year range.
+
+    Arrays are ``sector x year`` (``NaN`` where a sector has no value) or
+    per year. All three demand types are computed together.
+    """
+
+    def __init__(self, years: np.ndarray, sectors: List[str], gross: np.ndarray,
+                 net: np.ndarray, td_fraction: np.ndarray):
+        self.years = years
+        self.sectors = sectors
+        self.gross = gross
+        self.net = net
+        self.td_fraction = td_fraction
+
+        self.gross_total = np.nansum(gross, axis=0)
+        self.net_total = np.nansum(net, axis=0)
+        loss_factor = td_fraction / (1 - td_fraction)
+        self.gross_td_losses = self.gross_total * loss_factor
+        self.net_td_losses = self.net_total * loss_factor
+
+    def sector_values(self, demand_type: str) -> np.ndarray:
+        """Sector matrix for a demand type (solar-adjusted for net and on-grid)."""
+        return self.net if demand_type in ('net', 'onGrid') else self.gross
+
+    def records(self, demand_type: str, columns: Optional[Dict[str, np.ndarray]] = None) -> List[Dict]:
+        """
+        Rows of ``{"Year", <sector>..., <extra columns>...}`` for the UI tables.
+
+        Args:
+            demand_type: 'gross', 'net' or 'onGrid' (selects the sector values)
+            columns: Extra per-year columns appended in order, e.g.
+                     ``{'T&D Losses': result.net_td_losses}``
+        """
+        matrix = self.sector_values(demand_type)
+        sector_lists = [
+            [None if np.isnan(v) else float(v) for v in matrix[i]] for i in range(len(self.sectors))
+        ]
+        extra = {name: np.asarray(values, dtype=float).tolist() for name, values in (columns or {}).items()}
+
+        rows = []
+        for j, year in enumerate(self.years.tolist()):
+            row = {'Year': year}
+            for sector, values in zip(self.sectors, sector_lists):
+                row[sector] = values[j]
+            for name, values in extra.items():
+                row[name] = values[j]
+            rows.append(row)
+        return rows
+
+
+# =============================================================================
+# CUBE
+# =============================================================================
+
+class ForecastCube:
+    """All sector forecasts of a scenario as a ``sector x model x year`` array."""
+
+    def __init__(self, sectors: List[str], models: List[str], years: np.ndarray,
+                 values: np.ndarray, solar_shares: Dict[str, float], td_loss_points: List[Dict]):
+        self.sectors = sectors
+        self.models = models
+        self.years = years
+        self.values = values
+        self.solar_shares = solar_shares
+        self.td_loss_points = td_loss_points
+        self._model_index = {model: i for i, model in enumerate(models)}
+        self._year_index = {int(year): i for i, year in enumerate(years)}
+        self._results: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, scenario_dir: Union[str, Path],
+             read_solar_shares: Optional[Callable[[], Dict[str, float]]] = None) -> 'ForecastCube':
+        """Read the results store (or every sector workbook), ``td_losses.json`` and the solar shares once."""
+        scenario_dir = Path(scenario_dir)
+        td_loss_points = cls._read_td_losses(scenario_dir)
+        solar_shares = (read_solar_shares() if read_solar_shares else {}) or {}
+
+        store = get_forecast_store(scenario_dir)
+        if store is not None:
+            sectors, models, years, cube = store.results_matrix()
+            return cls(sectors, models, years, cube, solar_shares, td_loss_points)
+
+        sectors, per_sector = [], []
+        for file_path in sector_files(scenario_dir):
+            try:
+                models, values = _read_results_sheet(file_path)
+            except Exception as e:
+                logger.error(f"Error reading sector {file_path.stem}: {e}")
+                models, values = [], {}
+            sectors.append(file_path.stem)
+            per_sector.append((models, values))
+
+        models = list(dict.fromkeys(m for sector_models, _ in per_sector for m in sector_models))
+        years = np.array(sorted({y for _, values in per_sector for y in values}), dtype=int)
+        model_index = {model: i for i, model in enumerate(models)}
+        year_index = {int(year): i for i, year in enumerate(years)}
+
+        cube = np.full((len(sectors), len(models), len(years)), np.nan)
+        for s, (sector_models, values) in enumerate(per_sector):
+            if not values:
+                continue
+            cols = [year_index[y] for y in values]
+            block = np.array(list(values.values()), dtype=float).T  # model x year
+            cube[np.ix_([s], [model_index[m] for m in sector_models], cols)] = block[np.newaxis]
+
+        return cls(sectors, models, years, cube, solar_shares, td_loss_points)
+
+    @staticmethod
+    def _read_td_losses(scenario_dir: Path) -> List[Dict]:
+        losses_file = scenario_dir / TD_LOSSES_FILE
+        if not losses_file.exists():
+            return []
+        try:
+            with open(losses_file, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Could not parse {TD_LOSSES_FILE}: {e}")
+            return []
+
+    def select(self, selections: Dict[str, str], years: np.ndarray) -> np.ndarray:
+        """``sector x year`` values of each sector's selected model (NaN if unselected)."""
+        out = np.full((len(self.sectors), len(years)), np.nan)
+        cols = np.array([self._year_index.get(int(y), -1) for y in years], dtype=int)
+        present = cols >= 0
+        for s, sector in enumerate(self.sectors):
+            m = self._model_index.get(selections.get(sector) or '')
+            if m is not None:
+                out[s, present] = self.values[s, m, cols[present]]
+        return out
+
+    def consolidate(self, start_year: int, end_year: int, selections: Dict[str, str],
+                    is_solar_sector: Callable[[str], bool]) -> ConsolidatedDemand:
+        """
+        Gross/net/on-grid demand for a model selection over ``start_year..end_year``.
+
+        Solar sectors (per ``is_solar_sector``) contribute their absolute value;
+        other sectors are reduced by their solar share for net demand.
+        """
+        key = (start_year, end_year, tuple(sorted((selections or {}).items())), is_solar_sector)
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                self._results.move_to_end(key)
+                return cached
+
+        years = np.arange(start_year, end_year + 1)
+        selected = self.select(selections or {}, years)
+
+        solar = np.array([is_solar_sector(s) for s in self.sectors], dtype=bool)
+        shares = np.array([self.solar_shares.get(s, 0.0) for s in self.sectors], dtype=float)
+
+        gross = np.where(solar[:, None], np.abs(selected), selected)
+        net = np.where(solar[:, None], gross, selected * (1 - shares[:, None] / 100.0))
+        result = ConsolidatedDemand(years, list(self.sectors), gross, net,
+                                    td_loss_fractions(years, self.td_loss_points))
+
+        with self._lock:
+            self._results[key] = result
+            while len(self._results) > MAX_CACHED_CONSOLIDATIONS:
+                self._results.popitem(last=False)
+        return result
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+_cubes: OrderedDict = OrderedDict()
+_cubes_lock = threading.Lock()
+
+
+def scenario_fingerprint(scenario_dir: Union[str, Path],
+                         solar_share_file: Optional[Union[str, Path]] = None) -> Tuple:
+    """(name, size, mtime_ns) of every file the cube is built from."""
+    scenario_dir = Path(scenario_dir)
+    store = scenario_dir / FORECAST_STORE_FILE
+    sources = [store] if store.exists() else sector_files(scenario_dir)
+    sources.append(scenario_dir / TD_LOSSES_FILE)
+    if solar_share_file:
+        sources.append(Path(solar_share_file))
+
+    fingerprint = []
+    for path in sources:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        fingerprint.append((path.name, stat.st_size, stat.st_mtime_ns))
+    return tuple(fingerprint)
+
+
+def get_forecast_cube(scenario_dir: Union[str, Path],
+                      solar_share_file: Optional[Union[str, Path]] = None,
+                      read_solar_shares: Optional[Callable[[], Dict[str, float]]] = None) -> ForecastCube:
+    """
+    Cached cube for a scenario folder, rebuilt when any source file changes.
+
+    Args:
+        scenario_dir: ``results/demand_forecasts/<scenario>`` folder
+        solar_share_file: Input workbook holding the solar shares (fingerprinted)
+        read_solar_shares: Loader for ``{sector: percentage}`` solar shares
+    """
+    key = str(Path(scenario_dir).resolve())
+    fingerprint = scenario_fingerprint(scenario_dir, solar_share_file)
+
+    with _cubes_lock:
+        entry = _cubes.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            _cubes.move_to_end(key)
+            return entry[1]
+
+    cube = ForecastCube.load(scenario_dir, read_solar_shares)
+    logger.info(f"Forecast cube loaded for {Path(scenario_dir).name}: "
+                f"{len(cube.sectors)} sectors x {len(cube.models)} models x {len(cube.years)} years")
+
+    with _cubes_lock:
+        _cubes[key] = (fingerprint, cube)
+        _cubes.move_to_end(key)
+        while len(_cubes) > MAX_CACHED_CUBES:
+            _cubes.popitem(last=False)
+    return cube
+
+
+def clear_forecast_cubes():
+    """Drop all cached cubes."""
+    with _cubes_lock:
+        _cubes.clear()
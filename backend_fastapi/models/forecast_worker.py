@@ -0,0 +1,400 @@
+"""
+Persistent Forecasting Workers
+==============================
+
+Every forecast used to start a fresh ``python forecasting.py`` subprocess,
+paying interpreter start-up and the pandas / scikit-learn imports (a few
+seconds) before the first progress event.
+
+``ForecastWorkerPool`` keeps long-lived worker processes that import the
+forecasting script once and then run jobs sent to them over a pipe:
+
+- **isolation**: each job still runs in a separate process, one job per
+  worker at a time; ``forecasting.run`` resets the script's per-run state,
+  and a worker that dies mid-job fails that job and is replaced
+- **progress**: the worker captures the script's stdout/stderr; ``PROGRESS:``
+  lines are forwarded unchanged as events, stderr lines are logged, and the
+  result dict is returned directly instead of being parsed from stdout
+- **cancellation**: a queued job is dropped, a running one is stopped by
+  terminating its worker, which is replaced by a fresh (warming) worker
+- **start-up failures**: a worker that exits before reporting ready is
+  replaced at most ``MAX_STARTUP_FAILURES`` times in a row; after that the
+  pool stops respawning, fails its queued jobs and rejects new ones, so
+  callers fall back to a subprocess instead of waiting on a respawn loop
+  (e.g. a frozen build whose entry point does not call
+  ``multiprocessing.freeze_support()``)
+- **input cache**: the worker's prepared sector frames (keyed by a hash of
+  the sector's input rows, see ``forecasting.prepare_sector_data``) survive
+  between jobs, so re-runs of a project skip re-parsing unchanged inputs
+
+Jobs are queued in the API process and handed to the next idle worker.
+Events and the final ``end`` event are delivered through the job's
+callback, on the pool's listener thread.
+
+Usage::
+
+    job = get_forecast_pool().submit(config_path, on_event)
+    get_forecast_pool().cancel(job.id)
+"""
+
+import io
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+import traceback
+import uuid
+from collections import deque
+from multiprocessing.connection import wait
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+MODELS_DIR = Path(__file__).resolve().parent
+DEFAULT_WORKERS = 1
+POLL_INTERVAL = 0.5
+SHUTDOWN_TIMEOUT = 5.0
+MAX_STARTUP_FAILURES = 3
+
+EventCallback = Callable[[Dict[str, Any]], None]
+
+
+# =============================================================================
+# WORKER PROCESS
+# =============================================================================
+
+class _LineStream(io.TextIOBase):
+    """Stand-in for stdout/stderr that hands every complete line to a callback."""
+
+    def __init__(self, emit: Callable[[str], None]):
+        self._emit = emit
+        self._buffer = ''
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        self._buffer += text
+        *lines, self._buffer = self._buffer.split('\n')
+        for line in lines:
+            if line.strip():
+                self._emit(line.strip())
+        return len(text)
+
+
+def _worker_main(conn):
+    """Worker process: import the forecasting script once, then run the jobs sent over ``conn``."""
+    sys.path.insert(0, str(MODELS_DIR))
+    import forecasting
+
+    conn.send(('ready', None, os.getpid()))
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            break
+        if job is None:
+            break
+
+        job_id, config_path, backtest_mode = job
+
+        def forward_stdout(line: str):
+            if line.startswith('PROGRESS:'):
+                try:
+                    conn.send(('progress', job_id, json.loads(line[9:])))
+                except json.JSONDecodeError:
+                    pass
+
+        stdout, stderr = sys.stdout, sys.stderr
+        sys.stdout = _LineStream(forward_stdout)
+        sys.stderr = _LineStream(lambda line: conn.send(('log', job_id, line)))
+        try:
+            exit_code, result = forecasting.run(config_path, backtest_mode)
+        except SystemExit as e:
+            exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+            result = None
+        except Exception as e:
+            print(traceback.format_exc(), file=sys.stderr)
+            exit_code, result = 1, {'error': str(e)}
+        finally:
+            sys.stdout, sys.stderr = stdout, stderr
+        conn.send(('done', job_id, {'exit_code': exit_code, 'result': result}))
+
+
+# =============================================================================
+# POOL
+# =============================================================================
+
+class ForecastJob:
+    """One queued or running forecast."""
+
+    def __init__(self, config_path: Union[str, Path], on_event: EventCallback, backtest: bool = False):
+        self.id = uuid.uuid4().hex
+        self.config_path = str(config_path)
+        self.backtest = backtest
+        self.on_event = on_event
+        self.status = 'queued'
+        self.result: Optional[Dict[str, Any]] = None
+        self.worker: Optional['_Worker'] = None
+        self.done = threading.Event()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self.done.wait(timeout)
+
+
+class _Worker:
+    def __init__(self, ctx):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn,), daemon=True, name='forecast-worker')
+        self.process.start()
+        child_conn.close()
+        self.job: Optional[ForecastJob] = None
+        self.ready = False
+
+    def stop(self, timeout: float = SHUTDOWN_TIMEOUT):
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.kill()
+                self.process.join()
+        self.conn.close()
+
+
+class ForecastWorkerPool:
+    """
+    Long-lived forecasting worker processes fed from a local job queue.
+
+    Workers are started (spawned, so no server threads or sockets are
+    inherited) on the first ``start``/``submit``.
+    """
+
+    def __init__(self, workers: int = DEFAULT_WORKERS):
+        self.size = max(1, workers)
+        self._ctx = multiprocessing.get_context('spawn')
+        self._workers: List[_Worker] = []
+        self._pending: Deque[ForecastJob] = deque()
+        self._jobs: Dict[str, ForecastJob] = {}
+        self._lock = threading.RLock()
+        self._listener: Optional[threading.Thread] = None
+        self._closed = False
+        self._startup_failures = 0
+        self.failed = False
+
+    def start(self):
+        """Start the workers (importing the forecasting libraries in the background)."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Forecast worker pool is shut down")
+            if self.failed:
+                raise RuntimeError("Forecasting workers failed to start")
+            if self._listener is None:
+                self._workers = [_Worker(self._ctx) for _ in range(self.size)]
+                self._listener = threading.Thread(target=self._listen, daemon=True, name='forecast-pool')
+                self._listener.start()
+                logger.info(f"Started {self.size} forecasting worker(s)")
+
+    def submit(self, config_path: Union[str, Path], on_event: EventCallback, backtest: bool = False) -> ForecastJob:
+        """Queue a forecast; ``on_event`` gets its progress events and a final ``end`` event."""
+        self.start()
+        job = ForecastJob(config_path, on_event, backtest)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._pending.append(job)
+            self._dispatch()
+        return job
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job. Returns False if it is unknown or finished."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.done.is_set():
+                return False
+            if job in self._pending:
+                self._pending.remove(job)
+            elif job.worker is not None:
+                job.worker.job = None
+                self._replace(job.worker)
+            self._dispatch()
+        self._finish(job, 'cancelled', {'status': 'cancelled', 'error': 'Cancelled by user', 'type': 'end'})
+        return True
+
+    def get(self, job_id: str) -> Optional[ForecastJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'workers': len(self._workers),
+                'ready': sum(1 for w in self._workers if w.ready),
+                'busy': sum(1 for w in self._workers if w.job is not None),
+                'queued': len(self._pending),
+            }
+
+    def shutdown(self):
+        """Stop the workers; queued and running jobs are cancelled."""
+        with self._lock:
+            self._closed = True
+            workers, self._workers = self._workers, []
+            jobs = [job for job in self._jobs.values() if not job.done.is_set()]
+            self._pending.clear()
+        for worker in workers:
+            try:
+                worker.conn.send(None)
+                worker.process.join(1.0)
+            except (OSError, ValueError):
+                pass
+            worker.stop()
+        for job in jobs:
+            self._finish(job, 'cancelled', {'status': 'cancelled', 'error': 'Server shutting down', 'type': 'end'})
+
+    # -------------------------------------------------------------------------
+
+    def _dispatch(self):
+        """Hand queued jobs to idle workers (lock held)."""
+        for worker in self._workers:
+            if not self._pending:
+                return
+            if worker.job is None and worker.process.is_alive():
+                job = self._pending.popleft()
+                worker.job, job.worker, job.status = job, worker, 'running'
+                worker.conn.send((job.id, job.config_path, job.backtest))
+
+    def _replace(self, worker: _Worker):
+        """Stop a worker and start a fresh one in its place (lock held)."""
+        worker.stop()
+        if worker in self._workers and not self._closed:
+            self._workers[self._workers.index(worker)] = _Worker(self._ctx)
+
+    def _finish(self, job: ForecastJob, status: str, event: Dict[str, Any]):
+        with self._lock:
+            if job.done.is_set():
+                return
+            job.status, job.result, job.worker = status, event, None
+            self._jobs.pop(job.id, None)
+            job.done.set()
+        self._deliver(job, event)
+
+    @staticmethod
+    def _deliver(job: ForecastJob, event: Dict[str, Any]):
+        try:
+            job.on_event(event)
+        except Exception as e:
+            logger.error(f"Forecast event callback failed: {e}")
+
+    def _handle(self, worker: _Worker, kind: str, job_id: Optional[str], payload: Any):
+        with self._lock:
+            job = worker.job if worker.job is not None and worker.job.id == job_id else None
+
+        if kind == 'ready':
+            worker.ready = True
+            self._startup_failures = 0
+            logger.info(f"Forecasting worker {payload} ready")
+        elif kind == 'log':
+            logger.info(f"[Forecast worker]: {payload}")
+        elif kind == 'progress' and job is not None and not job.done.is_set():
+            self._deliver(job, payload)
+        elif kind == 'done':
+            with self._lock:
+                worker.job = None
+                self._dispatch()
+            if job is None:
+                return
+            exit_code, result = payload['exit_code'], payload['result']
+            if exit_code == 0:
+                self._finish(job, 'completed', {'status': 'completed', 'result': result, 'type': 'end'})
+            else:
+                error = (result or {}).get('error') or f"Python script exited with error code {exit_code}."
+                self._finish(job, 'failed', {'status': 'failed', 'error': error, 'result': result, 'type': 'end'})
+
+    def _worker_died(self, worker: _Worker):
+        with self._lock:
+            if worker not in self._workers:
+                return  # already replaced (cancelled job)
+            job = worker.job
+            if not worker.ready:
+                # The job never started; it goes back to the front of the queue
+                self._startup_failures += 1
+                if job is not None:
+                    worker.job, job.worker, job.status = None, None, 'queued'
+                    self._pending.appendleft(job)
+                    job = None
+            gave_up = self._startup_failures >= MAX_STARTUP_FAILURES
+            if gave_up:
+                worker.stop()
+                self._workers.remove(worker)
+                self.failed = True
+                abandoned = [] if self._workers else list(self._pending)
+                if not self._workers:
+                    self._pending.clear()
+            else:
+                self._replace(worker)
+                abandoned = []
+                self._dispatch()
+            exit_code = worker.process.exitcode
+
+        if gave_up:
+            logger.error(f"Forecasting worker failed to start {MAX_STARTUP_FAILURES} times "
+                         f"(exit code {exit_code}); not restarting it")
+        else:
+            logger.error(f"Forecasting worker exited unexpectedly (exit code {exit_code})")
+        for pending in abandoned:
+            self._finish(pending, 'failed', {
+                'status': 'failed', 'error': "Forecasting workers failed to start.", 'type': 'end',
+            })
+        if job is not None:
+            self._finish(job, 'failed', {
+                'status': 'failed', 'error': f"Forecast worker exited unexpectedly (exit code {exit_code}).",
+                'type': 'end',
+            })
+
+    def _listen(self):
+        while True:
+            with self._lock:
+                if self._closed or not self._workers:
+                    return
+                workers = {worker.conn: worker for worker in self._workers}
+
+            try:
+                ready = wait(list(workers), timeout=POLL_INTERVAL)
+            except OSError:
+                ready = []
+
+            for conn in ready:
+                worker = workers[conn]
+                try:
+                    message = conn.recv()
+                except (EOFError, OSError):
+                    self._worker_died(worker)
+                    continue
+                self._handle(worker, *message)
+
+            for conn, worker in workers.items():
+                if not worker.process.is_alive() and conn not in ready:
+                    self._worker_died(worker)
+
+
+_pool: Optional[ForecastWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_forecast_pool() -> ForecastWorkerPool:
+    """Get the process-wide forecasting worker pool (created, not started, on first use)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None or _pool._closed:
+            _pool = ForecastWorkerPool(int(os.environ.get('FORECAST_WORKERS', DEFAULT_WORKERS)))
+        return _pool
+
+
+def shutdown_forecast_pool():
+    """Stop the pool's workers if it was started."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
@@ -0,0 +1,300 @@
+"""
+HTTP Caching for File-Derived Responses
+=======================================
+
+Most GET endpoints compute their response purely from files on disk (profile
+workbooks, scenario result workbooks, ``.nc`` networks, ``td_losses.json``).
+``cache_on_files`` is a route dependency that derives a strong ETag from the
+route, its parameters, the ``Accept`` header and the size/mtime of those
+source files, so repeated requests cost one ``stat()`` per file:
+
+- ``If-None-Match`` matching the current ETag is answered with ``304`` before
+  the route body runs.
+- Otherwise ``ETag``, ``Last-Modified`` and ``Cache-Control: no-cache`` (always
+  revalidate) are added to the response.
+- Optionally, successful bodies are kept in a bounded server-side cache keyed
+  by ETag, so clients without a browser cache (or a second browser) are also
+  served without recomputation.
+
+``install_http_cache(app)`` registers the pieces the server-side cache needs
+(an exception handler for hits and an ASGI middleware that records bodies).
+Sources that do not exist disable caching for that request, so the route's
+own 404/validation handling is unchanged.
+
+Usage::
+
+    @router.get("/pypsa/emissions", dependencies=[cache_on_files(network_source)])
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from email.utils import formatdate
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from fastapi import Depends, HTTPException, Request, Response
+
+logger = logging.getLogger(__name__)
+
+MAX_CACHED_RESPONSES = 128
+MAX_CACHED_BYTES = 64 * 1024 * 1024
+# Bodies larger than this are never kept server-side
+MAX_ENTRY_BYTES = 8 * 1024 * 1024
+
+STORE_STATE_KEY = 'http_cache_store'
+CACHE_HEADER = 'X-Cache'
+
+SourceResolver = Callable[[Mapping[str, str]], Iterable[Union[str, Path]]]
+
+
+# =============================================================================
+# SOURCE RESOLVERS
+# =============================================================================
+
+def network_source(params: Mapping[str, str]) -> List[Path]:
+    """The ``.nc`` file addressed by projectPath / scenarioName / networkFile."""
+    return [
+        Path(params['projectPath']) / "results" / "pypsa_optimization"
+        / params['scenarioName'] / params['networkFile']
+    ]
+
+
+def profile_source(params: Mapping[str, str]) -> List[Path]:
+    """The load profile workbook addressed by projectPath / profileName."""
+    return [Path(params['projectPath']) / "results" / "load_profiles" / f"{params['profileName']}.xlsx"]
+
+
+def forecast_sector_source(params: Mapping[str, str]) -> List[Path]:
+    """A sector's forecast: the scenario's results store if present, else ``<sector>.xlsx``."""
+    # Imported here so installing the cache does not pull in pandas at startup
+    from .forecast_store import FORECAST_STORE_FILE
+
+    scenario_dir = Path(params['projectPath']) / "results" / "demand_forecasts" / params['scenarioName']
+    store = scenario_dir / FORECAST_STORE_FILE
+    if params['sectorName'] != 'Consolidated_Results' and store.exists():
+        return [store]
+    return [scenario_dir / f"{params['sectorName']}.xlsx"]
+
+
+def forecast_scenario_file(filename: str) -> SourceResolver:
+    """A file inside a demand forecast scenario folder (``{name}`` is filled from params)."""
+    def resolve(params: Mapping[str, str]) -> List[Path]:
+        return [
+            Path(params['projectPath']) / "results" / "demand_forecasts"
+            / params['scenarioName'] / filename.format(**params)
+        ]
+    return resolve
+
+
+# =============================================================================
+# ETAG COMPUTATION
+# =============================================================================
+
+def _stat_sources(paths: Iterable[Union[str, Path]]) -> Optional[List[Tuple[str, int, int]]]:
+    """(path, size, mtime_ns) per source, or None if any source is missing."""
+    stats = []
+    for path in paths:
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            return None
+        stats.append((str(path), stat.st_size, stat.st_mtime_ns))
+    return stats
+
+
+def compute_etag(route: str, params: Mapping[str, str], sources: List[Tuple[str, int, int]],
+                 variant: str = '') -> str:
+    """Strong ETag over the route, sorted params, response variant and source stats."""
+    digest = hashlib.sha1()
+    digest.update(route.encode('utf-8'))
+    for key in sorted(params):
+        digest.update(f"\0{key}={params[key]}".encode('utf-8'))
+    digest.update(f"\0accept={variant}".encode('utf-8'))
+    for path, size, mtime_ns in sources:
+        digest.update(f"\0{path}:{size}:{mtime_ns}".encode('utf-8'))
+    return f'"{digest.hexdigest()}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(',')]
+    # Weak comparison for If-None-Match (RFC 9110 13.1.2)
+    return '*' in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+# =============================================================================
+# SERVER-SIDE RESPONSE CACHE
+# =============================================================================
+
+class ResponseCache:
+    """Bounded LRU of response bodies keyed by ETag (entry count and total bytes)."""
+
+    def __init__(self, max_entries: int = MAX_CACHED_RESPONSES, max_bytes: int = MAX_CACHED_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, Tuple[int, List[Tuple[bytes, bytes]], bytes]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'not_modified': 0, 'stores': 0}
+
+    def get(self, etag: str) -> Optional[Tuple[int, List[Tuple[bytes, bytes]], bytes]]:
+        with self._lock:
+            entry = self._entries.get(etag)
+            if entry is not None:
+                self._entries.move_to_end(etag)
+                self._stats['hits'] += 1
+            return entry
+
+    def put(self, etag: str, status: int, headers: List[Tuple[bytes, bytes]], body: bytes):
+        if len(body) > MAX_ENTRY_BYTES:
+            return
+        with self._lock:
+            previous = self._entries.pop(etag, None)
+            if previous is not None:
+                self._bytes -= len(previous[2])
+            self._entries[etag] = (status, headers, body)
+            self._bytes += len(body)
+            self._stats['stores'] += 1
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, (_, _, evicted) = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def count_not_modified(self):
+        with self._lock:
+            self._stats['not_modified'] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {'size': len(self._entries), 'bytes': self._bytes, **self._stats}
+
+
+_response_cache = ResponseCache()
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the process-wide server-side response cache."""
+    return _response_cache
+
+
+class CachedResponseHit(Exception):
+    """Raised by the dependency to short-circuit a route with a stored response."""
+
+    def __init__(self, etag: str, status: int, headers: List[Tuple[bytes, bytes]], body: bytes):
+        self.etag = etag
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+
+# =============================================================================
+# DEPENDENCY
+# =============================================================================
+
+def cache_on_files(resolve_sources: SourceResolver, store: bool = True):
+    """
+    Route dependency adding ETag / 304 handling for a file-derived response.
+
+    Args:
+        resolve_sources: Maps the request's path + query params to the files
+                         the response is computed from
+        store: Also keep successful bodies in the server-side response cache
+               (requires ``install_http_cache``)
+
+    Returns:
+        A ``Depends`` marker for the route's ``dependencies`` list
+    """
+    async def dependency(request: Request, response: Response):
+        params = {**request.query_params, **request.path_params}
+        try:
+            sources = _stat_sources(resolve_sources(params))
+        except (KeyError, ValueError, TypeError):
+            # Missing/invalid params: let the route report the error
+            return
+        if not sources:
+            return
+
+        etag = compute_etag(request.url.path, params, sources, request.headers.get('accept', ''))
+
+        if _etag_matches(request.headers.get('if-none-match'), etag):
+            _response_cache.count_not_modified()
+            raise HTTPException(status_code=304, headers={'ETag': etag, 'Cache-Control': 'no-cache'})
+
+        if store:
+            cached = _response_cache.get(etag)
+            if cached is not None:
+                raise CachedResponseHit(etag, *cached)
+            setattr(request.state, STORE_STATE_KEY, etag)
+
+        last_modified = max(mtime_ns for _, _, mtime_ns in sources) / 1e9
+        response.headers['ETag'] = etag
+        response.headers['Last-Modified'] = formatdate(last_modified, usegmt=True)
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['Vary'] = 'Accept'
+
+    return Depends(dependency)
+
+
+# =============================================================================
+# APP INTEGRATION
+# =============================================================================
+
+async def _cached_response_handler(request: Request, exc: CachedResponseHit) -> Response:
+    headers = {key.decode('latin-1'): value.decode('latin-1') for key, value in exc.headers}
+    headers[CACHE_HEADER] = 'HIT'
+    return Response(content=exc.body, status_code=exc.status, headers=headers)
+
+
+class ResponseCacheMiddleware:
+    """
+    ASGI middleware that records bodies of responses marked by the dependency.
+
+    Messages are forwarded unchanged as they are sent (streaming responses
+    are not delayed); a copy of the body is kept only until it exceeds
+    ``MAX_ENTRY_BYTES``.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope.get('method') != 'GET':
+            await self.app(scope, receive, send)
+            return
+
+        # Shared with request.state, where the dependency marks storable responses
+        state = scope.setdefault('state', {})
+        start = {}
+        chunks: List[bytes] = []
+        size = 0
+
+        async def recording_send(message):
+            nonlocal size
+            if message['type'] == 'http.response.start':
+                start.update(message)
+            elif message['type'] == 'http.response.body':
+                etag = state.get(STORE_STATE_KEY)
+                if etag and start.get('status') == 200 and size <= MAX_ENTRY_BYTES:
+                    body = message.get('body', b'')
+                    chunks.append(body)
+                    size += len(body)
+                    if not message.get('more_body', False) and size <= MAX_ENTRY_BYTES:
+                        headers = [(k, v) for k, v in start.get('headers', [])
+                                   if k.lower() not in (b'content-length', b'date')]
+                        _response_cache.put(etag, 200, headers, b''.join(chunks))
+            await send(message)
+
+        await self.app(scope, receive, recording_send)
+
+
+def install_http_cache(app):
+    """Register the server-side response cache on the application."""
+    app.add_exception_handler(CachedResponseHit, _cached_response_handler)
+    app.add_middleware(ResponseCacheMiddleware)
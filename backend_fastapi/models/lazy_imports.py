@@ -0,0 +1,73 @@
+"""
+Deferred Module Imports
+=======================
+
+``pypsa`` (and through it scipy, linopy, seaborn and matplotlib), ``plotly``,
+``pandas`` and ``openpyxl`` take several seconds to import, yet the desktop
+shell only needs ``/project/load`` and a handful of light routes before the
+user opens a heavy page. Routers therefore bind these modules with
+``lazy_import`` instead of a top-level ``import``:
+
+    pd = lazy_import('pandas')
+    pypsa_analyzer = lazy_import('models.pypsa_analyzer')
+
+The returned proxy imports the real module on the first attribute access
+(``pd.DataFrame``) and forwards everything to it afterwards. Router
+registration stays eager; only the module bodies are deferred.
+
+The import goes through ``importlib.import_module``, so concurrent first
+requests from the threadpool are serialized by the interpreter's import lock
+and the module is executed exactly once.
+"""
+
+import importlib
+import sys
+import threading
+import types
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports ``name`` on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__['_lazy_module'] = None
+        self.__dict__['_lazy_lock'] = threading.Lock()
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__['_lazy_module']
+        if module is None:
+            with self.__dict__['_lazy_lock']:
+                module = self.__dict__['_lazy_module']
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__['_lazy_module'] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self.__dict__['_lazy_module'] is not None else 'not loaded'
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    Module ``name``, imported on first use.
+
+    Returns the real module when it is already imported, otherwise a
+    ``LazyModule`` proxy.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+
+def is_loaded(name: str) -> bool:
+    """Whether ``name`` has actually been imported (used by the startup benchmark/tests)."""
+    return name in sys.modules
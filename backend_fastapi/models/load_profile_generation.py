@@ -2377,6 +2377,22 @@ try:
 except ImportError:
     pass
 
+try:
+    from .profile_constraints import apply_profile_constraints, format_constraint_report
+except ImportError:
+    from profile_constraints import apply_profile_constraints, format_constraint_report
+
+try:
+    from profile_pyramid import build_profile_pyramid, pyramid_path_for, save_profile_pyramid
+    PYRAMID_AVAILABLE = True
+except ImportError:
+    PYRAMID_AVAILABLE = False
+
+try:
+    from profile_workbook import XLSXWRITER_AVAILABLE as STREAMING_WRITER_AVAILABLE, write_streaming_workbook
+except ImportError:
+    STREAMING_WRITER_AVAILABLE = False
+
 # Suppress warnings
 warnings.filterwarnings('ignore')
 
@@ -2388,10 +2404,12 @@ class ProgressReporter:
         self.enable_progress = enable_progress
         self.current_step = 0
         self.total_steps = 0
+        self.percentage = 0
         
     def start_process(self, total_steps, process_name="Load Profile Generation"):
         self.total_steps = total_steps
         self.current_step = 0
+        self.percentage = 0
         if self.enable_progress:
             self._send_progress(0, f'Starting {process_name}', 0)
     
@@ -2408,7 +2426,24 @@ class ProgressReporter:
     def report_error(self, error_msg):
         self._send_progress(0, error_msg, 0, type_='error')
     
-    def _send_progress(self, step, message, percentage, details="", type_='progress'):
+    def report_write(self, sheet_name, rows_written, total_rows, bytes_written):
+        """
+        Workbook export progress (rows of the sheet, bytes so far).
+
+        update_progress() reports a step at its end percentage before the
+        step's work runs, so the writes keep that percentage and only add
+        rows and bytes (an estimate within the step would go backwards).
+        """
+        if not self.enable_progress or self.total_steps <= 0:
+            return
+        self._send_progress(self.current_step, f"Writing {sheet_name}", self.percentage,
+                            f"{rows_written:,}/{total_rows:,} rows, {bytes_written / 1e6:.1f} MB written",
+                            extra={'sheet': sheet_name, 'rows_written': rows_written,
+                                   'total_rows': total_rows, 'bytes_written': bytes_written})
+    
+    def _send_progress(self, step, message, percentage, details="", type_='progress', extra=None):
+        if type_ != 'error':
+            self.percentage = percentage
         try:
             progress_data = {
                 'type': type_,
@@ -2419,6 +2454,8 @@ class ProgressReporter:
             }
             if details:
                 progress_data['details'] = details
+            if extra:
+                progress_data.update(extra)
             sys.stderr.write(f"PROGRESS:{json.dumps(progress_data)}\n")
             sys.stderr.flush()
         except Exception as e:
@@ -2742,9 +2779,7 @@ class OptimizedLoadProfileGenerator:
         print(f"OPTIMIZED PROFILE GENERATION - {self.method.upper()}", file=sys.stderr)
         print("="*60, file=sys.stderr)
         
-        if self.progress:
-            self.progress.start_process(6, "Optimized Load Profile Generation")
-        
+        # Steps 4-8 of the run started by main()
         # Load demand targets
         if self.progress:
             self.progress.update_progress("Loading demand targets")
@@ -2775,9 +2810,6 @@ class OptimizedLoadProfileGenerator:
             self.progress.update_progress("Validating generated profile")
         self.validation_results = self._validate_profile(profile_df)
         
-        if self.progress:
-            self.progress.complete_process("Generation completed successfully")
-        
         self.generated_profile = profile_df
         return profile_df
     
@@ -3115,61 +3147,16 @@ class OptimizedLoadProfileGenerator:
         return (1 + growth_rate) ** years_from_base
     
     def _apply_constraints_and_scaling(self, profile_df):
-        """Apply final constraints and energy scaling"""
-        # Apply annual energy targets
-        for year in range(self.start_year, self.end_year + 1):
-            if year not in self.demand_targets:
-                continue
-            
-            year_mask = profile_df['Fiscal_Year'] == year
-            if not year_mask.any():
-                continue
-            
-            current_total = profile_df.loc[year_mask, 'Demand_MW'].sum()
-            target_total = self.demand_targets[year]
-            
-            if current_total > 0:
-                scale_factor = target_total / current_total
-                profile_df.loc[year_mask, 'Demand_MW'] *= scale_factor
-        
-        # Apply monthly constraints if specified
+        """Apply annual energy targets and, in 'excel' mode, the monthly peak limits"""
+        peak_limits = load_factors = None
         if self.monthly_constraints == 'excel':
-            self._apply_excel_constraints(profile_df)
+            peak_limits = self.template_data.get('max_demand')
+            load_factors = self.template_data.get('load_factor')
         
-        return profile_df
-    
-    def _apply_excel_constraints(self, profile_df):
-        """Apply Excel-based monthly constraints"""
-        max_demand_constraints = self.template_data.get('max_demand', pd.DataFrame())
-        
-        if max_demand_constraints.empty:
-            return profile_df
-        
-        for year in range(self.start_year, self.end_year + 1):
-            year_row = max_demand_constraints[
-                max_demand_constraints.get('financial_year', max_demand_constraints.get('Year', 0)) == year
-            ]
-            
-            if year_row.empty:
-                continue
-            
-            for month in range(1, 13):
-                month_name = self.fiscal_month_names[month]
-                
-                if month_name not in year_row.columns:
-                    continue
-                
-                constraint_value = year_row[month_name].iloc[0]
-                if pd.isna(constraint_value) or constraint_value <= 0:
-                    continue
-                
-                # Apply constraint
-                mask = (profile_df['Fiscal_Year'] == year) & (profile_df['fiscal_month'] == month)
-                if mask.any():
-                    current_max = profile_df.loc[mask, 'Demand_MW'].max()
-                    if current_max > constraint_value:
-                        scale_factor = constraint_value / current_max
-                        profile_df.loc[mask, 'Demand_MW'] *= scale_factor
+        self.constraint_report = apply_profile_constraints(
+            profile_df, self.demand_targets, peak_limits, load_factors
+        )
+        print(f"  {format_constraint_report(self.constraint_report)}", file=sys.stderr)
         
         return profile_df
     
@@ -3321,6 +3308,124 @@ def daily_profile(profile_df):
     return main_df
 
 
+def output_sheets(profile_df, generator, pyramid=None, method='normalized', patterns=None):
+    """
+    Output workbook sheets as (sheet name, DataFrame) pairs, in workbook order.
+
+    Each sheet is built when it is requested, so a streaming writer only
+    holds one analysis table at a time.
+    """
+    patterns = patterns or {}
+    # Main profile
+    yield 'Load_Profile', profile_df
+    yield 'Monthly_analysis', monthly_analysis(profile_df)
+    yield 'Season_analysis', seasonal_analysis(profile_df)
+    yield 'Daily_analysis', daily_profile(profile_df)
+    
+    # Load Duration Curve
+    percent_bins = np.arange(1, 101)
+    ldc_rows = {'Percent_Time': percent_bins}
+    
+    if pyramid is not None:
+        # Read from the pyramid's per-year sorted index
+        for year in pyramid.arrays['ldc_fy']:
+            ldc_rows[str(year)] = pyramid.duration_curve(int(year))[1].tolist()
+    else:
+        for year in sorted(profile_df['Fiscal_Year'].unique()):
+            yearly = profile_df.loc[profile_df['Fiscal_Year'] == year, 'Demand_MW'].dropna().values
+            if len(yearly) == 0:
+                vals = [np.nan] * len(percent_bins)
+            else:
+                q = 100.0 - percent_bins
+                vals = np.percentile(yearly, q).tolist()
+            ldc_rows[str(year)] = vals
+    
+    ldc_100 = pd.DataFrame(ldc_rows)
+    yield 'Load_Duration_Curve', ldc_100
+    
+    # Summary sheet
+    summary_data = []
+    for fy in range(generator.start_year, generator.end_year + 1):
+        fy_mask = profile_df['Fiscal_Year'] == fy
+        if np.sum(fy_mask) > 0:
+            fy_data = profile_df.loc[fy_mask, 'Demand_MW']
+            summary_data.append({
+                'Fiscal_Year': f"FY{fy}",
+                'Peak_MW': f"{fy_data.max():.2f}",
+                'Average_MW': f"{fy_data.mean():.2f}",
+                'Min_MW': f"{fy_data.min():.2f}",
+                'Total_MWh': f"{fy_data.sum():.0f}",
+                'Load_Factor': f"{fy_data.mean() / fy_data.max():.3f}",
+                'Total_Hours': len(fy_data)
+            })
+    
+    if summary_data:
+        yield 'Summary', pd.DataFrame(summary_data)
+    
+    # Validation results
+    if generator.validation_results:
+        validation_summary = []
+        for key, value in generator.validation_results.items():
+            if isinstance(value, dict) and 'generated' in value:
+                validation_summary.append({
+                    'Metric': key,
+                    'Generated': value.get('generated', 0),
+                    'Target': value.get('target', 0),
+                    'Error %': value.get('error_pct', 0),
+                    'Peak': value.get('peak', 0),
+                    'Load Factor': value.get('load_factor', 0)
+                })
+        
+        if validation_summary:
+            yield 'Validation', pd.DataFrame(validation_summary)
+    
+    # Monthly statistics
+    monthly_stats = []
+    for fy in range(generator.start_year, generator.end_year + 1):
+        for month in range(1, 13):
+            mask = (profile_df['Fiscal_Year'] == fy) & (profile_df['fiscal_month'] == month)
+            if np.sum(mask) > 0:
+                month_data = profile_df.loc[mask, 'Demand_MW']
+                fiscal_month_names = {1: 'Apr', 2: 'May', 3: 'Jun', 4: 'Jul', 5: 'Aug', 6: 'Sep',
+                                    7: 'Oct', 8: 'Nov', 9: 'Dec', 10: 'Jan', 11: 'Feb', 12: 'Mar'}
+                monthly_stats.append({
+                    'Fiscal_Year': fy,
+                    'Month': fiscal_month_names[month],
+                    'Peak_MW': month_data.max(),
+                    'Average_MW': month_data.mean(),
+                    'Min_MW': month_data.min(),
+                    'Total_MWh': month_data.sum(),
+                    'Load_Factor': month_data.mean() / month_data.max() if month_data.max() > 0 else 0
+                })
+    
+    if monthly_stats:
+        yield 'Monthly_Statistics', pd.DataFrame(monthly_stats)
+    
+    # Pattern information
+    pattern_info = []
+    if method == 'stl' and 'stl' in patterns:
+        stl_info = patterns['stl']
+        pattern_info.append({
+            'Pattern_Type': 'STL_Decomposition',
+            'Metric': 'Trend_Strength',
+            'Value': f"{stl_info.get('trend_strength', 0):.3f}"
+        })
+        pattern_info.append({
+            'Pattern_Type': 'STL_Decomposition',
+            'Metric': 'Seasonal_Strength',
+            'Value': f"{stl_info.get('seasonal_strength', 0):.3f}"
+        })
+    else:
+        pattern_info.append({
+            'Pattern_Type': 'Normalized_Base_Year',
+            'Metric': 'Base_Year',
+            'Value': f"FY{generator.base_year}"
+        })
+    
+    if pattern_info:
+        yield 'Pattern_Info', pd.DataFrame(pattern_info)
+
+
 def main():
     """Optimized main function"""
     parser = argparse.ArgumentParser(description='Optimized Load Profile Generation System')
@@ -3343,8 +3448,10 @@ def main():
         print("OPTIMIZED LOAD PROFILE GENERATION SYSTEM", file=sys.stderr)
         print("="*80, file=sys.stderr)
         
+        # 3 steps here, 5 in generate_profile() and 2 for saving
+        progress.start_process(10, "Optimized Load Profile Generation")
+        
         # Load template data
-        progress.start_process(6, "Optimized Load Profile Generation")
         progress.update_progress("Loading template data")
         
         project_path = config.get('project_path')
@@ -3394,111 +3501,33 @@ def main():
         filename = f"{scenario_name}.xlsx"
         output_path = os.path.join(output_dir, filename)
         
-        # Save to Excel (unchanged output format)
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            # Main profile
-            profile_df.to_excel(writer, sheet_name='Load_Profile', index=False)
-            monthly_analysis(profile_df).to_excel(writer, sheet_name='Monthly_analysis', index=False)
-            seasonal_analysis(profile_df).to_excel(writer, sheet_name='Season_analysis', index=False)
-            daily_profile(profile_df).to_excel(writer, sheet_name='Daily_analysis', index=False)
-            
-            # Load Duration Curve
-            percent_bins = np.arange(1, 101)
-            ldc_rows = {'Percent_Time': percent_bins}
-            
-            for year in sorted(profile_df['Fiscal_Year'].unique()):
-                yearly = profile_df.loc[profile_df['Fiscal_Year'] == year, 'Demand_MW'].dropna().values
-                if len(yearly) == 0:
-                    vals = [np.nan] * len(percent_bins)
-                else:
-                    q = 100.0 - percent_bins
-                    vals = np.percentile(yearly, q).tolist()
-                ldc_rows[str(year)] = vals
-            
-            ldc_100 = pd.DataFrame(ldc_rows)
-            ldc_100.to_excel(writer, sheet_name='Load_Duration_Curve', index=False)
-            
-            # Summary sheet
-            summary_data = []
-            for fy in range(generator.start_year, generator.end_year + 1):
-                fy_mask = profile_df['Fiscal_Year'] == fy
-                if np.sum(fy_mask) > 0:
-                    fy_data = profile_df.loc[fy_mask, 'Demand_MW']
-                    summary_data.append({
-                        'Fiscal_Year': f"FY{fy}",
-                        'Peak_MW': f"{fy_data.max():.2f}",
-                        'Average_MW': f"{fy_data.mean():.2f}",
-                        'Min_MW': f"{fy_data.min():.2f}",
-                        'Total_MWh': f"{fy_data.sum():.0f}",
-                        'Load_Factor': f"{fy_data.mean() / fy_data.max():.3f}",
-                        'Total_Hours': len(fy_data)
-                    })
-            
-            if summary_data:
-                pd.DataFrame(summary_data).to_excel(writer, sheet_name='Summary', index=False)
-            
-            # Validation results
-            if generator.validation_results:
-                validation_summary = []
-                for key, value in generator.validation_results.items():
-                    if isinstance(value, dict) and 'generated' in value:
-                        validation_summary.append({
-                            'Metric': key,
-                            'Generated': value.get('generated', 0),
-                            'Target': value.get('target', 0),
-                            'Error %': value.get('error_pct', 0),
-                            'Peak': value.get('peak', 0),
-                            'Load Factor': value.get('load_factor', 0)
-                        })
-                
-                if validation_summary:
-                    pd.DataFrame(validation_summary).to_excel(writer, sheet_name='Validation', index=False)
-            
-            # Monthly statistics
-            monthly_stats = []
-            for fy in range(generator.start_year, generator.end_year + 1):
-                for month in range(1, 13):
-                    mask = (profile_df['Fiscal_Year'] == fy) & (profile_df['fiscal_month'] == month)
-                    if np.sum(mask) > 0:
-                        month_data = profile_df.loc[mask, 'Demand_MW']
-                        fiscal_month_names = {1: 'Apr', 2: 'May', 3: 'Jun', 4: 'Jul', 5: 'Aug', 6: 'Sep',
-                                            7: 'Oct', 8: 'Nov', 9: 'Dec', 10: 'Jan', 11: 'Feb', 12: 'Mar'}
-                        monthly_stats.append({
-                            'Fiscal_Year': fy,
-                            'Month': fiscal_month_names[month],
-                            'Peak_MW': month_data.max(),
-                            'Average_MW': month_data.mean(),
-                            'Min_MW': month_data.min(),
-                            'Total_MWh': month_data.sum(),
-                            'Load_Factor': month_data.mean() / month_data.max() if month_data.max() > 0 else 0
-                        })
-            
-            if monthly_stats:
-                pd.DataFrame(monthly_stats).to_excel(writer, sheet_name='Monthly_Statistics', index=False)
-            
-            # Pattern information
-            pattern_info = []
-            if method == 'stl' and 'stl' in patterns:
-                stl_info = patterns['stl']
-                pattern_info.append({
-                    'Pattern_Type': 'STL_Decomposition',
-                    'Metric': 'Trend_Strength',
-                    'Value': f"{stl_info.get('trend_strength', 0):.3f}"
-                })
-                pattern_info.append({
-                    'Pattern_Type': 'STL_Decomposition',
-                    'Metric': 'Seasonal_Strength',
-                    'Value': f"{stl_info.get('seasonal_strength', 0):.3f}"
-                })
-            else:
-                pattern_info.append({
-                    'Pattern_Type': 'Normalized_Base_Year',
-                    'Metric': 'Base_Year',
-                    'Value': f"FY{generator.base_year}"
-                })
-            
-            if pattern_info:
-                pd.DataFrame(pattern_info).to_excel(writer, sheet_name='Pattern_Info', index=False)
+        # Resolution pyramid (daily/weekly/monthly min/mean/max) and per-year
+        # load-duration index, also used for the Load_Duration_Curve sheet
+        pyramid = None
+        if PYRAMID_AVAILABLE:
+            try:
+                pyramid = build_profile_pyramid(profile_df)
+            except Exception as e:
+                print(f"Warning: could not build profile pyramid: {e}", file=sys.stderr)
+        
+        # Save to Excel (unchanged output format); sheets are built one at a time
+        sheets = output_sheets(profile_df, generator, pyramid, method, patterns)
+        if STREAMING_WRITER_AVAILABLE:
+            workbook_bytes = write_streaming_workbook(output_path, sheets, on_progress=progress.report_write)
+            print(f"Workbook written: {workbook_bytes / 1e6:.1f} MB", file=sys.stderr)
+        else:
+            with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+                for sheet_name, frame in sheets:
+                    frame.to_excel(writer, sheet_name=sheet_name, index=False)
+        
+        # Written after the workbook so the sidecar is not older than it
+        progress.update_progress("Saving resolution index")
+        if pyramid is not None:
+            try:
+                save_profile_pyramid(pyramid, pyramid_path_for(output_path))
+            except Exception as e:
+                # The range endpoint rebuilds a missing pyramid from the workbook
+                print(f"Warning: could not write profile pyramid: {e}", file=sys.stderr)
         
         progress.complete_process("Generation completed successfully")
         
@@ -3514,7 +3543,8 @@ def main():
             'method': generator.method,
             'base_year': int(generator.base_year),
             'generation_timestamp': datetime.now().isoformat(),
-            'profile_name': generator.profile_name
+            'profile_name': generator.profile_name,
+            'constraints': {key: value for key, value in generator.constraint_report.items() if key != 'years'}
         }
         
         # Print summary to stderr
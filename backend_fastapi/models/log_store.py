@@ -0,0 +1,302 @@
+"""
+Bounded Log Store
+=================
+
+Keeps memory flat for model runs that produce very large logs.
+
+- ``LogStore``: ring buffer of the most recent lines with monotonically
+  increasing sequence numbers. Every line is also appended to a spill file,
+  so clients that fall behind the ring can resume from any sequence number.
+  Writers may be worker threads; asyncio readers are woken through their own
+  event loop instead of sleep-polling.
+- ``LogFileTailer``: incremental reader for one or more growing log files
+  (e.g. ``solver_log_*.log``) that keeps an open handle and byte offset per
+  file and reads in bounded blocks.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from itertools import islice
+from pathlib import Path
+from typing import Dict, IO, List, Optional, Set, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPACITY = 5000
+SPILL_INDEX_STRIDE = 1000
+DEFAULT_READ_LIMIT = 2000
+TAIL_BLOCK_BYTES = 256 * 1024
+
+
+class LogStore:
+    """
+    Ring buffer of log lines with resumable sequence numbers.
+
+    Sequence numbers start at 1; ``last_seq`` is 0 while the store is empty.
+    Lines older than the ring are served from the spill file using a sparse
+    byte-offset index (one offset per ``SPILL_INDEX_STRIDE`` lines).
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, spill_path: Optional[Union[str, Path]] = None):
+        self.capacity = capacity
+        self.spill_path = Path(spill_path) if spill_path else None
+        self._lines: deque = deque(maxlen=capacity)
+        self._last_seq = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+        self._spill: Optional[IO[str]] = None
+        self._spill_index: List[int] = []
+        self._spill_offset = 0
+
+        if self.spill_path:
+            try:
+                self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+                self._spill = open(self.spill_path, 'w', encoding='utf-8', newline='\n')
+            except OSError as e:
+                logger.warning(f"Log spill file unavailable ({self.spill_path}): {e}")
+                self.spill_path = None
+
+    @property
+    def last_seq(self) -> int:
+        return self._last_seq
+
+    @property
+    def first_seq(self) -> int:
+        """Oldest sequence number still held in memory."""
+        return self._last_seq - len(self._lines) + 1
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def append(self, line: str) -> int:
+        """Add one line and wake any waiting readers. Returns its sequence number."""
+        with self._lock:
+            self._last_seq += 1
+            seq = self._last_seq
+            self._lines.append(line)
+            if self._spill is not None:
+                self._spill_line(seq, line)
+            waiters, self._waiters = self._waiters, set()
+        self._notify(waiters)
+        return seq
+
+    def _spill_line(self, seq: int, line: str):
+        if (seq - 1) % SPILL_INDEX_STRIDE == 0:
+            self._spill_index.append(self._spill_offset)
+        # One physical line per entry; embedded newlines are escaped
+        encoded = line.replace('\\', '\\\\').replace('\n', '\\n') + '\n'
+        try:
+            self._spill.write(encoded)
+            self._spill.flush()
+            self._spill_offset += len(encoded.encode('utf-8'))
+        except OSError as e:
+            logger.warning(f"Log spill write failed, continuing in memory only: {e}")
+            self._spill.close()
+            self._spill = None
+            self.spill_path = None
+
+    def close(self):
+        """Mark the run as finished; readers drain remaining lines and stop."""
+        with self._lock:
+            self._closed = True
+            if self._spill is not None:
+                self._spill.close()
+                self._spill = None
+            waiters, self._waiters = self._waiters, set()
+        self._notify(waiters)
+
+    @staticmethod
+    def _notify(waiters):
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # Loop already closed (client went away)
+                pass
+
+    def read(self, after_seq: int = 0, limit: int = DEFAULT_READ_LIMIT) -> Tuple[List[str], int, bool]:
+        """
+        Lines with sequence numbers greater than ``after_seq``.
+
+        Args:
+            after_seq: Last sequence number the reader has seen
+            limit: Maximum number of lines to return
+
+        Returns:
+            (lines, last sequence number returned, gap) where ``gap`` is True
+            when lines were lost because they left the ring and no spill file
+            is available
+        """
+        with self._lock:
+            after_seq = max(0, min(after_seq, self._last_seq))
+            first = self.first_seq
+            if after_seq + 1 >= first:
+                start = after_seq + 1 - first
+                lines = list(islice(self._lines, start, start + limit))
+                return lines, after_seq + len(lines), False
+            spill_path = self.spill_path if self._spill_index else None
+            if spill_path is None:
+                lines = list(islice(self._lines, 0, limit))
+                return lines, first - 1 + len(lines), True
+
+        lines = self._read_spill(spill_path, after_seq + 1, min(limit, first - after_seq - 1))
+        return lines, after_seq + len(lines), False
+
+    def _read_spill(self, path: Path, from_seq: int, count: int) -> List[str]:
+        block = (from_seq - 1) // SPILL_INDEX_STRIDE
+        skip = (from_seq - 1) % SPILL_INDEX_STRIDE
+        lines = []
+        with open(path, 'r', encoding='utf-8', newline='\n') as handle:
+            handle.seek(self._spill_index[block])
+            for _ in range(skip):
+                handle.readline()
+            while len(lines) < count:
+                raw = handle.readline()
+                if not raw:
+                    break
+                lines.append(_unescape(raw[:-1]))
+        return lines
+
+    async def wait(self, after_seq: int, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until a line newer than ``after_seq`` exists or the store closes.
+
+        Returns:
+            True if there is something to read (or the store closed), False on timeout
+        """
+        event = asyncio.Event()
+        waiter = (asyncio.get_running_loop(), event)
+        with self._lock:
+            if self._last_seq > after_seq or self._closed:
+                return True
+            self._waiters.add(waiter)
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._lock:
+                self._waiters.discard(waiter)
+
+    def tail(self, count: int = DEFAULT_CAPACITY) -> List[str]:
+        """Most recent lines held in memory."""
+        with self._lock:
+            return list(self._lines)[-count:]
+
+
+def _unescape(text: str) -> str:
+    if '\\' not in text:
+        return text
+    out, i = [], 0
+    while i < len(text):
+        ch = text[i]
+        if ch == '\\' and i + 1 < len(text):
+            nxt = text[i + 1]
+            out.append('\n' if nxt == 'n' else nxt)
+            i += 2
+        else:
+            out.append(ch)
+            i += 1
+    return ''.join(out)
+
+
+class LogFileTailer:
+    """
+    Incrementally read growing log files matching a glob in one directory.
+
+    Files are picked up as they appear (e.g. stage 1, stage 2 and later years
+    of a run) and read in order of creation. Each file keeps an open handle
+    and a byte offset, so a poll only costs a ``stat`` per file when nothing
+    changed. Partial trailing lines are held back until completed.
+
+    With ``since`` set (the run's start time), files last modified before it
+    are left out until they are written again, so logs kept from an earlier
+    run of the scenario are not replayed as live output.
+    """
+
+    def __init__(self, directory: Union[str, Path], pattern: str = "solver_log_*.log",
+                 block_bytes: int = TAIL_BLOCK_BYTES, since: Optional[float] = None):
+        self.directory = Path(directory)
+        self.pattern = pattern
+        self.block_bytes = block_bytes
+        self.since = since
+        self._handles: Dict[Path, IO[bytes]] = {}
+        self._offsets: Dict[Path, int] = {}
+        self._partial: Dict[Path, bytes] = {}
+
+    def _discover(self):
+        if not self.directory.exists():
+            return
+        found = []
+        for path in self.directory.glob(self.pattern):
+            if path in self._offsets:
+                continue
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            if self.since is None or mtime >= self.since:
+                found.append((mtime, path))
+        for _, path in sorted(found):
+            self._offsets[path] = 0
+            self._partial[path] = b''
+
+    def read(self, final: bool = False) -> List[Tuple[str, str]]:
+        """
+        Read whatever was appended since the last call.
+
+        Args:
+            final: Also flush incomplete trailing lines (run has finished)
+
+        Returns:
+            List of (file name, text) chunks, at most ``block_bytes`` per file
+        """
+        self._discover()
+        chunks = []
+        for path, offset in list(self._offsets.items()):
+            try:
+                size = path.stat().st_size
+            except OSError:
+                continue
+            if size < offset:
+                # File was rewritten; start over
+                offset = self._offsets[path] = 0
+                self._partial[path] = b''
+            if size == offset and not (final and self._partial[path]):
+                continue
+
+            handle = self._handles.get(path)
+            if handle is None:
+                handle = self._handles[path] = open(path, 'rb')
+            handle.seek(offset)
+            data = self._partial[path] + handle.read(self.block_bytes)
+            self._offsets[path] = handle.tell()
+
+            if final and self._offsets[path] >= size:
+                complete, self._partial[path] = data, b''
+            else:
+                cut = data.rfind(b'\n') + 1
+                complete, self._partial[path] = data[:cut], data[cut:]
+            if complete:
+                chunks.append((path.name, complete.decode('utf-8', errors='replace')))
+        return chunks
+
+    def pending(self) -> bool:
+        """True if any known file has unread bytes."""
+        for path, offset in self._offsets.items():
+            try:
+                if path.stat().st_size > offset:
+                    return True
+            except OSError:
+                continue
+        return False
+
+    def close(self):
+        for handle in self._handles.values():
+            handle.close()
+        self._handles.clear()
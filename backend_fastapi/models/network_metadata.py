@@ -0,0 +1,229 @@
+"""
+Header-Only Network Metadata
+============================
+
+Reads what the scenario/network listing routes need to know about a ``.nc``
+network (snapshot count, single- vs multi-period, investment periods,
+component counts, solver objective) from the NetCDF dimensions and
+attributes only, without building a ``pypsa.Network``:
+
+- dimension ``snapshots`` gives the snapshot count; ``<component>_i``
+  dimensions give the component counts
+- a ``snapshots_period`` variable marks MultiIndex (multi-period) snapshots;
+  periods come from the small ``investment_periods`` variable
+- for single-period networks only the first and last snapshot timestamps
+  are read
+- ``network__objective`` (PyPSA >= 1.0) or ``network_objective`` (older
+  releases, such as the pinned 0.30) is the objective of a solved network
+
+``NetworkIndex`` caches the headers per results folder, revalidating each
+file by its fingerprint (size + mtime), so listing a folder of 30 networks
+costs 30 ``stat`` calls once it has been read. If netCDF4 is unavailable or
+a header cannot be parsed, the network is loaded in full instead.
+"""
+
+import copy
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+try:
+    import netCDF4
+    NETCDF4_AVAILABLE = True
+except ImportError:
+    NETCDF4_AVAILABLE = False
+
+try:
+    from .analysis_cache import network_fingerprint
+except ImportError:
+    from analysis_cache import network_fingerprint
+
+logger = logging.getLogger(__name__)
+
+# Static component tables PyPSA writes as ``<name>_i`` dimensions
+COMPONENTS = ['buses', 'carriers', 'generators', 'loads', 'lines', 'links', 'transformers',
+              'storage_units', 'stores', 'shunt_impedances', 'global_constraints']
+
+
+def _timestamps(variable, positions: List[int]) -> List[Any]:
+    """Decode selected entries of a CF-encoded time variable to pandas Timestamps."""
+    import pandas as pd
+
+    if not {'units', 'calendar'} <= set(variable.ncattrs()):
+        return []
+    dates = netCDF4.num2date(variable[positions], variable.units, variable.calendar,
+                             only_use_cftime_datetimes=False, only_use_python_datetimes=True)
+    return [pd.Timestamp(date) for date in dates]
+
+
+def _header_from_file(path: Path) -> Dict[str, Any]:
+    with netCDF4.Dataset(str(path), 'r') as ds:
+        attrs = {name: ds.getncattr(name) for name in ds.ncattrs()}
+        dims = {name: len(dim) for name, dim in ds.dimensions.items()}
+        variables = ds.variables
+
+        snapshot_count = dims.get('snapshots', 0)
+        is_multi_period = 'snapshots_period' in variables
+        start = end = None
+
+        if is_multi_period:
+            if 'investment_periods' in variables and dims.get('investment_periods', 0) > 0:
+                periods = variables['investment_periods'][:].tolist()
+            else:
+                periods = sorted(set(variables['snapshots_period'][:].tolist()))
+            periods = [int(p) for p in periods]
+            time_variable = variables.get('snapshots_timestep')
+        else:
+            periods = []
+            time_variable = variables.get('snapshots_snapshot')
+
+        if time_variable is not None and snapshot_count > 0:
+            bounds = _timestamps(time_variable, [0, snapshot_count - 1])
+            if bounds:
+                start, end = bounds
+                if not is_multi_period:
+                    periods = [start.year]
+
+    objective = attrs.get('network__objective', attrs.get('network_objective'))
+    return {
+        'network_name': attrs.get('network_name'),
+        'pypsa_version': attrs.get('network_pypsa_version'),
+        'snapshot_count': int(snapshot_count),
+        'is_multi_period': bool(is_multi_period),
+        'periods': periods,
+        'start': start.isoformat() if start is not None else None,
+        'end': end.isoformat() if end is not None else None,
+        'components': {component: int(dims.get(f'{component}_i', 0)) for component in COMPONENTS},
+        'objective': float(objective) if objective is not None else None,
+        'is_solved': objective is not None,
+    }
+
+
+def _header_from_network(path: Path) -> Dict[str, Any]:
+    """Same fields from a fully loaded network (fallback)."""
+    try:
+        from .pypsa_analyzer import get_periods, get_time_index, has_component, is_multi_period, load_network_cached
+    except ImportError:
+        from pypsa_analyzer import get_periods, get_time_index, has_component, is_multi_period, load_network_cached
+
+    n = load_network_cached(str(path))
+    time_index = get_time_index(n.snapshots) if len(n.snapshots) else []
+    has_times = len(time_index) > 0 and hasattr(time_index[0], 'isoformat')
+    objective = getattr(n, 'objective', None) if getattr(n, 'is_solved', True) else None
+    return {
+        'network_name': getattr(n, 'name', None),
+        'pypsa_version': getattr(n, 'pypsa_version', None),
+        'snapshot_count': int(len(n.snapshots)),
+        'is_multi_period': bool(is_multi_period(n)),
+        'periods': [int(p) for p in get_periods(n)],
+        'start': time_index[0].isoformat() if has_times else None,
+        'end': time_index[-1].isoformat() if has_times else None,
+        'components': {
+            component: int(len(getattr(n, component))) if has_component(n, component) else 0
+            for component in COMPONENTS
+        },
+        'objective': float(objective) if objective is not None else None,
+        'is_solved': objective is not None,
+    }
+
+
+def read_network_header(network_path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Read a network file's metadata from its NetCDF header.
+
+    Args:
+        network_path: Path to the ``.nc`` file
+
+    Returns:
+        Dict with name, path, size, fingerprint, snapshot count, multi-period
+        flag, periods, first/last snapshot, component counts and objective
+    """
+    path = Path(network_path)
+    stat = path.stat()
+    header = None
+    if NETCDF4_AVAILABLE:
+        try:
+            header = _header_from_file(path)
+        except Exception as error:
+            logger.warning(f"Could not read NetCDF header of {path.name}, loading network: {error}")
+    if header is None:
+        header = _header_from_network(path)
+
+    return {
+        'name': path.name,
+        'path': str(path),
+        'size_mb': round(stat.st_size / (1024 * 1024), 2),
+        'fingerprint': network_fingerprint(path),
+        **header,
+    }
+
+
+class NetworkIndex:
+    """
+    Per-folder cache of network headers.
+
+    Entries are revalidated by fingerprint on every lookup, so rewritten,
+    added or removed ``.nc`` files are picked up without explicit
+    invalidation. Lookups return copies.
+    """
+
+    def __init__(self):
+        self._folders: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _entry(self, folder: Dict[str, Dict[str, Any]], path: Path) -> Dict[str, Any]:
+        entry = folder.get(path.name)
+        if entry is None or entry['fingerprint'] != network_fingerprint(path):
+            entry = read_network_header(path)
+        return entry
+
+    def folder(self, folder_path: Union[str, Path]) -> List[Dict[str, Any]]:
+        """Headers of every ``.nc`` file in a folder, sorted by file name."""
+        folder_path = Path(folder_path).resolve()
+        key = str(folder_path)
+        with self._lock:
+            cached = self._folders.get(key, {})
+
+        entries = {path.name: self._entry(cached, path) for path in sorted(folder_path.glob('*.nc'))}
+        with self._lock:
+            self._folders[key] = entries
+        return copy.deepcopy(list(entries.values()))
+
+    def get(self, network_path: Union[str, Path]) -> Dict[str, Any]:
+        """Header of one network file."""
+        path = Path(network_path).resolve()
+        key = str(path.parent)
+        with self._lock:
+            cached = self._folders.get(key, {})
+
+        entry = self._entry(cached, path)
+        with self._lock:
+            self._folders.setdefault(key, {})[path.name] = entry
+        return copy.deepcopy(entry)
+
+    def invalidate(self, folder_path: Optional[Union[str, Path]] = None):
+        """Forget one folder's headers, or all of them."""
+        with self._lock:
+            if folder_path is None:
+                self._folders.clear()
+            else:
+                self._folders.pop(str(Path(folder_path).resolve()), None)
+
+
+_global_network_index = NetworkIndex()
+
+
+def get_network_index() -> NetworkIndex:
+    """Get the process-wide network header index."""
+    return _global_network_index
+
+
+def network_header(network_path: Union[str, Path]) -> Dict[str, Any]:
+    """Cached header of one network file; see ``NetworkIndex.get``."""
+    return _global_network_index.get(network_path)
+
+
+def folder_networks(folder_path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Cached headers of a folder's networks; see ``NetworkIndex.folder``."""
+    return _global_network_index.folder(folder_path)
@@ -0,0 +1,320 @@
+"""
+Network Summary Sidecar
+=======================
+
+A compact summary of a solved network, written next to its ``.nc`` file at
+export time (``<stem>.summary.json.gz``) so result views can be served
+without reopening the network:
+
+- ``inventory``: component counts, snapshot count, investment periods and
+  the solver objective
+- ``carrier_annual``: per-carrier, per-year weighted energy, curtailment,
+  emissions and operating cost plus installed capacity per carrier
+- ``duration_curves``: generation and load duration curves sampled at
+  every percent of exceedance (0 = peak, 100 = minimum)
+- ``analyses``: the parameterless analyzer/inspector results the analysis
+  routes ask for most (availability, capacities, energy mix, capacity
+  factors, costs, curtailment, daily profiles, ...)
+
+The summary carries the network file's fingerprint (size + mtime, see
+``analysis_cache.network_fingerprint``); a rewritten network no longer
+matches and its summary is ignored. Hourly drill-downs (dispatch, storage
+operation, date-filtered views) still load the full network.
+"""
+
+import gzip
+import json
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    from .analysis_cache import _encode, network_fingerprint
+    from .pypsa_analyzer import (
+        NetworkInspector,
+        PyPSASingleNetworkAnalyzer,
+        detect_renewable_carriers,
+        get_capacity_column,
+        get_periods,
+        has_component,
+        is_multi_period,
+        safe_float,
+    )
+except ImportError:
+    from analysis_cache import _encode, network_fingerprint
+    from pypsa_analyzer import (
+        NetworkInspector,
+        PyPSASingleNetworkAnalyzer,
+        detect_renewable_carriers,
+        get_capacity_column,
+        get_periods,
+        has_component,
+        is_multi_period,
+        safe_float,
+    )
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_SUFFIX = '.summary.json.gz'
+# Bump when the summary layout or an included analysis changes its output
+SUMMARY_VERSION = 1
+MAX_MEMORY_SUMMARIES = 32
+
+INVENTORY_COMPONENTS = ['buses', 'carriers', 'generators', 'loads', 'lines', 'links', 'transformers',
+                        'storage_units', 'stores', 'global_constraints']
+
+# Analyses stored in the summary: name -> (component, method name). Names match
+# the analysis cache keys, so a route asks for either by the same name.
+SUMMARY_ANALYSES = {
+    'get_full_availability': ('inspector', 'get_full_availability'),
+    'get_network_metadata': ('analyzer', 'get_network_metadata'),
+    'get_total_capacities': ('analyzer', 'get_total_capacities'),
+    'get_energy_mix': ('analyzer', 'get_energy_mix'),
+    'get_capacity_factors': ('analyzer', 'get_capacity_factors'),
+    'get_renewable_share': ('analyzer', 'get_renewable_share'),
+    'get_emissions_tracking': ('analyzer', 'get_emissions_tracking'),
+    'get_system_costs': ('analyzer', 'get_system_costs'),
+    'get_curtailment': ('analyzer', 'get_curtailment'),
+    'get_daily_profiles': ('analyzer', 'get_daily_profiles'),
+    'get_capacity_factors_multi_period': ('analyzer', 'get_capacity_factors_multi_period'),
+    'get_renewable_share_multi_period': ('analyzer', 'get_renewable_share_multi_period'),
+    'get_curtailment_multi_period': ('analyzer', 'get_curtailment_multi_period'),
+}
+
+
+def summary_path(network_path: Union[str, Path]) -> Path:
+    """Sidecar summary file for a network file."""
+    network_path = Path(network_path)
+    return network_path.with_name(network_path.stem + SUMMARY_SUFFIX)
+
+
+def _inventory(n) -> Dict[str, Any]:
+    # Unsolved networks warn on every objective access
+    objective = getattr(n, 'objective', None) if getattr(n, 'is_solved', True) else None
+    multi_period = is_multi_period(n)
+    return {
+        'components': {
+            component: int(len(getattr(n, component))) if has_component(n, component) else 0
+            for component in INVENTORY_COMPONENTS
+        },
+        'snapshots': int(len(n.snapshots)),
+        'is_multi_period': bool(multi_period),
+        'investment_periods': [int(p) for p in get_periods(n)] if multi_period else [],
+        'objective': safe_float(objective) if objective is not None else None,
+    }
+
+
+def _carrier_annual(n, analyzer: PyPSASingleNetworkAnalyzer) -> Dict[str, Any]:
+    """Per (year, carrier) aggregates from the analyzer's carrier/period kernel."""
+    kernel = analyzer.kernel
+    shape = (len(kernel.years), len(kernel.carriers))
+    energy = np.zeros(shape)
+    curtailment = np.zeros(shape)
+    operating_cost = np.zeros(shape)
+
+    capacity_col = get_capacity_column(n, 'generators') if has_component(n, 'generators') else None
+    capacity = (n.generators[capacity_col].reindex(kernel.generators).astype(float).fillna(0.0)
+                if capacity_col else pd.Series(0.0, index=kernel.generators))
+
+    gen_p = n.generators_t.p if hasattr(n, 'generators_t') and hasattr(n.generators_t, 'p') else None
+    if gen_p is not None and not gen_p.empty:
+        actual = kernel.period_by_generator(gen_p)
+        energy = kernel.to_carriers(actual)
+
+        if 'marginal_cost' in n.generators.columns:
+            marginal_cost = n.generators['marginal_cost'].reindex(kernel.generators).astype(float).fillna(0.0)
+            operating_cost = kernel.to_carriers(actual * marginal_cost.to_numpy())
+
+        p_max_pu = n.generators_t.p_max_pu if hasattr(n.generators_t, 'p_max_pu') else None
+        if p_max_pu is not None and not p_max_pu.empty:
+            renewable = n.generators['carrier'].reindex(kernel.generators).isin(detect_renewable_carriers(n))
+            analyzed = renewable.to_numpy() & kernel.present(gen_p) & kernel.present(p_max_pu)
+            curtailed = kernel.period_by_generator(p_max_pu) * capacity.to_numpy() - actual
+            curtailment = kernel.to_carriers(np.where(analyzed, np.clip(curtailed, 0.0, None), 0.0))
+
+    emission_factors = np.zeros(len(kernel.carriers))
+    if hasattr(n, 'carriers') and 'co2_emissions' in n.carriers.columns:
+        emission_factors = n.carriers['co2_emissions'].reindex(kernel.carriers).astype(float).fillna(0.0).to_numpy()
+
+    return {
+        'years': list(kernel.years),
+        'carriers': list(kernel.carriers),
+        'hours': kernel.period_hours.tolist(),
+        'capacity_mw': np.asarray(kernel.carrier_sum(capacity)).tolist(),
+        'energy_mwh': energy.tolist(),
+        'curtailment_mwh': curtailment.tolist(),
+        'emissions_tco2': (energy * emission_factors).tolist(),
+        'operating_cost': operating_cost.tolist(),
+    }
+
+
+def _duration_quantiles(analyzer: PyPSASingleNetworkAnalyzer) -> Dict[str, Any]:
+    exceedance = np.arange(101)
+    curves = analyzer.get_duration_curve_columns()
+    result = {'exceedance_percent': exceedance.tolist(),
+              'snapshots': max((len(values) for values in curves.values()), default=0)}
+    for curve_type, values in curves.items():
+        # Sorted high to low, so exceedance p% is the (100 - p)th percentile
+        result[curve_type] = np.percentile(values, 100 - exceedance).tolist() if len(values) else []
+    return result
+
+
+def build_network_summary(network) -> Dict[str, Any]:
+    """
+    Compute the summary of a (solved) network.
+
+    Args:
+        network: PyPSA network
+
+    Returns:
+        Dict with ``inventory``, ``carrier_annual``, ``duration_curves`` and
+        ``analyses`` sections. An analysis that fails is left out, so the
+        routes compute it from the network instead.
+    """
+    analyzer = PyPSASingleNetworkAnalyzer(network)
+    components = {'analyzer': analyzer}
+    analyses = {}
+    for name, (component, method) in SUMMARY_ANALYSES.items():
+        if component not in components:
+            components[component] = NetworkInspector(network)
+        try:
+            analyses[name] = getattr(components[component], method)()
+        except Exception as error:
+            logger.warning(f"Network summary: {name} failed: {error}")
+
+    return {
+        'inventory': _inventory(network),
+        'carrier_annual': _carrier_annual(network, analyzer),
+        'duration_curves': _duration_quantiles(analyzer),
+        'analyses': analyses,
+    }
+
+
+def write_network_summary(network, network_path: Union[str, Path]) -> Optional[Path]:
+    """
+    Write the summary sidecar for a network that was just exported.
+
+    Call after ``export_to_netcdf`` so the recorded fingerprint matches the
+    file. Failures are logged, never raised: a missing summary only means
+    the routes load the network.
+
+    Args:
+        network: The exported PyPSA network (still in memory)
+        network_path: Path of the ``.nc`` file it was written to
+
+    Returns:
+        Path of the summary file, or None if it could not be written
+    """
+    network_path = Path(network_path)
+    path = summary_path(network_path)
+    try:
+        summary = build_network_summary(network)
+        envelope = {
+            'version': SUMMARY_VERSION,
+            'fingerprint': network_fingerprint(network_path),
+            'network': network_path.name,
+            'summary': summary,
+        }
+        tmp_path = path.with_name(path.name + '.tmp')
+        with gzip.open(tmp_path, 'wb', compresslevel=5) as handle:
+            handle.write(_encode(envelope))
+        tmp_path.replace(path)
+    except Exception as error:
+        logger.warning(f"Could not write network summary for {network_path.name}: {error}")
+        return None
+
+    logger.info(f"Network summary written: {path.name} ({len(summary['analyses'])} analyses)")
+    return path
+
+
+# Decoded summaries keyed by (resolved network path, fingerprint)
+_summaries: OrderedDict[Tuple[str, str], Dict[str, Any]] = OrderedDict()
+_summaries_lock = threading.Lock()
+
+
+def load_network_summary(network_path: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """
+    Read a network's summary if it exists and still matches the network file.
+
+    The returned dict is shared; use ``summary_analysis`` for a copy that may
+    be mutated.
+    """
+    network_path = Path(network_path).resolve()
+    path = summary_path(network_path)
+    if not path.exists() or not network_path.exists():
+        return None
+
+    fingerprint = network_fingerprint(network_path)
+    key = (str(network_path), fingerprint)
+    with _summaries_lock:
+        summary = _summaries.get(key)
+        if summary is not None:
+            _summaries.move_to_end(key)
+            return summary
+
+    try:
+        with gzip.open(path, 'rb') as handle:
+            envelope = json.loads(handle.read())
+    except (OSError, ValueError) as error:
+        logger.warning(f"Ignoring unreadable network summary {path.name}: {error}")
+        return None
+
+    if envelope.get('version') != SUMMARY_VERSION or envelope.get('fingerprint') != fingerprint:
+        logger.info(f"Ignoring stale network summary {path.name}")
+        return None
+
+    summary = envelope['summary']
+    with _summaries_lock:
+        _summaries[key] = summary
+        while len(_summaries) > MAX_MEMORY_SUMMARIES:
+            _summaries.popitem(last=False)
+    return summary
+
+
+def get_network_summary(network_path: Union[str, Path], load_network: Callable[[str], Any]) -> Dict[str, Any]:
+    """
+    The network's summary, writing the sidecar first if it is missing or stale.
+
+    Args:
+        network_path: Path to the ``.nc`` file
+        load_network: Loader called with the path when the summary has to be built
+
+    Returns:
+        Summary dict (shared; do not mutate)
+    """
+    summary = load_network_summary(network_path)
+    if summary is None:
+        network = load_network(str(network_path))
+        write_network_summary(network, network_path)
+        summary = load_network_summary(network_path) or build_network_summary(network)
+    return summary
+
+
+def has_network_summary(network_path: Union[str, Path]) -> bool:
+    """True if the network has a valid summary sidecar."""
+    return load_network_summary(network_path) is not None
+
+
+def summary_analysis(network_path: Union[str, Path], name: str) -> Optional[Any]:
+    """A copy of a parameterless analysis result from the summary, or None."""
+    summary = load_network_summary(network_path)
+    if summary is None or name not in summary['analyses']:
+        return None
+    return json.loads(_encode(summary['analyses'][name]))
+
+
+def invalidate_network_summary(network_path: Optional[Union[str, Path]] = None):
+    """Delete one network's summary sidecar, or just forget every loaded summary."""
+    with _summaries_lock:
+        if network_path is None:
+            _summaries.clear()
+            return
+        network_path = Path(network_path).resolve()
+        for key in [k for k in _summaries if k[0] == str(network_path)]:
+            del _summaries[key]
+    summary_path(network_path).unlink(missing_ok=True)
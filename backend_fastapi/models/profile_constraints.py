@@ -0,0 +1,231 @@
+"""
+Load Profile Constraint Solver
+==============================
+
+Applies the annual energy targets and the monthly peak limits of the load
+curve template to a generated hourly profile.
+
+Every adjustment is a uniform (shape-preserving) scale of one fiscal month,
+so the solver works on the (fiscal year x 12 months) table of month sums and
+month peaks instead of the hourly rows:
+
+1. one pass over the hourly values computes each month's energy and peak
+2. the monthly scale factors are solved on that table (a few hundred cells
+   for a 25-year profile)
+3. one pass multiplies every hour by its month's factor
+
+Solving starts from the annual scale (target / generated energy) capped at
+each month's peak limit. When a cap binds, the year falls short of its
+energy target; the shortfall is redistributed over the year's months that
+are still below their cap. Each such pass either meets the target or caps at
+least one more month, so the solver needs at most 12 passes; a year
+whose capped months cannot carry its target is reported as infeasible and
+keeps all months at their cap.
+
+A month's load factor (mean / peak) does not change under a uniform scale.
+Load-factor targets from the template are therefore compared against the
+generated shape and reported, not enforced.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+MONTHS_PER_YEAR = 12
+FISCAL_MONTH_NAMES = ['Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan', 'Feb', 'Mar']
+
+# Enough redistribution passes for every month of a year to reach its cap
+DEFAULT_MAX_PASSES = MONTHS_PER_YEAR
+# Relative annual energy error accepted as converged
+DEFAULT_TOLERANCE = 1e-9
+
+
+def monthly_target_table(sheet: Optional[pd.DataFrame], years: np.ndarray) -> np.ndarray:
+    """
+    Read a (year x fiscal month) target sheet such as ``max_demand``.
+
+    Args:
+        sheet: Template sheet with a ``financial_year`` / ``Year`` column and
+            one column per month name (Apr .. Mar)
+        years: Fiscal years of the profile, in order
+
+    Returns:
+        Array of shape (len(years), 12); NaN where a year or month has no
+        positive target
+    """
+    table = np.full((len(years), MONTHS_PER_YEAR), np.nan)
+    if sheet is None or sheet.empty:
+        return table
+
+    year_col = next((col for col in ('financial_year', 'Year', 'financial year') if col in sheet.columns), None)
+    if year_col is None:
+        return table
+
+    sheet_years = pd.to_numeric(sheet[year_col], errors='coerce')
+    values = sheet.reindex(columns=FISCAL_MONTH_NAMES).apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+    values = np.where(values > 0, values, np.nan)
+
+    # First row wins when a year appears twice
+    rows = pd.Series(np.arange(len(sheet)), index=sheet_years).loc[lambda r: ~r.index.duplicated()]
+    for i, year in enumerate(years):
+        if year in rows.index:
+            table[i] = values[rows[year]]
+    return table
+
+
+def _month_segments(fiscal_years: np.ndarray, fiscal_months: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Fiscal years, a (year, month) cell code per hour and a stable order grouping the cells."""
+    years, year_index = np.unique(fiscal_years, return_inverse=True)
+    codes = year_index * MONTHS_PER_YEAR + (fiscal_months.astype(int) - 1)
+    # Chronological profiles are already grouped; sort only if they are not
+    order = None if np.all(codes[1:] >= codes[:-1]) else np.argsort(codes, kind='stable')
+    return years, codes, order
+
+
+def _month_stats(values: np.ndarray, codes: np.ndarray, order: Optional[np.ndarray],
+                 n_cells: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Energy, peak and hour count per (year, month) cell in one pass."""
+    clean = np.nan_to_num(values, nan=0.0)
+    sums = np.bincount(codes, weights=clean, minlength=n_cells)
+    counts = np.bincount(codes, minlength=n_cells)
+
+    peaks = np.full(n_cells, np.nan)
+    sorted_codes = codes if order is None else codes[order]
+    sorted_values = values if order is None else values[order]
+    if len(sorted_codes):
+        starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+        peaks[sorted_codes[starts]] = np.fmax.reduceat(sorted_values, starts)
+    return sums, peaks, counts
+
+
+def solve_month_scales(sums: np.ndarray, peaks: np.ndarray, annual_targets: np.ndarray,
+                       peak_caps: np.ndarray, max_passes: int = DEFAULT_MAX_PASSES,
+                       tolerance: float = DEFAULT_TOLERANCE) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """
+    Solve the per-month scale factors.
+
+    Args:
+        sums: Generated energy per cell, shape (years, 12)
+        peaks: Generated peak per cell, shape (years, 12)
+        annual_targets: Energy target per year, NaN for none
+        peak_caps: Peak limit per cell, NaN for none
+        max_passes: Redistribution passes before giving up (0 only caps
+            the annually scaled months)
+        tolerance: Relative annual energy error accepted as converged
+
+    Returns:
+        (scale factors of shape (years, 12), convergence info)
+    """
+    targeted = np.isfinite(annual_targets)
+    year_energy = sums.sum(axis=1)
+    annual_scale = np.where(targeted & (year_energy > 0), annual_targets / np.where(year_energy > 0, year_energy, 1.0), 1.0)
+
+    has_cap = np.isfinite(peak_caps) & (peaks > 0)
+    cap_scale = np.where(has_cap, peak_caps / np.where(has_cap, peaks, 1.0), np.inf)
+
+    scales = np.minimum(annual_scale[:, None], cap_scale)
+    passes = 0
+    while True:
+        energy = scales * sums
+        achieved = energy.sum(axis=1)
+        errors = np.where(targeted, np.abs(annual_targets - achieved) / np.where(targeted, annual_targets, 1.0), 0.0)
+        if errors.max(initial=0.0) <= tolerance or passes == max_passes:
+            break
+
+        # Spread each year's remaining energy over its months still below their cap
+        free = (scales < cap_scale) & (sums > 0)
+        free_energy = np.where(free, energy, 0.0).sum(axis=1)
+        adjustable = targeted & (free_energy > 0) & (errors > tolerance)
+        if not adjustable.any():
+            break
+        factor = np.where(adjustable, (annual_targets - (achieved - free_energy)) / np.where(adjustable, free_energy, 1.0), 1.0)
+        scales = np.where(free & adjustable[:, None], np.minimum(scales * factor[:, None], cap_scale), scales)
+        passes += 1
+
+    return scales, {
+        'passes': passes,
+        'converged': bool(errors.max(initial=0.0) <= tolerance),
+        'annual_error': errors,
+    }
+
+
+def apply_profile_constraints(profile_df: pd.DataFrame, annual_targets: Dict[int, float],
+                              peak_limits: Optional[pd.DataFrame] = None,
+                              load_factor_targets: Optional[pd.DataFrame] = None,
+                              column: str = 'Demand_MW', max_passes: int = DEFAULT_MAX_PASSES,
+                              tolerance: float = DEFAULT_TOLERANCE) -> Dict[str, Any]:
+    """
+    Scale a profile in place to meet annual energy targets and monthly peak limits.
+
+    Args:
+        profile_df: Hourly profile with ``Fiscal_Year``, ``fiscal_month``
+            (1 = April) and the demand column
+        annual_targets: Energy target (MWh) per fiscal year
+        peak_limits: ``max_demand`` template sheet, or None for no monthly limits
+        load_factor_targets: ``load_factor`` template sheet, reported only
+        column: Demand column to scale
+        max_passes: Redistribution passes before giving up
+        tolerance: Relative annual energy error accepted as converged
+
+    Returns:
+        Convergence report: passes, converged flag, largest annual energy
+        error and peak excess (%), infeasible years and per-year results
+    """
+    values = profile_df[column].to_numpy(dtype=float)
+    years, codes, order = _month_segments(profile_df['Fiscal_Year'].to_numpy(), profile_df['fiscal_month'].to_numpy())
+    shape = (len(years), MONTHS_PER_YEAR)
+
+    sums, peaks, counts = (stat.reshape(shape) for stat in _month_stats(values, codes, order, shape[0] * shape[1]))
+    targets = np.array([annual_targets.get(int(year), np.nan) for year in years], dtype=float)
+    caps = monthly_target_table(peak_limits, years)
+
+    scales, info = solve_month_scales(sums, peaks, targets, caps, max_passes, tolerance)
+    profile_df[column] = values * scales.reshape(-1)[codes]
+
+    new_peaks = peaks * scales
+    excess = np.where(np.isfinite(caps), (new_peaks - caps) / np.where(np.isfinite(caps), caps, 1.0), 0.0)
+    capped = np.isfinite(caps) & np.isclose(new_peaks, caps, rtol=1e-9)
+    achieved = (sums * scales).sum(axis=1)
+    targeted = np.isfinite(targets)
+    infeasible = targeted & (info['annual_error'] > tolerance) & (achieved < targets)
+
+    report = {
+        'passes': int(info['passes']),
+        'converged': info['converged'],
+        'max_energy_error_pct': float(info['annual_error'].max(initial=0.0) * 100),
+        'max_peak_excess_pct': float(max(np.nanmax(excess, initial=0.0), 0.0) * 100),
+        'capped_months': int(capped.sum()),
+        'infeasible_years': [int(year) for year in years[infeasible]],
+        'years': {
+            int(year): {
+                'target': float(targets[i]) if targeted[i] else None,
+                'achieved': float(achieved[i]),
+                'error_pct': float(info['annual_error'][i] * 100),
+                'capped_months': int(capped[i].sum()),
+            }
+            for i, year in enumerate(years)
+        },
+    }
+
+    lf_targets = monthly_target_table(load_factor_targets, years)
+    if np.isfinite(lf_targets).any():
+        with np.errstate(divide='ignore', invalid='ignore'):
+            load_factors = sums / (counts * peaks)
+        deviation = np.abs(load_factors - lf_targets)
+        report['max_load_factor_deviation'] = float(np.nanmax(deviation)) if np.isfinite(deviation).any() else None
+
+    return report
+
+
+def format_constraint_report(report: Dict[str, Any]) -> str:
+    """One-line summary of a constraint report for the generator log."""
+    status = 'converged' if report['converged'] else 'NOT converged'
+    line = (f"Constraints {status} in {report['passes']} pass(es): "
+            f"max energy error {report['max_energy_error_pct']:.4f}%, "
+            f"{report['capped_months']} month(s) at peak limit")
+    if report['infeasible_years']:
+        line += f", infeasible FY{', FY'.join(str(year) for year in report['infeasible_years'])}"
+    if report.get('max_load_factor_deviation') is not None:
+        line += f", max load factor deviation {report['max_load_factor_deviation']:.3f}"
+    return line
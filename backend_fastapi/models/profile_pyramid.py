@@ -0,0 +1,384 @@
+"""
+Load Profile Resolution Pyramid
+===============================
+
+Pre-aggregated views of an hourly load profile so that range queries over
+many fiscal years never have to touch every hourly row.
+
+Levels (finest to coarsest):
+
+- ``hourly``: the raw Demand_MW series
+- ``daily``: min / mean / max per calendar day
+- ``weekly``: min / mean / max per 7-day block, counted from the first day
+  of each fiscal year so no block straddles two fiscal years
+- ``monthly``: min / mean / max per calendar month
+
+Alongside the levels the pyramid keeps a load-duration index per fiscal
+year: the year's hourly values sorted high to low, a lookup table of the
+value exceeded at every whole percent of the time (0 = peak, 100 = minimum)
+and the peak/minimum hour. Duration curves at any resolution and arbitrary
+percentiles are interpolated from the sorted values without re-sorting.
+
+The pyramid is written by the profile generator next to the workbook as
+``<profile>.pyramid.npz``. Profiles generated before the pyramid existed get
+one built from their ``Load_Profile`` sheet on first use.
+
+A range query picks the finest level that still fits the pixel budget for
+the requested window (at most one bucket per pixel), so a 25-year overview is
+served from monthly buckets and zooming in falls through to weekly, daily
+and finally hourly rows.
+"""
+
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+LEVELS = ('hourly', 'daily', 'weekly', 'monthly')
+PYRAMID_SUFFIX = '.pyramid.npz'
+PYRAMID_VERSION = 2
+DEFAULT_PIXELS = 1000
+DEFAULT_LDC_POINTS = 100
+
+# Exceedance percentages of the stored duration lookup table
+LDC_EXCEEDANCE = np.arange(101)
+
+HOUR = np.timedelta64(1, 'h')
+WEEK = np.timedelta64(7, 'D')
+
+
+def pyramid_path_for(profile_path: Union[str, Path]) -> Path:
+    """Sidecar path for a profile workbook (``<profile>.xlsx`` -> ``<profile>.pyramid.npz``)."""
+    profile_path = Path(profile_path)
+    return profile_path.with_name(profile_path.stem + PYRAMID_SUFFIX)
+
+
+def _aggregate(values: np.ndarray, fiscal_years: np.ndarray,
+               buckets: np.ndarray, ends: np.ndarray) -> Dict[str, np.ndarray]:
+    """Min/mean/max of values grouped by (fiscal year, bucket start)."""
+    frame = pd.DataFrame({'fy': fiscal_years, 'bucket': buckets, 'end': ends, 'value': values})
+    grouped = frame.groupby(['fy', 'bucket'], sort=True)
+    stats = grouped['value'].agg(['min', 'mean', 'max', 'count'])
+    bucket_end = grouped['end'].max()
+
+    return {
+        'time': stats.index.get_level_values('bucket').to_numpy().astype('datetime64[s]'),
+        'end': bucket_end.to_numpy().astype('datetime64[s]'),
+        'fy': stats.index.get_level_values('fy').to_numpy().astype(np.int32),
+        'min': stats['min'].to_numpy(dtype=float),
+        'mean': stats['mean'].to_numpy(dtype=float),
+        'max': stats['max'].to_numpy(dtype=float),
+        'count': stats['count'].to_numpy(dtype=np.int32),
+    }
+
+
+def _exceeded(sorted_desc: np.ndarray, percent_time: np.ndarray) -> np.ndarray:
+    """
+    Value exceeded ``percent_time`` % of the hours, from values sorted high to low.
+
+    Linear interpolation between hours, identical to
+    ``np.percentile(values, 100 - percent_time)``.
+    """
+    count = len(sorted_desc)
+    if count == 0:
+        return np.full(len(percent_time), np.nan)
+    positions = np.clip(np.asarray(percent_time, dtype=float), 0.0, 100.0) / 100.0 * (count - 1)
+    return np.interp(positions, np.arange(count), sorted_desc)
+
+
+def _duration_index(times: np.ndarray, values: np.ndarray, fiscal_years: np.ndarray) -> Dict[str, np.ndarray]:
+    """Sorted values, exceedance table and peak/minimum hour per fiscal year."""
+    years = np.unique(fiscal_years)
+    offsets = np.zeros(len(years) + 1, dtype=np.int64)
+    sorted_values, table = [], np.full((len(years), len(LDC_EXCEEDANCE)), np.nan)
+    peak_time = np.full(len(years), np.datetime64('NaT'), dtype='datetime64[s]')
+    min_time = peak_time.copy()
+    peak_value, min_value, mean_value = (np.full(len(years), np.nan) for _ in range(3))
+
+    for i, year in enumerate(years):
+        in_year = (fiscal_years == year) & ~np.isnan(values)
+        yearly, yearly_times = values[in_year], times[in_year]
+        order = np.argsort(-yearly, kind='stable')
+        sorted_values.append(yearly[order])
+        offsets[i + 1] = offsets[i] + len(order)
+        if len(order):
+            table[i] = _exceeded(yearly[order], LDC_EXCEEDANCE)
+            peak_time[i], min_time[i] = yearly_times[order[0]], yearly_times[order[-1]]
+            peak_value[i], min_value[i], mean_value[i] = yearly[order[0]], yearly[order[-1]], yearly.mean()
+
+    return {
+        'ldc_fy': years.astype(np.int32),
+        'ldc_offset': offsets,
+        'ldc_value': np.concatenate(sorted_values) if sorted_values else np.zeros(0),
+        'ldc_table': table,
+        'ldc_peak_time': peak_time,
+        'ldc_peak_value': peak_value,
+        'ldc_min_time': min_time,
+        'ldc_min_value': min_value,
+        'ldc_mean_value': mean_value,
+    }
+
+
+def build_profile_pyramid(profile_df: pd.DataFrame) -> 'ProfilePyramid':
+    """
+    Build all pyramid levels from a generated profile.
+
+    Args:
+        profile_df: DataFrame with DateTime, Fiscal_Year and Demand_MW columns
+
+    Returns:
+        ProfilePyramid
+    """
+    frame = profile_df[['DateTime', 'Fiscal_Year', 'Demand_MW']].dropna(subset=['DateTime'])
+    frame = frame.sort_values('DateTime', kind='stable')
+
+    times = pd.to_datetime(frame['DateTime']).to_numpy().astype('datetime64[s]')
+    values = pd.to_numeric(frame['Demand_MW'], errors='coerce').to_numpy(dtype=float)
+    fiscal_years = frame['Fiscal_Year'].to_numpy().astype(np.int32)
+    hour_ends = times + HOUR
+
+    days = times.astype('datetime64[D]')
+    months = times.astype('datetime64[M]')
+
+    # Weekly blocks start at the first day of each fiscal year
+    fy_start = pd.Series(days).groupby(fiscal_years).transform('min').to_numpy().astype('datetime64[D]')
+    weeks = fy_start + ((days - fy_start) // WEEK) * WEEK
+
+    arrays = {
+        'version': np.array(PYRAMID_VERSION),
+        'hourly_time': times,
+        'hourly_end': hour_ends,
+        'hourly_fy': fiscal_years,
+        'hourly_value': values,
+    }
+    for level, buckets in (('daily', days), ('weekly', weeks), ('monthly', months)):
+        aggregated = _aggregate(values, fiscal_years, buckets.astype('datetime64[s]'), hour_ends)
+        arrays.update({f"{level}_{key}": array for key, array in aggregated.items()})
+    arrays.update(_duration_index(times, values, fiscal_years))
+
+    return ProfilePyramid(arrays)
+
+
+class ProfilePyramid:
+    """
+    In-memory pyramid: one set of sorted column arrays per level.
+
+    Hourly arrays are ``time``, ``end``, ``fy`` and ``value``; aggregated
+    levels carry ``time``, ``end``, ``fy``, ``min``, ``mean``, ``max`` and
+    ``count`` (hours per bucket). ``time`` is the bucket start and ``end`` the
+    exclusive end of its last hour. The ``ldc_*`` arrays hold the
+    load-duration index, one entry (or table row) per fiscal year.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.arrays = arrays
+
+    def column(self, level: str, name: str) -> np.ndarray:
+        return self.arrays[f"{level}_{name}"]
+
+    @property
+    def fiscal_years(self) -> List[int]:
+        return sorted(int(fy) for fy in np.unique(self.column('hourly', 'fy')))
+
+    @property
+    def extent(self) -> Tuple[Optional[np.datetime64], Optional[np.datetime64]]:
+        times = self.column('hourly', 'time')
+        if len(times) == 0:
+            return None, None
+        return times[0], self.column('hourly', 'end')[-1]
+
+    def window(self, level: str, start: Optional[np.datetime64] = None, end: Optional[np.datetime64] = None,
+               fiscal_year: Optional[int] = None, months: Optional[Iterable[int]] = None) -> np.ndarray:
+        """
+        Positions of the buckets of one level that overlap ``[start, end]``.
+
+        Args:
+            level: Pyramid level name
+            start: Window start (inclusive), None for open
+            end: Window end (inclusive), None for open
+            fiscal_year: Restrict to one fiscal year
+            months: Restrict to buckets starting in these calendar months
+
+        Returns:
+            Integer index array into the level's columns
+        """
+        times = self.column(level, 'time')
+        ends = self.column(level, 'end')
+
+        # Buckets never straddle fiscal years, so starts and ends are both
+        # sorted and two binary searches bound the window.
+        lo = 0 if start is None else int(np.searchsorted(ends, start, side='right'))
+        hi = len(times) if end is None else int(np.searchsorted(times, end, side='right'))
+        positions = np.arange(lo, max(lo, hi))
+
+        if fiscal_year is not None:
+            positions = positions[self.column(level, 'fy')[positions] == fiscal_year]
+        if months:
+            bucket_months = times[positions].astype('datetime64[M]').astype(int) % 12 + 1
+            positions = positions[np.isin(bucket_months, list(months))]
+        return positions
+
+    def select_level(self, start: Optional[np.datetime64] = None, end: Optional[np.datetime64] = None,
+                     pixels: int = DEFAULT_PIXELS, fiscal_year: Optional[int] = None,
+                     months: Optional[Iterable[int]] = None) -> Tuple[str, np.ndarray]:
+        """
+        Pick the finest level whose bucket count in the window fits ``pixels``.
+
+        Falls back to the coarsest level when even monthly buckets exceed the
+        budget. Weekly buckets are skipped when filtering by month because a
+        week can span two months.
+
+        Returns:
+            (level name, index array into that level)
+        """
+        pixels = max(int(pixels), 1)
+        positions = np.arange(0)
+        level = LEVELS[-1]
+        for level in LEVELS:
+            if months and level == 'weekly':
+                continue
+            positions = self.window(level, start, end, fiscal_year, months)
+            if len(positions) <= pixels:
+                break
+        return level, positions
+
+    def _ldc_position(self, fiscal_year: int) -> int:
+        years = self.arrays['ldc_fy']
+        position = int(np.searchsorted(years, fiscal_year))
+        if position == len(years) or years[position] != fiscal_year:
+            raise KeyError(fiscal_year)
+        return position
+
+    def sorted_values(self, fiscal_year: int) -> np.ndarray:
+        """The fiscal year's hourly values sorted high to low (a view, do not modify)."""
+        position = self._ldc_position(fiscal_year)
+        offsets = self.arrays['ldc_offset']
+        return self.arrays['ldc_value'][offsets[position]:offsets[position + 1]]
+
+    def duration_curve(self, fiscal_year: int, points: int = DEFAULT_LDC_POINTS) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Load-duration curve of one fiscal year.
+
+        Args:
+            fiscal_year: Fiscal year
+            points: Number of curve points, evenly spaced over ``(0, 100]`` %
+                of the time. The default 100 points (1 %, 2 %, ... 100 %) are
+                read from the stored lookup table.
+
+        Returns:
+            (percent of time, value exceeded that share of the hours)
+
+        Raises:
+            KeyError: If the fiscal year is not in the profile
+        """
+        points = max(int(points), 1)
+        percent_time = 100.0 * np.arange(1, points + 1) / points
+        if points == DEFAULT_LDC_POINTS:
+            return percent_time, self.arrays['ldc_table'][self._ldc_position(fiscal_year), 1:]
+        return percent_time, _exceeded(self.sorted_values(fiscal_year), percent_time)
+
+    def percentiles(self, fiscal_year: int, percentiles: Iterable[float]) -> np.ndarray:
+        """Demand percentiles (``np.percentile`` semantics) of one fiscal year."""
+        return _exceeded(self.sorted_values(fiscal_year), 100.0 - np.asarray(list(percentiles), dtype=float))
+
+    def peak(self, fiscal_year: int) -> Dict[str, object]:
+        """Peak and minimum hour, their values and the mean of one fiscal year."""
+        position = self._ldc_position(fiscal_year)
+        offsets = self.arrays['ldc_offset']
+        return {
+            'peak_time': self.arrays['ldc_peak_time'][position],
+            'peak_mw': float(self.arrays['ldc_peak_value'][position]),
+            'min_time': self.arrays['ldc_min_time'][position],
+            'min_mw': float(self.arrays['ldc_min_value'][position]),
+            'mean_mw': float(self.arrays['ldc_mean_value'][position]),
+            'hours': int(offsets[position + 1] - offsets[position]),
+        }
+
+    def columns(self, level: str, positions: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Output columns for the selected buckets.
+
+        ``Demand_MW`` is the hourly value or the bucket mean, so callers that
+        only plot one line can ignore the level; aggregated levels add
+        ``Min_MW`` / ``Max_MW`` for an envelope.
+        """
+        data = {'DateTime': self.column(level, 'time')[positions]}
+        if level == 'hourly':
+            data['Demand_MW'] = self.column(level, 'value')[positions]
+        else:
+            data['Demand_MW'] = self.column(level, 'mean')[positions]
+            data['Min_MW'] = self.column(level, 'min')[positions]
+            data['Max_MW'] = self.column(level, 'max')[positions]
+            data['Hours'] = self.column(level, 'count')[positions]
+        data['Fiscal_Year'] = self.column(level, 'fy')[positions]
+        return data
+
+
+def save_profile_pyramid(pyramid: ProfilePyramid, path: Union[str, Path]) -> Path:
+    """Write the pyramid arrays to an uncompressed ``.npz`` (fast to memory-load)."""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb') as handle:
+        np.savez(handle, **pyramid.arrays)
+    tmp_path.replace(path)
+    return path
+
+
+def _read_profile_sheet(profile_path: Path) -> pd.DataFrame:
+    """Read only the columns the pyramid needs from a profile workbook."""
+    return pd.read_excel(
+        profile_path,
+        sheet_name='Load_Profile',
+        usecols=['DateTime', 'Fiscal_Year', 'Demand_MW'],
+        engine='openpyxl'
+    )
+
+
+_cache: Dict[Path, Tuple[float, ProfilePyramid]] = {}
+_cache_lock = threading.Lock()
+
+
+def load_profile_pyramid(profile_path: Union[str, Path]) -> ProfilePyramid:
+    """
+    Load the pyramid for a profile workbook, building the sidecar if it is
+    missing or older than the workbook. Results are cached per process and
+    invalidated when the sidecar changes on disk.
+
+    Args:
+        profile_path: Path to ``<profile>.xlsx``
+
+    Returns:
+        ProfilePyramid
+    """
+    profile_path = Path(profile_path)
+    sidecar = pyramid_path_for(profile_path)
+
+    with _cache_lock:
+        fresh = sidecar.exists() and (
+            not profile_path.exists() or sidecar.stat().st_mtime >= profile_path.stat().st_mtime
+        )
+        if fresh:
+            mtime = sidecar.stat().st_mtime
+            cached = _cache.get(sidecar)
+            if cached and cached[0] == mtime:
+                return cached[1]
+            with np.load(sidecar) as stored:
+                arrays = {name: stored[name] for name in stored.files}
+            if int(arrays.get('version', 0)) == PYRAMID_VERSION:
+                pyramid = ProfilePyramid(arrays)
+                _cache[sidecar] = (mtime, pyramid)
+                return pyramid
+
+        logger.info(f"Building load profile pyramid for {profile_path.name}")
+        pyramid = build_profile_pyramid(_read_profile_sheet(profile_path))
+        try:
+            save_profile_pyramid(pyramid, sidecar)
+            _cache[sidecar] = (sidecar.stat().st_mtime, pyramid)
+        except OSError as error:
+            logger.warning(f"Could not write pyramid for {profile_path.name}: {error}")
+        return pyramid
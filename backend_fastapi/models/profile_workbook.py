@@ -0,0 +1,183 @@
+"""
+Streaming Profile Workbook Writer
+=================================
+
+``load_profile_generation.py`` used to build every output sheet as a full
+DataFrame and write them all through ``pd.ExcelWriter`` (openpyxl), which
+keeps the whole workbook as cell objects in memory until it is saved. Peak
+memory grew to several times the hourly profile and the save often took
+longer than the generation.
+
+``write_streaming_workbook`` writes the same sheets with XlsxWriter in
+``constant_memory`` mode: each row is flushed to the sheet's temporary XML
+file as soon as the next row starts, so only one row is ever held. Sheets
+are taken from an iterable of ``(sheet name, DataFrame)`` pairs and written
+one at a time; a caller that builds each frame lazily only has one analysis
+table alive at once.
+
+Cells keep the layout ``DataFrame.to_excel(index=False)`` produced: a bold,
+bordered header row, numbers as numbers, timestamps and dates with the
+pandas default number formats and blanks for missing values. Columns are
+converted to Python values a chunk of rows at a time, and progress (rows and
+bytes written) is reported per chunk.
+"""
+
+import datetime as dt
+import math
+import os
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+CHUNK_ROWS = 8760
+DATETIME_FORMAT = 'yyyy-mm-dd hh:mm:ss'
+DATE_FORMAT = 'yyyy-mm-dd'
+EXCEL_EPOCH = np.datetime64('1899-12-30')
+
+ProgressCallback = Callable[[str, int, int, int], None]
+
+
+def _sheet_bytes(worksheet) -> int:
+    """Bytes of sheet XML flushed so far (constant-memory temp file)."""
+    fh = getattr(worksheet, 'fh', None)
+    try:
+        return fh.tell() if fh is not None else 0
+    except (OSError, ValueError):
+        return 0
+
+
+class _ColumnWriter:
+    """Cell values of one DataFrame column, converted a chunk of rows at a time."""
+
+    def __init__(self, series: pd.Series, formats: Dict[str, Any]):
+        self.kind = series.dtype.kind
+        self.formats = formats
+        if self.kind == 'M' and getattr(series.dt, 'tz', None) is not None:
+            series = series.dt.tz_localize(None)
+        self.series = series
+
+    def chunk(self, start: int, stop: int) -> Tuple[List[Any], Optional[Any]]:
+        """Cell values of rows [start, stop) (None for blanks) and their number format."""
+        values = self.series.iloc[start:stop]
+        if self.kind == 'M':
+            serial = (values.to_numpy(dtype='datetime64[ns]') - EXCEL_EPOCH) / np.timedelta64(1, 'D')
+            return [None if np.isnan(v) else v for v in serial.tolist()], self.formats['datetime']
+        if self.kind in 'iubf':
+            return values.to_numpy().tolist(), None
+        return values.tolist(), None
+
+
+def _write_cell(worksheet, row: int, col: int, value: Any, formats: Dict[str, Any]):
+    """Write one value the way ``to_excel`` would (objects, headers)."""
+    if value is None or (isinstance(value, float) and value != value):
+        return
+    if isinstance(value, (bool, np.bool_)):
+        worksheet.write_boolean(row, col, bool(value))
+    elif isinstance(value, (int, float, np.integer, np.floating)):
+        if np.isfinite(value):
+            worksheet.write_number(row, col, float(value))
+    elif isinstance(value, (pd.Timestamp, dt.datetime)):
+        if not pd.isna(value):
+            worksheet.write_datetime(row, col, pd.Timestamp(value).tz_localize(None).to_pydatetime(),
+                                     formats['datetime'])
+    elif isinstance(value, dt.date):
+        worksheet.write_datetime(row, col, value, formats['date'])
+    else:
+        worksheet.write_string(row, col, str(value))
+
+
+def write_frame(workbook, sheet_name: str, frame: pd.DataFrame, formats: Dict[str, Any],
+                on_progress: Optional[ProgressCallback] = None, written_before: int = 0,
+                chunk_rows: int = CHUNK_ROWS) -> int:
+    """
+    Write a DataFrame as a new sheet (header row + values, no index).
+
+    Returns:
+        Bytes of sheet XML written
+    """
+    worksheet = workbook.add_worksheet(sheet_name)
+    for col, name in enumerate(frame.columns):
+        if isinstance(name, (int, float, np.integer, np.floating)) and not isinstance(name, bool):
+            worksheet.write_number(0, col, float(name), formats['header'])
+        else:
+            worksheet.write_string(0, col, str(name), formats['header'])
+
+    columns = [_ColumnWriter(frame.iloc[:, i], formats) for i in range(frame.shape[1])]
+    n_rows = len(frame)
+    for start in range(0, n_rows, chunk_rows):
+        stop = min(start + chunk_rows, n_rows)
+        chunk = [column.chunk(start, stop) for column in columns]
+        for offset in range(stop - start):
+            row = start + offset + 1
+            for col, (values, number_format) in enumerate(chunk):
+                value = values[offset]
+                if value is None:
+                    continue
+                if number_format is not None:
+                    worksheet.write_number(row, col, value, number_format)
+                elif type(value) is float or type(value) is int:
+                    if math.isfinite(value):
+                        worksheet.write_number(row, col, value)
+                elif type(value) is bool:
+                    worksheet.write_boolean(row, col, value)
+                else:
+                    _write_cell(worksheet, row, col, value, formats)
+        if on_progress is not None:
+            on_progress(sheet_name, stop, n_rows, written_before + _sheet_bytes(worksheet))
+
+    sheet_bytes = _sheet_bytes(worksheet)
+    if on_progress is not None and n_rows == 0:
+        on_progress(sheet_name, 0, 0, written_before + sheet_bytes)
+    return sheet_bytes
+
+
+def write_streaming_workbook(output_path: str, sheets: Iterable[Tuple[str, pd.DataFrame]],
+                             on_progress: Optional[ProgressCallback] = None,
+                             chunk_rows: int = CHUNK_ROWS) -> int:
+    """
+    Write sheets to an ``.xlsx`` file with a constant-memory writer.
+
+    Args:
+        output_path: Workbook to create (replaced atomically)
+        sheets: ``(sheet name, DataFrame)`` pairs, consumed one at a time
+        on_progress: Called per chunk with (sheet, rows written, sheet rows,
+            total sheet XML bytes written so far)
+        chunk_rows: Rows converted and written per chunk
+
+    Returns:
+        Size of the finished workbook in bytes
+    """
+    if not XLSXWRITER_AVAILABLE:
+        raise ImportError("xlsxwriter is required for the streaming workbook writer")
+
+    # Hidden temp name so folder listings never pick up a half-written workbook
+    directory, filename = os.path.split(output_path)
+    tmp_path = os.path.join(directory, f".{filename}.{os.getpid()}.tmp")
+    workbook = xlsxwriter.Workbook(tmp_path, {'constant_memory': True})
+    formats = {
+        'header': workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}),
+        'datetime': workbook.add_format({'num_format': DATETIME_FORMAT}),
+        'date': workbook.add_format({'num_format': DATE_FORMAT}),
+    }
+    try:
+        written = 0
+        for sheet_name, frame in sheets:
+            written += write_frame(workbook, sheet_name, frame, formats, on_progress, written, chunk_rows)
+        workbook.close()
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            workbook.close()
+        except Exception:
+            pass
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return os.path.getsize(output_path)
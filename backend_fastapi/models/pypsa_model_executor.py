@@ -1406,9 +1406,26 @@ from pathlib import Path
 import time
 import traceback
 import sys
-import io
 import threading
 
+try:
+    from analysis_cache import warm_analysis_cache
+    ANALYSIS_CACHE_AVAILABLE = True
+except ImportError:
+    ANALYSIS_CACHE_AVAILABLE = False
+
+try:
+    from network_summary import has_network_summary, write_network_summary
+    NETWORK_SUMMARY_AVAILABLE = True
+except ImportError:
+    NETWORK_SUMMARY_AVAILABLE = False
+
+try:
+    from solver_profiles import resolve_solver_profile
+    SOLVER_PROFILES_AVAILABLE = True
+except ImportError:
+    SOLVER_PROFILES_AVAILABLE = False
+
 
 # ============================================================================
 # MAIN EXECUTION FUNCTION
@@ -1472,6 +1489,19 @@ def run_pypsa_model_complete(project_folder: str, scenario_name: str, logger):
         execution_time = time.time() - start_time
         logger.success(f"Total execution time: {execution_time:.2f} seconds")
 
+        # Precompute the standard analyses for the networks just written so
+        # opening the results (even after a restart) is served from cache.
+        # Networks with a summary sidecar already answer those from it.
+        if result.get('success') and ANALYSIS_CACHE_AVAILABLE:
+            exported = [
+                nc_file for nc_file in Path(output_folder).glob('*.nc')
+                if nc_file.stat().st_mtime >= start_time
+                and not (NETWORK_SUMMARY_AVAILABLE and has_network_summary(nc_file))
+            ]
+            if exported:
+                warm_analysis_cache(exported)
+                logger.info(f"Warming analysis cache for {len(exported)} network(s) in the background")
+
         return {
             "success": True,
             "output_folder": output_folder,
@@ -1596,8 +1626,14 @@ def extract_settings(data: dict, config: dict, logger) -> dict:
     logger.info(f"  - Multi-year setting: {multi_year_setting}")
 
     # Calculate capital weighting
+    representative_days = None
     if snapshot_condition == 'All Snapshots':
         capital_weighting = 1
+    elif is_representative_days(snapshot_condition):
+        # Snapshot weightings scale the representative days back to the full year
+        capital_weighting = 1
+        representative_days = get_representative_day_count(snapshot_condition, settings_main)
+        logger.info(f"  - Representative days: {representative_days}")
     elif snapshot_condition == 'Critical days':
         capital_weighting = 365 * 24 / (24 * weightings)  # Simplified calculation
     else:  # Peak weeks
@@ -1615,6 +1651,7 @@ def extract_settings(data: dict, config: dict, logger) -> dict:
         'base_year': base_year,
         'multi_year_setting': multi_year_setting,
         'capital_weighting': capital_weighting,
+        'representative_days': representative_days,
         'year_list': year_list,
         'settings_main': settings_main,
         'settings_tables': settings_tables
@@ -1626,14 +1663,20 @@ def extract_settings(data: dict, config: dict, logger) -> dict:
 # ============================================================================
 
 class SolverOutputCapture:
-    """Context manager to capture solver output and stream to logger"""
+    """
+    Context manager to capture solver output and stream to logger.
+
+    Output is written through to ``log_file_path`` as it arrives (line
+    buffered) rather than accumulated in memory, so the file can be tailed
+    while the solver runs and long runs do not grow the process.
+    """
 
     def __init__(self, logger, log_file_path=None):
         self.logger = logger
         self.log_file_path = log_file_path
         self.original_stdout = None
         self.original_stderr = None
-        self.captured_output = io.StringIO()
+        self.log_file = None
         self.stop_flag = threading.Event()
 
     def __enter__(self):
@@ -1641,6 +1684,12 @@ class SolverOutputCapture:
         self.original_stdout = sys.stdout
         self.original_stderr = sys.stderr
 
+        if self.log_file_path:
+            try:
+                self.log_file = open(self.log_file_path, 'w', buffering=1, encoding='utf-8')
+            except Exception as e:
+                self.logger.warning(f"Could not open solver log file: {e}")
+
         class TeeOutput:
             def __init__(self, original, capture, logger, stop_flag):
                 self.original = original
@@ -1652,7 +1701,11 @@ class SolverOutputCapture:
             def write(self, text):
                 if text and not self.stop_flag.is_set():
                     self.original.write(text)
-                    self.capture.write(text)
+                    if self.capture is not None:
+                        try:
+                            self.capture.write(text)
+                        except Exception:
+                            pass
                     self.buffer += text
 
                     while '\n' in self.buffer:
@@ -1683,8 +1736,8 @@ class SolverOutputCapture:
                         pass
                     self.buffer = ""
 
-        sys.stdout = TeeOutput(self.original_stdout, self.captured_output, self.logger, self.stop_flag)
-        sys.stderr = TeeOutput(self.original_stderr, self.captured_output, self.logger, self.stop_flag)
+        sys.stdout = TeeOutput(self.original_stdout, self.log_file, self.logger, self.stop_flag)
+        sys.stderr = TeeOutput(self.original_stderr, self.log_file, self.logger, self.stop_flag)
 
         return self
 
@@ -1700,12 +1753,12 @@ class SolverOutputCapture:
         sys.stdout = self.original_stdout
         sys.stderr = self.original_stderr
 
-        if self.log_file_path:
+        if self.log_file is not None:
             try:
-                with open(self.log_file_path, 'w') as f:
-                    f.write(self.captured_output.getvalue())
+                self.log_file.close()
             except Exception as e:
                 self.logger.warning(f"Could not write solver log to file: {e}")
+            self.log_file = None
 
         return False
 
@@ -1847,6 +1900,50 @@ def generate_snapshots_single_year(input_file_name, year, snapshot_condition, we
     return full_datetime_ranges, date_range
 
 
+def generate_representative_snapshots_single_year(data, year, n_days, weightings, logger):
+    """
+    Generate representative-day snapshots for a single financial year.
+
+    Args:
+        data: Loaded data sheets (uses demand_df1 and P_max_pu_df1)
+        year: Financial year
+        n_days: Number of representative days k
+        weightings: Temporal resolution in hours
+        logger: Logger instance
+
+    Returns:
+        tuple: (snapshots, full_datetime_range, snapshot weights)
+    """
+    logger.info(f"Clustering FY{year} into {n_days} representative days")
+
+    date_range = pd.date_range(
+        start=f'{year-1}-04-01',
+        end=f'{year}-03-31 23:59:00',
+        freq='h',
+        inclusive='left'
+    )
+    profiles = fiscal_year_profiles(data['demand_df1'][year], data['P_max_pu_df1'], year)
+    clustering = cluster_representative_days(profiles, n_days)
+    log_representative_days(clustering, f"FY{year}", logger)
+
+    snapshots, snapshot_weights = representative_snapshots(clustering, weightings)
+    logger.success(f"Generated {len(snapshots)} snapshots for FY{year}")
+    return snapshots, date_range, snapshot_weights
+
+
+def apply_representative_weightings(network, snapshot_weights, weightings):
+    """
+    Weight objective and generator energy by the days each snapshot represents.
+
+    Store weightings stay at the plain resolution so storage state of charge
+    evolves hour by hour within the representative days.
+    """
+    weights = pd.Series(np.asarray(snapshot_weights, dtype=float), index=network.snapshots)
+    network.snapshot_weightings['objective'] = weights
+    network.snapshot_weightings['generators'] = weights
+    network.snapshot_weightings['stores'] = float(weightings)
+
+
 def prepare_time_series_data(P_max_pu_df1, P_min_pu_df1, demand_df1, year,
                              full_datetime_ranges, snapshots_df, logger):
     """Prepare and filter time series data for the given snapshots"""
@@ -1871,6 +1968,203 @@ def prepare_time_series_data(P_max_pu_df1, P_min_pu_df1, demand_df1, year,
     return P_max_pu_df, P_min_pu_df, demand_df
 
 
+# ============================================================================
+# REPRESENTATIVE DAY CLUSTERING
+# ============================================================================
+
+REPRESENTATIVE_DAYS_CONDITION = 'Representative days'
+DEFAULT_REPRESENTATIVE_DAYS = 12
+
+
+def is_representative_days(snapshot_condition) -> bool:
+    """True for 'Representative days' / 'Representative days (k)' snapshot conditions"""
+    return str(snapshot_condition).strip().lower().startswith(REPRESENTATIVE_DAYS_CONDITION.lower())
+
+
+def get_representative_day_count(snapshot_condition, settings_main) -> int:
+    """
+    Number of representative days k.
+
+    Taken from the condition text ('Representative days (24)'), else from a
+    'Representative Days' row in Main_Settings, else DEFAULT_REPRESENTATIVE_DAYS.
+    """
+    match = re.search(r'\((\d+)\)', str(snapshot_condition))
+    if match:
+        return max(2, int(match.group(1)))
+
+    if settings_main is not None:
+        rows = settings_main[settings_main['Setting'].astype(str).str.strip().str.lower() == 'representative days']
+        if len(rows) > 0:
+            try:
+                return max(2, int(float(rows['Option'].values[0])))
+            except (TypeError, ValueError):
+                pass
+
+    return DEFAULT_REPRESENTATIVE_DAYS
+
+
+def cluster_representative_days(profiles: pd.DataFrame, n_days: int, demand_column: str = 'demand') -> dict:
+    """
+    Pick k representative days from hourly demand and P_max_pu profiles.
+
+    The day holding the annual demand peak is always kept as its own cluster.
+    The remaining days are grouped into k-1 clusters with Ward hierarchical
+    clustering on their normalized 24-hour vectors (demand weighted as much
+    as all resource profiles together), and each cluster is represented by
+    its medoid day.
+
+    Args:
+        profiles: Hourly DataFrame indexed by timestamp; one column per profile
+        n_days: Number of representative days k (including the peak day)
+        demand_column: Column holding demand
+
+    Returns:
+        dict with 'days' (representative dates, chronological), 'weights'
+        (days represented by each), 'peak_day', 'assignment' (Series date ->
+        representative date), 'total_days' and 'errors' (approximation error
+        metrics, see representative_day_errors)
+    """
+    from scipy.cluster.hierarchy import linkage, fcluster
+
+    profiles = profiles.astype(float).fillna(0.0)
+    dates = profiles.index.normalize()
+    hours_per_day = pd.Series(1, index=dates).groupby(level=0).size()
+    full_days = hours_per_day.index[hours_per_day == 24]
+    profiles = profiles[dates.isin(full_days)]
+
+    n_total = len(full_days)
+    if n_total == 0:
+        raise ValueError("No complete days available for representative day clustering")
+
+    columns = list(profiles.columns)
+    cube = profiles.to_numpy().reshape(n_total, 24, len(columns))
+
+    # Normalize each profile to its own scale; demand carries as much weight as the resource profiles combined
+    scale = np.abs(cube).max(axis=(0, 1))
+    scale[scale == 0] = 1.0
+    features = cube / scale
+    demand_idx = columns.index(demand_column)
+    features[:, :, demand_idx] *= np.sqrt(max(1, len(columns) - 1))
+    features = features.reshape(n_total, -1)
+
+    peak_pos = int(np.argmax(cube[:, :, demand_idx].max(axis=1)))
+    rest = np.array([i for i in range(n_total) if i != peak_pos])
+    n_clusters = min(max(1, n_days - 1), len(rest))
+
+    representatives = {peak_pos: [peak_pos]}
+    if len(rest) > 0:
+        if n_clusters >= len(rest):
+            labels = np.arange(len(rest))
+        else:
+            labels = fcluster(linkage(features[rest], method='ward'), t=n_clusters, criterion='maxclust')
+
+        for label in np.unique(labels):
+            members = rest[labels == label]
+            block = features[members]
+            norms = (block ** 2).sum(axis=1)
+            distances = np.maximum(norms[:, None] + norms[None, :] - 2 * block @ block.T, 0).sum(axis=1)
+            representatives[int(members[np.argmin(distances)])] = members.tolist()
+
+    assignment = np.empty(n_total, dtype=int)
+    for medoid, members in representatives.items():
+        assignment[members] = medoid
+
+    order = sorted(representatives)
+    result = {
+        'days': [full_days[i] for i in order],
+        'weights': [len(representatives[i]) for i in order],
+        'peak_day': full_days[peak_pos],
+        'assignment': pd.Series(full_days[assignment], index=full_days),
+        'total_days': n_total,
+    }
+    result['errors'] = representative_day_errors(cube, assignment, columns, demand_column)
+    return result
+
+
+def representative_day_errors(cube: np.ndarray, assignment: np.ndarray, columns: list, demand_column: str) -> dict:
+    """
+    Approximation error of replacing every day by its representative.
+
+    Returns:
+        dict with demand energy error, hourly NRMSE, load-duration-curve NRMSE,
+        peak error (all in %) and the largest capacity factor deviation of any
+        P_max_pu profile (in percentage points)
+    """
+    demand_idx = columns.index(demand_column)
+    actual = cube[:, :, demand_idx].ravel()
+    approx = cube[assignment][:, :, demand_idx].ravel()
+    peak = actual.max() if actual.max() != 0 else 1.0
+    mean = actual.mean() if actual.mean() != 0 else 1.0
+
+    errors = {
+        'energy_error_pct': float((approx.sum() - actual.sum()) / (actual.sum() or 1.0) * 100),
+        'hourly_nrmse_pct': float(np.sqrt(np.mean((approx - actual) ** 2)) / mean * 100),
+        'ldc_nrmse_pct': float(np.sqrt(np.mean((np.sort(approx) - np.sort(actual)) ** 2)) / peak * 100),
+        'peak_error_pct': float((approx.max() - actual.max()) / peak * 100),
+        'max_cf_error_pp': 0.0,
+    }
+
+    cf_errors = [
+        abs(cube[assignment][:, :, i].mean() - cube[:, :, i].mean()) * 100
+        for i, column in enumerate(columns) if column != demand_column
+    ]
+    if cf_errors:
+        errors['max_cf_error_pp'] = float(max(cf_errors))
+    return errors
+
+
+def representative_snapshots(clustering: dict, weightings: float):
+    """
+    Snapshots and per-snapshot weights for a clustering result.
+
+    Each representative day contributes 24/weightings snapshots, each weighted
+    by weightings hours x the number of days it represents, so the weights sum
+    to the hours of all clustered days.
+
+    Returns:
+        tuple: (DatetimeIndex of snapshots, Series of weights indexed by snapshot)
+    """
+    step = max(1, int(weightings))
+    snapshots, weights = [], []
+    for day, n_represented in zip(clustering['days'], clustering['weights']):
+        hours = pd.date_range(start=day, periods=24 // step, freq=f'{step}h')
+        snapshots.extend(hours)
+        weights.extend([step * n_represented] * len(hours))
+
+    index = pd.DatetimeIndex(snapshots)
+    return index, pd.Series(weights, index=index, dtype=float)
+
+
+def log_representative_days(clustering: dict, label: str, logger):
+    """Write the clustering summary and approximation error to the run log"""
+    errors = clustering['errors']
+    n_selected = len(clustering['days'])
+    logger.info(
+        f"{label}: {n_selected} representative days for {clustering['total_days']} days "
+        f"({clustering['total_days'] / max(1, n_selected):.1f}x fewer snapshots), "
+        f"peak day {clustering['peak_day']:%Y-%m-%d} kept"
+    )
+    logger.info(
+        f"  Approximation error: energy {errors['energy_error_pct']:+.2f}%, "
+        f"hourly NRMSE {errors['hourly_nrmse_pct']:.2f}%, "
+        f"LDC NRMSE {errors['ldc_nrmse_pct']:.2f}%, "
+        f"peak {errors['peak_error_pct']:+.2f}%, "
+        f"max CF deviation {errors['max_cf_error_pp']:.2f} pp"
+    )
+
+
+def fiscal_year_profiles(demand: pd.Series, P_max_pu_df1: pd.DataFrame, year) -> pd.DataFrame:
+    """Hourly demand + P_max_pu profiles for one financial year (April to March)"""
+    date_range = pd.date_range(start=f'{year-1}-04-01', end=f'{year}-03-31 23:59:00', freq='h', inclusive='left')
+    n_hours = min(len(date_range), len(demand), len(P_max_pu_df1))
+
+    profiles = P_max_pu_df1.iloc[:n_hours].select_dtypes(include='number').reset_index(drop=True)
+    profiles = profiles.set_axis([f"p_max_pu:{c}" for c in profiles.columns], axis=1)
+    profiles.insert(0, 'demand', pd.to_numeric(demand.iloc[:n_hours], errors='coerce').to_numpy())
+    profiles.index = date_range[:n_hours]
+    return profiles
+
+
 # ============================================================================
 # COMPONENT ADDITION FUNCTIONS
 # ============================================================================
@@ -2665,6 +2959,19 @@ def combined_constraints(n, snapshots, settings_main, Setting_df, logger):
 # MODEL EXECUTION FUNCTIONS
 # ============================================================================
 
+def select_solver_options(config, logger) -> dict:
+    """HiGHS options for the next solve from the scenario's solver profile (empty: HiGHS defaults)"""
+    if not SOLVER_PROFILES_AVAILABLE:
+        return {}
+
+    profile, solver_options = resolve_solver_profile(config)
+    if solver_options:
+        logger.info(f"Solver profile: {profile} ({', '.join(f'{k}={v}' for k, v in solver_options.items())})")
+    else:
+        logger.info(f"Solver profile: {profile} (HiGHS defaults)")
+    return solver_options
+
+
 def run_single_year_model(data, settings, config, output_folder, input_file_name, logger):
     """
     Run single-year dispatch model with two-stage optimization.
@@ -2699,9 +3006,15 @@ def run_single_year_model(data, settings, config, output_folder, input_file_name
             logger.info("=" * 80)
 
             # Generate snapshots
-            snapshots_df, full_datetime_ranges = generate_snapshots_single_year(
-                input_file_name, year, snapshot_condition, weightings, logger
-            )
+            snapshot_weights = None
+            if is_representative_days(snapshot_condition):
+                snapshots_df, full_datetime_ranges, snapshot_weights = generate_representative_snapshots_single_year(
+                    data, year, settings['representative_days'], weightings, logger
+                )
+            else:
+                snapshots_df, full_datetime_ranges = generate_snapshots_single_year(
+                    input_file_name, year, snapshot_condition, weightings, logger
+                )
 
             # Prepare time series data
             P_max_pu_df, P_min_pu_df, demand_df = prepare_time_series_data(
@@ -2715,6 +3028,8 @@ def run_single_year_model(data, settings, config, output_folder, input_file_name
             pypsa_model.name = scenario_name
             pypsa_model.set_snapshots(snapshots_df)
             pypsa_model.snapshot_weightings = pd.Series(weightings, index=pypsa_model.snapshots)
+            if snapshot_weights is not None:
+                apply_representative_weightings(pypsa_model, snapshot_weights, weightings)
             logger.info(f"Network created with {len(pypsa_model.snapshots)} snapshots")
 
             # Add buses
@@ -2821,7 +3136,7 @@ def run_single_year_model(data, settings, config, output_folder, input_file_name
             logger.info("-" * 80)
 
             log_file_path = os.path.join(output_folder, f'solver_log_{year}_stage1.log')
-            solver_options = {}
+            solver_options = select_solver_options(config, logger)
 
             # Capture solver output
             with SolverOutputCapture(logger, log_file_path):
@@ -2868,7 +3183,8 @@ def run_single_year_model(data, settings, config, output_folder, input_file_name
             logger.info("-" * 80)
 
             log_file_path = os.path.join(output_folder, f'solver_log_{year}_stage2.log')
-            
+            solver_options = select_solver_options(config, logger)
+
             # Check if constraints are enabled
             monthly_enabled = settings_main[settings_main['Setting'] == 'Monthly constraints']['Option'].values
             battery_enabled = settings_main[settings_main['Setting'] == 'Battery Cycle']['Option'].values
@@ -2917,6 +3233,8 @@ def run_single_year_model(data, settings, config, output_folder, input_file_name
             nc_file = os.path.join(output_folder, f'{year}_network.nc')
             pypsa_model.export_to_netcdf(nc_file)
             logger.info(f"Network exported to NetCDF: {nc_file}")
+            if NETWORK_SUMMARY_AVAILABLE:
+                write_network_summary(pypsa_model, nc_file)
 
             # Log summary statistics
             logger.info("")
@@ -3036,6 +3354,44 @@ def generate_multiyear_snapshots(input_file_name, year_list, snapshot_condition,
     return df_main.index, df_main['demand']
 
 
+def generate_multiyear_representative_snapshots(data, year_list, n_days, weightings, logger):
+    """
+    Cluster each financial year into representative days.
+
+    Returns:
+        tuple: (snapshots, demand Series, snapshot weights, P_max_pu rows,
+        P_min_pu rows), all aligned position by position with the snapshots
+    """
+    logger.info(f"Clustering {len(year_list)} years into {n_days} representative days each...")
+
+    snapshots_list, weights_list, demand_list, positions_list = [], [], [], []
+    for fy in year_list:
+        profiles = fiscal_year_profiles(data['demand_df1'][fy], data['P_max_pu_df1'], fy)
+        clustering = cluster_representative_days(profiles, n_days)
+        log_representative_days(clustering, f"FY{fy}", logger)
+
+        snapshots, weights = representative_snapshots(clustering, weightings)
+        positions = ((snapshots - pd.Timestamp(fy - 1, 4, 1)) // pd.Timedelta(hours=1)).to_numpy()
+        snapshots_list.append(snapshots)
+        weights_list.append(weights)
+        demand_list.append(profiles['demand'].iloc[positions])
+        positions_list.append(positions)
+
+    all_snapshots = pd.DatetimeIndex(np.concatenate([idx.values for idx in snapshots_list]))
+    all_weights = pd.concat(weights_list)
+    all_demand = pd.Series(np.concatenate([d.to_numpy() for d in demand_list]), index=all_snapshots, name='demand')
+    positions = np.concatenate(positions_list)
+    P_max_pu_multi = data['P_max_pu_df1'].iloc[positions].reset_index(drop=True)
+    P_min_pu_multi = data['P_min_pu_df1'].iloc[positions].reset_index(drop=True)
+
+    full_hours = sum(w.sum() for w in weights_list) / max(1, weightings)
+    logger.info(
+        f"Generated {len(all_snapshots)} total snapshots across {len(year_list)} years "
+        f"(full resolution: {full_hours:,.0f})"
+    )
+    return all_snapshots, all_demand, all_weights, P_max_pu_multi, P_min_pu_multi
+
+
 def run_multi_year_model(data, settings, config, output_folder, input_file_name, logger):
     """
     Run multi-year capacity expansion model with investment periods.
@@ -3061,9 +3417,16 @@ def run_multi_year_model(data, settings, config, output_folder, input_file_name,
 
         # Generate multi-year snapshots
         logger.info("Generating multi-year snapshots...")
-        all_snapshots, all_demand = generate_multiyear_snapshots(
-            input_file_name, year_list, snapshot_condition, weightings, logger
-        )
+        snapshot_weights = None
+        if is_representative_days(snapshot_condition):
+            all_snapshots, all_demand, snapshot_weights, P_max_pu_multi, P_min_pu_multi = \
+                generate_multiyear_representative_snapshots(
+                    data, year_list, settings['representative_days'], weightings, logger
+                )
+        else:
+            all_snapshots, all_demand = generate_multiyear_snapshots(
+                input_file_name, year_list, snapshot_condition, weightings, logger
+            )
 
         # Create network
         logger.info("Initializing multi-year PyPSA network...")
@@ -3082,6 +3445,8 @@ def run_multi_year_model(data, settings, config, output_folder, input_file_name,
         pypsa_model.snapshots = pd.MultiIndex.from_arrays([years, all_snapshots], names=['period', 'timestep'])
         pypsa_model.investment_periods = year_list
         pypsa_model.snapshot_weightings = pd.Series(weightings, index=pypsa_model.snapshots)
+        if snapshot_weights is not None:
+            apply_representative_weightings(pypsa_model, snapshot_weights, weightings)
 
         # Investment period weightings
         pypsa_model.investment_period_weightings["years"] = list(np.diff(year_list)) + [1]
@@ -3105,17 +3470,18 @@ def run_multi_year_model(data, settings, config, output_folder, input_file_name,
         pypsa_model.add("Load", "load", bus='Main_Bus', p_set=all_demand.values)
         logger.info(f"Total demand across all years: {all_demand.sum():,.2f} MWh")
 
-        # Prepare multi-year time series
-        logger.info("Preparing multi-year time series profiles...")
-        P_max_pu_multi = pd.DataFrame()
-        P_min_pu_multi = pd.DataFrame()
-        
-        for year in year_list:
-            date_rng = pd.date_range(start=f"{year-1}-04-01", end=f"{year}-03-31 23:59:00", freq='h')
-            P_max_pu = data['P_max_pu_df1'].iloc[:len(date_rng)].copy()
-            P_min_pu = data['P_min_pu_df1'].iloc[:len(date_rng)].copy()
-            P_max_pu_multi = pd.concat([P_max_pu_multi, P_max_pu], ignore_index=True)
-            P_min_pu_multi = pd.concat([P_min_pu_multi, P_min_pu], ignore_index=True)
+        # Prepare multi-year time series (representative days are already aligned to the snapshots)
+        if snapshot_weights is None:
+            logger.info("Preparing multi-year time series profiles...")
+            P_max_pu_multi = pd.DataFrame()
+            P_min_pu_multi = pd.DataFrame()
+
+            for year in year_list:
+                date_rng = pd.date_range(start=f"{year-1}-04-01", end=f"{year}-03-31 23:59:00", freq='h')
+                P_max_pu = data['P_max_pu_df1'].iloc[:len(date_rng)].copy()
+                P_min_pu = data['P_min_pu_df1'].iloc[:len(date_rng)].copy()
+                P_max_pu_multi = pd.concat([P_max_pu_multi, P_max_pu], ignore_index=True)
+                P_min_pu_multi = pd.concat([P_min_pu_multi, P_min_pu], ignore_index=True)
 
         # Add base generators
         logger.info("Adding base generators for multi-year model...")
@@ -3173,7 +3539,7 @@ def run_multi_year_model(data, settings, config, output_folder, input_file_name,
         logger.info("-" * 80)
 
         log_file_path = os.path.join(output_folder, 'solver_log_multiyear.log')
-        solver_options = {}
+        solver_options = select_solver_options(config, logger)
 
         logger.info("Starting multi-period optimization (this may take a while)...")
 
@@ -3208,6 +3574,8 @@ def run_multi_year_model(data, settings, config, output_folder, input_file_name,
         nc_file = os.path.join(output_folder, f'{scenario_name}_multiyear.nc')
         pypsa_model.export_to_netcdf(nc_file)
         logger.info(f"Network exported to NetCDF: {nc_file}")
+        if NETWORK_SUMMARY_AVAILABLE:
+            write_network_summary(pypsa_model, nc_file)
 
         logger.info("")
         logger.info("Multi-year Summary:")
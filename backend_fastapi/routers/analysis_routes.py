@@ -12,15 +12,21 @@ Endpoints:
 
 from fastapi import APIRouter, HTTPException, Query
 from pathlib import Path
-from typing import List
-import openpyxl
+from typing import List, Optional
 import logging
+import math
+
+from models.http_cache import cache_on_files, profile_source
+from models.lazy_imports import lazy_import
+
+openpyxl = lazy_import('openpyxl')
+profile_pyramid = lazy_import('models.profile_pyramid')
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.get("/analysis-data")
+@router.get("/analysis-data", dependencies=[cache_on_files(profile_source)])
 async def get_analysis_data(
     projectPath: str = Query(..., description="Project root path"),
     profileName: str = Query(..., description="Profile name"),
@@ -120,7 +126,7 @@ async def get_analysis_data(
         raise HTTPException(status_code=500, detail="An internal server error occurred.")
 
 
-@router.get("/profile-years")
+@router.get("/profile-years", dependencies=[cache_on_files(profile_source)])
 async def get_profile_years(
     projectPath: str = Query(..., description="Project root path"),
     profileName: str = Query(..., description="Profile name")
@@ -178,76 +184,85 @@ async def get_profile_years(
         raise HTTPException(status_code=500, detail="An error occurred.")
 
 
-@router.get("/load-duration-curve")
+def _finite_or_none(value) -> Optional[float]:
+    """``float(value)``, or None for NaN/inf (not valid JSON)."""
+    value = float(value)
+    return value if math.isfinite(value) else None
+
+
+@router.get("/load-duration-curve", dependencies=[cache_on_files(profile_source)])
 async def get_load_duration_curve(
     projectPath: str = Query(..., description="Project root path"),
     profileName: str = Query(..., description="Profile name"),
-    fiscalYear: str = Query(..., description="Fiscal year (e.g., FY2024)")
+    fiscalYear: str = Query(..., description="Fiscal year (e.g., FY2024)"),
+    points: int = Query(100, ge=1, le=8784, description="Number of curve points over 0-100% of the time"),
+    percentiles: Optional[str] = Query(None, description="Comma-separated demand percentiles, e.g. '5,50,95'")
 ):
     """
     Get load duration curve data for a specific fiscal year.
 
-    Reads the Load_Duration_Curve sheet and extracts:
-    - Percent_Time column (X-axis)
-    - Year column (Y-axis values) - extracted from fiscalYear (FY2024 -> 2024)
+    Served from the load-duration index in the profile's pyramid sidecar
+    (built from the Load_Profile sheet once if the profile predates it), so
+    neither the curve nor the percentiles re-sort the hourly values.
 
     Args:
         projectPath: Project root directory
         profileName: Name of the profile (without .xlsx)
         fiscalYear: Fiscal year to extract (e.g., 'FY2024')
+        points: Curve resolution; the default 100 points match the
+            Load_Duration_Curve sheet (1% .. 100%)
+        percentiles: Optional demand percentiles to return for markers
 
     Returns:
-        dict: Chart data with Percent_Time and demand values
+        dict: Chart data with Percent_Time and demand values, the year's
+        peak/minimum hour and the requested percentiles
     """
     if not projectPath or not profileName or not fiscalYear:
         raise HTTPException(status_code=400, detail="Missing required parameters.")
 
+    try:
+        fiscal_year = int(fiscalYear.replace('FY', '') if fiscalYear.startswith('FY') else fiscalYear)
+        requested = [float(p) for p in percentiles.split(',') if p.strip()] if percentiles else []
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid fiscal year or percentile.")
+    if any(not 0 <= p <= 100 for p in requested):
+        raise HTTPException(status_code=400, detail="Percentiles must be between 0 and 100.")
+
     file_path = Path(projectPath) / "results" / "load_profiles" / f"{profileName}.xlsx"
 
     try:
         if not file_path.exists():
             raise HTTPException(status_code=404, detail="Profile file not found.")
 
-        workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
-        sheet_name = 'Load_Duration_Curve'
-
-        if sheet_name not in workbook.sheetnames:
-            workbook.close()
-            raise HTTPException(status_code=404, detail=f"Sheet '{sheet_name}' not found.")
-
-        worksheet = workbook[sheet_name]
-
-        # Read headers
-        headers = [str(cell.value) for cell in next(worksheet.iter_rows(min_row=1, max_row=1))]
-
-        if 'Percent_Time' not in headers:
-            workbook.close()
-            raise HTTPException(status_code=404, detail="'Percent_Time' column not found in Load_Duration_Curve sheet.")
-
-        # Extract year number from fiscalYear (e.g., 'FY2024' -> '2024')
-        year_number = fiscalYear.replace('FY', '') if fiscalYear.startswith('FY') else fiscalYear
-
-        # Check if year column exists
-        if year_number not in headers:
-            workbook.close()
-            raise HTTPException(status_code=404, detail=f"Year '{year_number}' column not found in Load_Duration_Curve sheet. Available columns: {headers}")
-
-        # Find column indices
-        percent_time_idx = headers.index('Percent_Time')
-        year_idx = headers.index(year_number)
-
-        # Read data rows
-        chart_data = []
-        for row in worksheet.iter_rows(min_row=2, values_only=True):
-            if row[percent_time_idx] is not None and row[year_idx] is not None:
-                chart_data.append({
-                    'Percent_Time': float(row[percent_time_idx]),
-                    'Demand_MW': float(row[year_idx])
-                })
-
-        workbook.close()
-
-        return {"success": True, "data": chart_data}
+        pyramid = profile_pyramid.load_profile_pyramid(file_path)
+        if fiscal_year not in pyramid.fiscal_years:
+            available = [f"FY{year}" for year in pyramid.fiscal_years]
+            raise HTTPException(status_code=404, detail=f"Fiscal year '{fiscalYear}' not found in profile. Available: {available}")
+
+        # A fiscal year whose demand cells are all blank has no curve: its
+        # index row, peak and percentiles are NaN, which JSON cannot encode
+        percent_time, demand = pyramid.duration_curve(fiscal_year, points)
+        chart_data = [
+            {'Percent_Time': float(percent), 'Demand_MW': float(value)}
+            for percent, value in zip(percent_time, demand)
+            if math.isfinite(value)
+        ]
+
+        peak = pyramid.peak(fiscal_year)
+        for key in ('peak_mw', 'min_mw', 'mean_mw'):
+            peak[key] = _finite_or_none(peak[key])
+        for key in ('peak_time', 'min_time'):
+            peak[key] = str(peak[key]) if peak['hours'] else None
+
+        return {
+            "success": True,
+            "data": chart_data,
+            "peak": peak,
+            "percentiles": {
+                f"p{p:g}": _finite_or_none(value)
+                for p, value in zip(requested, pyramid.percentiles(fiscal_year, requested))
+            }
+        }
 
     except HTTPException:
         raise
@@ -12,9 +12,12 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-import openpyxl
 import logging
 
+from models.lazy_imports import lazy_import
+
+openpyxl = lazy_import('openpyxl')
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
@@ -4,8 +4,13 @@ Demand Forecasting Routes
 
 Handles demand forecasting execution with real-time progress via SSE.
 
+Forecasts run on persistent worker processes (see models/forecast_worker.py)
+that keep the forecasting libraries imported between runs; a fresh
+``forecasting.py`` subprocess is only used if the workers cannot start.
+
 Endpoints:
 - POST /project/forecast - Start forecasting process
+- POST /project/forecast/cancel - Cancel the running forecast
 - GET /project/forecast-progress - Server-Sent Events for progress updates
 """
 
@@ -20,12 +25,17 @@ import asyncio
 import logging
 import threading
 import queue
+import uuid
+
+from models.forecast_worker import get_forecast_pool
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 # Global queue for SSE events
 forecast_event_queue: asyncio.Queue = None
+# Job id of the forecast started last (for cancellation)
+current_forecast_job: Optional[str] = None
 
 
 class SectorConfig(BaseModel):
@@ -44,6 +54,7 @@ class ForecastRequest(BaseModel):
     targetYear: int = Field(..., description="Target forecast year")
     excludeCovidYears: bool = Field(..., description="Exclude COVID-19 years flag")
     sectors: List[SectorConfig] = Field(..., description="List of sector configurations")
+    forceRerun: bool = Field(False, description="Re-run every sector even if its inputs are unchanged")
 
 
 @router.get("/forecast-progress")
@@ -58,8 +69,9 @@ async def forecast_progress():
 
     Event Types:
     - progress: Ongoing progress update
-    - sector_completed: Sector forecast completed
-    - end: Forecasting process completed/failed
+    - sector_completed: Sector forecast completed (``status: "cached"`` when
+      its inputs were unchanged and the previous results were reused)
+    - end: Forecasting process completed/failed/cancelled
     """
     global forecast_event_queue
 
@@ -148,6 +160,7 @@ async def start_forecast(request: ForecastRequest):
         "target_year": request.targetYear,
         "exclude_covid": request.excludeCovidYears,
         "forecast_path": str(scenario_results_path),
+        "force_rerun": request.forceRerun,
         "sectors": {}
     }
 
@@ -162,9 +175,8 @@ async def start_forecast(request: ForecastRequest):
             "data": sector.data
         }
 
-    # Write config to temporary file
-    import time
-    config_path = scenario_results_path / f"forecast_config.json"
+    # Write config to a per-run file: queued runs of the same scenario each read and delete their own
+    config_path = scenario_results_path / f"forecast_config_{uuid.uuid4().hex}.json"
     with open(config_path, 'w') as f:
         json.dump(config_for_python, f, indent=2)
 
@@ -180,6 +192,57 @@ async def start_forecast(request: ForecastRequest):
 
 
 async def run_forecast_process(config_path: Path, event_queue: asyncio.Queue):
+    """
+    Run a forecast on the persistent worker pool.
+
+    Progress events and the final ``end`` event go to the SSE queue exactly as
+    with the subprocess runner. Falls back to a subprocess if the pool cannot
+    start.
+
+    Args:
+        config_path: Path to configuration JSON file
+        event_queue: Queue for sending SSE events
+    """
+    global current_forecast_job
+    loop = asyncio.get_running_loop()
+
+    def on_event(event: Dict[str, Any]):
+        if event.get('type') == 'end':
+            logger.info(f"Forecast job finished: {event.get('status')}")
+            try:
+                config_path.unlink()
+            except OSError as e:
+                logger.error(f"Failed to delete temp config file: {e}")
+        loop.call_soon_threadsafe(event_queue.put_nowait, event)
+
+    try:
+        job = get_forecast_pool().submit(config_path, on_event)
+    except Exception as e:
+        logger.error(f"Forecast worker pool unavailable, using a subprocess: {e}")
+        await run_forecast_subprocess(config_path, event_queue)
+        return
+
+    current_forecast_job = job.id
+    logger.info(f"Forecast job {job.id} queued (config: {config_path})")
+
+
+@router.post("/forecast/cancel")
+async def cancel_forecast():
+    """
+    Cancel the running (or queued) forecast.
+
+    The worker running it is stopped and replaced; the SSE stream receives an
+    ``end`` event with status ``cancelled``.
+
+    Raises:
+        HTTPException: 404 if no forecast is running
+    """
+    if not current_forecast_job or not get_forecast_pool().cancel(current_forecast_job):
+        raise HTTPException(status_code=404, detail="No forecast is running.")
+    return {"success": True, "message": "Forecast cancelled."}
+
+
+async def run_forecast_subprocess(config_path: Path, event_queue: asyncio.Queue):
     """
     Run the Python forecasting script as a subprocess using synchronous subprocess.
 
@@ -19,13 +19,16 @@ from pydantic import BaseModel, Field
 from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
-import openpyxl
 import asyncio
 import json
 import logging
 import threading
 import queue
 
+from models.lazy_imports import lazy_import
+
+openpyxl = lazy_import('openpyxl')
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
@@ -23,29 +23,34 @@ Version: 3.0 (Consolidated)
 Date: 2025
 """
 
-from fastapi import APIRouter, HTTPException, Query, Body
+from fastapi import APIRouter, HTTPException, Query, Body, Header
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import logging
-import pandas as pd
-import openpyxl
+import json
 import re
+import time
 
 # Import models
 import sys
 sys.path.append(str(Path(__file__).parent.parent / "models"))
 
-from models.pypsa_analyzer import (
-    load_network_cached,
-    get_cache_stats,
-    invalidate_network_cache,
-    NetworkInspector,
-    PyPSASingleNetworkAnalyzer,
-    is_multi_period,
-    get_periods,
-    extract_period_networks,
-    process_multi_file_networks
-)
+from models.lazy_imports import lazy_import
+
+# Heavy modules (pypsa, scipy, pandas, ...) load on the first request that needs them
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+openpyxl = lazy_import('openpyxl')
+pypsa_analyzer = lazy_import('models.pypsa_analyzer')
+analysis_cache = lazy_import('models.analysis_cache')
+network_summary = lazy_import('models.network_summary')
+network_metadata = lazy_import('models.network_metadata')
+columnar_stream = lazy_import('models.columnar_stream')
+
+from models.http_cache import cache_on_files, get_response_cache, network_source
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -89,6 +94,29 @@ def safe_int(value) -> Optional[int]:
         return None
 
 
+def memoized_analysis(network_path: Path, method: str, **params) -> Any:
+    """
+    Run an analyzer (or inspector) method through the analysis cache.
+
+    Parameterless analyses are answered from the network's summary sidecar
+    when the model run wrote one. Otherwise the network is only loaded on a
+    cache miss; results persist in ``.analysis_cache/`` next to the network
+    file.
+    """
+    if not analysis_cache.normalize_params(params):
+        result = network_summary.summary_analysis(network_path, method)
+        if result is not None:
+            return result
+
+    def compute():
+        network = pypsa_analyzer.load_network_cached(str(network_path))
+        if method == 'get_full_availability':
+            return pypsa_analyzer.NetworkInspector(network).get_full_availability()
+        return getattr(pypsa_analyzer.PyPSASingleNetworkAnalyzer(network), method)(**params)
+
+    return analysis_cache.cached_analysis(network_path, method, compute, params)
+
+
 # =============================================================================
 # SCENARIO & FILE DISCOVERY
 # =============================================================================
@@ -140,12 +168,18 @@ async def list_network_files(
         if not scenario_path.exists():
             raise HTTPException(status_code=404, detail=f"Scenario not found: {scenarioName}")
         
+        # Headers come from the cached folder index; no network is loaded
         network_files = []
-        for file in scenario_path.glob("*.nc"):
+        for header in network_metadata.folder_networks(scenario_path):
             network_files.append({
-                "name": file.name,
-                "path": str(file),
-                "size_mb": round(file.stat().st_size / (1024 * 1024), 2)
+                "name": header['name'],
+                "path": str(scenario_path / header['name']),
+                "size_mb": header['size_mb'],
+                "snapshot_count": header['snapshot_count'],
+                "is_multi_period": header['is_multi_period'],
+                "periods": header['periods'],
+                "components": header['components'],
+                "objective": header['objective']
             })
         
         return {
@@ -368,10 +402,9 @@ async def detect_network_type(
                 if 2000 <= year_value <= 2100:
                     has_year_in_filename = True
 
-            # Load network to check structure
-            logger.info(f"Loading network: {filename}")
-            network = load_network_cached(str(file_path))
-            is_mp = is_multi_period(network)
+            # Check structure from the NetCDF header (no network load)
+            header = network_metadata.network_header(file_path)
+            is_mp = header['is_multi_period']
 
             # CASE 1A: Filename has year → SINGLE PERIOD (regardless of structure)
             if has_year_in_filename:
@@ -390,7 +423,7 @@ async def detect_network_type(
                         "size_mb": round(file_path.stat().st_size / (1024 * 1024), 2),
                         "year": year_value
                     },
-                    "snapshot_count": len(network.snapshots),
+                    "snapshot_count": header['snapshot_count'],
                     "ui_tabs": ["Dispatch & Load", "Capacity", "Metrics", "Storage", "Emissions", "Prices", "Network Flow"]
                 }
 
@@ -398,7 +431,7 @@ async def detect_network_type(
             else:
                 if is_mp:
                     # Multi-period network
-                    periods = get_periods(network)
+                    periods = header['periods']
                     logger.info(f"Single file without year in filename + MultiIndex → Multi-Period ({len(periods)} periods)")
                     return {
                         "success": True,
@@ -415,7 +448,7 @@ async def detect_network_type(
                         },
                         "periods": periods,
                         "period_count": len(periods),
-                        "snapshot_count": len(network.snapshots),
+                        "snapshot_count": header['snapshot_count'],
                         "ui_tabs": {
                             "period_selector": {
                                 "label": "Select period for analysis",
@@ -443,7 +476,7 @@ async def detect_network_type(
                             "path": str(file_path),
                             "size_mb": round(file_path.stat().st_size / (1024 * 1024), 2)
                         },
-                        "snapshot_count": len(network.snapshots),
+                        "snapshot_count": header['snapshot_count'],
                         "ui_tabs": ["Dispatch & Load", "Capacity", "Metrics", "Storage", "Emissions", "Prices", "Network Flow"]
                     }
 
@@ -574,10 +607,10 @@ async def get_multi_year_info(
         elif len(nc_files) == 1:
             # Single file: check if multi-period
             file_path = nc_files[0]
-            network = load_network_cached(str(file_path))
+            header = network_metadata.network_header(file_path)
             
-            if is_multi_period(network):
-                periods = get_periods(network)
+            if header['is_multi_period']:
+                periods = header['periods']
                 return {
                     "success": True,
                     "scenario": scenarioName,
@@ -586,7 +619,7 @@ async def get_multi_year_info(
                     "message": f"Single multi-period network with {len(periods)} periods",
                     "years": periods,
                     "period_count": len(periods),
-                    "snapshot_count": len(network.snapshots),
+                    "snapshot_count": header['snapshot_count'],
                     "file_count": 1,
                     "file": {
                         "name": file_path.name,
@@ -595,12 +628,8 @@ async def get_multi_year_info(
                     }
                 }
             else:
-                # Single period
-                year = None
-                if len(network.snapshots) > 0:
-                    first_snapshot = network.snapshots[0]
-                    if hasattr(first_snapshot, 'year'):
-                        year = first_snapshot.year
+                # Single period: year of the first snapshot
+                year = header['periods'][0] if header['periods'] else None
                 
                 return {
                     "success": True,
@@ -610,7 +639,7 @@ async def get_multi_year_info(
                     "message": "Single-period network",
                     "years": [year] if year else [],
                     "period_count": 1,
-                    "snapshot_count": len(network.snapshots),
+                    "snapshot_count": header['snapshot_count'],
                     "file_count": 1,
                     "file": {
                         "name": file_path.name,
@@ -658,7 +687,7 @@ async def get_multi_year_info(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/list-periods")
+@router.get("/pypsa/list-periods", dependencies=[cache_on_files(network_source)])
 async def list_periods(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -671,18 +700,17 @@ async def list_periods(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
         
-        network = load_network_cached(str(network_path))
-        periods = get_periods(network)
-        is_mp = is_multi_period(network)
+        header = network_metadata.network_header(network_path)
+        periods = header['periods']
         
         return {
             "success": True,
             "scenario": scenarioName,
             "network_file": networkFile,
-            "is_multi_period": is_mp,
+            "is_multi_period": header['is_multi_period'],
             "periods": periods,
             "period_count": len(periods),
-            "snapshot_count": len(network.snapshots)
+            "snapshot_count": header['snapshot_count']
         }
     
     except HTTPException:
@@ -715,7 +743,7 @@ async def extract_periods(
         
         logger.info(f"Extracting periods from {network_path} to {output_path}")
         
-        period_files = extract_period_networks(str(network_path), str(output_path))
+        period_files = pypsa_analyzer.extract_period_networks(str(network_path), str(output_path))
         
         return {
             "success": True,
@@ -754,7 +782,7 @@ async def analyze_multi_file(
         
         logger.info(f"Processing {len(file_paths)} network files")
         
-        networks_by_year = process_multi_file_networks(file_paths)
+        networks_by_year = pypsa_analyzer.process_multi_file_networks(file_paths)
         
         year_info = {}
         for year, network in networks_by_year.items():
@@ -786,7 +814,7 @@ async def analyze_multi_file(
 # NETWORK INSPECTION & AVAILABILITY
 # =============================================================================
 
-@router.get("/pypsa/availability")
+@router.get("/pypsa/availability", dependencies=[cache_on_files(network_source)])
 async def get_network_availability(
     projectPath: str = Query(..., description="Project root path"),
     scenarioName: str = Query(..., description="Scenario folder name"),
@@ -840,14 +868,9 @@ async def get_network_availability(
         if file_size_mb > 500:
             logger.warning(f"Large network file detected: {file_size_mb:.2f} MB. Loading may take time.")
 
-        # Load network with caching
-        logger.info(f"Loading network from: {network_path.name}")
-        network = load_network_cached(str(network_path))
-
-        # Get availability information
+        # Get availability information (memoized per network file)
         logger.info("Computing network availability...")
-        inspector = NetworkInspector(network)
-        availability = inspector.get_full_availability()
+        availability = memoized_analysis(network_path, 'get_full_availability')
 
         # Log key availability info for debugging
         logger.info(
@@ -886,7 +909,7 @@ async def get_network_availability(
         )
 
 
-@router.get("/pypsa/overview")
+@router.get("/pypsa/overview", dependencies=[cache_on_files(network_source)])
 async def get_network_overview(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -899,7 +922,7 @@ async def get_network_overview(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
         
-        network = load_network_cached(str(network_path))
+        network = pypsa_analyzer.load_network_cached(str(network_path))
         
         overview = {
             "success": True,
@@ -951,7 +974,7 @@ async def get_network_overview(
 # COMPONENT DETAIL ENDPOINTS
 # =============================================================================
 
-@router.get("/pypsa/buses")
+@router.get("/pypsa/buses", dependencies=[cache_on_files(network_source)])
 async def get_buses(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -964,7 +987,7 @@ async def get_buses(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
         
-        network = load_network_cached(str(network_path))
+        network = pypsa_analyzer.load_network_cached(str(network_path))
         
         if not hasattr(network, 'buses') or network.buses.empty:
             return {"success": True, "buses": [], "voltage_levels": [], "zones": []}
@@ -1023,7 +1046,7 @@ async def get_buses(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/carriers")
+@router.get("/pypsa/carriers", dependencies=[cache_on_files(network_source)])
 async def get_carriers(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -1036,7 +1059,7 @@ async def get_carriers(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
         
-        network = load_network_cached(str(network_path))
+        network = pypsa_analyzer.load_network_cached(str(network_path))
         
         carriers_data = []
         total_emissions = 0
@@ -1083,7 +1106,7 @@ async def get_carriers(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/generators")
+@router.get("/pypsa/generators", dependencies=[cache_on_files(network_source)])
 async def get_generators(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -1096,7 +1119,7 @@ async def get_generators(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
         
-        network = load_network_cached(str(network_path))
+        network = pypsa_analyzer.load_network_cached(str(network_path))
         
         if not hasattr(network, 'generators') or network.generators.empty:
             return {"success": True, "generators": [], "by_carrier": {}}
@@ -1162,7 +1185,7 @@ async def get_generators(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/loads")
+@router.get("/pypsa/loads", dependencies=[cache_on_files(network_source)])
 async def get_loads(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -1175,7 +1198,7 @@ async def get_loads(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
         
-        network = load_network_cached(str(network_path))
+        network = pypsa_analyzer.load_network_cached(str(network_path))
         
         if not hasattr(network, 'loads') or network.loads.empty:
             return {"success": True, "loads": []}
@@ -1214,7 +1237,7 @@ async def get_loads(
 # COMPREHENSIVE ANALYSIS ENDPOINTS
 # =============================================================================
 
-@router.get("/pypsa/analyze")
+@router.get("/pypsa/analyze", dependencies=[cache_on_files(network_source)])
 async def analyze_network(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -1227,8 +1250,8 @@ async def analyze_network(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
         
-        network = load_network_cached(str(network_path))
-        analyzer = PyPSASingleNetworkAnalyzer(network)
+        network = pypsa_analyzer.load_network_cached(str(network_path))
+        analyzer = pypsa_analyzer.PyPSASingleNetworkAnalyzer(network)
         
         results = analyzer.run_all_analyses()
         
@@ -1246,7 +1269,7 @@ async def analyze_network(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/total-capacities")
+@router.get("/pypsa/total-capacities", dependencies=[cache_on_files(network_source)])
 async def get_total_capacities(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -1259,10 +1282,7 @@ async def get_total_capacities(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
         
-        network = load_network_cached(str(network_path))
-        analyzer = PyPSASingleNetworkAnalyzer(network)
-        
-        capacities = analyzer.get_total_capacities()
+        capacities = memoized_analysis(network_path, 'get_total_capacities')
         
         return {
             "success": True,
@@ -1276,24 +1296,55 @@ async def get_total_capacities(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/dispatch")
+@router.get("/pypsa/dispatch", dependencies=[cache_on_files(network_source)])
 async def get_dispatch_data(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
     networkFile: str = Query(...),
     resolution: str = Query('1H', description="Time resolution (1H, 3H, 6H, 12H, 1D, 1W)"),
     start_date: Optional[str] = Query(None, description="Start date for filtering (YYYY-MM-DD)"),
-    end_date: Optional[str] = Query(None, description="End date for filtering (YYYY-MM-DD)")
+    end_date: Optional[str] = Query(None, description="End date for filtering (YYYY-MM-DD)"),
+    accept: Optional[str] = Header(None)
 ):
-    """Get time-series dispatch data for stacked area chart visualization."""
+    """
+    Get time-series dispatch data for stacked area chart visualization.
+
+    With an NDJSON/Arrow ``Accept`` header the full (unsampled) series is
+    streamed as columns: ``timestamp``, ``load``, ``generation:<carrier>``,
+    ``storage_discharge:<name>`` and ``storage_charge:<name>``.
+    """
     try:
         network_path = Path(projectPath) / "results" / "pypsa_optimization" / scenarioName / networkFile
 
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
 
-        network = load_network_cached(str(network_path))
-        analyzer = PyPSASingleNetworkAnalyzer(network)
+        network = pypsa_analyzer.load_network_cached(str(network_path))
+        analyzer = pypsa_analyzer.PyPSASingleNetworkAnalyzer(network)
+
+        stream_format = columnar_stream.negotiate_stream_format(accept)
+        if stream_format:
+            dispatch = analyzer.get_dispatch_columns(
+                resolution=resolution,
+                start_date=start_date,
+                end_date=end_date
+            )
+            columns = {'timestamp': dispatch['timestamps'], 'load': dispatch['load']}
+            for group in ('generation', 'storage_discharge', 'storage_charge'):
+                columns.update({f"{group}:{name}": values for name, values in dispatch[group].items()})
+
+            meta = {
+                'endpoint': 'dispatch',
+                'resolution': resolution,
+                'columns': list(columns.keys()),
+                'generation': list(dispatch['generation'].keys()),
+                'storage_discharge': list(dispatch['storage_discharge'].keys()),
+                'storage_charge': list(dispatch['storage_charge'].keys()),
+                'total_points': len(dispatch['timestamps'])
+            }
+            if 'message' in dispatch:
+                meta['message'] = dispatch['message']
+            return columnar_stream.columnar_response(stream_format, columnar_stream.chunk_columns(columns), meta)
 
         dispatch_data = analyzer.get_dispatch_data(
             resolution=resolution,
@@ -1313,7 +1364,7 @@ async def get_dispatch_data(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/energy-mix")
+@router.get("/pypsa/energy-mix", dependencies=[cache_on_files(network_source)])
 async def get_energy_mix(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -1328,10 +1379,7 @@ async def get_energy_mix(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
 
-        network = load_network_cached(str(network_path))
-        analyzer = PyPSASingleNetworkAnalyzer(network)
-
-        energy_mix = analyzer.get_energy_mix(start_date=start_date, end_date=end_date)
+        energy_mix = memoized_analysis(network_path, 'get_energy_mix', start_date=start_date, end_date=end_date)
 
         return {
             "success": True,
@@ -1345,7 +1393,7 @@ async def get_energy_mix(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/capacity-factors")
+@router.get("/pypsa/capacity-factors", dependencies=[cache_on_files(network_source)])
 async def get_capacity_factors(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -1358,10 +1406,7 @@ async def get_capacity_factors(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
         
-        network = load_network_cached(str(network_path))
-        analyzer = PyPSASingleNetworkAnalyzer(network)
-        
-        capacity_factors_data = analyzer.get_capacity_factors()
+        capacity_factors_data = memoized_analysis(network_path, 'get_capacity_factors')
         
         return {
             "success": True,
@@ -1375,7 +1420,51 @@ async def get_capacity_factors(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/renewable-share")
+def network_is_multi_period(network_path: Path) -> bool:
+    """Multi-period check from the NetCDF header (no network load)."""
+    return network_metadata.network_header(network_path)['is_multi_period']
+
+
+def renewable_share_payload(network_path: Path, networkFile: str) -> Dict[str, Any]:
+    """Renewable share, CUF and curtailment combined (single- or multi-period)."""
+    # Check if network is multi-period
+    if network_is_multi_period(network_path):
+        logger.info(f"Processing multi-period network: {networkFile}")
+
+        # Get multi-period data
+        renewable_data = memoized_analysis(network_path, 'get_renewable_share_multi_period')
+        capacity_factors_data = memoized_analysis(network_path, 'get_capacity_factors_multi_period')
+        curtailment_data = memoized_analysis(network_path, 'get_curtailment_multi_period')
+
+        # Combine all data
+        return {
+            "success": True,
+            "is_multi_period": True,
+            **renewable_data,
+            "capacity_factors": capacity_factors_data.get('capacity_factors', []),
+            "curtailment": curtailment_data.get('curtailment', [])
+        }
+
+    logger.info(f"Processing single-period network: {networkFile}")
+
+    # Get single period data
+    renewable_share_data = memoized_analysis(network_path, 'get_renewable_share')
+    capacity_factors_data = memoized_analysis(network_path, 'get_capacity_factors')
+    curtailment_data = memoized_analysis(network_path, 'get_curtailment')
+
+    # Combine all data
+    return {
+        "success": True,
+        "is_multi_period": False,
+        **renewable_share_data,
+        "capacity_factors": capacity_factors_data.get('utilization', []),
+        "curtailment": curtailment_data.get('curtailment', []),
+        "total_curtailed_mwh": curtailment_data.get('total_curtailed', 0),
+        "curtailment_rate_percent": curtailment_data.get('curtailment_rate', 0)
+    }
+
+
+@router.get("/pypsa/renewable-share", dependencies=[cache_on_files(network_source)])
 async def get_renewable_share(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -1406,47 +1495,7 @@ async def get_renewable_share(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
 
-        network = load_network_cached(str(network_path))
-        analyzer = PyPSASingleNetworkAnalyzer(network)
-
-        # Import is_multi_period function
-        from models.pypsa_analyzer import is_multi_period
-
-        # Check if network is multi-period
-        if is_multi_period(network):
-            logger.info(f"Processing multi-period network: {networkFile}")
-
-            # Get multi-period data
-            renewable_data = analyzer.get_renewable_share_multi_period()
-            capacity_factors_data = analyzer.get_capacity_factors_multi_period()
-            curtailment_data = analyzer.get_curtailment_multi_period()
-
-            # Combine all data
-            return {
-                "success": True,
-                "is_multi_period": True,
-                **renewable_data,
-                "capacity_factors": capacity_factors_data.get('capacity_factors', []),
-                "curtailment": curtailment_data.get('curtailment', [])
-            }
-        else:
-            logger.info(f"Processing single-period network: {networkFile}")
-
-            # Get single period data
-            renewable_share_data = analyzer.get_renewable_share()
-            capacity_factors_data = analyzer.get_capacity_factors()
-            curtailment_data = analyzer.get_curtailment()
-
-            # Combine all data
-            return {
-                "success": True,
-                "is_multi_period": False,
-                **renewable_share_data,
-                "capacity_factors": capacity_factors_data.get('utilization', []),
-                "curtailment": curtailment_data.get('curtailment', []),
-                "total_curtailed_mwh": curtailment_data.get('total_curtailed', 0),
-                "curtailment_rate_percent": curtailment_data.get('curtailment_rate', 0)
-            }
+        return renewable_share_payload(network_path, networkFile)
 
     except HTTPException:
         raise
@@ -1455,7 +1504,7 @@ async def get_renewable_share(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/emissions")
+@router.get("/pypsa/emissions", dependencies=[cache_on_files(network_source)])
 async def get_emissions(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -1468,10 +1517,7 @@ async def get_emissions(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
         
-        network = load_network_cached(str(network_path))
-        analyzer = PyPSASingleNetworkAnalyzer(network)
-        
-        emissions_data = analyzer.get_emissions_tracking()
+        emissions_data = memoized_analysis(network_path, 'get_emissions_tracking')
         
         return {
             "success": True,
@@ -1485,7 +1531,7 @@ async def get_emissions(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/system-costs")
+@router.get("/pypsa/system-costs", dependencies=[cache_on_files(network_source)])
 async def get_system_costs(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -1498,10 +1544,7 @@ async def get_system_costs(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
         
-        network = load_network_cached(str(network_path))
-        analyzer = PyPSASingleNetworkAnalyzer(network)
-        
-        system_costs_data = analyzer.get_system_costs()
+        system_costs_data = memoized_analysis(network_path, 'get_system_costs')
         
         return {
             "success": True,
@@ -1515,6 +1558,166 @@ async def get_system_costs(
         raise HTTPException(status_code=500, detail=str(error))
 
 
+# =============================================================================
+# BATCH ANALYSIS
+# =============================================================================
+
+class BatchContext:
+    """Network, analyzer and path shared by every analysis of one batch request."""
+
+    def __init__(self, network_path: Path, network_file: str):
+        self.network_path = network_path
+        self.network_file = network_file
+        self._analyzer = None
+
+    @property
+    def network(self):
+        return pypsa_analyzer.load_network_cached(str(self.network_path))
+
+    @property
+    def analyzer(self) -> 'pypsa_analyzer.PyPSASingleNetworkAnalyzer':
+        # Built on first use; analyses answered from the memo cache never load the network
+        if self._analyzer is None:
+            self._analyzer = pypsa_analyzer.PyPSASingleNetworkAnalyzer(self.network)
+        return self._analyzer
+
+
+def _analyzer_data(method: str):
+    return lambda ctx, params: {"success": True, "data": getattr(ctx.analyzer, method)(**params)}
+
+
+def _memoized_data(method: str):
+    return lambda ctx, params: {"success": True, "data": memoized_analysis(ctx.network_path, method, **params)}
+
+
+# Batch analysis name (the GET endpoint path under /pypsa/) -> payload builder.
+# Each payload matches the JSON body of the corresponding endpoint.
+BATCH_ANALYSES = {
+    'availability': lambda ctx, params: {
+        "success": True,
+        "network_file": ctx.network_file,
+        "availability": memoized_analysis(ctx.network_path, 'get_full_availability')
+    },
+    'network-metadata': lambda ctx, params: {
+        "success": True, **memoized_analysis(ctx.network_path, 'get_network_metadata')
+    },
+    'total-capacities': _memoized_data('get_total_capacities'),
+    'energy-mix': _memoized_data('get_energy_mix'),
+    'capacity-factors': lambda ctx, params: {
+        "success": True, **memoized_analysis(ctx.network_path, 'get_capacity_factors')
+    },
+    'renewable-share': lambda ctx, params: renewable_share_payload(ctx.network_path, ctx.network_file),
+    'emissions': _memoized_data('get_emissions_tracking'),
+    'system-costs': _memoized_data('get_system_costs'),
+    'marginal-prices': _analyzer_data('get_marginal_prices'),
+    'network-losses': _analyzer_data('get_network_losses'),
+    'curtailment': _memoized_data('get_curtailment'),
+    'dispatch': _analyzer_data('get_dispatch_data'),
+    'daily-profiles': _memoized_data('get_daily_profiles'),
+    'duration-curves': _analyzer_data('get_duration_curves'),
+    'storage-operation': _analyzer_data('get_storage_operation'),
+    'transmission-flows': _analyzer_data('get_transmission_flows'),
+    'load-growth': _analyzer_data('get_load_profiles'),
+    'storage-units': lambda ctx, params: storage_units_payload(ctx.network),
+    'lines': lambda ctx, params: lines_payload(ctx.network),
+}
+
+# Query parameters each analysis accepts (anything else is ignored)
+BATCH_ANALYSIS_PARAMS = {
+    'energy-mix': {'start_date', 'end_date'},
+    'dispatch': {'resolution', 'start_date', 'end_date'},
+}
+
+
+def _ndjson_line(record: Dict[str, Any]) -> bytes:
+    return (json.dumps(jsonable_encoder(record), default=str) + "\n").encode('utf-8')
+
+
+@router.post("/pypsa/batch")
+async def batch_analysis(
+    projectPath: str = Body(...),
+    scenarioName: str = Body(...),
+    networkFile: str = Body(...),
+    analyses: List[Any] = Body(..., description="Analysis names, or {name, params} objects")
+):
+    """
+    Compute several analyses of one network in a single request.
+
+    The network is loaded once and one analyzer (with its shared carrier ×
+    period aggregation kernel) serves every analysis, so per-carrier
+    generation sums and snapshot weights are computed once per batch.
+
+    The response is NDJSON, one record per line, written as each analysis
+    completes:
+
+    - ``{"type": "meta", "analyses": [...], "network_file": ...}``
+    - ``{"type": "result", "name": ..., "params": ..., "elapsed_ms": ..., "data": <endpoint body>}``
+    - ``{"type": "error", "name": ..., "status": ..., "detail": ...}`` (other analyses continue)
+    - ``{"type": "end", "count": ..., "errors": ..., "elapsed_ms": ...}``
+
+    ``data`` is exactly the body the matching ``GET /pypsa/<name>`` endpoint returns.
+    """
+    try:
+        network_path = Path(projectPath) / "results" / "pypsa_optimization" / scenarioName / networkFile
+
+        if not network_path.exists():
+            raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
+
+        requests = []
+        for item in analyses:
+            name, params = (item, {}) if isinstance(item, str) else (item.get('name'), item.get('params') or {})
+            if name not in BATCH_ANALYSES:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Unknown analysis: {name}. Available: {sorted(BATCH_ANALYSES)}"
+                )
+            allowed = BATCH_ANALYSIS_PARAMS.get(name, set())
+            requests.append((name, {key: value for key, value in params.items() if key in allowed}))
+
+        if not requests:
+            raise HTTPException(status_code=400, detail="No analyses requested")
+
+    except HTTPException:
+        raise
+    except Exception as error:
+        logger.error(f"Error starting batch analysis: {error}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(error))
+
+    async def result_stream():
+        context = BatchContext(network_path, networkFile)
+        batch_start = time.perf_counter()
+        errors = 0
+
+        yield _ndjson_line({
+            "type": "meta",
+            "network_file": networkFile,
+            "analyses": [name for name, _ in requests]
+        })
+
+        for name, params in requests:
+            start = time.perf_counter()
+            try:
+                data = await run_in_threadpool(BATCH_ANALYSES[name], context, params)
+                record = {"type": "result", "name": name, "params": params, "data": data}
+            except Exception as error:
+                errors += 1
+                logger.error(f"Batch analysis {name} failed: {error}", exc_info=True)
+                status = error.status_code if isinstance(error, HTTPException) else 500
+                detail = error.detail if isinstance(error, HTTPException) else str(error)
+                record = {"type": "error", "name": name, "params": params, "status": status, "detail": detail}
+            record["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+            yield _ndjson_line(record)
+
+        yield _ndjson_line({
+            "type": "end",
+            "count": len(requests),
+            "errors": errors,
+            "elapsed_ms": round((time.perf_counter() - batch_start) * 1000, 1)
+        })
+
+    return StreamingResponse(result_stream(), media_type=columnar_stream.NDJSON_MEDIA_TYPE)
+
+
 # =============================================================================
 # CACHE MANAGEMENT
 # =============================================================================
@@ -1523,11 +1726,13 @@ async def get_system_costs(
 async def get_cache_statistics():
     """Get network cache statistics."""
     try:
-        stats = get_cache_stats()
+        stats = pypsa_analyzer.get_cache_stats()
         
         return {
             "success": True,
-            **stats
+            **stats,
+            "analysis_cache": analysis_cache.get_analysis_cache().get_stats(),
+            "response_cache": get_response_cache().get_stats()
         }
     
     except Exception as error:
@@ -1539,9 +1744,12 @@ async def get_cache_statistics():
 async def invalidate_cache(
     networkPath: Optional[str] = Body(None, description="Specific network to invalidate, or None for all")
 ):
-    """Invalidate network cache."""
+    """Invalidate network cache, memoized analysis results and network summaries."""
     try:
-        invalidate_network_cache(networkPath)
+        pypsa_analyzer.invalidate_network_cache(networkPath)
+        analysis_cache.get_analysis_cache().invalidate(networkPath)
+        network_summary.invalidate_network_summary(networkPath)
+        get_response_cache().clear()
 
         return {
             "success": True,
@@ -1557,7 +1765,41 @@ async def invalidate_cache(
 # DETAILED NETWORK COMPONENT ENDPOINTS
 # =============================================================================
 
-@router.get("/pypsa/storage-units")
+def storage_units_payload(network) -> Dict[str, Any]:
+    """Storage units (PHS) table and totals."""
+    if not hasattr(network, 'storage_units') or network.storage_units.empty:
+        return {"success": True, "storage_units": [], "total_power_capacity": 0, "total_energy_capacity": 0}
+
+    su = network.storage_units
+    storage_units = []
+
+    for name, row in su.iterrows():
+        unit_data = {
+            "storage_unit_name": name,
+            "bus": row.get('bus', ''),
+            "carrier": row.get('carrier', ''),
+            "p_nom": safe_float(row.get('p_nom')),
+            "p_nom_opt": safe_float(row.get('p_nom_opt')),
+            "max_hours": safe_float(row.get('max_hours', 1)),
+            "efficiency_dispatch": safe_float(row.get('efficiency_dispatch', 1)),
+            "efficiency_store": safe_float(row.get('efficiency_store', 1)),
+            "cyclic_state_of_charge": bool(row.get('cyclic_state_of_charge', True)),
+            "capital_cost": safe_float(row.get('capital_cost', 0))
+        }
+        storage_units.append(unit_data)
+
+    total_power = su['p_nom_opt'].sum() if 'p_nom_opt' in su.columns else su['p_nom'].sum()
+    total_energy = (su['p_nom_opt'] * su['max_hours']).sum() if 'p_nom_opt' in su.columns else (su['p_nom'] * su['max_hours']).sum()
+
+    return {
+        "success": True,
+        "storage_units": storage_units,
+        "total_power_capacity": safe_float(total_power),
+        "total_energy_capacity": safe_float(total_energy)
+    }
+
+
+@router.get("/pypsa/storage-units", dependencies=[cache_on_files(network_source)])
 async def get_storage_units(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -1566,45 +1808,15 @@ async def get_storage_units(
     """Get detailed storage units (PHS) information."""
     try:
         network_path = Path(projectPath) / "results" / "pypsa_optimization" / scenarioName / networkFile
-        network = load_network_cached(str(network_path))
-
-        if not hasattr(network, 'storage_units') or network.storage_units.empty:
-            return {"success": True, "storage_units": [], "total_power_capacity": 0, "total_energy_capacity": 0}
-
-        su = network.storage_units
-        storage_units = []
-
-        for name, row in su.iterrows():
-            unit_data = {
-                "storage_unit_name": name,
-                "bus": row.get('bus', ''),
-                "carrier": row.get('carrier', ''),
-                "p_nom": safe_float(row.get('p_nom')),
-                "p_nom_opt": safe_float(row.get('p_nom_opt')),
-                "max_hours": safe_float(row.get('max_hours', 1)),
-                "efficiency_dispatch": safe_float(row.get('efficiency_dispatch', 1)),
-                "efficiency_store": safe_float(row.get('efficiency_store', 1)),
-                "cyclic_state_of_charge": bool(row.get('cyclic_state_of_charge', True)),
-                "capital_cost": safe_float(row.get('capital_cost', 0))
-            }
-            storage_units.append(unit_data)
-
-        total_power = su['p_nom_opt'].sum() if 'p_nom_opt' in su.columns else su['p_nom'].sum()
-        total_energy = (su['p_nom_opt'] * su['max_hours']).sum() if 'p_nom_opt' in su.columns else (su['p_nom'] * su['max_hours']).sum()
-
-        return {
-            "success": True,
-            "storage_units": storage_units,
-            "total_power_capacity": safe_float(total_power),
-            "total_energy_capacity": safe_float(total_energy)
-        }
+        network = pypsa_analyzer.load_network_cached(str(network_path))
+        return storage_units_payload(network)
 
     except Exception as error:
         logger.error(f"Error getting storage units: {error}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/stores")
+@router.get("/pypsa/stores", dependencies=[cache_on_files(network_source)])
 async def get_stores(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -1613,7 +1825,7 @@ async def get_stores(
     """Get detailed stores (batteries) information."""
     try:
         network_path = Path(projectPath) / "results" / "pypsa_optimization" / scenarioName / networkFile
-        network = load_network_cached(str(network_path))
+        network = pypsa_analyzer.load_network_cached(str(network_path))
 
         if not hasattr(network, 'stores') or network.stores.empty:
             return {"success": True, "stores": [], "total_energy_capacity": 0}
@@ -1647,7 +1859,7 @@ async def get_stores(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/links")
+@router.get("/pypsa/links", dependencies=[cache_on_files(network_source)])
 async def get_links(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -1656,7 +1868,7 @@ async def get_links(
     """Get detailed links (DC transmission) information."""
     try:
         network_path = Path(projectPath) / "results" / "pypsa_optimization" / scenarioName / networkFile
-        network = load_network_cached(str(network_path))
+        network = pypsa_analyzer.load_network_cached(str(network_path))
 
         if not hasattr(network, 'links') or network.links.empty:
             return {"success": True, "links": [], "total_capacity": 0}
@@ -1691,7 +1903,39 @@ async def get_links(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/lines")
+def lines_payload(network) -> Dict[str, Any]:
+    """AC lines table and total capacity."""
+    if not hasattr(network, 'lines') or network.lines.empty:
+        return {"success": True, "lines": [], "total_capacity": 0}
+
+    lines = network.lines
+    lines_list = []
+
+    for name, row in lines.iterrows():
+        line_data = {
+            "line_name": name,
+            "bus0": row.get('bus0', ''),
+            "bus1": row.get('bus1', ''),
+            "type": row.get('type', ''),
+            "s_nom": safe_float(row.get('s_nom')),
+            "s_nom_opt": safe_float(row.get('s_nom_opt')),
+            "length": safe_float(row.get('length', 0)),
+            "r": safe_float(row.get('r', 0)),
+            "x": safe_float(row.get('x', 0)),
+            "capital_cost": safe_float(row.get('capital_cost', 0))
+        }
+        lines_list.append(line_data)
+
+    total_capacity = lines['s_nom_opt'].sum() if 's_nom_opt' in lines.columns else lines['s_nom'].sum()
+
+    return {
+        "success": True,
+        "lines": lines_list,
+        "total_capacity": safe_float(total_capacity)
+    }
+
+
+@router.get("/pypsa/lines", dependencies=[cache_on_files(network_source)])
 async def get_lines(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -1700,43 +1944,15 @@ async def get_lines(
     """Get detailed lines (AC transmission) information."""
     try:
         network_path = Path(projectPath) / "results" / "pypsa_optimization" / scenarioName / networkFile
-        network = load_network_cached(str(network_path))
-
-        if not hasattr(network, 'lines') or network.lines.empty:
-            return {"success": True, "lines": [], "total_capacity": 0}
-
-        lines = network.lines
-        lines_list = []
-
-        for name, row in lines.iterrows():
-            line_data = {
-                "line_name": name,
-                "bus0": row.get('bus0', ''),
-                "bus1": row.get('bus1', ''),
-                "type": row.get('type', ''),
-                "s_nom": safe_float(row.get('s_nom')),
-                "s_nom_opt": safe_float(row.get('s_nom_opt')),
-                "length": safe_float(row.get('length', 0)),
-                "r": safe_float(row.get('r', 0)),
-                "x": safe_float(row.get('x', 0)),
-                "capital_cost": safe_float(row.get('capital_cost', 0))
-            }
-            lines_list.append(line_data)
-
-        total_capacity = lines['s_nom_opt'].sum() if 's_nom_opt' in lines.columns else lines['s_nom'].sum()
-
-        return {
-            "success": True,
-            "lines": lines_list,
-            "total_capacity": safe_float(total_capacity)
-        }
+        network = pypsa_analyzer.load_network_cached(str(network_path))
+        return lines_payload(network)
 
     except Exception as error:
         logger.error(f"Error getting lines: {error}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/transformers")
+@router.get("/pypsa/transformers", dependencies=[cache_on_files(network_source)])
 async def get_transformers(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -1745,7 +1961,7 @@ async def get_transformers(
     """Get detailed transformers information."""
     try:
         network_path = Path(projectPath) / "results" / "pypsa_optimization" / scenarioName / networkFile
-        network = load_network_cached(str(network_path))
+        network = pypsa_analyzer.load_network_cached(str(network_path))
 
         if not hasattr(network, 'transformers') or network.transformers.empty:
             return {"success": True, "transformers": [], "total_capacity": 0}
@@ -1778,7 +1994,7 @@ async def get_transformers(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/global-constraints")
+@router.get("/pypsa/global-constraints", dependencies=[cache_on_files(network_source)])
 async def get_global_constraints(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -1787,7 +2003,7 @@ async def get_global_constraints(
     """Get global constraints information (CO₂ limits, etc.)."""
     try:
         network_path = Path(projectPath) / "results" / "pypsa_optimization" / scenarioName / networkFile
-        network = load_network_cached(str(network_path))
+        network = pypsa_analyzer.load_network_cached(str(network_path))
 
         if not hasattr(network, 'global_constraints') or network.global_constraints.empty:
             return {"success": True, "constraints": [], "co2_limit": None, "co2_emissions": None}
@@ -1871,7 +2087,7 @@ def get_multi_year_networks(projectPath: str, scenarioName: str):
             fallback_index += 5  # Increment by 5 years for next file
 
         try:
-            network = load_network_cached(str(file_path))
+            network = pypsa_analyzer.load_network_cached(str(file_path))
             networks_by_year[year] = network
             logger.info(f"Loaded network file: {file_path.name} as year {year}")
         except Exception as e:
@@ -2261,7 +2477,7 @@ async def get_cost_evolution(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/marginal-prices")
+@router.get("/pypsa/marginal-prices", dependencies=[cache_on_files(network_source)])
 async def get_marginal_prices(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -2274,8 +2490,8 @@ async def get_marginal_prices(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
 
-        network = load_network_cached(str(network_path))
-        analyzer = PyPSASingleNetworkAnalyzer(network)
+        network = pypsa_analyzer.load_network_cached(str(network_path))
+        analyzer = pypsa_analyzer.PyPSASingleNetworkAnalyzer(network)
 
         prices_data = analyzer.get_marginal_prices()
 
@@ -2291,7 +2507,7 @@ async def get_marginal_prices(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/network-losses")
+@router.get("/pypsa/network-losses", dependencies=[cache_on_files(network_source)])
 async def get_network_losses(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -2304,8 +2520,8 @@ async def get_network_losses(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
 
-        network = load_network_cached(str(network_path))
-        analyzer = PyPSASingleNetworkAnalyzer(network)
+        network = pypsa_analyzer.load_network_cached(str(network_path))
+        analyzer = pypsa_analyzer.PyPSASingleNetworkAnalyzer(network)
 
         losses_data = analyzer.get_network_losses()
 
@@ -2321,7 +2537,7 @@ async def get_network_losses(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/curtailment")
+@router.get("/pypsa/curtailment", dependencies=[cache_on_files(network_source)])
 async def get_curtailment(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -2334,10 +2550,7 @@ async def get_curtailment(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
 
-        network = load_network_cached(str(network_path))
-        analyzer = PyPSASingleNetworkAnalyzer(network)
-
-        curtailment_data = analyzer.get_curtailment()
+        curtailment_data = memoized_analysis(network_path, 'get_curtailment')
 
         return {
             "success": True,
@@ -2351,23 +2564,38 @@ async def get_curtailment(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/daily-profiles")
+@router.get("/pypsa/daily-profiles", dependencies=[cache_on_files(network_source)])
 async def get_daily_profiles(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
-    networkFile: str = Query(...)
+    networkFile: str = Query(...),
+    accept: Optional[str] = Header(None)
 ):
-    """Get daily generation profiles by hour."""
+    """
+    Get daily generation profiles by hour.
+
+    With an NDJSON/Arrow ``Accept`` header the profiles are streamed as an
+    ``hour`` column plus one column per carrier.
+    """
     try:
         network_path = Path(projectPath) / "results" / "pypsa_optimization" / scenarioName / networkFile
 
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
 
-        network = load_network_cached(str(network_path))
-        analyzer = PyPSASingleNetworkAnalyzer(network)
+        stream_format = columnar_stream.negotiate_stream_format(accept)
+        if stream_format:
+            network = pypsa_analyzer.load_network_cached(str(network_path))
+            profiles = pypsa_analyzer.PyPSASingleNetworkAnalyzer(network).get_daily_profile_columns()
+            columns = {'hour': profiles['hour'], **profiles['carriers']}
+            meta = {
+                'endpoint': 'daily-profiles',
+                'columns': list(columns.keys()),
+                'carriers': list(profiles['carriers'].keys())
+            }
+            return columnar_stream.columnar_response(stream_format, columnar_stream.chunk_columns(columns), meta)
 
-        profiles_data = analyzer.get_daily_profiles()
+        profiles_data = memoized_analysis(network_path, 'get_daily_profiles')
 
         return {
             "success": True,
@@ -2381,21 +2609,45 @@ async def get_daily_profiles(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/duration-curves")
+@router.get("/pypsa/duration-curves", dependencies=[cache_on_files(network_source)])
 async def get_duration_curves(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
-    networkFile: str = Query(...)
+    networkFile: str = Query(...),
+    quantiles: bool = Query(False, description="Return the curves sampled at each percent of exceedance"),
+    accept: Optional[str] = Header(None)
 ):
-    """Get load and generation duration curves."""
+    """
+    Get load and generation duration curves.
+
+    With an NDJSON/Arrow ``Accept`` header the curves are streamed as
+    ``hours``, ``generation`` and ``load`` columns (sorted high to low).
+    With ``quantiles=true`` the 101-point curves (0 % = peak ... 100 % =
+    minimum) are returned from the network summary instead.
+    """
     try:
         network_path = Path(projectPath) / "results" / "pypsa_optimization" / scenarioName / networkFile
 
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
 
-        network = load_network_cached(str(network_path))
-        analyzer = PyPSASingleNetworkAnalyzer(network)
+        if quantiles:
+            summary = network_summary.get_network_summary(network_path, pypsa_analyzer.load_network_cached)
+            return {
+                "success": True,
+                "data": summary['duration_curves']
+            }
+
+        network = pypsa_analyzer.load_network_cached(str(network_path))
+        analyzer = pypsa_analyzer.PyPSASingleNetworkAnalyzer(network)
+
+        stream_format = columnar_stream.negotiate_stream_format(accept)
+        if stream_format:
+            curves = analyzer.get_duration_curve_columns()
+            length = max((len(values) for values in curves.values()), default=0)
+            columns = {'hours': np.arange(length), **curves}
+            meta = {'endpoint': 'duration-curves', 'columns': list(columns.keys())}
+            return columnar_stream.columnar_response(stream_format, columnar_stream.chunk_columns(columns), meta)
 
         duration_data = analyzer.get_duration_curves()
 
@@ -2411,7 +2663,7 @@ async def get_duration_curves(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/storage-operation")
+@router.get("/pypsa/storage-operation", dependencies=[cache_on_files(network_source)])
 async def get_storage_operation(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -2424,8 +2676,8 @@ async def get_storage_operation(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
 
-        network = load_network_cached(str(network_path))
-        analyzer = PyPSASingleNetworkAnalyzer(network)
+        network = pypsa_analyzer.load_network_cached(str(network_path))
+        analyzer = pypsa_analyzer.PyPSASingleNetworkAnalyzer(network)
 
         storage_data = analyzer.get_storage_operation()
 
@@ -2441,21 +2693,43 @@ async def get_storage_operation(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/transmission-flows")
+@router.get("/pypsa/transmission-flows", dependencies=[cache_on_files(network_source)])
 async def get_transmission_flows(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
-    networkFile: str = Query(...)
+    networkFile: str = Query(...),
+    accept: Optional[str] = Header(None)
 ):
-    """Get transmission line flows and utilization."""
+    """
+    Get transmission line flows and utilization.
+
+    With an NDJSON/Arrow ``Accept`` header the per-branch statistics are
+    streamed as columns, with ``component_type`` set to 'line' or 'link'.
+    """
     try:
         network_path = Path(projectPath) / "results" / "pypsa_optimization" / scenarioName / networkFile
 
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
 
-        network = load_network_cached(str(network_path))
-        analyzer = PyPSASingleNetworkAnalyzer(network)
+        network = pypsa_analyzer.load_network_cached(str(network_path))
+        analyzer = pypsa_analyzer.PyPSASingleNetworkAnalyzer(network)
+
+        stream_format = columnar_stream.negotiate_stream_format(accept)
+        if stream_format:
+            flows = analyzer.get_transmission_flow_columns()
+            tables = [(key, flows[component]) for component, key in [('lines', 'line'), ('links', 'link')]
+                      if flows.get(component)]
+            chunks = (
+                {'component_type': np.full(len(table['name']), key, dtype=object), **table}
+                for key, table in tables
+            )
+            meta = {
+                'endpoint': 'transmission-flows',
+                'columns': ['component_type', 'name', 'avg_flow_mw', 'max_flow_mw',
+                            'capacity_mw', 'avg_utilization_pct']
+            }
+            return columnar_stream.columnar_response(stream_format, chunks, meta)
 
         transmission_data = analyzer.get_transmission_flows()
 
@@ -2471,7 +2745,7 @@ async def get_transmission_flows(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/load-growth")
+@router.get("/pypsa/load-growth", dependencies=[cache_on_files(network_source)])
 async def get_load_growth(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -2484,8 +2758,8 @@ async def get_load_growth(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
 
-        network = load_network_cached(str(network_path))
-        analyzer = PyPSASingleNetworkAnalyzer(network)
+        network = pypsa_analyzer.load_network_cached(str(network_path))
+        analyzer = pypsa_analyzer.PyPSASingleNetworkAnalyzer(network)
 
         load_data = analyzer.get_load_profiles()
 
@@ -2501,7 +2775,7 @@ async def get_load_growth(
         raise HTTPException(status_code=500, detail=str(error))
 
 
-@router.get("/pypsa/network-metadata")
+@router.get("/pypsa/network-metadata", dependencies=[cache_on_files(network_source)])
 async def get_network_metadata(
     projectPath: str = Query(...),
     scenarioName: str = Query(...),
@@ -2514,10 +2788,7 @@ async def get_network_metadata(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
 
-        network = load_network_cached(str(network_path))
-        analyzer = PyPSASingleNetworkAnalyzer(network)
-
-        metadata = analyzer.get_network_metadata()
+        metadata = memoized_analysis(network_path, 'get_network_metadata')
 
         return {
             "success": True,
@@ -2531,11 +2802,48 @@ async def get_network_metadata(
         raise HTTPException(status_code=500, detail=str(error))
 
 
+@router.get("/pypsa/summary", dependencies=[cache_on_files(network_source)])
+async def get_network_summary(
+    projectPath: str = Query(...),
+    scenarioName: str = Query(...),
+    networkFile: str = Query(...)
+):
+    """
+    Get the network's precomputed summary.
+
+    Returns the component inventory, per-carrier annual aggregates and
+    duration-curve quantiles written next to the network at export time
+    (built and written on first request for older result folders).
+    """
+    try:
+        network_path = Path(projectPath) / "results" / "pypsa_optimization" / scenarioName / networkFile
+
+        if not network_path.exists():
+            raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
+
+        summary = network_summary.get_network_summary(network_path, pypsa_analyzer.load_network_cached)
+
+        return {
+            "success": True,
+            "network_file": networkFile,
+            "inventory": summary['inventory'],
+            "carrier_annual": summary['carrier_annual'],
+            "duration_curves": summary['duration_curves'],
+            "analyses": sorted(summary['analyses'])
+        }
+
+    except HTTPException:
+        raise
+    except Exception as error:
+        logger.error(f"Error getting network summary: {error}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(error))
+
+
 # =============================================================================
 # PERIOD-SPECIFIC ANALYSIS (for multi-period networks)
 # =============================================================================
 
-@router.get("/pypsa/analysis/period/{period_id}")
+@router.get("/pypsa/analysis/period/{period_id}", dependencies=[cache_on_files(network_source)])
 async def get_period_analysis(
     period_id: int,
     analysisType: str = Query(..., description="dispatch, capacity, metrics, storage, emissions, prices, network_flow"),
@@ -2555,19 +2863,19 @@ async def get_period_analysis(
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
 
         # Load network
-        network = load_network_cached(str(network_path))
+        network = pypsa_analyzer.load_network_cached(str(network_path))
 
         # Verify it's multi-period
-        if not is_multi_period(network):
+        if not pypsa_analyzer.is_multi_period(network):
             raise HTTPException(status_code=400, detail="Network is not multi-period. Use regular analysis endpoints.")
 
         # Get available periods
-        periods = get_periods(network)
+        periods = pypsa_analyzer.get_periods(network)
         if period_id not in periods:
             raise HTTPException(status_code=400, detail=f"Period {period_id} not found. Available: {periods}")
 
         # Create analyzer
-        analyzer = PyPSASingleNetworkAnalyzer(network)
+        analyzer = pypsa_analyzer.PyPSASingleNetworkAnalyzer(network)
 
         # Route to appropriate analysis method based on type
         result = {}
@@ -2629,14 +2937,14 @@ async def compare_periods_analysis(
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
 
         # Load network
-        network = load_network_cached(str(network_path))
+        network = pypsa_analyzer.load_network_cached(str(network_path))
 
         # Verify it's multi-period
-        if not is_multi_period(network):
+        if not pypsa_analyzer.is_multi_period(network):
             raise HTTPException(status_code=400, detail="Network is not multi-period")
 
         # Get available periods
-        available_periods = get_periods(network)
+        available_periods = pypsa_analyzer.get_periods(network)
 
         # Validate requested periods
         invalid_periods = [p for p in periods if p not in available_periods]
@@ -2644,7 +2952,7 @@ async def compare_periods_analysis(
             raise HTTPException(status_code=400, detail=f"Invalid periods: {invalid_periods}. Available: {available_periods}")
 
         # Create analyzer
-        analyzer = PyPSASingleNetworkAnalyzer(network)
+        analyzer = pypsa_analyzer.PyPSASingleNetworkAnalyzer(network)
 
         # Get comparison data for each period
         comparison_data = {}
@@ -2715,8 +3023,8 @@ async def get_year_analysis(
             raise HTTPException(status_code=404, detail=f"No .nc file found for year {year}")
 
         # Load and analyze
-        network = load_network_cached(str(target_file))
-        analyzer = PyPSASingleNetworkAnalyzer(network)
+        network = pypsa_analyzer.load_network_cached(str(target_file))
+        analyzer = pypsa_analyzer.PyPSASingleNetworkAnalyzer(network)
 
         # Route to appropriate analysis method
         result = {}
@@ -2797,17 +3105,15 @@ async def compare_years_analysis(
         comparison_data = {}
 
         for year, file_path in sorted(year_to_file.items()):
-            network = load_network_cached(str(file_path))
-            analyzer = PyPSASingleNetworkAnalyzer(network)
-
             if comparisonType == "capacity":
-                comparison_data[year] = analyzer.get_total_capacities()
+                comparison_data[year] = memoized_analysis(file_path, 'get_total_capacities')
             elif comparisonType == "generation":
-                comparison_data[year] = analyzer.get_energy_mix()
+                comparison_data[year] = memoized_analysis(file_path, 'get_energy_mix')
             elif comparisonType == "metrics":
+                analyzer = pypsa_analyzer.PyPSASingleNetworkAnalyzer(pypsa_analyzer.load_network_cached(str(file_path)))
                 comparison_data[year] = analyzer.get_system_metrics()
             elif comparisonType == "emissions":
-                comparison_data[year] = analyzer.get_emissions_tracking()
+                comparison_data[year] = memoized_analysis(file_path, 'get_emissions_tracking')
             else:
                 raise HTTPException(status_code=400, detail=f"Invalid comparison type: {comparisonType}")
 
@@ -2852,11 +3158,8 @@ async def get_stacked_capacity_evolution(
 
         for year in years:
             network_path = networks_by_year[year]
-            network = load_network_cached(str(network_path))
-            analyzer = PyPSASingleNetworkAnalyzer(network)
-
             # Get capacities
-            capacities = analyzer.get_total_capacities()
+            capacities = memoized_analysis(network_path, 'get_total_capacities')
             year_data = {}
 
             # Process generators
@@ -2933,10 +3236,7 @@ async def get_new_capacity_additions(
 
         for year in years:
             network_path = networks_by_year[year]
-            network = load_network_cached(str(network_path))
-            analyzer = PyPSASingleNetworkAnalyzer(network)
-
-            capacities = analyzer.get_total_capacities()
+            capacities = memoized_analysis(network_path, 'get_total_capacities')
             year_data = {}
 
             if 'capacities' in capacities and 'generators' in capacities['capacities']:
@@ -3005,10 +3305,7 @@ async def get_stacked_emissions_evolution(
 
         for year in years:
             network_path = networks_by_year[year]
-            network = load_network_cached(str(network_path))
-            analyzer = PyPSASingleNetworkAnalyzer(network)
-
-            emissions = analyzer.get_emissions_tracking()
+            emissions = memoized_analysis(network_path, 'get_emissions_tracking')
             data_point = {'year': year}
 
             if 'by_carrier' in emissions:
@@ -3060,8 +3357,8 @@ async def get_total_cost_evolution(
 
         for year in years:
             network_path = networks_by_year[year]
-            network = load_network_cached(str(network_path))
-            analyzer = PyPSASingleNetworkAnalyzer(network)
+            network = pypsa_analyzer.load_network_cached(str(network_path))
+            analyzer = pypsa_analyzer.PyPSASingleNetworkAnalyzer(network)
 
             costs = analyzer.get_system_costs()
             data_point = {'year': year}
@@ -3120,8 +3417,8 @@ async def get_growth_trends(
 
         for year in years:
             network_path = networks_by_year[year]
-            network = load_network_cached(str(network_path))
-            analyzer = PyPSASingleNetworkAnalyzer(network)
+            network = pypsa_analyzer.load_network_cached(str(network_path))
+            analyzer = pypsa_analyzer.PyPSASingleNetworkAnalyzer(network)
 
             if metric == 'capacity':
                 capacities = analyzer.get_total_capacities()
@@ -10,9 +10,14 @@ Endpoints:
 - GET /project/pypsa-model-progress - Server-Sent Events for real-time logs
 - POST /project/stop-pypsa-model - Stop/cancel running model
 - GET /project/pypsa-solver-logs - Stream solver log file in real-time
+- GET /project/pypsa/solver-profiles - List HiGHS solver profiles
+
+Run logs are held in a bounded ring buffer (models.log_store.LogStore) that
+spills to ``<scenario>/logs/model_run.log``. Progress events carry SSE ids,
+so a reconnecting EventSource (or ``?since=<seq>``) resumes where it left off.
 """
 
-from fastapi import APIRouter, HTTPException, Query, Body
+from fastapi import APIRouter, HTTPException, Query, Body, Header
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any, List
@@ -20,20 +25,28 @@ import os
 import json
 import asyncio
 import logging
+import time
 from datetime import datetime
 from pathlib import Path
 import traceback
 import sys
-from io import StringIO
 import signal
 import psutil
 
+from models.log_store import LogStore, LogFileTailer
+from models.solver_profiles import AUTO_PROFILE, SOLVER_PROFILES, list_solver_profiles
+
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Seconds between SSE keep-alive comments while no new log lines arrive
+SSE_KEEPALIVE_SECONDS = 15
+# Upper bound on the wait between solver log reads when no run log line wakes the tailer
+SOLVER_LOG_POLL_SECONDS = 1.0
+
 # Global variables for streaming logs and process management
-current_log_buffer = []
-model_status = {"running": False, "completed": False, "error": None, "pid": None}
+current_log_store = LogStore()
+model_status = {"running": False, "completed": False, "error": None, "pid": None, "started_at": None}
 current_solver_log_path = None
 
 
@@ -63,6 +76,8 @@ class Optimization(BaseModel):
     solver: str
     multiYearInvestment: str
     weightings: str
+    solverProfile: Optional[str] = None
+    solverOptions: Optional[Dict[str, Any]] = None
 
 
 class AssetManagement(BaseModel):
@@ -109,22 +124,19 @@ class RunModelRequest(BaseModel):
 class StreamingLogger:
     """Custom logger that captures logs for streaming to frontend"""
 
-    def __init__(self):
-        self.logs = []
-        self.string_io = StringIO()
+    def __init__(self, store: Optional[LogStore] = None):
+        self.store = store if store is not None else current_log_store
 
     def log_buffer(self, log_entry: str):
-        """Add a pre-formatted log entry directly to buffers (used by solver capture)"""
-        self.logs.append(log_entry)
-        current_log_buffer.append(log_entry)
+        """Add a pre-formatted log entry directly to the store (used by solver capture)"""
+        self.store.append(log_entry)
         # Don't call print() here to avoid recursion when stdout is captured
 
     def log(self, level: str, message: str):
         """Add a log entry"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_entry = f"[{timestamp}] [{level}] {message}"
-        self.logs.append(log_entry)
-        current_log_buffer.append(log_entry)
+        self.store.append(log_entry)
         print(log_entry)  # Also print to console
 
     def info(self, message: str):
@@ -143,8 +155,13 @@ class StreamingLogger:
         """Log success message"""
         self.log("SUCCESS", message)
 
+    @property
+    def logs(self) -> List[str]:
+        """Most recent log lines still held in memory"""
+        return self.store.tail()
+
     def get_logs(self) -> str:
-        """Get all logs as formatted string"""
+        """Get recent logs as formatted string"""
         return "\n".join(self.logs)
 
 
@@ -235,7 +252,7 @@ async def run_pypsa_model(request: RunModelRequest):
     Raises:
         HTTPException: 400 if validation fails, 409 if already running, 500 on error
     """
-    global model_status, current_log_buffer
+    global model_status, current_log_store
 
     try:
         # Check if model is already running
@@ -262,8 +279,11 @@ async def run_pypsa_model(request: RunModelRequest):
             )
 
         # Reset status
-        model_status = {"running": True, "completed": False, "error": None}
-        current_log_buffer = []
+        model_status = {"running": True, "completed": False, "error": None, "started_at": time.time()}
+        current_log_store.close()
+        current_log_store = LogStore(
+            spill_path=project_path / "results" / "pypsa_optimization" / request.scenarioName / "logs" / "model_run.log"
+        )
 
         # Start model execution in background
         asyncio.create_task(
@@ -300,7 +320,7 @@ async def execute_pypsa_model(project_folder: str, scenario_name: str):
         scenario_name: Name of the scenario
     """
     global model_status
-    stream_logger = StreamingLogger()
+    stream_logger = StreamingLogger(current_log_store)
 
     try:
         stream_logger.info("="*80)
@@ -358,50 +378,67 @@ async def execute_pypsa_model(project_folder: str, scenario_name: str):
         model_status["running"] = False
         model_status["pid"] = None
         stream_logger.info("Model execution finished.")
+        stream_logger.store.close()
 
 
 # ============================================================================
 # SERVER-SENT EVENTS FOR REAL-TIME LOGS
 # ============================================================================
 
+def _resume_position(since: Optional[int], last_event_id: Optional[str]) -> int:
+    """Sequence number to resume after, from ?since= or the SSE Last-Event-ID header."""
+    if since is not None:
+        return since
+    try:
+        return max(0, int(last_event_id)) if last_event_id else 0
+    except ValueError:
+        return 0
+
+
 @router.get("/pypsa-model-progress")
-async def pypsa_model_progress():
+async def pypsa_model_progress(
+    since: Optional[int] = Query(None, ge=0, description="Resume after this log sequence number"),
+    last_event_id: Optional[str] = Header(None)
+):
     """
     Stream real-time model execution logs via Server-Sent Events (SSE).
 
     This endpoint provides live updates of the model execution progress.
     The frontend should connect to this endpoint using EventSource.
+    Each event carries the sequence number of its last line as the SSE id;
+    reconnecting with Last-Event-ID (or ``since``) resumes without gaps,
+    reading from the spill file if the lines have left the ring buffer.
 
     Returns:
         StreamingResponse: SSE stream with log updates
     """
     async def event_generator():
-        """Generate SSE events with log updates"""
-        global model_status, current_log_buffer
-        last_log_index = 0
+        """Generate SSE events as log lines are appended"""
+        store = current_log_store
+        last_seq = _resume_position(since, last_event_id)
 
         try:
             while True:
-                # Check if there are new logs
-                if last_log_index < len(current_log_buffer):
-                    # Send new logs
-                    new_logs = current_log_buffer[last_log_index:]
-                    log_text = "\n".join(new_logs)
-
-                    yield f"data: {json.dumps({'type': 'progress', 'log': log_text})}\n\n"
-
-                    last_log_index = len(current_log_buffer)
+                lines, seq, gap = store.read(last_seq)
+                if lines:
+                    payload = {'type': 'progress', 'log': "\n".join(lines), 'seq': seq}
+                    if gap:
+                        payload['gap'] = True
+                    yield f"id: {seq}\ndata: {json.dumps(payload)}\n\n"
+                    last_seq = seq
+                    continue
 
-                # Check if model has finished
-                if not model_status["running"]:
+                # Check if model has finished (all lines drained)
+                if not model_status["running"] or store.closed:
                     if model_status["error"]:
                         yield f"data: {json.dumps({'type': 'end', 'status': 'failed', 'error': model_status['error']})}\n\n"
                     else:
                         yield f"data: {json.dumps({'type': 'end', 'status': 'completed'})}\n\n"
                     break
 
-                # Wait before checking again
-                await asyncio.sleep(0.5)
+                # Sleep until the next line is appended
+                if not await store.wait(last_seq, timeout=SSE_KEEPALIVE_SECONDS):
+                    yield ": keep-alive\n\n"
 
         except asyncio.CancelledError:
             logger.info("Client disconnected from progress stream")
@@ -433,7 +470,7 @@ async def get_model_status():
         "completed": model_status["completed"],
         "error": model_status["error"],
         "pid": model_status.get("pid"),
-        "logCount": len(current_log_buffer)
+        "logCount": current_log_store.last_seq
     }
 
 
@@ -453,7 +490,7 @@ async def stop_pypsa_model():
     Raises:
         HTTPException: 404 if no model is running, 500 on error
     """
-    global model_status, current_log_buffer
+    global model_status
 
     try:
         if not model_status["running"]:
@@ -479,20 +516,21 @@ async def stop_pypsa_model():
                     process.kill()  # Send SIGKILL
                     logger.warning(f"Process {pid} force killed")
 
-                current_log_buffer.append("\n⚠️  Model execution cancelled by user")
+                current_log_store.append("\n⚠️  Model execution cancelled by user")
 
             except psutil.NoSuchProcess:
                 logger.warning(f"Process {pid} not found (already terminated)")
             except Exception as e:
                 logger.error(f"Error terminating process: {str(e)}")
-                current_log_buffer.append(f"\n⚠️  Error stopping process: {str(e)}")
+                current_log_store.append(f"\n⚠️  Error stopping process: {str(e)}")
 
         # Update status
         model_status["running"] = False
         model_status["error"] = "Cancelled by user"
         model_status["pid"] = None
 
-        current_log_buffer.append("\n❌ Model execution stopped")
+        # Appending after the status change wakes progress streams so they end promptly
+        current_log_store.append("\n❌ Model execution stopped")
 
         return {
             "success": True,
@@ -516,10 +554,13 @@ async def stream_solver_logs(
     scenarioName: str = Query(..., description="Scenario name")
 ):
     """
-    Stream HiGHS solver log file in real-time via SSE.
+    Stream HiGHS solver log files in real-time via SSE.
 
-    This endpoint tails the solver log file and streams new lines as they're written.
-    Crucial for monitoring long-running optimizations that can take hours.
+    Tails every ``solver_log_*.log`` written for the scenario (stage 1,
+    stage 2, later years) since the current run started, in creation order. Files stay open between reads and
+    only newly appended bytes are read, in bounded blocks. Reads are triggered
+    by new run log lines (solver output is tee'd there too), with a short
+    poll as a fallback.
 
     Args:
         projectPath: Project folder path
@@ -529,51 +570,29 @@ async def stream_solver_logs(
         StreamingResponse: SSE stream with solver log updates
     """
     async def solver_log_generator():
-        """Tail solver log file and stream updates"""
-        try:
-            # Find solver log file
-            log_dir = Path(projectPath) / "results" / "pypsa_optimization" / scenarioName / "logs"
-            solver_log_file = log_dir / f"{scenarioName}_solver.log"
-
-            if not solver_log_file.exists():
-                yield f"data: {json.dumps({'type': 'info', 'message': 'Waiting for solver to start...'})}\n\n"
-
-                # Wait up to 30 seconds for log file to be created
-                for _ in range(60):
-                    await asyncio.sleep(0.5)
-                    if solver_log_file.exists():
-                        break
-                else:
-                    yield f"data: {json.dumps({'type': 'error', 'message': 'Solver log file not created'})}\n\n"
-                    return
-
-            # Tail the log file
-            last_position = 0
-
-            while model_status["running"]:
-                try:
-                    with open(solver_log_file, 'r') as f:
-                        f.seek(last_position)
-                        new_lines = f.read()
-
-                        if new_lines:
-                            yield f"data: {json.dumps({'type': 'log', 'content': new_lines})}\n\n"
-                            last_position = f.tell()
+        """Tail solver log files and stream updates"""
+        scenario_dir = Path(projectPath) / "results" / "pypsa_optimization" / scenarioName
+        tailer = LogFileTailer(scenario_dir, "solver_log_*.log", since=model_status.get("started_at"))
+        store = current_log_store
+        last_seq = store.last_seq
+        announced = False
 
-                except Exception as e:
-                    logger.error(f"Error reading solver log: {str(e)}")
+        try:
+            while True:
+                running = model_status["running"]
+                for name, content in tailer.read(final=not running):
+                    announced = True
+                    yield f"data: {json.dumps({'type': 'log', 'file': name, 'content': content})}\n\n"
 
-                await asyncio.sleep(1)  # Check for updates every second
+                if not running and not tailer.pending():
+                    break
+                if not announced:
+                    announced = True
+                    yield f"data: {json.dumps({'type': 'info', 'message': 'Waiting for solver to start...'})}\n\n"
 
-            # Final read after model stops
-            try:
-                with open(solver_log_file, 'r') as f:
-                    f.seek(last_position)
-                    final_lines = f.read()
-                    if final_lines:
-                        yield f"data: {json.dumps({'type': 'log', 'content': final_lines})}\n\n"
-            except:
-                pass
+                if not tailer.pending():
+                    await store.wait(last_seq, timeout=SOLVER_LOG_POLL_SECONDS)
+                    last_seq = store.last_seq
 
             yield f"data: {json.dumps({'type': 'end'})}\n\n"
 
@@ -582,6 +601,8 @@ async def stream_solver_logs(
         except Exception as e:
             logger.error(f"Error in solver log generator: {str(e)}")
             yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+        finally:
+            tailer.close()
 
     return StreamingResponse(
         solver_log_generator(),
@@ -694,20 +715,39 @@ async def get_pypsa_settings(projectPath: str = Query(..., description="Project
         )
 
 
+@router.get("/pypsa/solver-profiles")
+async def get_solver_profiles():
+    """
+    List the HiGHS solver profiles selectable for a model run.
+
+    Returns:
+        dict: Profiles with label, description and HiGHS options; ``auto``
+              (the default) runs HiGHS with its own defaults
+    """
+    return {
+        "success": True,
+        "default": AUTO_PROFILE,
+        "profiles": list_solver_profiles()
+    }
+
+
 @router.post("/pypsa/apply-configuration")
 async def apply_configuration(
     projectPath: str = Body(..., description="Project folder path"),
-    scenarioName: str = Body(..., description="Scenario name")
+    scenarioName: str = Body(..., description="Scenario name"),
+    solverProfile: Optional[str] = Body(None, description="HiGHS solver profile (or 'auto')")
 ):
     """
     Apply PyPSA configuration for a scenario.
 
     This endpoint validates the project and scenario, and prepares the
-    configuration for model execution.
+    configuration for model execution. A selected solver profile is stored
+    in ``inputs/pypsa_config_<scenario>.json`` (other settings are kept).
 
     Args:
         projectPath: Project folder path
         scenarioName: Name of the scenario
+        solverProfile: Solver profile name from /pypsa/solver-profiles
 
     Returns:
         dict: Success status and message
@@ -721,17 +761,41 @@ async def apply_configuration(
                 detail=f"Project path does not exist: {projectPath}"
             )
 
+        if solverProfile and solverProfile != AUTO_PROFILE and solverProfile not in SOLVER_PROFILES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown solver profile: {solverProfile}"
+            )
+
         # Create scenario folder if it doesn't exist
         scenario_folder = project_path / "results" / "pypsa_optimization" / scenarioName
         scenario_folder.mkdir(parents=True, exist_ok=True)
 
+        if solverProfile:
+            inputs_folder = project_path / "inputs"
+            inputs_folder.mkdir(exist_ok=True)
+            config_file = inputs_folder / f"pypsa_config_{scenarioName}.json"
+
+            config_data = {"scenarioName": scenarioName, "configuration": {"solver": {"name": "highs"}}}
+            if config_file.exists():
+                with open(config_file, 'r', encoding='utf-8') as f:
+                    config_data = json.load(f)
+
+            optimization = config_data.setdefault("configuration", {}).setdefault("optimization", {})
+            optimization["solverProfile"] = solverProfile
+
+            with open(config_file, 'w', encoding='utf-8') as f:
+                json.dump(config_data, f, indent=2, ensure_ascii=False)
+            logger.info(f"Solver profile '{solverProfile}' saved to {config_file}")
+
         logger.info(f"Configuration applied for scenario '{scenarioName}'")
 
         return {
             "success": True,
             "message": f"Configuration applied successfully for scenario '{scenarioName}'",
             "scenarioName": scenarioName,
-            "scenarioPath": str(scenario_folder)
+            "scenarioPath": str(scenario_folder),
+            "solverProfile": solverProfile or AUTO_PROFILE
         }
 
     except HTTPException:
@@ -11,9 +11,10 @@ Features:
 - Interactive Plotly-based visualizations
 - Multiple plot types (dispatch, capacity, storage, transmission, prices)
 - Customizable filters (resolution, date range, carriers)
-- Export in multiple formats (HTML, PNG, PDF)
+- Export in multiple formats (JSON figure spec, HTML, PNG, PDF)
 - Dynamic plot availability detection
-- Memory-efficient rendering
+- Encoded figures cached per network fingerprint, plot type and filters;
+  PNG/PDF rendered on a warm Kaleido worker (see models/figure_render.py)
 
 Supported Plot Types:
 - dispatch: Power system dispatch with generation and storage
@@ -30,20 +31,25 @@ Date: 2025
 """
 
 from fastapi import APIRouter, HTTPException, Query, Body
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 from pydantic import BaseModel, Field
+import json
 import logging
 import tempfile
-import pandas as pd
 
 # Import models
 import sys
 sys.path.append(str(Path(__file__).parent.parent / "models"))
 
-from models.pypsa_visualizer import PyPSAVisualizer
-from models.pypsa_analyzer import load_network_cached
+from models.lazy_imports import lazy_import
+
+# pypsa/plotly load on the first plot request, not at server start
+pd = lazy_import('pandas')
+pypsa_visualizer = lazy_import('models.pypsa_visualizer')
+pypsa_analyzer = lazy_import('models.pypsa_analyzer')
+figure_render = lazy_import('models.figure_render')
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -77,7 +83,7 @@ class PlotRequest(BaseModel):
     network_path: str = Field(..., description="Full path to network file")
     plot_type: str = Field(..., description="Type of plot to generate")
     filters: PlotFilters = Field(default_factory=PlotFilters, description="Plot filters")
-    output_format: str = Field("html", description="Output format: html, png, pdf")
+    output_format: str = Field("html", description="Output format: json, html, png, pdf")
 
 
 class NetworkPlotRequest(BaseModel):
@@ -87,7 +93,7 @@ class NetworkPlotRequest(BaseModel):
     networkFile: str = Field(..., description="Network filename")
     plot_type: str = Field(..., description="Type of plot to generate")
     filters: PlotFilters = Field(default_factory=PlotFilters, description="Plot filters")
-    output_format: str = Field("html", description="Output format: html, png, pdf")
+    output_format: str = Field("html", description="Output format: json, html, png, pdf")
 
 
 # =============================================================================
@@ -112,7 +118,7 @@ async def generate_plot(request: PlotRequest):
         request: PlotRequest with network path, plot type, filters, and format
 
     Returns:
-        dict: Response with plot content (HTML) or file path (PNG/PDF)
+        dict: Response with the figure spec (JSON), plot content (HTML) or file path (PNG/PDF)
     """
     try:
         # Validate network file
@@ -123,48 +129,12 @@ async def generate_plot(request: PlotRequest):
         if network_path.suffix != '.nc':
             raise HTTPException(status_code=400, detail="Only .nc files are supported")
         
-        # Load network with caching
-        logger.info(f"Loading network for plot generation: {network_path}")
-        network = load_network_cached(str(network_path))
-        
-        # Create visualizer
-        visualizer = PyPSAVisualizer(network)
-        
-        # Generate plot based on type
-        logger.info(f"Generating {request.plot_type} plot")
-        fig = _generate_plot_by_type(visualizer, request.plot_type, request.filters)
-        
-        if fig is None:
-            raise HTTPException(status_code=500, detail="Failed to generate plot")
-        
-        # Export based on format
-        if request.output_format == "html":
-            html_content = fig.to_html(
-                include_plotlyjs='cdn',
-                config={'responsive': True, 'displayModeBar': True}
-            )
-            
-            return {
-                "success": True,
-                "plot_type": request.plot_type,
-                "format": "html",
-                "content": html_content
-            }
+        def build(visualizer):
+            logger.info(f"Generating {request.plot_type} plot")
+            return _generate_plot_by_type(visualizer, request.plot_type, request.filters)
         
-        elif request.output_format in ["png", "pdf"]:
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{request.output_format}") as tmp:
-                fig.write_image(tmp.name)
-                
-                return {
-                    "success": True,
-                    "plot_type": request.plot_type,
-                    "format": request.output_format,
-                    "file_path": tmp.name
-                }
-        
-        else:
-            raise HTTPException(status_code=400, detail=f"Unsupported output format: {request.output_format}")
+        content = _render_plot(network_path, request.plot_type, request.filters, request.output_format, build)
+        return _plot_response(content, request.output_format, {"plot_type": request.plot_type})
     
     except HTTPException:
         raise
@@ -196,8 +166,8 @@ async def get_available_years(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
         
-        network = load_network_cached(str(network_path))
-        visualizer = PyPSAVisualizer(network)
+        network = pypsa_analyzer.load_network_cached(str(network_path))
+        visualizer = pypsa_visualizer.PyPSAVisualizer(network)
         
         years = visualizer._get_available_years() if visualizer.is_multi_period else []
         
@@ -226,7 +196,7 @@ async def generate_dispatch_by_year(request: NetworkPlotRequest):
         request: NetworkPlotRequest with network details and filters
         
     Returns:
-        dict: Response with plot content (HTML) or file path (PNG/PDF)
+        dict: Response with the figure spec (JSON), plot content (HTML) or file path (PNG/PDF)
     """
     try:
         network_path = Path(request.projectPath) / "results" / "pypsa_optimization" / request.scenarioName / request.networkFile
@@ -234,54 +204,23 @@ async def generate_dispatch_by_year(request: NetworkPlotRequest):
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {network_path}")
         
-        network = load_network_cached(str(network_path))
-        visualizer = PyPSAVisualizer(network)
-        
-        logger.info(f"Generating dispatch plot by year for {request.scenarioName}")
-        
         year = request.filters.year
-        fig = visualizer.plot_dispatch_by_year(
-            year=year,
-            resolution=request.filters.resolution,
-            start_date=request.filters.start_date,
-            end_date=request.filters.end_date,
-            carriers=request.filters.carriers,
-            stacked=request.filters.stacked,
-            show_storage=request.filters.show_storage,
-            show_load=request.filters.show_load
-        )
         
-        if fig is None:
-            raise HTTPException(status_code=500, detail="Failed to generate plot")
-        
-        if request.output_format == "html":
-            html_content = fig.to_html(
-                include_plotlyjs='cdn',
-                config={'responsive': True, 'displayModeBar': True}
+        def build(visualizer):
+            logger.info(f"Generating dispatch plot by year for {request.scenarioName}")
+            return visualizer.plot_dispatch_by_year(
+                year=year,
+                resolution=request.filters.resolution,
+                start_date=request.filters.start_date,
+                end_date=request.filters.end_date,
+                carriers=request.filters.carriers,
+                stacked=request.filters.stacked,
+                show_storage=request.filters.show_storage,
+                show_load=request.filters.show_load
             )
-            
-            return {
-                "success": True,
-                "plot_type": "dispatch_by_year",
-                "year": year,
-                "format": "html",
-                "content": html_content
-            }
         
-        elif request.output_format in ["png", "pdf"]:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=f".{request.output_format}") as tmp:
-                fig.write_image(tmp.name)
-                
-                return {
-                    "success": True,
-                    "plot_type": "dispatch_by_year",
-                    "year": year,
-                    "format": request.output_format,
-                    "file_path": tmp.name
-                }
-        
-        else:
-            raise HTTPException(status_code=400, detail=f"Unsupported output format: {request.output_format}")
+        content = _render_plot(network_path, "dispatch_by_year", request.filters, request.output_format, build)
+        return _plot_response(content, request.output_format, {"plot_type": "dispatch_by_year", "year": year})
     
     except HTTPException:
         raise
@@ -301,7 +240,7 @@ async def generate_plot_from_project(request: NetworkPlotRequest):
         request: NetworkPlotRequest with project path, scenario, network file, plot type, and filters
 
     Returns:
-        dict: Response with plot content (HTML) or file path (PNG/PDF)
+        dict: Response with the figure spec (JSON), plot content (HTML) or file path (PNG/PDF)
     """
     try:
         # Construct network path
@@ -356,7 +295,7 @@ async def get_plot_availability(
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
         
         # Load network
-        network = load_network_cached(str(network_path))
+        network = pypsa_analyzer.load_network_cached(str(network_path))
         
         # Determine available plots
         availability = {
@@ -437,7 +376,49 @@ async def get_plot_availability(
 # HELPER FUNCTIONS
 # =============================================================================
 
-def _generate_plot_by_type(visualizer: PyPSAVisualizer, plot_type: str, filters: PlotFilters):
+def _render_plot(network_path: Path, plot_type: str, filters: PlotFilters, output_format: str,
+                 build: Callable[[Any], Any]) -> bytes:
+    """
+    Encoded plot for a request, from the figure cache or built on a miss.
+
+    The network is only loaded (and ``build`` called with a visualizer) when
+    no figure for this network version, plot type, format and filters is
+    cached.
+    """
+    if output_format not in figure_render.FIGURE_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported output format: {output_format}")
+
+    def build_figure():
+        logger.info(f"Loading network for plot generation: {network_path}")
+        network = pypsa_analyzer.load_network_cached(str(network_path))
+        fig = build(pypsa_visualizer.PyPSAVisualizer(network))
+        if fig is None:
+            raise HTTPException(status_code=500, detail="Failed to generate plot")
+        return fig
+
+    return figure_render.cached_figure(network_path, plot_type, output_format, filters.model_dump(), build_figure)
+
+
+def _plot_payload(content: bytes, output_format: str) -> Dict[str, Any]:
+    """Response fields for encoded plot content (images go to a temp file)."""
+    if output_format == "json":
+        return {"format": "json", "figure": json.loads(content)}
+    if output_format == "html":
+        return {"format": "html", "content": content.decode('utf-8')}
+    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{output_format}") as tmp:
+        tmp.write(content)
+    return {"format": output_format, "file_path": tmp.name}
+
+
+def _plot_response(content: bytes, output_format: str, fields: Dict[str, Any]):
+    """Plot route response; JSON figure specs are spliced in without re-encoding."""
+    if output_format == "json":
+        head = json.dumps({"success": True, **fields, "format": "json"})[:-1]
+        return Response(content=head.encode('utf-8') + b',"figure":' + content + b'}', media_type="application/json")
+    return {"success": True, **fields, **_plot_payload(content, output_format)}
+
+
+def _generate_plot_by_type(visualizer: 'pypsa_visualizer.PyPSAVisualizer', plot_type: str, filters: PlotFilters):
     """Generate plot based on type and filters."""
     
     if plot_type == "dispatch":
@@ -615,45 +596,25 @@ async def generate_batch_plots(
         if not network_path.exists():
             raise HTTPException(status_code=404, detail=f"Network file not found: {networkFile}")
         
-        # Load network once
-        network = load_network_cached(str(network_path))
-        visualizer = PyPSAVisualizer(network)
+        if output_format not in figure_render.FIGURE_FORMATS:
+            raise HTTPException(status_code=400, detail=f"Unsupported output format: {output_format}")
         
-        # Generate all plots
+        # Generate all plots (the network is only loaded on a figure cache miss)
         results = {}
         for plot_type in plot_types:
             try:
-                logger.info(f"Generating {plot_type} plot")
-                fig = _generate_plot_by_type(visualizer, plot_type, filters)
+                def build(visualizer, plot_type=plot_type):
+                    logger.info(f"Generating {plot_type} plot")
+                    return _generate_plot_by_type(visualizer, plot_type, filters)
                 
-                if fig is None:
-                    results[plot_type] = {
-                        "success": False,
-                        "error": "Failed to generate plot"
-                    }
-                    continue
-                
-                # Export based on format
-                if output_format == "html":
-                    html_content = fig.to_html(
-                        include_plotlyjs='cdn',
-                        config={'responsive': True, 'displayModeBar': True}
-                    )
-                    results[plot_type] = {
-                        "success": True,
-                        "format": "html",
-                        "content": html_content
-                    }
-                
-                elif output_format in ["png", "pdf"]:
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=f".{output_format}") as tmp:
-                        fig.write_image(tmp.name)
-                        results[plot_type] = {
-                            "success": True,
-                            "format": output_format,
-                            "file_path": tmp.name
-                        }
+                content = _render_plot(network_path, plot_type, filters, output_format, build)
+                results[plot_type] = {"success": True, **_plot_payload(content, output_format)}
             
+            except HTTPException as plot_error:
+                results[plot_type] = {
+                    "success": False,
+                    "error": plot_error.detail
+                }
             except Exception as plot_error:
                 logger.error(f"Error generating {plot_type}: {plot_error}")
                 results[plot_type] = {
@@ -15,17 +15,26 @@ Endpoints:
 - GET /project/scenarios/{scenarioName}/consolidated/exists - Check if consolidated file exists
 - POST /project/scenarios/{scenarioName}/consolidated - Generate consolidated results
 - POST /project/save-consolidated - Save consolidated results to Excel
+- POST /project/scenarios/compare - Compare N scenarios on aligned sector/model/year arrays
 """
 
 from fastapi import APIRouter, HTTPException, Query, Path as PathParam
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-import openpyxl
-from openpyxl.utils import get_column_letter
 import json
 import logging
 
+from models.http_cache import cache_on_files, forecast_scenario_file, forecast_sector_source
+from models.lazy_imports import lazy_import
+
+openpyxl = lazy_import('openpyxl')
+pd = lazy_import('pandas')
+forecast_cube = lazy_import('models.forecast_cube')
+forecast_store = lazy_import('models.forecast_store')
+scenario_comparison = lazy_import('models.scenario_comparison')
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
@@ -51,6 +60,16 @@ class ConsolidatedRequest(BaseModel):
     demandType: Optional[str] = "gross"  # Options: "gross", "net", "onGrid"
 
 
+class ScenarioCompareRequest(BaseModel):
+    """Request model for comparing scenarios"""
+    projectPath: str
+    scenarios: List[str] = Field(..., min_length=2, description="Scenarios to compare (base first by default)")
+    baseScenario: Optional[str] = None
+    startYear: Optional[int] = None
+    endYear: Optional[int] = None
+    sectors: Optional[List[str]] = None
+
+
 class SaveConsolidatedRequest(BaseModel):
     """Request model for saving consolidated results"""
     projectPath: str
@@ -175,58 +194,6 @@ def is_solar_sector(sector_name: str) -> bool:
     return 'solar' in sector_name.lower()
 
 
-def calculate_td_loss_percentage(target_year: int, loss_points: List[TDLossPoint]) -> float:
-    """
-    Calculate T&D loss percentage for a given year using linear interpolation.
-
-    Args:
-        target_year: Year to calculate loss for
-        loss_points: List of T&D loss data points
-
-    Returns:
-        Loss percentage as decimal (e.g., 0.10 for 10%)
-    """
-    DEFAULT_LOSS = 0.10  # 10%
-
-    if not loss_points or len(loss_points) == 0:
-        return DEFAULT_LOSS
-
-    # Filter and sort points
-    sorted_points = sorted(
-        [p for p in loss_points if isinstance(p.year, (int, float)) and isinstance(p.loss, (int, float))],
-        key=lambda p: p.year
-    )
-
-    if len(sorted_points) == 0:
-        return DEFAULT_LOSS
-    if len(sorted_points) == 1:
-        return sorted_points[0].loss / 100
-
-    first_point = sorted_points[0]
-    last_point = sorted_points[-1]
-
-    # Extrapolation
-    if target_year <= first_point.year:
-        return first_point.loss / 100
-    if target_year >= last_point.year:
-        return last_point.loss / 100
-
-    # Interpolation
-    for i in range(len(sorted_points) - 1):
-        p1 = sorted_points[i]
-        p2 = sorted_points[i + 1]
-
-        if target_year >= p1.year and target_year <= p2.year:
-            if p2.year - p1.year == 0:
-                return p1.loss / 100
-
-            # Linear interpolation
-            interpolated_loss = p1.loss + (target_year - p1.year) * (p2.loss - p1.loss) / (p2.year - p1.year)
-            return interpolated_loss / 100
-
-    return DEFAULT_LOSS
-
-
 @router.get("/scenarios")
 async def list_scenarios(projectPath: str = Query(..., description="Project root path")):
     """
@@ -257,7 +224,7 @@ async def list_scenarios(projectPath: str = Query(..., description="Project root
         raise HTTPException(status_code=500, detail="Failed to read scenario folders")
 
 
-@router.get("/scenarios/{scenarioName}/meta")
+@router.get("/scenarios/{scenarioName}/meta", dependencies=[cache_on_files(forecast_scenario_file("scenario_meta.json"))])
 async def get_scenario_meta(
     scenarioName: str = PathParam(..., description="Scenario name"),
     projectPath: str = Query(..., description="Project root path")
@@ -319,6 +286,12 @@ async def get_scenario_sectors(
             raise HTTPException(status_code=404, detail="Scenario folder not found.")
 
         files = [f.stem for f in scenario_path.glob("*.xlsx") if not f.name.startswith("~$")]
+
+        # Sectors written only to the columnar store (Excel export disabled)
+        store = forecast_store.get_forecast_store(scenario_path)
+        if store is not None:
+            files += [sector for sector in store.sectors if sector not in files]
+
         return {"success": True, "sectors": files}
 
     except HTTPException:
@@ -336,7 +309,8 @@ async def get_scenario_models(
     """
     Get available forecasting models for each sector.
 
-    Reads the 'Results' sheet headers from each sector Excel file.
+    Reads the columnar results store, falling back to the 'Results' sheet
+    headers of each sector Excel file for scenarios without one.
 
     Args:
         scenarioName: Name of the scenario
@@ -356,12 +330,17 @@ async def get_scenario_models(
 
         models_by_sector = {}
 
+        store = forecast_store.get_forecast_store(scenario_path)
+        if store is not None:
+            for sector_name in store.sectors:
+                models_by_sector[sector_name] = store.models(sector_name)
+
         for file in scenario_path.glob("*.xlsx"):
               # Skip temporary Excel files
             if file.name.startswith("~$"):
                 continue
             sector_name = file.stem
-            if sector_name == 'Consolidated_Results':
+            if sector_name == 'Consolidated_Results' or sector_name in models_by_sector:
                 continue
 
             try:
@@ -391,12 +370,11 @@ async def get_scenario_models(
         raise HTTPException(status_code=500, detail="Failed to fetch models for the scenario.")
 
 from pathlib import Path
-import openpyxl
 from fastapi import HTTPException
 # PathParam and Query typed-deps assumed imported as in your original file
 # logger assumed to be available in module scope
 
-@router.get("/scenarios/{scenarioName}/sectors/{sectorName}")
+@router.get("/scenarios/{scenarioName}/sectors/{sectorName}", dependencies=[cache_on_files(forecast_sector_source)])
 async def get_sector_data(
     scenarioName: str = PathParam(..., description="Scenario name"),
     sectorName: str = PathParam(..., description="Sector name"),
@@ -417,7 +395,24 @@ async def get_sector_data(
         raise HTTPException(status_code=400, detail="startYear must be <= endYear.")
 
     try:
-        file_path = Path(projectPath) / "results" / "demand_forecasts" / scenarioName / f"{sectorName}.xlsx"
+        scenario_path = Path(projectPath) / "results" / "demand_forecasts" / scenarioName
+
+        # Columnar results store (one file for all sectors)
+        store = forecast_store.get_forecast_store(scenario_path) if sectorName != "Consolidated_Results" else None
+        if store is not None and store.has_sector(sectorName):
+            results = store.results(sectorName)
+            years = pd.to_numeric(results["Year"], errors="coerce") if "Year" in results.columns else None
+            if years is None:
+                rows = results.iloc[0:0]
+            else:
+                rows = results[(years >= startYear) & (years <= endYear)]
+            return {
+                "success": True,
+                "data": rows.astype(object).where(rows.notna(), None).to_dict(orient="records"),
+                "forecastYearstart": store.forecast_start_year(sectorName)
+            }
+
+        file_path = scenario_path / f"{sectorName}.xlsx"
 
         if not file_path.exists():
             raise HTTPException(status_code=404, detail="Sector result file not found.")
@@ -562,7 +557,7 @@ async def get_sector_data(
         logger.error(f"Error processing sector data for {scenarioName}/{sectorName}: {error}", exc_info=True)
         raise HTTPException(status_code=500, detail="Failed to process sector data.")
 
-@router.get("/scenarios/{scenarioName}/td-losses")
+@router.get("/scenarios/{scenarioName}/td-losses", dependencies=[cache_on_files(forecast_scenario_file("td_losses.json"))])
 async def get_td_losses(
     scenarioName: str = PathParam(..., description="Scenario name"),
     projectPath: str = Query(..., description="Project root path")
@@ -690,161 +685,92 @@ async def generate_consolidated(
         if not scenario_path.exists():
             raise HTTPException(status_code=404, detail="Scenario folder not found.")
 
-        model_selections = request.selections or {}
-
-        # Get all Excel files except Consolidated_Results and temporary files
-        excel_files = [
-            f for f in scenario_path.glob("*.xlsx")
-            if f.stem != 'Consolidated_Results' and not f.name.startswith("~$")
-          ]
-        sectors = [f.stem for f in excel_files]
-
-        # Create year range
-        years = list(range(request.startYear, request.endYear + 1))
-
-        # Initialize consolidated data
-        consolidated_data = []
-        data_map = {}
-        for year in years:
-            row_data = {"Year": year}
-            for sector in sectors:
-                row_data[sector] = None
-            consolidated_data.append(row_data)
-            data_map[year] = row_data
-
-        # Read data from each sector
-        for sector in sectors:
-            selected_model = model_selections.get(sector)
-            if not selected_model:
-                continue
+        # Sector forecasts, solar shares and T&D losses are loaded once per
+        # scenario fingerprint; all demand types are computed together
+        cube = forecast_cube.get_forecast_cube(
+            scenario_path,
+            solar_share_file=Path(request.projectPath) / "inputs" / "input_demand_file.xlsx",
+            read_solar_shares=lambda: read_solar_share_data(request.projectPath)
+        )
+        result = cube.consolidate(request.startYear, request.endYear, request.selections or {}, is_solar_sector)
 
-            file_path = scenario_path / f"{sector}.xlsx"
-            if not file_path.exists():
-                continue
+        demand_type = request.demandType or "gross"
+        if demand_type == "gross":
+            # GROSS DEMAND: Sector totals + T&D losses
+            extra_columns = {
+                'Gross Total': result.gross_total,
+                'T&D Loss (%)': result.td_fraction,
+                'T&D Losses': result.gross_td_losses,
+                'Total': result.gross_total + result.gross_td_losses,
+            }
+        elif demand_type == "net":
+            # NET DEMAND: Solar share subtracted from each non-solar sector
+            extra_columns = {'Total': result.net_total}
+        elif demand_type == "onGrid":
+            # ON GRID DEMAND: Net demand + T&D losses
+            extra_columns = {
+                'Net Total': result.net_total,
+                'T&D Loss (%)': result.td_fraction,
+                'T&D Losses': result.net_td_losses,
+                'Total': result.net_total + result.net_td_losses,
+            }
+        else:
+            extra_columns = {}
 
-            try:
-                workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
-                if 'Results' not in workbook.sheetnames:
-                    workbook.close()
-                    continue
+        consolidated_data = result.records(demand_type, extra_columns)
 
-                sheet = workbook['Results']
-                headers = [cell.value for cell in next(sheet.iter_rows(min_row=1, max_row=1))]
-                for row in sheet.iter_rows(min_row=2, values_only=True):
-                    row_dict = dict(zip(headers, row))
-                    year = row_dict.get('Year')
-                    if year and int(year) in data_map:
-                        value = row_dict.get(selected_model)
-                        if value is not None:
-                            data_map[int(year)][sector] = value
+        return {"success": True, "data": consolidated_data}
 
-                workbook.close()
+    except HTTPException:
+        raise
+    except Exception as error:
+        logger.error(f"Error generating consolidated data: {error}")
+        raise HTTPException(status_code=500, detail="Failed to fetch consolidated data.")
 
-            except Exception as e:
-                logger.error(f"Error reading sector {sector}: {e}")
-                continue
 
-        # Load solar share data for net demand calculation
-        solar_shares = {}
-        demand_type = request.demandType or "gross"
+@router.post("/scenarios/compare")
+async def compare_scenario_forecasts(request: ScenarioCompareRequest):
+    """
+    Compare demand forecast scenarios in one call.
 
-        if demand_type in ["net", "onGrid"]:
-            solar_shares = read_solar_share_data(request.projectPath)
-            logger.info(f"[generate_consolidated] Loaded solar shares: {solar_shares}")
+    Aligns the scenarios on (sector, model, year) and returns their values,
+    absolute/percent differences against the base scenario, CAGR and
+    cumulative energy (with deltas) per series. Results are cached by
+    scenario fingerprints, so repeated calls are served from memory.
 
-        # Load T&D losses
-        td_loss_points = []
-        losses_file_path = scenario_path / "td_losses.json"
-        if losses_file_path.exists():
-            try:
-                with open(losses_file_path, 'r') as f:
-                    loss_data = json.load(f)
-                    td_loss_points = [TDLossPoint(**point) for point in loss_data]
-            except Exception as e:
-                logger.error(f"Could not parse td_losses.json: {e}")
-
-        # Calculate totals based on demand type
-        for row in consolidated_data:
-            year = row['Year']
-
-            # Apply solar sector abs() transformation
-            for sector in sectors:
-                if row[sector] is not None and is_solar_sector(sector):
-                    row[sector] = abs(float(row[sector]))
-
-            if demand_type == "gross":
-                # GROSS DEMAND: Original behavior
-                gross_total = sum(
-                    float(row[sector]) if row[sector] is not None else 0
-                    for sector in sectors
-                )
-
-                td_percentage = calculate_td_loss_percentage(year, td_loss_points)
-                td_losses = gross_total * (td_percentage / (1 - td_percentage))
-                final_total = gross_total + td_losses
-
-                row['Gross Total'] = gross_total
-                row['T&D Loss (%)'] = td_percentage
-                row['T&D Losses'] = td_losses
-                row['Total'] = final_total
-
-            elif demand_type == "net":
-                # NET DEMAND: Subtract solar generation from each sector
-                net_total = 0
-
-                for sector in sectors:
-                    if row[sector] is not None:
-                        sector_value = float(row[sector])
-
-                        # For non-solar sectors, subtract their solar share
-                        if not is_solar_sector(sector):
-                            solar_share_pct = solar_shares.get(sector, 0.0)
-                            net_value = sector_value - (sector_value * solar_share_pct / 100.0)
-                            row[sector] = net_value
-                            net_total += net_value
-                        else:
-                            # For solar sectors, keep the absolute value
-                            row[sector] = abs(sector_value)
-                            net_total += abs(sector_value)
-
-                row['Total'] = net_total
-
-            elif demand_type == "onGrid":
-                # ON GRID DEMAND: Net demand + T&D losses
-                net_total = 0
-
-                for sector in sectors:
-                    if row[sector] is not None:
-                        sector_value = float(row[sector])
-
-                        # For non-solar sectors, subtract their solar share
-                        if not is_solar_sector(sector):
-                            solar_share_pct = solar_shares.get(sector, 0.0)
-                            net_value = sector_value - (sector_value * solar_share_pct / 100.0)
-                            row[sector] = net_value
-                            net_total += net_value
-                        else:
-                            # For solar sectors, keep the absolute value
-                            row[sector] = abs(sector_value)
-                            net_total += abs(sector_value)
+    Args:
+        request: Project path, scenarios, optional base, year window and sectors
+
+    Returns:
+        dict: Comparison payload (see models.scenario_comparison)
+    """
+    try:
+        base_path = Path(request.projectPath) / "results" / "demand_forecasts"
+        scenario_dirs = {}
+        for name in request.scenarios:
+            scenario_path = base_path / name
+            if not scenario_path.exists():
+                raise HTTPException(status_code=404, detail=f"Scenario folder not found: {name}")
+            scenario_dirs[name] = scenario_path
 
-                # Apply T&D losses to net demand
-                td_percentage = calculate_td_loss_percentage(year, td_loss_points)
-                td_losses = net_total * (td_percentage / (1 - td_percentage))
-                final_total = net_total + td_losses
+        if request.startYear and request.endYear and request.startYear > request.endYear:
+            raise HTTPException(status_code=400, detail="startYear must be <= endYear.")
 
-                row['Net Total'] = net_total
-                row['T&D Loss (%)'] = td_percentage
-                row['T&D Losses'] = td_losses
-                row['Total'] = final_total
+        try:
+            comparison = await run_in_threadpool(
+                scenario_comparison.compare_scenarios, scenario_dirs, request.baseScenario,
+                request.startYear, request.endYear, request.sectors
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-        return {"success": True, "data": consolidated_data}
+        return {"success": True, **comparison.to_payload()}
 
     except HTTPException:
         raise
     except Exception as error:
-        logger.error(f"Error generating consolidated data: {error}")
-        raise HTTPException(status_code=500, detail="Failed to fetch consolidated data.")
+        logger.error(f"Error comparing scenarios {request.scenarios}: {error}", exc_info=True)
+        raise HTTPException(status_code=500, detail="Failed to compare scenarios.")
 
 
 @router.post("/save-consolidated")
@@ -10,9 +10,12 @@ Endpoints:
 
 from fastapi import APIRouter, HTTPException, Query
 from pathlib import Path
-import openpyxl
 import logging
 
+from models.lazy_imports import lazy_import
+
+openpyxl = lazy_import('openpyxl')
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
@@ -6,39 +6,142 @@ Handles hourly load profile time series data extraction with filtering.
 
 Endpoints:
 - GET /project/full-load-profile - Get hourly load data filtered by fiscal year/month/season
+- GET /project/load-profile-range - Get a date window at the resolution that fits the chart width
+
+Sending ``Accept: application/x-ndjson`` (or the Arrow IPC stream media type)
+streams the filtered rows as columnar chunks while the workbook is being read.
 """
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Header
 from pathlib import Path
-from typing import Optional
-import openpyxl
-from openpyxl.utils import datetime as excel_datetime
+from typing import Any, Dict, Iterator, List, Optional
+from datetime import datetime, timedelta
 import logging
 
+from models.lazy_imports import lazy_import
+
+from models.http_cache import cache_on_files, profile_source
+
+openpyxl = lazy_import('openpyxl')
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+columnar_stream = lazy_import('models.columnar_stream')
+profile_pyramid = lazy_import('models.profile_pyramid')
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Excel epoch starts at 1899-12-30
+EXCEL_EPOCH = datetime(1899, 12, 30)
+
+
+def _profile_file(projectPath: str, profileName: str) -> Path:
+    """Workbook path for a profile, raising 404 when it does not exist."""
+    file_path = Path(projectPath) / "results" / "load_profiles" / f"{profileName}.xlsx"
+    if not file_path.exists():
+        raise HTTPException(
+            status_code=404,
+            detail=f"Profile file not found: {profileName}.xlsx"
+        )
+    return file_path
+
+
+def _parse_timestamp(value: Optional[str], name: str) -> Optional['np.datetime64']:
+    """Parse an ISO date/datetime query parameter."""
+    if not value:
+        return None
+    try:
+        return np.datetime64(pd.Timestamp(value).tz_localize(None).to_datetime64(), 's')
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail=f"Invalid {name}: {value}")
+
+
+def _pyramid_result(columns: Dict[str, 'np.ndarray'], level: str, accept: Optional[str], meta: Dict[str, Any]):
+    """Return pyramid columns as JSON records or, if negotiated, a columnar stream."""
+    stream_format = columnar_stream.negotiate_stream_format(accept)
+    if stream_format:
+        return columnar_stream.columnar_response(stream_format, columnar_stream.chunk_columns(columns), {**meta, 'level': level})
+
+    frame = pd.DataFrame(columns)
+    frame['DateTime'] = np.datetime_as_string(columns['DateTime'], unit='s')
+    records = frame.astype(object).where(frame.notna(), None).to_dict('records')
+    return {"success": True, "level": level, "data": records}
+
 
-@router.get("/full-load-profile")
+def _iter_profile_rows(worksheet, headers: List[Any], year: int, months: List[int]) -> Iterator[Dict[str, Any]]:
+    """Yield Load_Profile rows for one fiscal year (and optional months) as they are read."""
+    for row in worksheet.iter_rows(min_row=2, values_only=True):
+        row_dict = dict(zip(headers, row))
+
+        if row_dict.get('Fiscal_Year') != year:
+            continue
+        if months and row_dict.get('Month') not in months:
+            continue
+
+        # Format DateTime field
+        excel_date_serial = row_dict.get('DateTime')
+        if excel_date_serial and isinstance(excel_date_serial, (int, float)):
+            # Convert Excel serial number to datetime
+            try:
+                python_date = EXCEL_EPOCH + timedelta(days=excel_date_serial)
+                row_dict['DateTime'] = python_date.strftime("%Y-%m-%d %H:%M:%S")
+            except Exception:
+                # If conversion fails, keep original value
+                pass
+
+        yield row_dict
+
+
+def _iter_profile_chunks(workbook, rows: Iterator[Dict[str, Any]], headers: List[Any],
+                         chunk_rows: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Batch filtered rows into column chunks; closes the workbook when exhausted."""
+    chunk_rows = chunk_rows or columnar_stream.DEFAULT_CHUNK_ROWS
+    names = [str(h) for h in headers]
+    try:
+        buffer: Dict[str, list] = {name: [] for name in names}
+        count = 0
+        for row in rows:
+            for header, name in zip(headers, names):
+                value = row.get(header)
+                buffer[name].append(value.isoformat() if isinstance(value, datetime) else value)
+            count += 1
+            if count == chunk_rows:
+                yield {name: columnar_stream.coerce_column(values) for name, values in buffer.items()}
+                buffer = {name: [] for name in names}
+                count = 0
+        if count:
+            yield {name: columnar_stream.coerce_column(values) for name, values in buffer.items()}
+    finally:
+        workbook.close()
+
+
+@router.get("/full-load-profile", dependencies=[cache_on_files(profile_source)])
 async def get_full_load_profile(
     projectPath: str = Query(..., description="Project root path"),
     profileName: str = Query(..., description="Profile name"),
     fiscalYear: str = Query(..., description="Fiscal year (e.g., FY2025)"),
     month: Optional[int] = Query(None, description="Month number (1-12)"),
-    season: Optional[str] = Query(None, description="Season name")
+    season: Optional[str] = Query(None, description="Season name"),
+    maxPoints: Optional[int] = Query(None, ge=1, description="Serve pre-aggregated rows when the hourly rows exceed this count"),
+    accept: Optional[str] = Header(None)
 ):
     """
     Get full hourly load profile data with optional filtering by month or season.
 
+    With ``maxPoints`` the rows come from the profile's resolution pyramid:
+    hourly if they fit, otherwise daily/monthly min/mean/max buckets.
+
     Args:
         projectPath: Project root directory
         profileName: Name of the profile (without .xlsx)
         fiscalYear: Fiscal year string (e.g., 'FY2025')
         month: Optional month filter (1-12)
         season: Optional season filter (Monsoon, Post-monsoon, Winter, Summer)
+        maxPoints: Optional point budget (e.g. chart width in pixels)
+        accept: Accept header; NDJSON / Arrow media types select the streamed mode
 
     Returns:
-        dict: Filtered hourly load profile data
+        dict: Filtered hourly load profile data, or a columnar stream
     """
     if not projectPath or not profileName or not fiscalYear:
         raise HTTPException(
@@ -77,14 +180,21 @@ async def get_full_load_profile(
             )
         months_to_filter = season_months[season]
 
-    file_path = Path(projectPath) / "results" / "load_profiles" / f"{profileName}.xlsx"
-
     try:
-        if not file_path.exists():
-            raise HTTPException(
-                status_code=404,
-                detail=f"Profile file not found: {profileName}.xlsx"
+        file_path = _profile_file(projectPath, profileName)
+
+        if maxPoints:
+            pyramid = profile_pyramid.load_profile_pyramid(file_path)
+            level, positions = pyramid.select_level(
+                pixels=maxPoints, fiscal_year=year_to_filter, months=months_to_filter
             )
+            meta = {
+                'endpoint': 'full-load-profile',
+                'profile': profileName,
+                'fiscal_year': year_to_filter,
+                'months': months_to_filter
+            }
+            return _pyramid_result(pyramid.columns(level, positions), level, accept, meta)
 
         workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
         sheet_name = 'Load_Profile'
@@ -94,43 +204,26 @@ async def get_full_load_profile(
             raise HTTPException(status_code=404, detail=f"Sheet '{sheet_name}' not found.")
 
         worksheet = workbook[sheet_name]
-
-        # Read all data
         headers = [cell.value for cell in next(worksheet.iter_rows(min_row=1, max_row=1))]
-        all_data = []
-        for row in worksheet.iter_rows(min_row=2, values_only=True):
-            row_dict = dict(zip(headers, row))
-            all_data.append(row_dict)
+        rows = _iter_profile_rows(worksheet, headers, year_to_filter, months_to_filter)
 
-        workbook.close()
-
-        # Filter data by fiscal year
-        filtered_data = [
-            row for row in all_data
-            if row.get('Fiscal_Year') == year_to_filter
-        ]
-
-        # Filter by month(s) if specified
-        if months_to_filter:
-            filtered_data = [
-                row for row in filtered_data
-                if row.get('Month') in months_to_filter
-            ]
+        stream_format = columnar_stream.negotiate_stream_format(accept)
+        if stream_format:
+            meta = {
+                'endpoint': 'full-load-profile',
+                'profile': profileName,
+                'fiscal_year': year_to_filter,
+                'months': months_to_filter,
+                'columns': [str(h) for h in headers]
+            }
+            try:
+                return columnar_stream.columnar_response(stream_format, _iter_profile_chunks(workbook, rows, headers), meta)
+            except HTTPException:
+                workbook.close()
+                raise
 
-        # Format DateTime field
-        for row in filtered_data:
-            excel_date_serial = row.get('DateTime')
-            if excel_date_serial and isinstance(excel_date_serial, (int, float)):
-                # Convert Excel serial number to datetime
-                try:
-                    from datetime import datetime, timedelta
-                    # Excel epoch starts at 1899-12-30
-                    excel_epoch = datetime(1899, 12, 30)
-                    python_date = excel_epoch + timedelta(days=excel_date_serial)
-                    row['DateTime'] = python_date.strftime("%Y-%m-%d %H:%M:%S")
-                except:
-                    # If conversion fails, keep original value
-                    pass
+        filtered_data = list(rows)
+        workbook.close()
 
         return {"success": True, "data": filtered_data}
 
@@ -142,3 +235,78 @@ async def get_full_load_profile(
             status_code=500,
             detail="An error occurred while reading the profile file."
         )
+
+
+@router.get("/load-profile-range", dependencies=[cache_on_files(profile_source)])
+async def get_load_profile_range(
+    projectPath: str = Query(..., description="Project root path"),
+    profileName: str = Query(..., description="Profile name"),
+    start: Optional[str] = Query(None, description="Window start (ISO date/datetime)"),
+    end: Optional[str] = Query(None, description="Window end (ISO date/datetime)"),
+    pixels: Optional[int] = Query(None, ge=1, le=100000, description="Chart width in pixels (default 1000)"),
+    fiscalYear: Optional[str] = Query(None, description="Restrict to one fiscal year (e.g., FY2025)"),
+    accept: Optional[str] = Header(None)
+):
+    """
+    Get load profile data for a date window at the coarsest useful resolution.
+
+    The finest pyramid level (hourly, daily, weekly, monthly) with no more
+    buckets in the window than ``pixels`` is returned, so a multi-year view
+    is served from monthly buckets and narrower windows fall through to
+    weekly, daily and hourly rows. Aggregated rows carry Min_MW / Max_MW
+    next to the mean in Demand_MW.
+
+    Args:
+        projectPath: Project root directory
+        profileName: Name of the profile (without .xlsx)
+        start: Optional window start; defaults to the start of the profile
+        end: Optional window end; defaults to the end of the profile
+        pixels: Point budget, normally the chart width
+        fiscalYear: Optional fiscal year filter
+        accept: Accept header; NDJSON / Arrow media types select the streamed mode
+
+    Returns:
+        dict: Level name, profile extent and rows, or a columnar stream
+    """
+    if not projectPath or not profileName:
+        raise HTTPException(status_code=400, detail="Project path and profile name are required.")
+
+    start_ts = _parse_timestamp(start, 'start')
+    end_ts = _parse_timestamp(end, 'end')
+    if start_ts is not None and end_ts is not None and end_ts < start_ts:
+        raise HTTPException(status_code=400, detail="end must not be before start.")
+
+    fiscal_year = None
+    if fiscalYear:
+        try:
+            fiscal_year = int(fiscalYear.replace('FY', ''))
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid fiscal year format.")
+
+    try:
+        pyramid = profile_pyramid.load_profile_pyramid(_profile_file(projectPath, profileName))
+        level, positions = pyramid.select_level(start_ts, end_ts, pixels or profile_pyramid.DEFAULT_PIXELS, fiscal_year)
+
+        extent_start, extent_end = pyramid.extent
+        meta = {
+            'endpoint': 'load-profile-range',
+            'profile': profileName,
+            'fiscal_years': pyramid.fiscal_years,
+            'extent': [
+                None if extent_start is None else str(extent_start),
+                None if extent_end is None else str(extent_end)
+            ]
+        }
+        result = _pyramid_result(pyramid.columns(level, positions), level, accept, meta)
+        if isinstance(result, dict):
+            result.update({'fiscal_years': meta['fiscal_years'], 'extent': meta['extent']})
+        return result
+
+    except HTTPException:
+        raise
+    except Exception as error:
+        logger.error(f"❌ Error reading load profile range for '{profileName}': {error}")
+        raise HTTPException(
+            status_code=500,
+            detail="An error occurred while reading the profile range."
+        )
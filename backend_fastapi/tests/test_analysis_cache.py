@@ -0,0 +1,112 @@
+"""
+Test Network Analysis Memo Cache
+================================
+
+Checks that analysis results are memoized per network file, persisted in
+``.analysis_cache/``, invalidated when the network is rewritten and warmed in
+the background.
+"""
+
+import os
+
+import pytest
+import numpy as np
+import pandas as pd
+import pypsa
+from fastapi.testclient import TestClient
+
+from backend_fastapi.main import app
+from backend_fastapi.models.analysis_cache import (
+    CACHE_DIR_NAME,
+    AnalysisCache,
+    warm_analysis_cache,
+)
+
+client = TestClient(app)
+
+
+def build_network(p_nom: float = 100) -> pypsa.Network:
+    rng = np.random.default_rng(5)
+    n = pypsa.Network()
+    n.set_snapshots(pd.date_range('2025-01-01', periods=24, freq='h'))
+    n.add('Carrier', ['solar', 'coal'], co2_emissions=[0, 0.9])
+    n.add('Bus', 'b0')
+    n.add('Generator', ['s1', 'c1'], bus='b0', carrier=['solar', 'coal'], p_nom=p_nom)
+    n.add('Load', 'ld', bus='b0')
+    n.generators['p_nom_opt'] = p_nom
+    n.generators_t.p = pd.DataFrame(rng.uniform(0, 50, (24, 2)), index=n.snapshots, columns=['s1', 'c1'])
+    return n
+
+
+@pytest.fixture
+def network_file(tmp_path):
+    scenario_dir = tmp_path / "results" / "pypsa_optimization" / "base"
+    scenario_dir.mkdir(parents=True)
+    path = scenario_dir / "2025_network.nc"
+    build_network().export_to_netcdf(path)
+    return path
+
+
+class TestAnalysisCache:
+    """Test memoization, persistence and invalidation"""
+
+    def test_result_is_computed_once_and_persisted(self, network_file):
+        cache = AnalysisCache()
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {'total': np.float64(3.5), 'count': np.int64(2)}
+
+        first = cache.get_or_compute(network_file, 'demo', compute, {'start_date': None})
+        first['total'] = 0
+        second = cache.get_or_compute(network_file, 'demo', compute)
+
+        assert second == {'total': 3.5, 'count': 2}
+        assert len(calls) == 1
+        assert list((network_file.parent / CACHE_DIR_NAME / network_file.stem).glob('demo*.json.gz'))
+
+        # A new process (empty memory) is served from disk
+        assert AnalysisCache().get_or_compute(network_file, 'demo', compute) == second
+        assert len(calls) == 1
+
+    def test_rewritten_network_invalidates_entries(self, network_file):
+        cache = AnalysisCache()
+        cache.get_or_compute(network_file, 'demo', lambda: {'version': 1})
+
+        build_network(p_nom=200).export_to_netcdf(network_file)
+        stat = network_file.stat()
+        os.utime(network_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert cache.get_or_compute(network_file, 'demo', lambda: {'version': 2}) == {'version': 2}
+
+    def test_params_are_part_of_the_key(self, network_file):
+        cache = AnalysisCache()
+        a = cache.get_or_compute(network_file, 'demo', lambda: 'jan', {'start_date': '2025-01-01'})
+        b = cache.get_or_compute(network_file, 'demo', lambda: 'all', {'start_date': None})
+        assert (a, b) == ('jan', 'all')
+
+
+class TestCachedEndpoints:
+    """Test routes served through the cache"""
+
+    def test_total_capacities_uses_warmed_cache(self, network_file):
+        warm_analysis_cache([network_file]).join(timeout=60)
+        entries = {p.name for p in (network_file.parent / CACHE_DIR_NAME / network_file.stem).iterdir()}
+        assert 'get_total_capacities.json.gz' in entries
+        assert 'get_full_availability.json.gz' in entries
+
+        params = {
+            "projectPath": str(network_file.parents[3]),
+            "scenarioName": "base",
+            "networkFile": network_file.name,
+        }
+        data = client.get("/project/pypsa/total-capacities", params=params).json()['data']
+        assert data['totals']['generation_capacity_mw'] == pytest.approx(200)
+
+        availability = client.get("/project/pypsa/availability", params=params).json()['availability']
+        assert availability['has_generators'] is True
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,150 @@
+"""
+Test Columnar Streaming Responses
+=================================
+
+Covers Accept-header negotiation, NDJSON/Arrow chunk encoding and the
+streamed modes of the large time-series endpoints.
+"""
+
+import io
+import json
+
+import pytest
+import numpy as np
+import pandas as pd
+import pypsa
+from fastapi.testclient import TestClient
+
+from backend_fastapi.main import app
+from backend_fastapi.models.columnar_stream import (
+    ARROW_AVAILABLE,
+    ARROW_STREAM_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    chunk_columns,
+    iter_arrow_ipc,
+    iter_ndjson,
+    negotiate_stream_format,
+)
+
+client = TestClient(app)
+
+
+def read_ndjson(payload: bytes):
+    """Split an NDJSON body into meta, concatenated columns and end record."""
+    lines = [json.loads(line) for line in payload.decode('utf-8').splitlines() if line]
+    meta, chunks, end = lines[0], lines[1:-1], lines[-1]
+    columns = {}
+    for chunk in chunks:
+        for name, values in chunk['data'].items():
+            columns.setdefault(name, []).extend(values)
+    return meta, columns, end
+
+
+class TestEncoding:
+    """Test the format negotiation and encoders"""
+
+    def test_negotiate_stream_format(self):
+        assert negotiate_stream_format(None) is None
+        assert negotiate_stream_format("application/json") is None
+        assert negotiate_stream_format(f"{NDJSON_MEDIA_TYPE}, application/json;q=0.5") == 'ndjson'
+        assert negotiate_stream_format(ARROW_STREAM_MEDIA_TYPE) == 'arrow'
+
+    def test_ndjson_round_trip_with_missing_values(self):
+        columns = {
+            'timestamp': pd.date_range('2025-01-01', periods=10, freq='h').to_numpy(),
+            'value': np.array([1.5, np.nan] * 5),
+        }
+        payload = b''.join(iter_ndjson(chunk_columns(columns, chunk_rows=3), {'endpoint': 'test'}))
+        meta, data, end = read_ndjson(payload)
+
+        assert meta == {'type': 'meta', 'endpoint': 'test'}
+        assert end == {'type': 'end', 'rows': 10}
+        assert data['timestamp'][1] == '2025-01-01T01:00:00'
+        assert data['value'][:2] == [1.5, None]
+
+    def test_chunk_columns_rejects_ragged_columns(self):
+        with pytest.raises(ValueError):
+            list(chunk_columns({'a': np.zeros(3), 'b': np.zeros(4)}))
+
+    @pytest.mark.skipif(not ARROW_AVAILABLE, reason="pyarrow not installed")
+    def test_arrow_round_trip(self):
+        import pyarrow as pa
+
+        columns = {'hour': np.arange(24), 'solar': np.linspace(0, 1, 24)}
+        payload = b''.join(iter_arrow_ipc(chunk_columns(columns, chunk_rows=10), {'endpoint': 'test'}))
+        table = pa.ipc.open_stream(io.BytesIO(payload)).read_all()
+
+        assert table.num_rows == 24
+        assert table.column('solar').to_pylist() == pytest.approx(columns['solar'].tolist())
+        assert json.loads(table.schema.metadata[b'kseb']) == {'endpoint': 'test'}
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project folder with one network and one load profile workbook."""
+    scenario_dir = tmp_path / "results" / "pypsa_optimization" / "base"
+    scenario_dir.mkdir(parents=True)
+
+    rng = np.random.default_rng(1)
+    n = pypsa.Network()
+    n.set_snapshots(pd.date_range('2025-01-01', periods=48, freq='h'))
+    n.add('Carrier', ['solar', 'coal'], co2_emissions=[0, 0.9])
+    n.add('Bus', 'b0')
+    n.add('Generator', ['s1', 'c1'], bus='b0', carrier=['solar', 'coal'], p_nom=100)
+    n.add('Load', 'ld', bus='b0')
+    n.generators_t.p = pd.DataFrame(rng.uniform(0, 50, (48, 2)), index=n.snapshots, columns=['s1', 'c1'])
+    n.loads_t.p = pd.DataFrame(rng.uniform(20, 80, (48, 1)), index=n.snapshots, columns=['ld'])
+    n.export_to_netcdf(scenario_dir / "2025_network.nc")
+
+    profile_dir = tmp_path / "results" / "load_profiles"
+    profile_dir.mkdir(parents=True)
+    hours = pd.date_range('2025-04-01', periods=24 * 60, freq='h')
+    pd.DataFrame({
+        'DateTime': hours,
+        'Fiscal_Year': 2026,
+        'Month': hours.month,
+        'Demand_MW': np.arange(len(hours), dtype=float),
+    }).to_excel(profile_dir / "base_profile.xlsx", sheet_name='Load_Profile', index=False)
+
+    return tmp_path
+
+
+class TestStreamedEndpoints:
+    """Test streamed modes return the same values as the JSON responses"""
+
+    def test_dispatch_stream_matches_json(self, project):
+        params = {"projectPath": str(project), "scenarioName": "base", "networkFile": "2025_network.nc"}
+
+        json_data = client.get("/project/pypsa/dispatch", params=params).json()['data']
+        response = client.get("/project/pypsa/dispatch", params=params, headers={"Accept": NDJSON_MEDIA_TYPE})
+
+        assert response.headers['content-type'].startswith(NDJSON_MEDIA_TYPE)
+        meta, columns, end = read_ndjson(response.content)
+        assert end['rows'] == 48
+        assert meta['generation'] == sorted(json_data['generation'].keys())
+        assert columns['load'] == pytest.approx(json_data['load'])
+        assert columns['generation:solar'] == pytest.approx(json_data['generation']['solar'])
+
+    def test_duration_curve_stream_is_sorted(self, project):
+        params = {"projectPath": str(project), "scenarioName": "base", "networkFile": "2025_network.nc"}
+        response = client.get("/project/pypsa/duration-curves", params=params, headers={"Accept": NDJSON_MEDIA_TYPE})
+
+        _, columns, _ = read_ndjson(response.content)
+        assert columns['hours'] == list(range(48))
+        assert columns['generation'] == sorted(columns['generation'], reverse=True)
+
+    def test_full_load_profile_stream_matches_json(self, project):
+        params = {"projectPath": str(project), "profileName": "base_profile", "fiscalYear": "FY2026", "month": 5}
+
+        json_rows = client.get("/project/full-load-profile", params=params).json()['data']
+        response = client.get("/project/full-load-profile", params=params, headers={"Accept": NDJSON_MEDIA_TYPE})
+
+        meta, columns, end = read_ndjson(response.content)
+        assert meta['columns'] == ['DateTime', 'Fiscal_Year', 'Month', 'Demand_MW']
+        assert end['rows'] == len(json_rows) == 30 * 24
+        assert columns['DateTime'] == [row['DateTime'] for row in json_rows]
+        assert columns['Demand_MW'] == pytest.approx([row['Demand_MW'] for row in json_rows])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
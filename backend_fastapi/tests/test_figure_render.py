@@ -0,0 +1,89 @@
+"""
+Test Plot Figure Cache
+======================
+
+Checks the compact JSON figure spec (float32 typed arrays, stepped time
+axes) and that repeated plot requests are answered from the figure cache
+without loading the network.
+"""
+
+import base64
+import importlib
+import json
+
+import pytest
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import pypsa
+from fastapi.testclient import TestClient
+
+from backend_fastapi.main import app
+from backend_fastapi.models.figure_render import figure_to_json
+
+client = TestClient(app)
+
+
+def build_network() -> pypsa.Network:
+    n = pypsa.Network()
+    n.set_snapshots(pd.date_range('2025-01-01', periods=48, freq='h'))
+    n.add('Carrier', ['solar', 'coal'], color=['#f9d002', '#8c564b'])
+    n.add('Bus', 'b0')
+    n.add('Generator', ['s1', 'c1'], bus='b0', carrier=['solar', 'coal'], p_nom=100)
+    n.add('Load', 'ld', bus='b0', p_set=50)
+    n.generators['p_nom_opt'] = 100
+    n.generators_t.p = pd.DataFrame(np.random.default_rng(5).uniform(0, 50, (48, 2)),
+                                    index=n.snapshots, columns=['s1', 'c1'])
+    return n
+
+
+class TestFigureSpec:
+    """Test the JSON figure encoding"""
+
+    def test_float_arrays_become_float32(self):
+        values = np.linspace(0, 1, 100)
+        hours = pd.date_range('2025-01-01', periods=100, freq='h')
+        fig = go.Figure([go.Scatter(x=hours, y=values), go.Bar(x=['a', 'b'], y=[1.5, 2.5])])
+
+        spec = json.loads(figure_to_json(fig))
+        encoded = spec['data'][0]['y']
+        assert encoded['dtype'] == 'f4'
+        assert np.frombuffer(base64.b64decode(encoded['bdata']), dtype='<f4') == pytest.approx(values, abs=1e-7)
+        assert (spec['data'][0]['x0'], spec['data'][0]['dx']) == ('2025-01-01T00:00:00.000', 3600 * 1000)
+        assert 'x' not in spec['data'][0]
+        assert spec['data'][1]['y'] == [1.5, 2.5]
+        assert spec['data'][1]['x'] == ['a', 'b']
+
+
+class TestPlotEndpoint:
+    """Test the plot routes with the figure cache"""
+
+    def test_json_plot_is_cached(self, tmp_path, monkeypatch):
+        scenario_dir = tmp_path / "results" / "pypsa_optimization" / "base"
+        scenario_dir.mkdir(parents=True)
+        build_network().export_to_netcdf(scenario_dir / "network.nc")
+        body = {
+            "projectPath": str(tmp_path), "scenarioName": "base", "networkFile": "network.nc",
+            "plot_type": "dispatch", "output_format": "json", "filters": {"resolution": "1H"},
+        }
+
+        first = client.post("/project/pypsa/plot/generate-from-project", json=body)
+        assert first.status_code == 200
+        assert first.json()['format'] == 'json' and first.json()['figure']['data']
+
+        def fail(*args, **kwargs):
+            raise AssertionError("network loaded")
+
+        monkeypatch.setattr(importlib.import_module('models.pypsa_analyzer'), 'load_network_cached', fail)
+        assert client.post("/project/pypsa/plot/generate-from-project", json=body).content == first.content
+
+        # Another format or resolution is a separate entry and needs the network
+        daily = client.post("/project/pypsa/plot/generate-from-project", json={**body, "filters": {"resolution": "1D"}})
+        assert daily.status_code == 500
+
+        bad = client.post("/project/pypsa/plot/generate-from-project", json={**body, "output_format": "svg"})
+        assert bad.status_code == 400
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
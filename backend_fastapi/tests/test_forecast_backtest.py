@@ -0,0 +1,109 @@
+"""
+Test Rolling-Origin Forecast Backtest
+=====================================
+
+Checks the expanding-window fits against refitting each cutoff with
+scikit-learn and the forecasting script's WAM, and the error table layout.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LinearRegression
+
+from backend_fastapi.models.forecast_backtest import ALL_SECTORS, backtest_sector, error_table, run_backtest
+from backend_fastapi.models.forecasting import weighted_average_forecast
+
+
+def build_sector(seed: int = 0, growth: float = 1.06) -> pd.DataFrame:
+    years = np.arange(2005, 2025)
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'Year': years,
+        'Electricity': 1000 * growth ** (years - 2005) * rng.uniform(0.97, 1.03, len(years)),
+        'GDP': np.linspace(1, 4, len(years)) * rng.uniform(0.95, 1.05, len(years)),
+        'Population': np.linspace(30, 35, len(years)),
+    })
+
+
+class TestSectorBacktest:
+    """Test one sector against per-cutoff refits"""
+
+    def test_ols_models_match_refits(self):
+        df = build_sector()
+        forecasts = backtest_sector(df, ['SLR', 'MLR', 'TimeSeries'], ['GDP', 'Population'], cutoffs=4, horizon=3)
+        train = df[~df['Year'].isin([2020, 2021, 2022])]
+
+        for cutoff in forecasts['Cutoff'].unique():
+            history = train[train['Year'] <= cutoff]
+            rows = forecasts[forecasts['Cutoff'] == cutoff]
+            targets = train[train['Year'].isin(rows['Year'])]
+
+            slr = LinearRegression().fit(history[['Year']], history['Electricity'])
+            mlr = LinearRegression().fit(history[['GDP', 'Population']], history['Electricity'])
+            full = df[df['Year'] <= cutoff]
+            trend = LinearRegression().fit(full[['Year']], full['Electricity'])
+
+            assert rows[rows['Model'] == 'SLR']['Forecast'].to_numpy() == pytest.approx(slr.predict(targets[['Year']]))
+            assert rows[rows['Model'] == 'MLR']['Forecast'].to_numpy() == pytest.approx(
+                mlr.predict(targets[['GDP', 'Population']]))
+            assert rows[rows['Model'] == 'TimeSeries']['Forecast'].to_numpy() == pytest.approx(
+                trend.predict(targets[['Year']]))
+
+    def test_wam_matches_forecasting_script(self):
+        df = build_sector(seed=3)
+        forecasts = backtest_sector(df, ['WAM'], window_size=4, cutoffs=5, horizon=5)
+
+        for cutoff in forecasts['Cutoff'].unique():
+            rows = forecasts[forecasts['Cutoff'] == cutoff]
+            wam = weighted_average_forecast(df[df['Year'] <= cutoff], 2030, 4)
+            expected = wam.set_index('Year')['Electricity'].reindex(rows['Year'])
+            assert rows['Forecast'].to_numpy() == pytest.approx(expected.to_numpy())
+
+    def test_covid_years_are_not_scored(self):
+        forecasts = backtest_sector(build_sector(), cutoffs=10, horizon=5)
+
+        assert not forecasts['Year'].isin([2020, 2021, 2022]).any()
+        assert forecasts['Horizon'].between(1, 5).all()
+        assert (forecasts['Year'] - forecasts['Cutoff'] == forecasts['Horizon']).all()
+        assert forecasts['Cutoff'].nunique() == 10
+
+
+class TestBacktestRun:
+    """Test the multi-sector run and error table"""
+
+    def test_error_table_by_horizon(self):
+        sectors = {
+            f"Sector {i}": (build_sector(seed=i, growth=1.03 + 0.01 * i), {'independent_vars': ['GDP']})
+            for i in range(20)
+        }
+        forecasts, errors, failed = run_backtest(sectors, cutoffs=10, horizon=5)
+
+        assert not failed
+        assert set(forecasts['Sector']) == set(sectors)
+        pooled = errors[errors['Sector'] == ALL_SECTORS]
+        assert len(pooled) == 4 * 5
+        assert pooled.groupby('Model')['Count'].sum().to_dict() == forecasts.groupby('Model').size().to_dict()
+        assert (errors['MAPE (%)'] >= 0).all() and (errors['RMSE'] >= 0).all()
+
+    def test_error_metrics(self):
+        forecasts = pd.DataFrame({
+            'Sector': ['A', 'A'], 'Model': ['SLR', 'SLR'], 'Cutoff': [2020, 2021], 'Year': [2021, 2022],
+            'Horizon': [1, 1], 'Actual': [100.0, 200.0], 'Forecast': [110.0, 180.0],
+        })
+        row = error_table(forecasts, pooled=False).iloc[0]
+
+        assert row['Count'] == 2
+        assert row['MAPE (%)'] == pytest.approx(10.0)
+        assert row['RMSE'] == pytest.approx(np.sqrt((10 ** 2 + 20 ** 2) / 2))
+
+    def test_failed_sector_is_reported(self):
+        sectors = {'Good': (build_sector(), {}), 'Bad': (build_sector(), {'models': ['WAM'], 'window_size': 1})}
+        forecasts, _, failed = run_backtest(sectors, cutoffs=3)
+
+        assert list(failed) == ['Bad']
+        assert set(forecasts['Sector']) == {'Good'}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
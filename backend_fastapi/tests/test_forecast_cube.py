@@ -0,0 +1,101 @@
+"""
+Test Consolidated Demand Forecast Cube
+======================================
+
+Checks gross/net/on-grid consolidation from the cached scenario cube and that
+the cube is rebuilt when a source file changes.
+"""
+
+import json
+import os
+
+import pytest
+import openpyxl
+from fastapi.testclient import TestClient
+
+from backend_fastapi.main import app
+
+client = TestClient(app)
+
+
+def write_sector(path, rows):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Results"
+    sheet.append(["Year", "MLR", "SLR"])
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Scenario with two demand sectors, a rooftop solar sector and T&D losses."""
+    scenario_dir = tmp_path / "results" / "demand_forecasts" / "base"
+    scenario_dir.mkdir(parents=True)
+    write_sector(scenario_dir / "Domestic.xlsx", [[2025, 100, 90], [2026, 110, 95]])
+    write_sector(scenario_dir / "Industry.xlsx", [[2025, 200, 210], [2026, None, 220]])
+    write_sector(scenario_dir / "Solar_rooftop.xlsx", [[2025, -10, -12], [2026, -20, -22]])
+    (scenario_dir / "td_losses.json").write_text(json.dumps([{"year": 2025, "loss": 10}, {"year": 2027, "loss": 20}]))
+
+    (tmp_path / "inputs").mkdir()
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "main"
+    sheet.append(["~Solar_share"])
+    sheet.append(["Sector", "Percentage_share"])
+    sheet.append(["Domestic", 10])
+    workbook.save(tmp_path / "inputs" / "input_demand_file.xlsx")
+    return tmp_path
+
+
+def consolidate(project, demand_type, selections=None):
+    payload = {
+        "projectPath": str(project),
+        "startYear": 2025,
+        "endYear": 2026,
+        "selections": selections or {"Domestic": "MLR", "Industry": "MLR", "Solar_rooftop": "SLR"},
+        "demandType": demand_type,
+    }
+    response = client.post("/project/scenarios/base/consolidated", json=payload)
+    assert response.status_code == 200
+    return response.json()["data"]
+
+
+class TestConsolidation:
+    """Test demand types computed from the cube"""
+
+    def test_gross_net_and_on_grid(self, project):
+        gross = consolidate(project, "gross")
+        assert gross[0]["Solar_rooftop"] == 12
+        assert gross[0]["Gross Total"] == pytest.approx(312)
+        assert gross[0]["Total"] == pytest.approx(312 / 0.9)
+        # Missing values stay empty and count as zero
+        assert gross[1]["Industry"] is None
+        assert gross[1]["T&D Loss (%)"] == pytest.approx(0.15)
+
+        net = consolidate(project, "net")
+        assert net[0]["Domestic"] == pytest.approx(90)
+        assert net[0]["Total"] == pytest.approx(302)
+        assert "T&D Losses" not in net[0]
+
+        on_grid = consolidate(project, "onGrid")
+        assert on_grid[0]["Net Total"] == pytest.approx(302)
+        assert on_grid[0]["Total"] == pytest.approx(302 / 0.9)
+
+    def test_unselected_sector_and_source_change(self, project):
+        data = consolidate(project, "gross", {"Domestic": "SLR"})
+        assert data[0]["Industry"] is None
+        assert data[0]["Gross Total"] == pytest.approx(90)
+
+        losses = project / "results" / "demand_forecasts" / "base" / "td_losses.json"
+        losses.write_text(json.dumps([{"year": 2025, "loss": 50}]))
+        stat = losses.stat()
+        os.utime(losses, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        data = consolidate(project, "gross", {"Domestic": "SLR"})
+        assert data[0]["Total"] == pytest.approx(180)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,77 @@
+"""
+Test Incremental Forecast Re-runs
+=================================
+
+Runs ``forecasting.py`` twice on the same scenario and checks that sectors
+with unchanged inputs are reported as cached and keep their results, while
+an edited sector is forecast again.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[1] / "models" / "forecasting.py"
+
+
+def sector(offset: float) -> dict:
+    return {
+        'enabled': True,
+        'models': ['SLR', 'WAM'],
+        'parameters': {'MLR': {'independent_vars': []}, 'WAM': {'window_size': 5}},
+        'data': [{'Year': year, 'Electricity': 1000 * 1.05 ** (year - 2010) + offset} for year in range(2010, 2025)],
+    }
+
+
+def run_forecast(tmp_path: Path, sectors: dict, **options) -> tuple:
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({
+        'scenario_name': 'base', 'target_year': 2030,
+        'forecast_path': str(tmp_path / "base"), 'sectors': sectors, **options,
+    }))
+    completed = subprocess.run([sys.executable, str(SCRIPT), '--config', str(config_path)],
+                               cwd=str(SCRIPT.parent), capture_output=True, text=True, timeout=300)
+    assert completed.returncode == 0, completed.stderr
+
+    lines = completed.stdout.splitlines()
+    events = [json.loads(line[9:]) for line in lines if line.startswith('PROGRESS:')]
+    final = json.loads('\n'.join(line for line in lines if not line.startswith('PROGRESS:')))
+    return events, final
+
+
+class TestIncrementalRerun:
+    """Test sector reuse across forecast runs"""
+
+    def test_only_changed_sector_is_rerun(self, tmp_path):
+        sectors = {name: sector(i) for i, name in enumerate(['Domestic', 'Commercial', 'Industrial'])}
+        _, first = run_forecast(tmp_path, sectors)
+        assert not any(r.get('cached') for r in first['results'])
+
+        sectors['Commercial']['data'][3]['Electricity'] += 25
+        events, second = run_forecast(tmp_path, sectors)
+
+        cached = [e['sector'] for e in events if e.get('status') == 'cached']
+        assert cached == ['Domestic', 'Industrial']
+        assert {r['sector']: bool(r.get('cached')) for r in second['results']} == {
+            'Domestic': True, 'Commercial': False, 'Industrial': True}
+        assert second['successful_sectors'] == 3
+        assert second['results'][0]['output_file'] == first['results'][0]['output_file']
+
+    def test_force_rerun_and_missing_outputs(self, tmp_path):
+        sectors = {'Domestic': sector(0), 'Commercial': sector(1)}
+        run_forecast(tmp_path, sectors)
+
+        events, _ = run_forecast(tmp_path, sectors, force_rerun=True)
+        assert not any(e.get('status') == 'cached' for e in events)
+
+        (tmp_path / "base" / "Domestic.xlsx").unlink()
+        events, _ = run_forecast(tmp_path, sectors)
+        assert [e['sector'] for e in events if e.get('status') == 'cached'] == ['Commercial']
+        assert (tmp_path / "base" / "Domestic.xlsx").exists()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
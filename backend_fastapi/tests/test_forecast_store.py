@@ -0,0 +1,90 @@
+"""
+Test Columnar Forecast Results Store
+====================================
+
+Checks the long-format round trip, merging of re-run sectors and that the
+scenario endpoints serve sectors that only exist in the store.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from fastapi.testclient import TestClient
+
+from backend_fastapi.main import app
+from backend_fastapi.models.forecast_store import (
+    ForecastStore,
+    FORECAST_STORE_FILE,
+    sector_to_long,
+    write_forecast_store,
+)
+
+client = TestClient(app)
+
+
+def sector_tables(scale: float = 1.0):
+    inputs = pd.DataFrame({'Year': [2021, 2022, 2023, 2024],
+                           'Electricity': [10.0, 11.0, 12.5, np.nan], 'GDP': [1, 2, 3, 4]})
+    results = pd.DataFrame({'Year': [2021, 2022, 2023, 2024, 2025],
+                            'MLR': np.array([10, 11, 12.5, 13, 14]) * scale,
+                            'SLR': np.array([10, 11, 12.5, 13.5, np.nan]) * scale})
+    models = pd.DataFrame([{'Model': 'SLR', 'Type': 'LinearRegression', 'Parameters': "{'fit_intercept': True}"}])
+    return {'inputs': inputs, 'results': results, 'models': models}
+
+
+@pytest.fixture
+def scenario(tmp_path):
+    scenario_dir = tmp_path / "results" / "demand_forecasts" / "base"
+    write_forecast_store(scenario_dir, [sector_to_long('Domestic', sector_tables()),
+                                        sector_to_long('Industry', sector_tables(2))])
+    return tmp_path
+
+
+class TestStore:
+    """Test writing and reading the store"""
+
+    def test_round_trip(self, scenario):
+        store = ForecastStore.load(scenario / "results" / "demand_forecasts" / "base" / FORECAST_STORE_FILE)
+        expected = sector_tables()
+
+        assert store.sectors == ['Domestic', 'Industry']
+        pd.testing.assert_frame_equal(store.results('Domestic'), expected['results'], check_dtype=False)
+        pd.testing.assert_frame_equal(store.table('models', 'Domestic'), expected['models'], check_dtype=False)
+        assert store.models('Industry') == ['MLR', 'SLR']
+        assert store.forecast_start_year('Domestic') == 2023
+
+        sectors, models, years, values = store.results_matrix()
+        assert values.shape == (2, 2, 5)
+        assert values[1, 0, 4] == 28
+
+    def test_rerun_replaces_only_written_sectors(self, scenario):
+        scenario_dir = scenario / "results" / "demand_forecasts" / "base"
+        write_forecast_store(scenario_dir, [sector_to_long('Industry', sector_tables(3))])
+
+        store = ForecastStore.load(scenario_dir / FORECAST_STORE_FILE)
+        assert sorted(store.sectors) == ['Domestic', 'Industry']
+        assert store.results('Industry')['MLR'].iloc[-1] == 42
+
+
+class TestEndpoints:
+    """Test scenario routes reading the store"""
+
+    def test_sector_data_and_models_without_workbooks(self, scenario):
+        params = {"projectPath": str(scenario)}
+        assert client.get("/project/scenarios/base/sectors", params=params).json()['sectors'] == ['Domestic', 'Industry']
+        assert client.get("/project/scenarios/base/models", params=params).json()['models'] == {
+            'Domestic': ['MLR', 'SLR'], 'Industry': ['MLR', 'SLR']}
+
+        data = client.get("/project/scenarios/base/sectors/Domestic",
+                          params={**params, "startYear": 2023, "endYear": 2030}).json()
+        assert data['forecastYearstart'] == 2023
+        assert data['data'][-1] == {'Year': 2025, 'MLR': 14.0, 'SLR': None}
+
+        consolidated = client.post("/project/scenarios/base/consolidated", json={
+            **params, "startYear": 2025, "endYear": 2025,
+            "selections": {"Domestic": "MLR", "Industry": "MLR"}, "demandType": "gross"}).json()
+        assert consolidated['data'][0]['Gross Total'] == pytest.approx(42)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,190 @@
+"""
+Test Persistent Forecasting Workers
+===================================
+
+Checks that forecasts run on a warm worker deliver the same progress and end
+events as the subprocess runner, that the worker is reused across jobs, that
+queued and running jobs can be cancelled, that a worker which cannot start is
+not respawned forever, and that the frozen entry point hands spawned workers
+to ``multiprocessing`` instead of starting a second server.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend_fastapi.main import app
+from backend_fastapi.models import forecast_worker
+from backend_fastapi.models.forecast_worker import ForecastWorkerPool, MAX_STARTUP_FAILURES
+
+client = TestClient(app)
+
+
+def write_config(tmp_path, name: str, sectors: int) -> str:
+    path = tmp_path / f"{name}.json"
+    path.write_text(json.dumps({
+        'scenario_name': name, 'target_year': 2030, 'forecast_path': str(tmp_path / name),
+        'sectors': {
+            f"Sector {i}": {
+                'enabled': True, 'models': ['SLR', 'WAM'], 'parameters': {'WAM': {'window_size': 5}},
+                'data': [{'Year': year, 'Electricity': 1000 * 1.05 ** (year - 2010) + i} for year in range(2010, 2025)],
+            }
+            for i in range(sectors)
+        },
+    }))
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = ForecastWorkerPool()
+    pool.start()
+    yield pool
+    pool.shutdown()
+
+
+class TestForecastWorkerPool:
+    """Test jobs on the warm worker pool"""
+
+    def test_jobs_complete_with_progress_and_result(self, pool, tmp_path):
+        for run in range(2):
+            events = []
+            job = pool.submit(write_config(tmp_path, f"run{run}", 2), events.append)
+            assert job.wait(120)
+
+            assert job.status == 'completed'
+            assert [e['sector'] for e in events if e.get('type') == 'sector_completed'] == ['Sector 0', 'Sector 1']
+            end = events[-1]
+            assert end['type'] == 'end' and end['status'] == 'completed'
+            assert end['result']['successful_sectors'] == 2
+            assert (tmp_path / f"run{run}" / "Sector 1.xlsx").exists()
+
+    def test_failed_job_reports_error(self, pool, tmp_path):
+        events = []
+        job = pool.submit(str(tmp_path / "missing.json"), events.append)
+        assert job.wait(60)
+
+        assert job.status == 'failed' and events[-1]['status'] == 'failed'
+        assert pool.stats()['workers'] == 1
+
+    def test_cancel_running_and_queued_jobs(self, pool, tmp_path):
+        started = threading.Event()
+        events = []
+        running = pool.submit(write_config(tmp_path, "long", 400), lambda e: (events.append(e), started.set()))
+        queued = pool.submit(write_config(tmp_path, "queued", 1), events.append)
+        assert started.wait(120)
+
+        assert pool.cancel(queued.id) and queued.status == 'cancelled'
+        assert pool.cancel(running.id) and running.status == 'cancelled'
+        assert not pool.cancel(running.id)
+        assert events[-1] == {'status': 'cancelled', 'error': 'Cancelled by user', 'type': 'end'}
+
+        # The replacement worker takes the next job
+        after = pool.submit(write_config(tmp_path, "after", 1), lambda e: None)
+        assert after.wait(120) and after.status == 'completed'
+
+
+class TestStartupFailures:
+    """Test workers that exit before they are ready"""
+
+    def test_pool_gives_up_after_repeated_startup_failures(self, monkeypatch, tmp_path):
+        # Spawned workers run sys.exit(<pipe>) and die before reporting ready
+        monkeypatch.setattr(forecast_worker, '_worker_main', sys.exit)
+        pool = ForecastWorkerPool()
+        events = []
+        job = pool.submit(write_config(tmp_path, "never", 1), events.append)
+        try:
+            assert job.wait(60)
+            assert job.status == 'failed' and events[-1]['error'] == "Forecasting workers failed to start."
+            assert pool.failed and pool._startup_failures == MAX_STARTUP_FAILURES
+            with pytest.raises(RuntimeError):
+                pool.submit(write_config(tmp_path, "rejected", 1), events.append)
+        finally:
+            pool.shutdown()
+
+
+class TestFrozenEntryPoint:
+    """Test ``main.py`` run as the frozen executable"""
+
+    SCRIPT = textwrap.dedent("""
+        import multiprocessing, multiprocessing.spawn, runpy, sys, uvicorn
+
+        calls = []
+        uvicorn.run = lambda *args, **kwargs: calls.append(('server', kwargs['reload']))
+        multiprocessing.spawn.spawn_main = lambda **kwargs: calls.append(('worker', kwargs))
+        # freeze_support only acts on Windows; call the spawn check it delegates to
+        multiprocessing.freeze_support = multiprocessing.spawn.freeze_support
+
+        sys.frozen = True
+        sys.argv = ['kseb-backend.exe'] + sys.argv[1:]
+        try:
+            runpy.run_path('main.py', run_name='__main__')
+        except SystemExit:
+            pass
+        print(calls)
+    """)
+
+    def run_main(self, *args):
+        backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, '-c', self.SCRIPT, *args], cwd=backend_dir,
+                                capture_output=True, text=True, timeout=120)
+        assert result.returncode == 0, result.stderr
+        return result.stdout.strip().splitlines()[-1]
+
+    def test_spawned_worker_does_not_start_server(self):
+        calls = self.run_main('--multiprocessing-fork', 'parent_pid=1', 'pipe_handle=5')
+        assert calls == "[('worker', {'parent_pid': 1, 'pipe_handle': 5})]"
+
+    def test_frozen_server_runs_without_reload(self):
+        assert self.run_main() == "[('server', False)]"
+
+
+class TestForecastRoute:
+    """Test forecasts started through the route"""
+
+    def test_queued_runs_of_one_scenario_keep_their_configs(self, tmp_path):
+        routes = sys.modules['routers.forecast_routes']
+        sector = {
+            'name': 'Domestic', 'selectedMethods': ['SLR'], 'mlrParameters': [], 'wamWindow': 5,
+            'data': [{'Year': year, 'Electricity': 1000 * 1.05 ** (year - 2010)} for year in range(2010, 2025)],
+        }
+        request = {'projectPath': str(tmp_path), 'scenarioName': 'base', 'targetYear': 2030,
+                   'excludeCovidYears': False, 'sectors': [sector], 'forceRerun': True}
+        scenario_dir = tmp_path / "results" / "demand_forecasts" / "base"
+
+        with TestClient(app) as live_client:
+            queues = []
+            for _ in range(2):
+                assert live_client.post("/project/forecast", json=request).status_code == 202
+                queues.append(routes.forecast_event_queue)
+            assert len(list(scenario_dir.glob("forecast_config_*.json"))) == 2
+
+            deadline = time.time() + 120
+            while list(scenario_dir.glob("forecast_config_*.json")) and time.time() < deadline:
+                time.sleep(0.2)
+            time.sleep(0.5)
+
+            ends = []
+            for events in queues:
+                items = [events.get_nowait() for _ in range(events.qsize())]
+                ends.append(items[-1])
+        assert [end['status'] for end in ends] == ['completed', 'completed']
+
+
+class TestCancelEndpoint:
+    """Test the cancel route"""
+
+    def test_cancel_without_forecast_returns_404(self):
+        response = client.post("/project/forecast/cancel")
+        assert response.status_code == 404
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,88 @@
+"""
+Test HTTP Caching for File-Derived Responses
+============================================
+
+Checks ETag generation, 304 answers to If-None-Match, the server-side
+response cache and invalidation when the source file changes.
+"""
+
+import json
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend_fastapi.main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def scenario(tmp_path):
+    """Demand forecast scenario folder with a td_losses.json file."""
+    scenario_dir = tmp_path / "results" / "demand_forecasts" / "base"
+    scenario_dir.mkdir(parents=True)
+    (scenario_dir / "td_losses.json").write_text(json.dumps([{"year": 2025, "loss": 12.5}]))
+    return tmp_path
+
+
+def touch_later(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestConditionalRequests:
+    """Test ETag / If-None-Match handling"""
+
+    def test_etag_and_not_modified(self, scenario):
+        url = "/project/scenarios/base/td-losses"
+        params = {"projectPath": str(scenario)}
+
+        first = client.get(url, params=params)
+        etag = first.headers['etag']
+        assert first.json()['data'] == [{"year": 2025, "loss": 12.5}]
+        assert first.headers['cache-control'] == 'no-cache'
+        assert 'last-modified' in first.headers
+
+        revalidated = client.get(url, params=params, headers={"If-None-Match": etag})
+        assert revalidated.status_code == 304
+        assert revalidated.content == b''
+
+        # Different params give a different ETag
+        other = client.get(url, params={**params, "unused": 1})
+        assert other.headers['etag'] != etag
+
+    def test_source_change_invalidates(self, scenario):
+        url = "/project/scenarios/base/td-losses"
+        params = {"projectPath": str(scenario)}
+        etag = client.get(url, params=params).headers['etag']
+
+        losses = scenario / "results" / "demand_forecasts" / "base" / "td_losses.json"
+        losses.write_text(json.dumps([{"year": 2025, "loss": 9.0}]))
+        touch_later(losses)
+
+        response = client.get(url, params=params, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers['etag'] != etag
+        assert response.json()['data'][0]['loss'] == 9.0
+
+    def test_server_side_cache_hit(self, scenario):
+        url = "/project/scenarios/base/td-losses"
+        params = {"projectPath": str(scenario), "variant": "server-cache"}
+
+        first = client.get(url, params=params)
+        second = client.get(url, params=params)
+
+        assert 'x-cache' not in first.headers
+        assert second.headers.get('x-cache') == 'HIT'
+        assert second.json() == first.json()
+        assert second.headers['etag'] == first.headers['etag']
+
+    def test_missing_source_is_not_cached(self, tmp_path):
+        response = client.get("/project/scenarios/none/td-losses", params={"projectPath": str(tmp_path)})
+        assert response.json() == {"success": True, "data": []}
+        assert 'etag' not in response.headers
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,42 @@
+"""
+Test Deferred Heavy Imports
+===========================
+
+Checks that starting the app does not import pypsa/pandas/plotly/openpyxl and
+that lazily bound modules load on first use.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from backend_fastapi.models.lazy_imports import LazyModule, lazy_import
+
+BACKEND_DIR = Path(__file__).parent.parent
+
+HEAVY_MODULES = ['pypsa', 'plotly', 'matplotlib', 'scipy', 'pandas', 'numpy', 'openpyxl', 'pyarrow']
+
+
+class TestLazyImports:
+    """Test the startup import footprint"""
+
+    def test_app_import_defers_heavy_modules(self):
+        probe = f"import json, sys; import main; print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+        result = subprocess.run([sys.executable, '-c', probe], cwd=BACKEND_DIR,
+                                capture_output=True, text=True, check=True)
+        assert json.loads(result.stdout.strip().splitlines()[-1]) == []
+
+    def test_proxy_loads_on_first_attribute(self):
+        module = LazyModule('json.tool')
+        assert 'not loaded' in repr(module)
+        assert callable(module.main)
+        assert module.main is sys.modules['json.tool'].main
+        # Already imported modules are returned as-is
+        assert lazy_import('json') is json
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,102 @@
+"""
+Test Bounded Log Store
+======================
+
+Covers the ring buffer with spill-file resume, cross-thread wake-ups and
+incremental tailing of solver log files.
+"""
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+from backend_fastapi.models.log_store import LogStore, LogFileTailer
+
+
+class TestLogStore:
+    """Test ring buffer, spill file and notifications"""
+
+    def test_ring_is_bounded_and_resumes_from_spill(self, tmp_path):
+        store = LogStore(capacity=100, spill_path=tmp_path / "logs" / "run.log")
+        for i in range(1, 2501):
+            store.append(f"line {i}\nwrapped" if i == 1500 else f"line {i}")
+
+        assert len(store.tail()) == 100
+        assert store.first_seq == 2401
+
+        lines, seq, gap = store.read(after_seq=1498, limit=3)
+        assert not gap
+        assert lines == ["line 1499", "line 1500\nwrapped", "line 1501"]
+        assert seq == 1501
+
+        lines, seq, _ = store.read(after_seq=2450)
+        assert lines[0] == "line 2451" and seq == 2500
+
+    def test_gap_reported_without_spill(self):
+        store = LogStore(capacity=10)
+        for i in range(50):
+            store.append(str(i))
+
+        lines, seq, gap = store.read(after_seq=5)
+        assert gap
+        assert lines[0] == "40" and seq == 50
+
+    def test_wait_wakes_on_append_from_thread(self):
+        store = LogStore()
+
+        async def scenario():
+            timer = threading.Timer(0.05, store.append, args=("from worker",))
+            timer.start()
+            woke = await store.wait(0, timeout=5)
+            timer.join()
+            return woke
+
+        assert asyncio.run(scenario()) is True
+        assert store.read(0)[0] == ["from worker"]
+
+    def test_wait_times_out_and_returns_on_close(self):
+        store = LogStore()
+        assert asyncio.run(store.wait(0, timeout=0.01)) is False
+        store.close()
+        assert asyncio.run(store.wait(0, timeout=5)) is True
+
+
+class TestLogFileTailer:
+    """Test incremental reads across growing solver logs"""
+
+    def test_reads_only_new_complete_lines_across_files(self, tmp_path):
+        tailer = LogFileTailer(tmp_path, "solver_log_*.log")
+        stage1 = tmp_path / "solver_log_2025_stage1.log"
+
+        with open(stage1, 'w') as f:
+            f.write("Running HiGHS\nIteration 1")
+            f.flush()
+            assert tailer.read() == [(stage1.name, "Running HiGHS\n")]
+            f.write(" done\n")
+        assert tailer.read() == [(stage1.name, "Iteration 1 done\n")]
+        assert tailer.read() == []
+
+        stage2 = tmp_path / "solver_log_2025_stage2.log"
+        stage2.write_text("Optimal")
+        assert tailer.read() == []
+        assert tailer.read(final=True) == [(stage2.name, "Optimal")]
+        tailer.close()
+
+    def test_skips_logs_from_earlier_runs(self, tmp_path):
+        old = tmp_path / "solver_log_2025_stage1.log"
+        old.write_text("previous run\n")
+        os.utime(old, (1_000_000, 1_000_000))
+
+        tailer = LogFileTailer(tmp_path, "solver_log_*.log", since=2_000_000)
+        assert tailer.read(final=True) == []
+
+        # Rewritten by the new run
+        old.write_text("new run\n")
+        assert tailer.read() == [(old.name, "new run\n")]
+        tailer.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,122 @@
+"""
+Test Header-Only Network Metadata
+=================================
+
+Checks that network metadata read from the NetCDF header matches a full
+network load, that the per-folder index only rereads changed files, and that
+the scenario listing routes no longer load networks.
+"""
+
+import importlib
+import os
+
+import netCDF4
+import pytest
+import numpy as np
+import pandas as pd
+import pypsa
+from fastapi.testclient import TestClient
+
+from backend_fastapi.main import app
+from backend_fastapi.models import network_metadata
+from backend_fastapi.models.network_metadata import NetworkIndex, _header_from_file, _header_from_network
+
+client = TestClient(app)
+
+
+def build_network(multi_period: bool, p_nom: float = 100) -> pypsa.Network:
+    n = pypsa.Network()
+    hours = pd.date_range('2030-01-01', periods=24, freq='h')
+    if multi_period:
+        n.set_snapshots(pd.MultiIndex.from_product([[2030, 2035], hours], names=['period', 'timestep']))
+        n.investment_periods = [2030, 2035]
+    else:
+        n.set_snapshots(hours)
+    n.add('Carrier', ['solar', 'coal'])
+    n.add('Bus', ['b0', 'b1'])
+    n.add('Generator', ['s1', 'c1'], bus='b0', carrier=['solar', 'coal'], p_nom=p_nom)
+    n.generators_t.p = pd.DataFrame(np.ones((len(n.snapshots), 2)), index=n.snapshots, columns=['s1', 'c1'])
+    return n
+
+
+@pytest.fixture
+def scenario_dir(tmp_path):
+    path = tmp_path / "results" / "pypsa_optimization" / "base"
+    path.mkdir(parents=True)
+    return path
+
+
+class TestNetworkHeader:
+    """Test header parsing against a full load"""
+
+    @pytest.mark.parametrize("multi_period", [True, False])
+    def test_header_matches_loaded_network(self, scenario_dir, multi_period):
+        path = scenario_dir / "network.nc"
+        build_network(multi_period).export_to_netcdf(path)
+
+        header = _header_from_file(path)
+        assert header == _header_from_network(path)
+        assert header['is_multi_period'] is multi_period
+        assert header['periods'] == ([2030, 2035] if multi_period else [2030])
+        assert header['components']['generators'] == 2 and header['components']['buses'] == 2
+
+    @pytest.mark.parametrize("attribute", ['network__objective', 'network_objective'])
+    def test_objective_attribute_of_each_pypsa_release(self, scenario_dir, attribute):
+        """PyPSA >= 1.0 writes ``network__objective``, 0.30 writes ``network_objective``."""
+        path = scenario_dir / "network.nc"
+        build_network(False).export_to_netcdf(path)
+        with netCDF4.Dataset(str(path), 'a') as ds:
+            for name in ('network__objective', 'network_objective'):
+                if name in ds.ncattrs():
+                    ds.delncattr(name)
+            ds.setncattr(attribute, 1234.5)
+
+        header = _header_from_file(path)
+        assert header['objective'] == 1234.5 and header['is_solved'] is True
+
+    def test_index_rereads_only_changed_files(self, scenario_dir, monkeypatch):
+        for year in (2030, 2035):
+            build_network(False).export_to_netcdf(scenario_dir / f"{year}_network.nc")
+
+        reads = []
+        original = network_metadata.read_network_header
+        monkeypatch.setattr(network_metadata, 'read_network_header', lambda path: reads.append(path) or original(path))
+
+        index = NetworkIndex()
+        assert [h['name'] for h in index.folder(scenario_dir)] == ['2030_network.nc', '2035_network.nc']
+        index.folder(scenario_dir)
+        assert len(reads) == 2
+
+        rewritten = scenario_dir / "2035_network.nc"
+        build_network(False, p_nom=200).export_to_netcdf(rewritten)
+        stat = rewritten.stat()
+        os.utime(rewritten, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        index.folder(scenario_dir)
+        assert reads[2:] == [rewritten.resolve()]
+
+
+class TestListingEndpoints:
+    """Test scenario listing routes served from headers"""
+
+    def test_routes_do_not_load_the_network(self, scenario_dir, monkeypatch):
+        build_network(True).export_to_netcdf(scenario_dir / "investments.nc")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("network loaded")
+
+        monkeypatch.setattr(importlib.import_module('models.pypsa_analyzer'), 'load_network_cached', fail)
+        params = {"projectPath": str(scenario_dir.parents[2]), "scenarioName": "base"}
+
+        detected = client.get("/project/pypsa/detect-network-type", params=params).json()
+        assert detected['workflow_type'] == 'multi-period'
+        assert detected['periods'] == [2030, 2035] and detected['snapshot_count'] == 48
+
+        info = client.get("/project/pypsa/multi-year-info", params=params).json()
+        assert info['network_type'] == 'multi-period'
+
+        networks = client.get("/project/pypsa/networks", params=params).json()['networks']
+        assert networks[0]['is_multi_period'] is True and networks[0]['components']['generators'] == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
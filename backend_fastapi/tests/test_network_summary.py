@@ -0,0 +1,123 @@
+"""
+Test Network Summary Sidecar
+============================
+
+Checks that the summary written at export time matches the analyses computed
+from the reloaded network, that the analysis routes answer from it without
+loading the network, and that a rewritten network ignores its stale summary.
+"""
+
+import importlib
+import json
+import os
+
+import pytest
+import numpy as np
+import pandas as pd
+import pypsa
+from fastapi.testclient import TestClient
+
+from backend_fastapi.main import app
+from backend_fastapi.models.analysis_cache import _encode
+from backend_fastapi.models.network_summary import (
+    SUMMARY_ANALYSES,
+    load_network_summary,
+    summary_analysis,
+    summary_path,
+    write_network_summary,
+)
+from backend_fastapi.models.pypsa_analyzer import NetworkInspector, PyPSASingleNetworkAnalyzer
+
+client = TestClient(app)
+
+
+def build_network(p_nom: float = 100) -> pypsa.Network:
+    rng = np.random.default_rng(7)
+    n = pypsa.Network()
+    n.set_snapshots(pd.date_range('2025-01-01', periods=48, freq='h'))
+    n.snapshot_weightings.loc[:, :] = 2.0
+    n.add('Carrier', ['solar', 'coal'], co2_emissions=[0, 0.9])
+    n.add('Bus', 'b0')
+    n.add('Generator', ['s1', 'c1'], bus='b0', carrier=['solar', 'coal'], p_nom=p_nom, marginal_cost=[0, 25])
+    n.add('Load', 'ld', bus='b0')
+    n.generators['p_nom_opt'] = p_nom
+    n.generators_t.p = pd.DataFrame(rng.uniform(0, 50, (48, 2)), index=n.snapshots, columns=['s1', 'c1'])
+    n.generators_t.p_max_pu = pd.DataFrame({'s1': rng.uniform(0.5, 1, 48)}, index=n.snapshots)
+    n.loads_t.p = pd.DataFrame({'ld': rng.uniform(20, 90, 48)}, index=n.snapshots)
+    return n
+
+
+@pytest.fixture
+def network_file(tmp_path):
+    scenario_dir = tmp_path / "results" / "pypsa_optimization" / "base"
+    scenario_dir.mkdir(parents=True)
+    path = scenario_dir / "2025_network.nc"
+    network = build_network()
+    network.export_to_netcdf(path)
+    write_network_summary(network, path)
+    return path
+
+
+class TestNetworkSummary:
+    """Test the summary contents"""
+
+    def test_analyses_match_reloaded_network(self, network_file):
+        network = pypsa.Network(str(network_file))
+        components = {'analyzer': PyPSASingleNetworkAnalyzer(network), 'inspector': NetworkInspector(network)}
+
+        for name, (component, method) in SUMMARY_ANALYSES.items():
+            expected = json.loads(_encode(getattr(components[component], method)()))
+            assert summary_analysis(network_file, name) == expected, name
+        assert summary_analysis(network_file, 'get_energy_mix')['totals']['total_energy_mwh'] == pytest.approx(
+            network.generators_t.p.sum().sum() * 2.0
+        )
+
+    def test_carrier_annual_and_duration_quantiles(self, network_file):
+        summary = load_network_summary(network_file)
+        network = build_network()
+
+        annual = summary['carrier_annual']
+        assert annual['years'] == [2025] and annual['carriers'] == ['coal', 'solar']
+        assert annual['energy_mwh'][0][0] == pytest.approx(network.generators_t.p['c1'].sum() * 2.0)
+        assert annual['emissions_tco2'][0][0] == pytest.approx(annual['energy_mwh'][0][0] * 0.9)
+        assert annual['operating_cost'][0][0] == pytest.approx(annual['energy_mwh'][0][0] * 25)
+        assert summary['inventory']['components']['generators'] == 2
+
+        curves = summary['duration_curves']
+        load = network.loads_t.p['ld']
+        assert len(curves['load']) == 101
+        assert (curves['load'][0], curves['load'][-1]) == pytest.approx((load.max(), load.min()))
+
+    def test_stale_summary_is_ignored(self, network_file):
+        build_network(p_nom=200).export_to_netcdf(network_file)
+        stat = network_file.stat()
+        os.utime(network_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert summary_path(network_file).exists()
+        assert load_network_summary(network_file) is None
+
+
+class TestSummaryEndpoints:
+    """Test routes answered from the summary"""
+
+    def test_routes_do_not_load_the_network(self, network_file, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("network loaded")
+
+        monkeypatch.setattr(importlib.import_module('models.pypsa_analyzer'), 'load_network_cached', fail)
+        params = {
+            "projectPath": str(network_file.parents[3]),
+            "scenarioName": "base",
+            "networkFile": network_file.name,
+        }
+        for endpoint in ['system-costs', 'curtailment', 'capacity-factors', 'renewable-share', 'daily-profiles',
+                         'availability', 'summary']:
+            response = client.get(f"/project/pypsa/{endpoint}", params=params)
+            assert response.status_code == 200, endpoint
+
+        quantiles = client.get("/project/pypsa/duration-curves", params={**params, "quantiles": True}).json()
+        assert len(quantiles['data']['generation']) == 101
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
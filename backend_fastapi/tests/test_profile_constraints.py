@@ -0,0 +1,103 @@
+"""
+Test Load Profile Constraint Solver
+===================================
+
+Checks the month-table solver against the per-year, per-month scaling loops
+it replaces, and that redistribution meets annual targets under binding
+monthly peak limits.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from backend_fastapi.models.profile_constraints import (
+    FISCAL_MONTH_NAMES,
+    apply_profile_constraints,
+    monthly_target_table,
+)
+
+
+def build_profile(years: int = 3) -> pd.DataFrame:
+    hours = pd.date_range('2025-04-01', pd.Timestamp(2025 + years, 4, 1), freq='h', inclusive='left')
+    rng = np.random.default_rng(11)
+    return pd.DataFrame({
+        'DateTime': hours,
+        'Fiscal_Year': np.where(hours.month >= 4, hours.year + 1, hours.year),
+        'fiscal_month': ((hours.month - 4) % 12) + 1,
+        'Demand_MW': 1000 + 300 * np.sin(np.arange(len(hours)) / 24 * 2 * np.pi) + rng.uniform(0, 100, len(hours)),
+    })
+
+
+def peak_limits(years, limit: float, tight: float) -> pd.DataFrame:
+    """Same limit every month except June and July."""
+    return pd.DataFrame({
+        'Year': list(years),
+        **{month: [tight if month in ('Jun', 'Jul') else limit] * len(years) for month in FISCAL_MONTH_NAMES},
+    })
+
+
+def loop_reference(profile: pd.DataFrame, targets: dict, limits: pd.DataFrame) -> pd.Series:
+    """The generators' previous per-year / per-month loops."""
+    profile = profile.copy()
+    for year, target in targets.items():
+        mask = profile['Fiscal_Year'] == year
+        profile.loc[mask, 'Demand_MW'] *= target / profile.loc[mask, 'Demand_MW'].sum()
+    for _, row in limits.iterrows():
+        for month, name in enumerate(FISCAL_MONTH_NAMES, start=1):
+            mask = (profile['Fiscal_Year'] == row['Year']) & (profile['fiscal_month'] == month)
+            current_max = profile.loc[mask, 'Demand_MW'].max()
+            if current_max > row[name]:
+                profile.loc[mask, 'Demand_MW'] *= row[name] / current_max
+    return profile['Demand_MW']
+
+
+class TestConstraintSolver:
+    """Test the vectorized constraint solver"""
+
+    def test_zero_passes_match_previous_loops(self):
+        profile = build_profile()
+        targets = {2026: 1.1e7, 2027: 1.2e7, 2028: 1.3e7}
+        limits = peak_limits(targets, 2000, 1500)
+
+        expected = loop_reference(profile, targets, limits)
+        report = apply_profile_constraints(profile, targets, limits, max_passes=0)
+
+        assert profile['Demand_MW'].to_numpy() == pytest.approx(expected.to_numpy())
+        assert report['passes'] == 0 and not report['converged']
+
+    def test_redistribution_meets_targets_and_limits(self):
+        profile = build_profile()
+        targets = {2026: 1.1e7, 2027: 1.15e7, 2028: 1.2e7}
+        limits = peak_limits(targets, 2000, 1500)
+
+        report = apply_profile_constraints(profile, targets, limits)
+
+        totals = profile.groupby('Fiscal_Year')['Demand_MW'].sum()
+        peaks = profile.groupby(['Fiscal_Year', 'fiscal_month'])['Demand_MW'].max().unstack()
+        assert report['converged'] and report['passes'] <= 12
+        assert totals.to_numpy() == pytest.approx(list(targets.values()))
+        assert (peaks.to_numpy() <= monthly_target_table(limits, peaks.index.to_numpy()) * (1 + 1e-9)).all()
+        assert report['capped_months'] >= 6
+
+    def test_infeasible_year_is_reported(self):
+        profile = build_profile(years=1)
+        report = apply_profile_constraints(profile, {2026: 1e12}, peak_limits([2026], 2000, 1500))
+
+        assert report['infeasible_years'] == [2026]
+        assert report['capped_months'] == 12
+        assert profile['Demand_MW'].max() == pytest.approx(2000)
+
+    def test_load_factor_targets_are_reported(self):
+        profile = build_profile(years=1)
+        load_factors = pd.DataFrame({'Year': [2026], **{month: [0.8] for month in FISCAL_MONTH_NAMES}})
+        before = profile['Demand_MW'].copy()
+
+        report = apply_profile_constraints(profile, {}, load_factor_targets=load_factors)
+
+        assert profile['Demand_MW'].equals(before)
+        assert 0 < report['max_load_factor_deviation'] < 0.2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
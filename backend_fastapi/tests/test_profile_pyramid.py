@@ -0,0 +1,177 @@
+"""
+Test Load Profile Resolution Pyramid
+====================================
+
+Checks the pre-aggregated daily/weekly/monthly levels against pandas, the
+level selection used by the range endpoints and the load-duration index.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from fastapi.testclient import TestClient
+
+from backend_fastapi.main import app
+from backend_fastapi.models.profile_pyramid import (
+    build_profile_pyramid,
+    pyramid_path_for,
+)
+
+client = TestClient(app)
+
+
+def build_profile(years: int = 2) -> pd.DataFrame:
+    """Hourly profile covering whole fiscal years (April to March)."""
+    hours = pd.date_range('2025-04-01', pd.Timestamp(2025 + years, 4, 1), freq='h', inclusive='left')
+    rng = np.random.default_rng(3)
+    return pd.DataFrame({
+        'DateTime': hours,
+        'Fiscal_Year': np.where(hours.month >= 4, hours.year + 1, hours.year),
+        'Month': hours.month,
+        'Demand_MW': 500 + 100 * np.sin(np.arange(len(hours)) / 24 * 2 * np.pi) + rng.uniform(0, 20, len(hours)),
+    })
+
+
+class TestPyramidLevels:
+    """Test aggregation and level selection"""
+
+    def test_daily_and_monthly_levels_match_pandas(self):
+        profile = build_profile()
+        pyramid = build_profile_pyramid(profile)
+        demand = profile.set_index('DateTime')['Demand_MW']
+
+        daily = demand.resample('D').agg(['min', 'mean', 'max'])
+        assert pyramid.column('daily', 'mean') == pytest.approx(daily['mean'].to_numpy())
+        assert pyramid.column('daily', 'max') == pytest.approx(daily['max'].to_numpy())
+
+        monthly = demand.resample('MS').agg(['min', 'mean', 'max'])
+        assert len(pyramid.column('monthly', 'time')) == 24
+        assert pyramid.column('monthly', 'min') == pytest.approx(monthly['min'].to_numpy())
+
+    def test_weeks_restart_each_fiscal_year(self):
+        pyramid = build_profile_pyramid(build_profile())
+        times = pd.to_datetime(pyramid.column('weekly', 'time'))
+
+        assert pd.Timestamp('2026-04-01') in times
+        assert set(pyramid.column('weekly', 'fy')) == {2026, 2027}
+        assert pyramid.column('weekly', 'count').sum() == len(pyramid.column('hourly', 'time'))
+
+    def test_zooming_in_falls_through_to_finer_levels(self):
+        pyramid = build_profile_pyramid(build_profile())
+
+        assert pyramid.select_level(pixels=50)[0] == 'monthly'
+        assert pyramid.select_level(pixels=200)[0] == 'weekly'
+        assert pyramid.select_level(pixels=1000)[0] == 'daily'
+
+        start, end = np.datetime64('2025-06-01T00:00:00'), np.datetime64('2025-06-07T23:00:00')
+        level, positions = pyramid.select_level(start, end, pixels=1000)
+        assert level == 'hourly'
+        assert len(positions) == 7 * 24
+
+    def test_month_filter_skips_weekly_level(self):
+        pyramid = build_profile_pyramid(build_profile())
+        level, positions = pyramid.select_level(pixels=100, fiscal_year=2026, months=[7, 8, 9])
+
+        assert level == 'daily'
+        assert len(positions) == 31 + 31 + 30
+
+
+class TestDurationIndex:
+    """Test the per-year load-duration index"""
+
+    def test_curve_and_percentiles_match_numpy(self):
+        profile = build_profile()
+        pyramid = build_profile_pyramid(profile)
+        yearly = profile.loc[profile['Fiscal_Year'] == 2026, 'Demand_MW'].to_numpy()
+
+        percent_time, demand = pyramid.duration_curve(2026)
+        assert percent_time[0] == 1 and percent_time[-1] == 100
+        assert demand == pytest.approx(np.percentile(yearly, 100.0 - np.arange(1, 101)))
+
+        percent_time, demand = pyramid.duration_curve(2026, points=8)
+        assert demand == pytest.approx(np.percentile(yearly, 100.0 - percent_time))
+        assert pyramid.percentiles(2026, [5, 50, 99.5]) == pytest.approx(np.percentile(yearly, [5, 50, 99.5]))
+
+        peak = pyramid.peak(2026)
+        assert peak['peak_mw'] == yearly.max() and peak['hours'] == len(yearly)
+        peak_row = profile.loc[profile.loc[profile['Fiscal_Year'] == 2026, 'Demand_MW'].idxmax()]
+        assert pd.Timestamp(peak['peak_time']) == peak_row['DateTime']
+        with pytest.raises(KeyError):
+            pyramid.sorted_values(2030)
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project folder with one profile workbook and no pyramid sidecar."""
+    profile_dir = tmp_path / "results" / "load_profiles"
+    profile_dir.mkdir(parents=True)
+    build_profile().to_excel(profile_dir / "base_profile.xlsx", sheet_name='Load_Profile', index=False)
+    return tmp_path
+
+
+class TestRangeEndpoints:
+    """Test the pyramid-backed endpoints"""
+
+    def test_range_builds_sidecar_and_picks_level(self, project):
+        params = {"projectPath": str(project), "profileName": "base_profile", "pixels": 400}
+        result = client.get("/project/load-profile-range", params=params).json()
+
+        assert result['level'] == 'weekly'
+        assert result['fiscal_years'] == [2026, 2027]
+        assert pyramid_path_for(project / "results" / "load_profiles" / "base_profile.xlsx").exists()
+
+        params.update({"start": "2026-01-10", "end": "2026-01-12"})
+        zoomed = client.get("/project/load-profile-range", params=params).json()
+        assert zoomed['level'] == 'hourly'
+        assert zoomed['data'][0]['DateTime'] == '2026-01-10T00:00:00'
+
+    def test_full_load_profile_max_points(self, project):
+        params = {"projectPath": str(project), "profileName": "base_profile", "fiscalYear": "FY2026"}
+
+        hourly = client.get("/project/full-load-profile", params=params).json()['data']
+        reduced = client.get("/project/full-load-profile", params={**params, "maxPoints": 1000}).json()
+
+        assert reduced['level'] == 'daily'
+        assert len(reduced['data']) == 365
+        assert max(row['Max_MW'] for row in reduced['data']) == pytest.approx(max(row['Demand_MW'] for row in hourly))
+
+    def test_load_duration_curve_reads_index_not_workbook(self, project, monkeypatch):
+        params = {"projectPath": str(project), "profileName": "base_profile", "fiscalYear": "FY2027"}
+        default = client.get("/project/load-duration-curve", params=params).json()
+        assert len(default['data']) == 100 and default['peak']['hours'] == 8760
+
+        def fail(*args, **kwargs):
+            raise AssertionError("workbook read")
+
+        monkeypatch.setattr(pd, 'read_excel', fail)
+        result = client.get("/project/load-duration-curve",
+                            params={**params, "points": 20, "percentiles": "50,95"}).json()
+        assert len(result['data']) == 20
+        assert result['data'][-1]['Demand_MW'] == pytest.approx(default['data'][-1]['Demand_MW'])
+        assert set(result['percentiles']) == {'p50', 'p95'}
+        assert client.get("/project/load-duration-curve", params={**params, "fiscalYear": "FY2030"}).status_code == 404
+
+    def test_load_duration_curve_of_blank_fiscal_year(self, tmp_path):
+        profile_dir = tmp_path / "results" / "load_profiles"
+        profile_dir.mkdir(parents=True)
+        profile = build_profile()
+        profile.loc[profile['Fiscal_Year'] == 2026, 'Demand_MW'] = np.nan
+        profile.to_excel(profile_dir / "blank_profile.xlsx", sheet_name='Load_Profile', index=False)
+
+        params = {"projectPath": str(tmp_path), "profileName": "blank_profile", "fiscalYear": "FY2026",
+                  "percentiles": "50"}
+        response = client.get("/project/load-duration-curve", params=params)
+        assert response.status_code == 200
+
+        result = response.json()
+        assert result['success'] and result['data'] == []
+        assert result['peak'] == {'peak_time': None, 'peak_mw': None, 'min_time': None, 'min_mw': None,
+                                  'mean_mw': None, 'hours': 0}
+        assert result['percentiles'] == {'p50': None}
+
+        other = client.get("/project/load-duration-curve", params={**params, "fiscalYear": "FY2027"}).json()
+        assert len(other['data']) == 100 and other['peak']['hours'] == 8760
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
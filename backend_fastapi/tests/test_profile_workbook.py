@@ -0,0 +1,102 @@
+"""
+Test Streaming Profile Workbook Writer
+======================================
+
+Checks that the constant-memory writer produces the same sheets as
+``DataFrame.to_excel`` (values, timestamps, blanks), reports rows and bytes
+written per chunk and leaves no temporary file behind, and that the load
+profile run's progress does not go backwards while the workbook is written.
+"""
+
+import json
+import os
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from backend_fastapi.models.load_profile_generation import ProgressReporter
+from backend_fastapi.models.profile_workbook import write_streaming_workbook
+
+
+def build_sheets():
+    index = pd.date_range('2026-04-01', periods=1000, freq='h')
+    demand = np.linspace(100, 200, len(index))
+    demand[5] = np.nan
+    profile = pd.DataFrame({
+        'DateTime': index,
+        'Year': index.year,
+        'Demand_MW': demand,
+        'Is_Holiday': np.arange(len(index)) % 24 == 0,
+    })
+    monthly = pd.DataFrame({'Parameters': ['Peak', 'Average'], 'Fiscal_Year': ['FY2027', 'FY2027'],
+                            1: [200.5, 150.25], 2: [199.0, None]})
+    return [('Load_Profile', profile), ('Monthly_analysis', monthly)]
+
+
+class TestStreamingWorkbook:
+    """Test the streaming writer against the pandas writer"""
+
+    def test_round_trip_matches_to_excel(self, tmp_path):
+        sheets = build_sheets()
+        streamed = tmp_path / "streamed.xlsx"
+        reference = tmp_path / "reference.xlsx"
+
+        size = write_streaming_workbook(str(streamed), sheets, chunk_rows=300)
+        with pd.ExcelWriter(reference, engine='openpyxl') as writer:
+            for name, frame in sheets:
+                frame.to_excel(writer, sheet_name=name, index=False)
+
+        assert size == os.path.getsize(streamed)
+        expected = pd.read_excel(reference, sheet_name=None)
+        actual = pd.read_excel(streamed, sheet_name=None)
+        assert list(actual) == list(expected)
+        for name in expected:
+            pd.testing.assert_frame_equal(actual[name], expected[name])
+
+    def test_progress_reports_rows_and_bytes(self, tmp_path):
+        events = []
+        write_streaming_workbook(str(tmp_path / "out.xlsx"), build_sheets(),
+                                 on_progress=lambda *event: events.append(event), chunk_rows=300)
+
+        profile = [e for e in events if e[0] == 'Load_Profile']
+        assert [e[1] for e in profile] == [300, 600, 900, 1000]
+        assert all(e[2] == 1000 for e in profile)
+        written = [e[3] for e in events]
+        assert written == sorted(written) and written[0] > 0
+        assert events[-1][:3] == ('Monthly_analysis', 2, 2)
+
+    def test_failed_write_leaves_no_files(self, tmp_path):
+        def sheets():
+            yield 'Load_Profile', build_sheets()[0][1]
+            raise ValueError("analysis failed")
+
+        with pytest.raises(ValueError):
+            write_streaming_workbook(str(tmp_path / "out.xlsx"), sheets())
+        assert os.listdir(tmp_path) == []
+
+    def test_write_progress_does_not_go_backwards(self, tmp_path, capsys):
+        # Same steps as the generation script: 3 in main(), 5 in
+        # generate_profile(), then the workbook and the pyramid sidecar
+        progress = ProgressReporter()
+        progress.start_process(10)
+        for step in range(8):
+            progress.update_progress(f"Step {step + 1}")
+        progress.update_progress("Saving results")
+        write_streaming_workbook(str(tmp_path / "out.xlsx"), build_sheets(),
+                                 on_progress=progress.report_write, chunk_rows=300)
+        progress.update_progress("Saving resolution index")
+        progress.complete_process()
+
+        events = [json.loads(line[len("PROGRESS:"):]) for line in capsys.readouterr().err.splitlines()
+                  if line.startswith("PROGRESS:")]
+        percentages = [e['percentage'] for e in events]
+        assert percentages == sorted(percentages) and percentages[-1] == 100
+
+        writes = [e for e in events if e['message'].startswith("Writing")]
+        assert [e['rows_written'] for e in writes if e['sheet'] == 'Load_Profile'] == [300, 600, 900, 1000]
+        assert {e['percentage'] for e in writes} == {90}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
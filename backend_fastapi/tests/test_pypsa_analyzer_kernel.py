@@ -0,0 +1,210 @@
+"""
+Test Carrier × Period Aggregation Kernel
+========================================
+
+Checks that the sparse generator→carrier / snapshot→period kernel used by
+PyPSASingleNetworkAnalyzer reproduces straightforward per-carrier, per-year
+pandas aggregations on small synthetic networks.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import pypsa
+
+from backend_fastapi.models.pypsa_analyzer import (
+    PyPSASingleNetworkAnalyzer,
+    get_carrier_period_kernel,
+)
+
+
+GENERATORS = [('s1', 'solar'), ('s2', 'solar'), ('w1', 'wind'), ('c1', 'coal'), ('g1', 'gas')]
+
+
+def build_network(multi_period: bool = True, seed: int = 0) -> pypsa.Network:
+    """Build a small network with random dispatch and snapshot weightings."""
+    rng = np.random.default_rng(seed)
+    n = pypsa.Network()
+    hours = pd.date_range('2025-01-01', periods=48, freq='h')
+    if multi_period:
+        n.set_snapshots(pd.MultiIndex.from_product([[2025, 2030], hours], names=['period', 'timestep']))
+        n.investment_periods = [2025, 2030]
+    else:
+        n.set_snapshots(hours)
+    n.snapshot_weightings.loc[:, :] = rng.uniform(1, 3, len(n.snapshots))[:, None]
+
+    n.add('Carrier', ['solar', 'wind', 'coal', 'gas'], co2_emissions=[0, 0, 0.9, 0.4])
+    n.add('Bus', 'b0')
+    for name, carrier in GENERATORS:
+        n.add('Generator', name, bus='b0', carrier=carrier, p_nom=rng.uniform(50, 200))
+    n.generators['p_nom_opt'] = n.generators['p_nom'] * 1.1
+
+    names = [name for name, _ in GENERATORS]
+    n.generators_t.p = pd.DataFrame(
+        rng.uniform(0, 60, (len(n.snapshots), len(names))), index=n.snapshots, columns=names
+    )
+    n.generators_t.p_max_pu = pd.DataFrame(
+        rng.uniform(0.2, 1, (len(n.snapshots), 3)), index=n.snapshots, columns=['s1', 's2', 'w1']
+    )
+    return n
+
+
+def reference_energy(n: pypsa.Network, carrier: str, year: int) -> float:
+    """Weighted energy for one carrier and year computed column by column."""
+    weights = n.snapshot_weightings['objective']
+    cols = n.generators.index[n.generators['carrier'] == carrier]
+    gen_p = n.generators_t.p[cols]
+    if isinstance(gen_p.index, pd.MultiIndex):
+        mask = gen_p.index.get_level_values(0) == year
+    else:
+        mask = gen_p.index.year == year
+    return float(gen_p[mask].mul(weights[mask], axis=0).sum().sum())
+
+
+class TestCarrierPeriodKernel:
+    """Test the kernel matrices against direct pandas aggregation"""
+
+    @pytest.mark.parametrize("multi_period", [True, False])
+    def test_carrier_period_energy_matches_reference(self, multi_period):
+        n = build_network(multi_period)
+        kernel = get_carrier_period_kernel(n)
+        energy = kernel.carrier_period(n.generators_t.p)
+
+        assert energy.shape == (len(kernel.years), len(kernel.carriers))
+        for y, year in enumerate(kernel.years):
+            for c, carrier in enumerate(kernel.carriers):
+                assert energy[y, c] == pytest.approx(reference_energy(n, carrier, year))
+
+    def test_period_hours_are_weighted(self):
+        n = build_network(True)
+        kernel = get_carrier_period_kernel(n)
+        weights = n.snapshot_weightings['objective']
+
+        assert kernel.years == [2025, 2030]
+        for y, year in enumerate(kernel.years):
+            assert kernel.period_hours[y] == pytest.approx(weights.loc[year].sum())
+
+    def test_kernel_is_built_once_per_network(self):
+        n = build_network(True)
+        assert get_carrier_period_kernel(n) is get_carrier_period_kernel(n)
+        assert get_carrier_period_kernel(n) is not get_carrier_period_kernel(build_network(True))
+
+    def test_filtered_rows_use_matching_weights(self):
+        n = build_network(False)
+        kernel = get_carrier_period_kernel(n)
+        subset = n.generators_t.p.iloc[5:20]
+        weights = n.snapshot_weightings['objective'].iloc[5:20]
+
+        totals = kernel.carrier_period(subset).sum(axis=0)
+        expected = subset.mul(weights, axis=0).T.groupby(n.generators['carrier']).sum().sum(axis=1)
+        for c, carrier in enumerate(kernel.carriers):
+            assert totals[c] == pytest.approx(expected[carrier])
+
+
+class TestMultiPeriodMetrics:
+    """Test analyzer metrics built on the kernel"""
+
+    def test_capacity_factors_multi_period(self):
+        n = build_network(True)
+        result = PyPSASingleNetworkAnalyzer(n).get_capacity_factors_multi_period()
+        weights = n.snapshot_weightings['objective']
+
+        assert result['years'] == [2025, 2030]
+        for row in result['capacity_factors']:
+            capacity = n.generators.loc[n.generators['carrier'] == row['Carrier'], 'p_nom_opt'].sum()
+            for year in result['years']:
+                expected = reference_energy(n, row['Carrier'], year) / (capacity * weights.loc[year].sum()) * 100
+                assert row[str(year)] == pytest.approx(expected)
+
+    def test_renewable_share_multi_period(self):
+        n = build_network(True)
+        result = PyPSASingleNetworkAnalyzer(n).get_renewable_share_multi_period()
+
+        for year in result['years']:
+            total = sum(reference_energy(n, c, year) for c in ['solar', 'wind', 'coal', 'gas'])
+            renewable = sum(reference_energy(n, c, year) for c in ['solar', 'wind'])
+            assert result['total_energy_mwh'][str(year)] == pytest.approx(total)
+            assert result['renewable_share_percent'][str(year)] == pytest.approx(renewable / total * 100)
+
+    def test_curtailment_multi_period_totals_by_carrier(self):
+        n = build_network(True)
+        result = PyPSASingleNetworkAnalyzer(n).get_curtailment_multi_period()
+        rows = {row['Carrier']: row for row in result['curtailment']}
+        weights = n.snapshot_weightings['objective']
+
+        for year in result['years']:
+            expected = {}
+            for gen in ['s1', 's2', 'w1']:
+                actual = (n.generators_t.p.loc[year, gen] * weights.loc[year]).sum()
+                potential = (n.generators_t.p_max_pu.loc[year, gen] * weights.loc[year]
+                             * n.generators.loc[gen, 'p_nom_opt']).sum()
+                if potential - actual > 0.01:
+                    carrier = n.generators.loc[gen, 'carrier']
+                    expected[carrier] = expected.get(carrier, 0.0) + (potential - actual)
+            for carrier, curtailed in expected.items():
+                assert rows[carrier]['Curtailment_MWh'][str(year)] == pytest.approx(curtailed)
+
+
+
+class TestCostAndCurtailment:
+    """Test weighted cost, curtailment and capacity aggregation"""
+
+    def test_system_costs_are_weighted(self):
+        n = build_network(False)
+        n.generators['capital_cost'] = [10.0, 20.0, 30.0, 40.0, 50.0]
+        n.generators['marginal_cost'] = [0.0, 0.0, 0.0, 30.0, 60.0]
+        result = PyPSASingleNetworkAnalyzer(n).get_system_costs()
+        weights = n.snapshot_weightings['objective']
+
+        rows = {row['Carrier']: row for row in result['costs']}
+        assert list(rows) == ['coal', 'gas', 'solar', 'wind']
+        for carrier, row in rows.items():
+            gens = n.generators.index[n.generators['carrier'] == carrier]
+            capex = (n.generators.loc[gens, 'capital_cost'] * n.generators.loc[gens, 'p_nom_opt']).sum()
+            opex = sum(
+                (n.generators_t.p[gen] * weights).sum() * n.generators.loc[gen, 'marginal_cost'] for gen in gens
+            )
+            assert row['Capital_Cost'] == pytest.approx(capex)
+            assert row['Marginal_Cost'] == pytest.approx(opex)
+        assert result['total_costs']['total_system_cost'] == pytest.approx(
+            sum(row['Total_Cost'] for row in rows.values())
+        )
+
+    @pytest.mark.parametrize("unit_weights", [True, False])
+    def test_curtailment_matches_per_generator_reference(self, unit_weights):
+        n = build_network(False, seed=3)
+        if unit_weights:
+            n.snapshot_weightings.loc[:, :] = 1.0
+        result = PyPSASingleNetworkAnalyzer(n).get_curtailment()
+        weights = n.snapshot_weightings['objective']
+
+        expected = []
+        for gen in ['s1', 's2', 'w1']:
+            actual = (n.generators_t.p[gen] * weights).sum()
+            potential = (n.generators_t.p_max_pu[gen] * n.generators.loc[gen, 'p_nom_opt'] * weights).sum()
+            if potential - actual > 0.01:
+                expected.append((gen, potential - actual, potential))
+
+        assert [row['generator'] for row in result['curtailment']] == [gen for gen, _, _ in expected]
+        for row, (_, curtailed, potential) in zip(result['curtailment'], expected):
+            assert row['curtailment_mwh'] == pytest.approx(curtailed)
+            assert row['potential_generation'] == pytest.approx(potential)
+        assert result['total_curtailed'] == pytest.approx(sum(c for _, c, _ in expected))
+
+    def test_total_capacities_by_carrier(self):
+        n = build_network(False)
+        n.add('Store', ['st1', 'st2'], bus='b0', carrier='battery', e_nom=[50.0, 25.0])
+        result = PyPSASingleNetworkAnalyzer(n).get_total_capacities()
+
+        rows = {row['Carrier']: row for row in result['capacities']['generators']}
+        assert list(rows) == ['coal', 'gas', 'solar', 'wind']
+        assert rows['solar']['Count'] == 2
+        assert rows['solar']['Capacity_MW'] == pytest.approx(
+            n.generators.loc[['s1', 's2'], 'p_nom_opt'].sum()
+        )
+        assert result['capacities']['stores'][0]['Count'] == 2
+        assert result['totals']['generation_capacity_mw'] == pytest.approx(n.generators['p_nom_opt'].sum())
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
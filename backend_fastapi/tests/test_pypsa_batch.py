@@ -0,0 +1,89 @@
+"""
+Test Batch Analysis Endpoint
+============================
+
+Checks that /pypsa/batch streams one NDJSON record per analysis and that each
+result matches the body of the corresponding GET endpoint.
+"""
+
+import json
+
+import pytest
+import numpy as np
+import pandas as pd
+import pypsa
+from fastapi.testclient import TestClient
+
+from backend_fastapi.main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Project folder with one solved-looking single-period network."""
+    scenario_dir = tmp_path / "results" / "pypsa_optimization" / "base"
+    scenario_dir.mkdir(parents=True)
+
+    rng = np.random.default_rng(7)
+    n = pypsa.Network()
+    n.set_snapshots(pd.date_range('2025-01-01', periods=48, freq='h'))
+    n.add('Carrier', ['solar', 'coal'], co2_emissions=[0, 0.9])
+    n.add('Bus', ['b0', 'b1'])
+    n.add('Line', 'l01', bus0='b0', bus1='b1', x=0.1, r=0.01, s_nom=150)
+    n.add('StorageUnit', 'phs', bus='b1', carrier='coal', p_nom=40, max_hours=6)
+    n.add('Generator', ['s1', 'c1'], bus='b0', carrier=['solar', 'coal'], p_nom=100)
+    n.add('Load', 'ld', bus='b0')
+    n.generators['p_nom_opt'] = 100.0
+    n.generators_t.p = pd.DataFrame(rng.uniform(0, 50, (48, 2)), index=n.snapshots, columns=['s1', 'c1'])
+    n.generators_t.p_max_pu = pd.DataFrame(rng.uniform(0.5, 1, (48, 1)), index=n.snapshots, columns=['s1'])
+    n.loads_t.p = pd.DataFrame(rng.uniform(20, 80, (48, 1)), index=n.snapshots, columns=['ld'])
+    n.export_to_netcdf(scenario_dir / "2025_network.nc")
+    return tmp_path
+
+
+def read_records(response):
+    return [json.loads(line) for line in response.text.splitlines() if line]
+
+
+class TestBatchEndpoint:
+    """Test /pypsa/batch"""
+
+    def test_results_match_individual_endpoints(self, project):
+        params = {"projectPath": str(project), "scenarioName": "base", "networkFile": "2025_network.nc"}
+        analyses = ['energy-mix', 'emissions', 'renewable-share',
+                    {'name': 'dispatch', 'params': {'resolution': '6h', 'ignored': 1}}]
+
+        response = client.post("/project/pypsa/batch", json={**params, "analyses": analyses})
+        assert response.headers['content-type'].startswith('application/x-ndjson')
+
+        records = read_records(response)
+        assert records[0]['type'] == 'meta'
+        assert records[-1] == {**records[-1], 'type': 'end', 'count': 4, 'errors': 0}
+
+        results = {record['name']: record for record in records[1:-1]}
+        assert results['dispatch']['params'] == {'resolution': '6h'}
+        assert results['energy-mix']['data'] == client.get("/project/pypsa/energy-mix", params=params).json()
+        assert results['emissions']['data'] == client.get("/project/pypsa/emissions", params=params).json()
+        assert results['renewable-share']['data'] == client.get("/project/pypsa/renewable-share", params=params).json()
+
+    def test_results_page_analyses(self, project):
+        """Every tab of the network results view is served by one batch."""
+        params = {"projectPath": str(project), "scenarioName": "base", "networkFile": "2025_network.nc"}
+        analyses = ['total-capacities', 'system-costs', 'storage-units', 'lines']
+
+        records = read_records(client.post("/project/pypsa/batch", json={**params, "analyses": analyses}))
+        assert records[-1]['errors'] == 0
+
+        results = {record['name']: record['data'] for record in records[1:-1]}
+        for name in analyses:
+            assert results[name] == client.get(f"/project/pypsa/{name}", params=params).json()
+
+    def test_unknown_analysis_is_rejected(self, project):
+        payload = {"projectPath": str(project), "scenarioName": "base",
+                   "networkFile": "2025_network.nc", "analyses": ['energy-mix', 'nope']}
+        assert client.post("/project/pypsa/batch", json=payload).status_code == 400
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,96 @@
+"""
+Test Scenario Comparison Engine
+===============================
+
+Checks aligned differences, CAGR and cumulative deltas between scenarios and
+the error statuses of the comparison endpoint.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+from fastapi.testclient import TestClient
+
+from backend_fastapi.main import app
+from backend_fastapi.models.forecast_store import sector_to_long, write_forecast_store
+
+client = TestClient(app)
+
+
+def sector_tables(values):
+    inputs = pd.DataFrame({'Year': [2020, 2021], 'Electricity': [100.0, 110.0]})
+    results = pd.DataFrame({'Year': [2020, 2021, 2022], 'MLR': values})
+    return {'inputs': inputs, 'results': results}
+
+
+@pytest.fixture
+def project(tmp_path):
+    forecasts = tmp_path / "results" / "demand_forecasts"
+    write_forecast_store(forecasts / "base", [sector_to_long('Domestic', sector_tables([100.0, 110.0, 121.0]))])
+    write_forecast_store(forecasts / "high", [sector_to_long('Domestic', sector_tables([100.0, 120.0, np.nan])),
+                                              sector_to_long('Industry', sector_tables([50.0, 50.0, 50.0]))])
+    return tmp_path
+
+
+def compare(project, **payload):
+    return client.post("/project/scenarios/compare", json={"projectPath": str(project), **payload})
+
+
+class TestComparison:
+    """Test diffs and summaries against the base scenario"""
+
+    def test_diffs_and_summary(self, project):
+        response = compare(project, scenarios=["base", "high"])
+        assert response.status_code == 200
+        data = response.json()
+
+        assert data['base'] == 'base'
+        assert data['years'] == [2020, 2021, 2022]
+        assert data['sectors'] == ['Domestic', 'Industry']
+        assert data['forecastStartYear']['high']['Domestic'] == 2021
+
+        assert data['absDiff']['high']['Domestic']['MLR'] == [0.0, 10.0, None]
+        assert data['pctDiff']['high']['Domestic']['MLR'][1] == pytest.approx(100 / 11)
+        # Sector missing from the base: values kept, diffs undefined
+        assert data['values']['base']['Industry']['MLR'] == [None, None, None]
+        assert data['absDiff']['high']['Industry']['MLR'] == [None, None, None]
+
+        base_summary = data['summary']['base']['Domestic']['MLR']
+        assert base_summary['cagr'] == pytest.approx(10)
+        high_summary = data['summary']['high']['Domestic']['MLR']
+        assert high_summary['cagr'] == pytest.approx(20)
+        assert high_summary['cumulativeDelta'] == pytest.approx(220 - 331)
+
+    def test_year_window_and_sectors(self, project):
+        data = compare(project, scenarios=["high", "base"], baseScenario="base",
+                       startYear=2021, endYear=2022, sectors=["Domestic"]).json()
+        assert data['years'] == [2021, 2022]
+        assert data['sectors'] == ['Domestic']
+        assert data['absDiff']['high']['Domestic']['MLR'] == [10.0, None]
+
+    def test_errors(self, project):
+        assert compare(project, scenarios=["base"]).status_code == 422
+        assert compare(project, scenarios=["base", "high"], baseScenario="other").status_code == 400
+        assert compare(project, scenarios=["base", "missing"]).status_code == 404
+        assert compare(project, scenarios=["base", "high"], startYear=2030, endYear=2020).status_code == 400
+
+    def test_empty_window_is_rejected(self, project):
+        response = compare(project, scenarios=["base", "high"], startYear=2030)
+        assert response.status_code == 400
+        assert "No years to compare" in response.json()['detail']
+        assert "argmax" not in response.json()['detail']
+
+        forecasts = project / "results" / "demand_forecasts"
+        write_forecast_store(forecasts / "empty", [])
+        write_forecast_store(forecasts / "blank", [])
+        response = compare(project, scenarios=["empty", "blank"])
+        assert response.status_code == 400
+        assert "no forecast data" in response.json()['detail']
+
+        # A scenario without rows next to one with data still compares
+        data = compare(project, scenarios=["base", "empty"]).json()
+        assert data['summary']['empty']['Domestic']['MLR']['cagr'] is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
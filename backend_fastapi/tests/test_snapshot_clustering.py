@@ -0,0 +1,82 @@
+"""
+Test Representative Day Clustering
+==================================
+
+Checks the representative-day snapshot condition of the PyPSA executor:
+peak day retention, weights that add up to the full year, and the reported
+approximation error.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from backend_fastapi.models.pypsa_model_executor import (
+    cluster_representative_days,
+    fiscal_year_profiles,
+    get_representative_day_count,
+    is_representative_days,
+    representative_snapshots,
+)
+
+
+def build_inputs(seed: int = 0):
+    """One financial year of hourly demand with P_max_pu for solar and wind."""
+    rng = np.random.default_rng(seed)
+    hours = np.arange(8760)
+    daily = np.sin((hours % 24 - 6) / 24 * 2 * np.pi)
+    seasonal = np.sin(hours / 8760 * 2 * np.pi)
+
+    demand = pd.DataFrame({2026: 1000 + 200 * daily + 150 * seasonal + rng.normal(0, 20, 8760)})
+    demand.loc[5000, 2026] = 2000  # single extreme hour
+    P_max_pu = pd.DataFrame({
+        'Solar': np.clip(daily, 0, None) * (0.8 + 0.2 * seasonal),
+        'Wind': np.clip(0.4 + 0.2 * seasonal + rng.normal(0, 0.1, 8760), 0, 1),
+    })
+    return demand, P_max_pu
+
+
+class TestRepresentativeDays:
+    """Test clustering, weights and condition parsing"""
+
+    def test_peak_day_kept_and_weights_cover_year(self):
+        demand, P_max_pu = build_inputs()
+        profiles = fiscal_year_profiles(demand[2026], P_max_pu, 2026)
+        clustering = cluster_representative_days(profiles, 12)
+
+        assert len(clustering['days']) == 12
+        assert sum(clustering['weights']) == clustering['total_days'] == 365
+        assert clustering['peak_day'] == profiles['demand'].idxmax().normalize()
+        assert clustering['peak_day'] in clustering['days']
+        assert clustering['errors']['peak_error_pct'] == pytest.approx(0.0)
+        assert abs(clustering['errors']['energy_error_pct']) < 5
+
+    def test_snapshot_weights_sum_to_year(self):
+        demand, P_max_pu = build_inputs()
+        clustering = cluster_representative_days(fiscal_year_profiles(demand[2026], P_max_pu, 2026), 8)
+
+        snapshots, weights = representative_snapshots(clustering, 3)
+        assert len(snapshots) == 8 * 8
+        assert weights.sum() == pytest.approx(365 * 24)
+        assert snapshots.is_monotonic_increasing
+
+    def test_more_days_reduce_error(self):
+        demand, P_max_pu = build_inputs()
+        profiles = fiscal_year_profiles(demand[2026], P_max_pu, 2026)
+
+        coarse = cluster_representative_days(profiles, 4)['errors']['hourly_nrmse_pct']
+        fine = cluster_representative_days(profiles, 48)['errors']['hourly_nrmse_pct']
+        assert fine < coarse
+
+    def test_condition_parsing(self):
+        settings_main = pd.DataFrame({'Setting': ['Representative Days'], 'Option': [20]})
+
+        assert is_representative_days('Representative days (k)')
+        assert not is_representative_days('Peak weeks')
+        assert get_representative_day_count('Representative days (30)', settings_main) == 30
+        assert get_representative_day_count('Representative days', settings_main) == 20
+        assert get_representative_day_count('Representative days', None) == 12
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,82 @@
+"""
+Test HiGHS Solver Profiles
+==========================
+
+Checks profile resolution from a scenario configuration and that the model
+config endpoints list and persist the selected profile.
+"""
+
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend_fastapi.main import app
+from backend_fastapi.models.solver_profiles import SOLVER_PROFILES, resolve_solver_profile
+
+client = TestClient(app)
+
+
+class TestProfileResolution:
+    """Test resolve_solver_profile"""
+
+    def test_auto_profile_keeps_highs_defaults(self):
+        config = {"configuration": {"solver": {"name": "highs"}, "optimization": {}}}
+        assert resolve_solver_profile(config) == ('auto', {})
+
+        config["configuration"]["optimization"]["solverProfile"] = "auto"
+        config["configuration"]["solver"]["options"] = {"threads": 4}
+        assert resolve_solver_profile(config) == ('auto', {"threads": 4})
+
+    def test_profile_applies_only_when_selected(self):
+        profile, options = resolve_solver_profile({"configuration": {"solver": {"profile": "fast-dispatch"}}})
+        assert profile == 'fast-dispatch'
+        assert options == SOLVER_PROFILES['fast-dispatch']['options']
+
+    def test_named_profile_with_overrides(self):
+        config = {"configuration": {
+            "solver": {"name": "highs", "options": {"time_limit": 60.0}},
+            "optimization": {"solverProfile": "large-LP-ipm", "solverOptions": {"run_crossover": "on"}},
+        }}
+        profile, options = resolve_solver_profile(config)
+
+        assert profile == 'large-LP-ipm'
+        assert options['solver'] == 'ipm'
+        assert options['time_limit'] == 60.0
+        assert options['run_crossover'] == 'on'
+        # Overrides never leak into the shared profile definition
+        assert SOLVER_PROFILES['large-LP-ipm']['options']['run_crossover'] == 'off'
+
+    def test_unknown_profile_raises(self):
+        with pytest.raises(ValueError):
+            resolve_solver_profile({"configuration": {"optimization": {"solverProfile": "turbo"}}})
+
+
+class TestProfileEndpoints:
+    """Test listing and selecting profiles"""
+
+    def test_list_profiles(self):
+        data = client.get("/project/pypsa/solver-profiles").json()
+        assert data['default'] == 'auto'
+        assert [p['name'] for p in data['profiles']] == list(SOLVER_PROFILES)
+
+    def test_apply_configuration_stores_profile(self, tmp_path):
+        inputs = tmp_path / "inputs"
+        inputs.mkdir()
+        config_file = inputs / "pypsa_config_base.json"
+        config_file.write_text(json.dumps({"scenarioName": "base", "configuration": {"optimization": {"weightings": "1"}}}))
+
+        response = client.post("/project/pypsa/apply-configuration", json={
+            "projectPath": str(tmp_path), "scenarioName": "base", "solverProfile": "unit-commitment"})
+        assert response.json()['solverProfile'] == 'unit-commitment'
+
+        saved = json.loads(config_file.read_text())['configuration']['optimization']
+        assert saved == {"weightings": "1", "solverProfile": "unit-commitment"}
+
+        rejected = client.post("/project/pypsa/apply-configuration", json={
+            "projectPath": str(tmp_path), "scenarioName": "base", "solverProfile": "turbo"})
+        assert rejected.status_code == 400
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
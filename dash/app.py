@@ -7,13 +7,10 @@ import dash
 from dash import Dash, html, dcc, Input, Output, State, callback_context, ALL, MATCH
 import dash_bootstrap_components as dbc
 from dash.exceptions import PreventUpdate
-import plotly.graph_objects as go
-import plotly.express as px
+import importlib
 import json
 import os
 from pathlib import Path
-import pandas as pd
-import numpy as np
 from datetime import datetime
 import threading
 import time
@@ -23,57 +20,46 @@ from components.sidebar import create_sidebar
 from components.topbar import create_topbar
 from components.workflow_stepper import create_workflow_stepper
 
-# Page modules - LAZY LOADED (only import when needed to improve startup time)
-# This prevents all heavy page dependencies from loading on app start
+# Page registry: page name -> module in pages/.
+# Every page module is imported once at startup (register_pages below) because
+# Dash only sends the callbacks registered before the first request to the
+# browser. Page modules are cheap to import: pandas, numpy, openpyxl and
+# plotly.subplots are bound through utils/lazy_imports.py, and pypsa, sklearn
+# and statsmodels are only imported inside the services/models that use them,
+# so each page's heavy dependencies load when its callbacks first fire.
+PAGE_MODULES = {
+    'Home': 'home',
+    'Create Project': 'create_project',
+    'Load Project': 'load_project',
+    'Demand Projection': 'demand_projection',
+    'Demand Visualization': 'demand_visualization',
+    'Generate Profiles': 'generate_profiles',
+    'Analyze Profiles': 'analyze_profiles',
+    'Model Config': 'model_config',
+    'View Results': 'view_results',
+    'Settings': 'settings_page',
+    'Other Tools': 'other_tools',
+}
+
+# Pages whose layout() takes the active project
+PROJECT_PAGES = {'Home', 'Demand Projection', 'Demand Visualization', 'Generate Profiles',
+                 'Analyze Profiles', 'Model Config', 'View Results'}
+
 _page_modules = {}
 
 def _lazy_import_page(page_name):
     """
-    Lazy import page modules only when they're first accessed.
-    This significantly improves app startup time by deferring heavy imports.
+    Import a page module (registering its callbacks) on first access.
 
     Args:
-        page_name: Name of the page module to import
+        page_name: Module name in pages/ (value of PAGE_MODULES)
 
     Returns:
         Imported page module
     """
     if page_name not in _page_modules:
-        if page_name == 'home':
-            from pages import home
-            _page_modules['home'] = home
-        elif page_name == 'create_project':
-            from pages import create_project
-            _page_modules['create_project'] = create_project
-        elif page_name == 'load_project':
-            from pages import load_project
-            _page_modules['load_project'] = load_project
-        elif page_name == 'demand_projection':
-            from pages import demand_projection
-            _page_modules['demand_projection'] = demand_projection
-        elif page_name == 'demand_visualization':
-            from pages import demand_visualization
-            _page_modules['demand_visualization'] = demand_visualization
-        elif page_name == 'generate_profiles':
-            from pages import generate_profiles
-            _page_modules['generate_profiles'] = generate_profiles
-        elif page_name == 'analyze_profiles':
-            from pages import analyze_profiles
-            _page_modules['analyze_profiles'] = analyze_profiles
-        elif page_name == 'model_config':
-            from pages import model_config
-            _page_modules['model_config'] = model_config
-        elif page_name == 'view_results':
-            from pages import view_results
-            _page_modules['view_results'] = view_results
-        elif page_name == 'settings_page':
-            from pages import settings_page
-            _page_modules['settings_page'] = settings_page
-        elif page_name == 'other_tools':
-            from pages import other_tools
-            _page_modules['other_tools'] = other_tools
-
-    return _page_modules.get(page_name)
+        _page_modules[page_name] = importlib.import_module(f'pages.{page_name}')
+    return _page_modules[page_name]
 
 # Callback modules - LAZY LOADED (only import when callbacks are registered)
 _callback_modules = {}
@@ -299,38 +285,10 @@ def render_page_content(selected_page, active_project, collapsed):
 
     # Page routing with lazy loading
     try:
-        if selected_page == 'Home':
-            page_module = _lazy_import_page('home')
-            return page_module.layout(active_project), style
-        elif selected_page == 'Create Project':
-            page_module = _lazy_import_page('create_project')
-            return page_module.layout(), style
-        elif selected_page == 'Load Project':
-            page_module = _lazy_import_page('load_project')
-            return page_module.layout(), style
-        elif selected_page == 'Demand Projection':
-            page_module = _lazy_import_page('demand_projection')
-            return page_module.layout(active_project), style
-        elif selected_page == 'Demand Visualization':
-            page_module = _lazy_import_page('demand_visualization')
-            return page_module.layout(active_project), style
-        elif selected_page == 'Generate Profiles':
-            page_module = _lazy_import_page('generate_profiles')
-            return page_module.layout(active_project), style
-        elif selected_page == 'Analyze Profiles':
-            page_module = _lazy_import_page('analyze_profiles')
-            return page_module.layout(active_project), style
-        elif selected_page == 'Model Config':
-            page_module = _lazy_import_page('model_config')
-            return page_module.layout(active_project), style
-        elif selected_page == 'View Results':
-            page_module = _lazy_import_page('view_results')
-            return page_module.layout(active_project), style
-        elif selected_page == 'Settings':
-            page_module = _lazy_import_page('settings_page')
-            return page_module.layout(), style
-        elif selected_page == 'Other Tools':
-            page_module = _lazy_import_page('other_tools')
+        if selected_page in PAGE_MODULES:
+            page_module = _lazy_import_page(PAGE_MODULES[selected_page])
+            if selected_page in PROJECT_PAGES:
+                return page_module.layout(active_project), style
             return page_module.layout(), style
         else:
             return html.Div([
@@ -529,6 +487,10 @@ import queue as queue_module
 # Import the global SSE queues from local_service
 from services.local_service import forecast_sse_queue, pypsa_solver_sse_queue, profile_sse_queue
 
+# On-demand export downloads (files are generated only when a download is clicked)
+from utils.export import register_export_routes
+register_export_routes(server)
+
 @server.route('/api/forecast-progress')
 def forecast_progress_sse():
     """
@@ -654,47 +616,19 @@ def pypsa_solver_logs_sse():
     )
 
 # =============================================================================
-# EAGER IMPORT ALL PAGES - CRITICAL FIX FOR CALLBACK REGISTRATION
+# REGISTER PAGE CALLBACKS
 # =============================================================================
-# **IMPORTANT:** Dash requires ALL callbacks to be registered BEFORE app.run_server()
-# Lazy loading imports pages too late (after server starts), causing callbacks to fail
-# This eager import ensures all page callbacks are registered when server starts
-
-print("\n" + "="*80)
-print("REGISTERING PAGE CALLBACKS")
-print("="*80)
-
-# Import all pages to register their callbacks
-from pages import (
-    home,
-    create_project,
-    load_project,
-    demand_projection,
-    demand_visualization,
-    generate_profiles,
-    analyze_profiles,
-    model_config,
-    view_results,
-    settings_page,
-    other_tools
-)
+# Dash serves the callback list to the browser once, so every page module
+# must be imported (and its @callback decorators run) before the server
+# starts. This is cheap: pages defer their heavy imports (see PAGE_MODULES).
+
+def register_pages():
+    """Import every page module so its callbacks are registered."""
+    for module_name in PAGE_MODULES.values():
+        _lazy_import_page(module_name)
+    return len(_page_modules)
 
-# Pre-populate the lazy loading cache
-_page_modules['home'] = home
-_page_modules['create_project'] = create_project
-_page_modules['load_project'] = load_project
-_page_modules['demand_projection'] = demand_projection
-_page_modules['demand_visualization'] = demand_visualization
-_page_modules['generate_profiles'] = generate_profiles
-_page_modules['analyze_profiles'] = analyze_profiles
-_page_modules['model_config'] = model_config
-_page_modules['view_results'] = view_results
-_page_modules['settings_page'] = settings_page
-_page_modules['other_tools'] = other_tools
-
-print(f"✅ Successfully imported {len(_page_modules)} page modules")
-print(f"✅ All page callbacks registered")
-print("="*80 + "\n")
+print(f"✅ Registered callbacks for {register_pages()} page modules")
 
 # =============================================================================
 # RUN THE APP
@@ -0,0 +1,120 @@
+"""
+Dash Startup Benchmark
+======================
+
+Measures what the browser waits for before the first paint, in a fresh
+interpreter per run:
+
+- ``import app``: builds the layout and registers every page's callbacks
+- ``GET /``, ``/_dash-layout`` and ``/_dash-dependencies``: the requests the
+  Dash renderer makes before it can draw anything
+
+and reports which heavy modules (pandas, numpy, openpyxl, plotly.express,
+pypsa, sklearn, statsmodels, ...) ``import app`` pulled in. Pages bind those
+through ``utils/lazy_imports.py`` so they load when a page's callback first
+fires; any of them in the eager list is a regression. (Serving the layout
+imports numpy through Dash's own plotly JSON encoder; that is reported
+separately and not counted.) ``--check`` makes the run fail on an eager heavy
+module or when the median time to first paint exceeds the budget.
+
+Usage::
+
+    python dash/benchmarks/startup_benchmark.py
+    python dash/benchmarks/startup_benchmark.py --runs 5 --check 1.5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+DASH_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ['pandas', 'numpy', 'openpyxl', 'pyarrow', 'plotly.express', 'plotly.subplots',
+                 'pypsa', 'scipy', 'sklearn', 'statsmodels', 'matplotlib']
+
+# Runs inside the fresh interpreter; prints one JSON line
+PROBE = """
+import contextlib, io, json, sys, time
+started = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    import app
+imported = time.perf_counter()
+eager = [m for m in HEAVY_MODULES if m in sys.modules]
+client = app.server.test_client()
+for path in ('/', '/_dash-layout', '/_dash-dependencies'):
+    assert client.get(path).status_code == 200, path
+served = time.perf_counter()
+callbacks = len(client.get('/_dash-dependencies').get_json())
+print(json.dumps({
+    'import_s': imported - started,
+    'first_paint_s': served - started,
+    'callbacks': callbacks,
+    'eager_heavy_modules': eager,
+    'serving_modules': [m for m in HEAVY_MODULES if m in sys.modules and m not in eager],
+}))
+"""
+
+
+def run_once() -> Dict:
+    code = f"HEAVY_MODULES = {HEAVY_MODULES!r}\n{PROBE}"
+    proc = subprocess.run([sys.executable, '-c', code], cwd=DASH_DIR, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"Startup probe failed:\n{proc.stderr}")
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def run_benchmark(runs: int) -> Dict:
+    samples = [run_once() for _ in range(runs)]
+    return {
+        'import_s': [s['import_s'] for s in samples],
+        'first_paint_s': [s['first_paint_s'] for s in samples],
+        'first_paint_median_s': statistics.median(s['first_paint_s'] for s in samples),
+        'callbacks': samples[-1]['callbacks'],
+        'eager_heavy_modules': sorted({m for s in samples for m in s['eager_heavy_modules']}),
+        'serving_modules': sorted({m for s in samples for m in s['serving_modules']}),
+    }
+
+
+def format_report(result: Dict) -> str:
+    return '\n'.join([
+        f"import app:             {statistics.median(result['import_s']):.3f} s median",
+        f"time to first paint:    {result['first_paint_median_s']:.3f} s median of "
+        f"{len(result['first_paint_s'])} ({', '.join(f'{t:.3f}' for t in result['first_paint_s'])})",
+        f"registered callbacks:   {result['callbacks']}",
+        f"eager heavy modules:    {', '.join(result['eager_heavy_modules']) or 'none'}",
+        f"loaded while serving:   {', '.join(result['serving_modules']) or 'none'}",
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=3, help='Fresh interpreters to time')
+    parser.add_argument('--check', type=float, metavar='SECONDS',
+                        help='Fail if a heavy module loads eagerly or the median exceeds SECONDS')
+    parser.add_argument('--json', dest='json_path', help='Also write results to this JSON file')
+    args = parser.parse_args()
+
+    result = run_benchmark(args.runs)
+    print(format_report(result))
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+
+    if args.check is not None:
+        failures: List[str] = []
+        if result['eager_heavy_modules']:
+            failures.append(f"heavy modules imported at startup: {', '.join(result['eager_heavy_modules'])}")
+        if result['first_paint_median_s'] > args.check:
+            failures.append(f"time to first paint {result['first_paint_median_s']:.3f} s > {args.check} s")
+        if failures:
+            print('\nFAILED: ' + '; '.join(failures))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,287 @@
+"""
+Rolling-Origin Forecast Backtest
+================================
+
+``forecasting.py`` scores each sector on one split (the last two years).
+Comparing models honestly needs many forecasts: for every cutoff year the
+models are refit on the history up to the cutoff and scored on the years
+that follow it, by horizon (years ahead of the cutoff).
+
+Refitting the per-sector GridSearchCV pipeline for every cutoff is far too
+slow, so the backtest fits every cutoff of a sector at once:
+
+- SLR / MLR / TimeSeries are ordinary least squares with an intercept. The
+  normal equations of an expanding window are prefix sums of the per-year
+  ``x xᵀ`` and ``x y`` terms, so one cumulative sum gives the fit of every
+  cutoff and a single batched pseudo-inverse solves them all.
+- WAM weights the last ``window_size`` growth rates; the rates are computed
+  once per sector and each cutoff takes the rates up to it.
+
+Models follow the forecasting script: SLR/MLR train without the COVID
+years, TimeSeries on the full history, WAM on growth rates of the full
+history with the COVID years' rates dropped. MLR is scored with the observed
+indicator values of the forecast years (known-regressor backtest). Actuals
+are the non-COVID years after each cutoff.
+
+Sectors run concurrently on a thread pool; the consolidated table has MAPE
+and RMSE per sector, model and horizon plus an ``All`` row per model and
+horizon pooled over sectors.
+
+Usage::
+
+    forecasts, errors = run_backtest({'Domestic': (df, {'models': ['SLR', 'WAM']})},
+                                     cutoffs=10, horizon=5)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+BACKTEST_MODELS = ('SLR', 'MLR', 'WAM', 'TimeSeries')
+BACKTEST_ERRORS_FILE = 'backtest_errors.csv'
+DEFAULT_CUTOFFS = 10
+DEFAULT_HORIZON = 5
+DEFAULT_MIN_TRAIN_YEARS = 5
+DEFAULT_WAM_WINDOW = 10
+DEFAULT_COVID_YEARS = (2020, 2021, 2022)
+ALL_SECTORS = 'All'
+
+FORECAST_COLUMNS = ['Sector', 'Model', 'Cutoff', 'Year', 'Horizon', 'Actual', 'Forecast']
+ERROR_COLUMNS = ['Sector', 'Model', 'Horizon', 'Count', 'MAPE (%)', 'RMSE']
+
+
+# =============================================================================
+# MODEL KERNELS
+# =============================================================================
+
+def _standardize(X: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Centre and scale columns; OLS with an intercept is invariant to it."""
+    mean = X.mean(axis=0)
+    scale = X.std(axis=0)
+    scale = np.where(scale > 0, scale, 1.0)
+    return (X - mean) / scale, mean, scale
+
+
+def expanding_ols(X: np.ndarray, y: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Coefficients of OLS fits (with intercept) on rows ``[0, end)`` for each end.
+
+    Args:
+        X: Regressors, shape (rows, features), rows in time order
+        y: Target, shape (rows,)
+        ends: Number of leading rows of each fit
+
+    Returns:
+        Array of shape (len(ends), features + 1); column 0 is the intercept,
+        the rest apply to the regressors as given
+    """
+    design = np.column_stack([np.ones(len(X)), X])
+    xtx = np.cumsum(design[:, :, None] * design[:, None, :], axis=0)
+    xty = np.cumsum(design * y[:, None], axis=0)
+    rows = np.asarray(ends, dtype=int) - 1
+    return np.einsum('kij,kj->ki', np.linalg.pinv(xtx[rows], hermitian=True), xty[rows])
+
+
+def _ols_forecasts(X: np.ndarray, y: np.ndarray, ends: np.ndarray, X_targets: np.ndarray) -> np.ndarray:
+    """Predictions of each expanding fit for its own target rows, shape (cutoffs, horizon)."""
+    X_std, mean, scale = _standardize(X)
+    coefs = expanding_ols(X_std, y, ends)
+    targets = (X_targets - mean) / scale
+    return coefs[:, None, 0] + np.einsum('khf,kf->kh', targets, coefs[:, 1:])
+
+
+def _growth_rates(years: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Annualized growth of each year over the previous row (NaN for the first)."""
+    rates = np.full(len(years), np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rates[1:] = (values[1:] / values[:-1]) ** (1.0 / (years[1:] - years[:-1])) - 1
+    return rates
+
+
+def _wam_rate(rates: np.ndarray, usable: np.ndarray, window_size: int) -> float:
+    """Weighted average of the last ``window_size`` usable growth rates."""
+    recent = rates[usable][-window_size:]
+    if len(recent) == 0:
+        return np.nan
+    weights = np.arange(1, len(recent) + 1)
+    return float(np.average(recent, weights=weights))
+
+
+# =============================================================================
+# SECTOR BACKTEST
+# =============================================================================
+
+def _cutoff_positions(n_years: int, cutoffs: int, min_train_years: int) -> np.ndarray:
+    """Positions (in the training years) of the last ``cutoffs`` usable origins."""
+    first = max(min_train_years, 2) - 1
+    positions = np.arange(first, n_years - 1)
+    return positions[-cutoffs:] if cutoffs > 0 else positions[:0]
+
+
+def _regressors(df: pd.DataFrame, independent_vars: Sequence[str]) -> List[str]:
+    """MLR regressors as the forecasting script picks them (Year when none apply)."""
+    available = [c for c in df.columns if c not in ('Year', 'Electricity')]
+    return [v for v in independent_vars if v in available and v != 'Year'] or ['Year']
+
+
+def backtest_sector(df: pd.DataFrame, models: Iterable[str] = BACKTEST_MODELS,
+                    independent_vars: Sequence[str] = (), window_size: int = DEFAULT_WAM_WINDOW,
+                    covid_years: Sequence[int] = DEFAULT_COVID_YEARS, exclude_covid: bool = True,
+                    cutoffs: int = DEFAULT_CUTOFFS, horizon: int = DEFAULT_HORIZON,
+                    min_train_years: int = DEFAULT_MIN_TRAIN_YEARS) -> pd.DataFrame:
+    """
+    Rolling-origin forecasts of one sector.
+
+    Args:
+        df: Prepared sector data (``Year``, ``Electricity`` and indicator
+            columns), as returned by ``prepare_sector_data``
+        models: Models to backtest (any of ``BACKTEST_MODELS``)
+        independent_vars: MLR indicator columns
+        window_size: WAM window
+        covid_years: Years left out of training and scoring
+        exclude_covid: Whether to leave the COVID years out
+        cutoffs: Number of forecast origins (the most recent usable ones)
+        horizon: Years ahead of each origin to forecast
+        min_train_years: Training years required before the first origin
+
+    Returns:
+        One row per model, cutoff and forecast year: ``Model``, ``Cutoff``,
+        ``Year``, ``Horizon``, ``Actual``, ``Forecast``
+    """
+    models = [m for m in BACKTEST_MODELS if m in set(models)]
+    full = df.sort_values('Year').reset_index(drop=True)
+    full = full[full['Year'].notna() & full['Electricity'].notna()]
+    train = full[~full['Year'].isin(covid_years)] if exclude_covid else full
+
+    years = train['Year'].to_numpy(dtype=float)
+    actual = train['Electricity'].to_numpy(dtype=float)
+    positions = _cutoff_positions(len(years), cutoffs, min_train_years)
+    if len(positions) == 0 or not models:
+        return pd.DataFrame(columns=FORECAST_COLUMNS[1:])
+
+    # Target rows of each origin, padded to ``horizon`` columns
+    cutoff_years = years[positions]
+    offsets = np.arange(1, horizon + 1)
+    target_rows = np.minimum(positions[:, None] + offsets, len(years) - 1)
+    valid = (positions[:, None] + offsets < len(years)) & (years[target_rows] - cutoff_years[:, None] <= horizon)
+    target_years = years[target_rows]
+
+    forecasts: Dict[str, np.ndarray] = {}
+    ends = positions + 1
+
+    if 'SLR' in models:
+        forecasts['SLR'] = np.maximum(_ols_forecasts(years[:, None], actual, ends, target_years[..., None]), 0)
+
+    if 'MLR' in models:
+        mlr_vars = _regressors(train, independent_vars)
+        X = train[mlr_vars].apply(pd.to_numeric, errors='coerce')
+        X = X.fillna(X.mean()).fillna(0).to_numpy(dtype=float)
+        forecasts['MLR'] = np.maximum(_ols_forecasts(X, actual, ends, X[target_rows]), 0)
+
+    if 'TimeSeries' in models:
+        full_years = full['Year'].to_numpy(dtype=float)
+        full_ends = np.searchsorted(full_years, cutoff_years, side='right')
+        forecasts['TimeSeries'] = np.maximum(
+            _ols_forecasts(full_years[:, None], full['Electricity'].to_numpy(dtype=float), full_ends,
+                           target_years[..., None]), 0)
+
+    if 'WAM' in models:
+        if window_size < 2:
+            raise ValueError("window_size must be at least 2")
+        full_years = full['Year'].to_numpy(dtype=float)
+        rates = _growth_rates(full_years, full['Electricity'].to_numpy(dtype=float))
+        usable = np.isfinite(rates)
+        if exclude_covid:
+            usable &= ~np.isin(full_years, covid_years)
+        growth = np.array([_wam_rate(rates, usable & (full_years <= year), window_size) for year in cutoff_years])
+        steps = target_years - cutoff_years[:, None]
+        forecasts['WAM'] = actual[positions][:, None] * (1 + growth[:, None]) ** steps
+
+    cutoff_index, step_index = np.nonzero(valid)
+    frames = [
+        pd.DataFrame({
+            'Model': model,
+            'Cutoff': cutoff_years[cutoff_index].astype(int),
+            'Year': target_years[cutoff_index, step_index].astype(int),
+            'Horizon': (target_years - cutoff_years[:, None])[cutoff_index, step_index].astype(int),
+            'Actual': actual[target_rows][cutoff_index, step_index],
+            'Forecast': values[cutoff_index, step_index],
+        })
+        for model, values in forecasts.items()
+    ]
+    return pd.concat(frames, ignore_index=True)
+
+
+# =============================================================================
+# ERROR TABLE
+# =============================================================================
+
+def error_table(forecasts: pd.DataFrame, pooled: bool = True) -> pd.DataFrame:
+    """
+    MAPE and RMSE by sector, model and horizon.
+
+    Actuals of zero are left out of MAPE. With ``pooled`` an ``All`` sector
+    row per model and horizon pools the forecasts of every sector.
+    """
+    if forecasts.empty:
+        return pd.DataFrame(columns=ERROR_COLUMNS)
+
+    frame = forecasts[['Sector', 'Model', 'Horizon']].copy()
+    error = forecasts['Forecast'] - forecasts['Actual']
+    frame['squared'] = error ** 2
+    nonzero = forecasts['Actual'] != 0
+    frame['ape'] = (error.abs() / forecasts['Actual'].abs()).where(nonzero)
+    if pooled:
+        frame = pd.concat([frame, frame.assign(Sector=ALL_SECTORS)], ignore_index=True)
+
+    grouped = frame.groupby(['Sector', 'Model', 'Horizon'], sort=False)
+    table = grouped.agg(Count=('squared', 'size'), mape=('ape', 'mean'), mse=('squared', 'mean')).reset_index()
+    table['MAPE (%)'] = table.pop('mape') * 100
+    table['RMSE'] = np.sqrt(table.pop('mse'))
+    order = {model: i for i, model in enumerate(BACKTEST_MODELS)}
+    table = table.sort_values(['Sector', 'Model', 'Horizon'],
+                              key=lambda col: col.map(order) if col.name == 'Model' else col)
+    return table[ERROR_COLUMNS].reset_index(drop=True)
+
+
+def run_backtest(sectors: Dict[str, Tuple[pd.DataFrame, Dict[str, Any]]],
+                 cutoffs: int = DEFAULT_CUTOFFS, horizon: int = DEFAULT_HORIZON,
+                 min_train_years: int = DEFAULT_MIN_TRAIN_YEARS,
+                 covid_years: Sequence[int] = DEFAULT_COVID_YEARS, exclude_covid: bool = True,
+                 max_workers: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, str]]:
+    """
+    Backtest every sector concurrently.
+
+    Args:
+        sectors: Sector name -> (prepared data, options); options may set
+            ``models``, ``independent_vars`` and ``window_size``
+        cutoffs, horizon, min_train_years: See ``backtest_sector``
+        covid_years, exclude_covid: COVID handling, as in the forecast
+        max_workers: Thread pool size (default: one per sector, at most 8)
+
+    Returns:
+        (all forecasts, error table, failed sector -> error message)
+    """
+    def run(name, df, options):
+        result = backtest_sector(
+            df, options.get('models', BACKTEST_MODELS), options.get('independent_vars', ()),
+            options.get('window_size', DEFAULT_WAM_WINDOW), covid_years, exclude_covid,
+            cutoffs, horizon, min_train_years,
+        )
+        return result.assign(Sector=name)
+
+    frames, failed = [], {}
+    workers = max_workers or min(8, max(len(sectors), 1))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='backtest') as pool:
+        futures = {name: pool.submit(run, name, df, options) for name, (df, options) in sectors.items()}
+        for name, future in futures.items():
+            try:
+                frames.append(future.result())
+            except Exception as e:
+                failed[name] = str(e)
+
+    frames = [f for f in frames if not f.empty]
+    forecasts = pd.concat(frames, ignore_index=True)[FORECAST_COLUMNS] if frames else pd.DataFrame(columns=FORECAST_COLUMNS)
+    return forecasts, error_table(forecasts), failed
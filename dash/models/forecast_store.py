@@ -0,0 +1,279 @@
+"""
+Columnar Forecast Results Store
+===============================
+
+``forecasting.py`` writes every sector of a scenario into one long-format
+Parquet file, ``forecast_results.parquet``, next to the (now optional)
+per-sector workbooks. Every table a sector workbook used to hold is kept:
+
+=============  ==============================================
+table          contents
+=============  ==============================================
+inputs         historical/user input data ('Inputs' sheet)
+results        Year + one column per model ('Results' sheet)
+models         model type and parameters ('Models' sheet)
+statistics     Electricity min/max/mean/std/count
+evaluation     per-model test metrics
+=============  ==============================================
+
+Each cell is one row: ``table, sector, row, column, order, year, value, text``
+(numbers in ``value``, anything else in ``text``; ``order`` keeps the column
+order of the original sheet). Readers load the file once per modification
+time and pivot tables back to the original wide layout on demand, so listing
+models or comparing scenarios across many sectors is a single file read
+instead of one workbook parse per sector.
+
+Scenarios produced before the store existed have no Parquet file;
+``get_forecast_store`` returns None for them and callers keep reading the
+sector workbooks.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    STORE_AVAILABLE = True
+except ImportError:
+    STORE_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+FORECAST_STORE_FILE = 'forecast_results.parquet'
+STORE_COLUMNS = ['table', 'sector', 'row', 'column', 'order', 'year', 'value', 'text']
+MAX_CACHED_STORES = 8
+
+
+# =============================================================================
+# WRITING
+# =============================================================================
+
+def table_to_long(table: str, sector: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Melt one wide sheet into store rows."""
+    df = df.reset_index(drop=True)
+    if df.empty or len(df.columns) == 0:
+        return pd.DataFrame(columns=STORE_COLUMNS)
+
+    years = (pd.to_numeric(df['Year'], errors='coerce') if 'Year' in df.columns
+             else pd.Series(np.nan, index=df.index))
+    parts = []
+    for order, column in enumerate(df.columns):
+        series = df[column]
+        numeric = pd.to_numeric(series, errors='coerce') if not pd.api.types.is_bool_dtype(series) else \
+            pd.Series(np.nan, index=series.index)
+        is_text = numeric.isna() & series.notna()
+        parts.append(pd.DataFrame({
+            'table': table,
+            'sector': sector,
+            'row': np.arange(len(df), dtype='int32'),
+            'column': str(column),
+            'order': np.int16(order),
+            'year': years.to_numpy(dtype=float),
+            'value': numeric.to_numpy(dtype=float),
+            'text': series.where(is_text).map(lambda v: None if pd.isna(v) else str(v)).astype(object),
+        }))
+    return pd.concat(parts, ignore_index=True)
+
+
+def sector_to_long(sector: str, tables: Dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """Store rows for all tables of one sector (``{table name: wide frame}``)."""
+    frames = [table_to_long(name, sector, df) for name, df in tables.items() if df is not None]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=STORE_COLUMNS)
+
+
+def write_forecast_store(scenario_dir: Union[str, Path], sector_frames: List[pd.DataFrame]) -> Optional[Path]:
+    """
+    Write (or update) the scenario's store with the given sectors.
+
+    Sectors already in the store and not rewritten are kept, so re-running a
+    subset of sectors does not drop the others. The file is replaced
+    atomically.
+
+    Returns:
+        Path of the store, or None if Parquet support is unavailable
+    """
+    if not STORE_AVAILABLE:
+        logger.warning("pyarrow not installed; forecast results store not written")
+        return None
+
+    path = Path(scenario_dir) / FORECAST_STORE_FILE
+    new = pd.concat(sector_frames, ignore_index=True) if sector_frames else pd.DataFrame(columns=STORE_COLUMNS)
+
+    if path.exists():
+        try:
+            existing = pd.read_parquet(path)
+            kept = existing[~existing['sector'].isin(set(new['sector']))]
+            new = pd.concat([kept, new], ignore_index=True)
+        except Exception as e:
+            logger.warning(f"Could not merge existing forecast store {path}: {e}")
+
+    new = new[STORE_COLUMNS].astype({
+        'table': 'category', 'sector': 'category', 'column': 'category',
+        'row': 'int32', 'order': 'int16', 'year': 'float64', 'value': 'float64', 'text': 'object',
+    })
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    new.to_parquet(tmp_path, index=False, compression='zstd')
+    os.replace(tmp_path, path)
+    return path
+
+
+# =============================================================================
+# READING
+# =============================================================================
+
+class ForecastStore:
+    """In-memory view of a scenario's ``forecast_results.parquet``."""
+
+    def __init__(self, data: pd.DataFrame):
+        self.data = data
+        self._groups = {
+            key: group for key, group in data.groupby(['table', 'sector'], observed=True, sort=False)
+        }
+        self._wide: Dict[Tuple[str, str], pd.DataFrame] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'ForecastStore':
+        return cls(pd.read_parquet(path))
+
+    @property
+    def sectors(self) -> List[str]:
+        """Sectors in the order they were written."""
+        return list(dict.fromkeys(str(s) for s in self.data['sector']))
+
+    def has_sector(self, sector: str) -> bool:
+        return ('results', sector) in self._groups
+
+    def table(self, table: str, sector: str) -> pd.DataFrame:
+        """
+        One sheet of a sector in its original wide layout.
+
+        Returns an empty frame when the sector/table is not stored. The frame
+        is shared between callers; copy it before modifying.
+        """
+        key = (table, sector)
+        with self._lock:
+            cached = self._wide.get(key)
+        if cached is not None:
+            return cached
+
+        group = self._groups.get(key)
+        if group is None:
+            return pd.DataFrame()
+
+        columns = (group[['order', 'column']].drop_duplicates('order')
+                   .sort_values('order')['column'].astype(str).tolist())
+        n_rows = int(group['row'].max()) + 1
+        wide = {}
+        for column, cells in group.groupby('column', observed=True, sort=False):
+            rows = cells['row'].to_numpy()
+            if cells['text'].notna().any():
+                numbers = cells['value'].to_numpy()
+                texts = cells['text'].to_numpy(dtype=object)
+                cell_values = np.where(pd.notna(texts), texts, numbers).astype(object)
+                cell_values[pd.isna(texts) & np.isnan(numbers)] = None
+                values = np.full(n_rows, None, dtype=object)
+                values[rows] = cell_values
+            else:
+                values = np.full(n_rows, np.nan)
+                values[rows] = cells['value'].to_numpy()
+            wide[str(column)] = values
+        frame = pd.DataFrame(wide)[columns]
+        if 'Year' in frame.columns and frame['Year'].notna().all():
+            frame['Year'] = frame['Year'].astype(int)
+
+        with self._lock:
+            self._wide[key] = frame
+        return frame
+
+    def results(self, sector: str) -> pd.DataFrame:
+        """'Results' table: Year plus one column per model."""
+        return self.table('results', sector)
+
+    def models(self, sector: str) -> List[str]:
+        """Model columns of a sector's results (excluding Year)."""
+        return [c for c in self.results(sector).columns if c.lower() not in ('year', 'time series')]
+
+    def forecast_start_year(self, sector: str) -> Optional[int]:
+        """Last input year with an Electricity value (None if unknown)."""
+        inputs = self.table('inputs', sector)
+        if 'Year' not in inputs.columns or 'Electricity' not in inputs.columns:
+            return None
+        years = pd.to_numeric(inputs.loc[inputs['Electricity'].notna(), 'Year'], errors='coerce').dropna()
+        return int(years.max()) if not years.empty else None
+
+    def results_matrix(self) -> Tuple[List[str], List[str], np.ndarray, np.ndarray]:
+        """
+        All results as ``(sectors, models, years, values[sector, model, year])``.
+
+        Missing combinations are NaN. Used to build the consolidation cube
+        without pivoting sector by sector.
+        """
+        results = self.data[(self.data['table'] == 'results') & (self.data['column'] != 'Year')]
+        results = results[results['year'].notna() & (results['year'] != 0)]
+        sectors = self.sectors
+        models = list(dict.fromkeys(str(c) for c in results.sort_values('order', kind='stable')['column']))
+        years = np.array(sorted(results['year'].unique()), dtype=int)
+
+        values = np.full((len(sectors), len(models), len(years)), np.nan)
+        if len(results):
+            s = pd.Categorical(results['sector'].astype(str), categories=sectors).codes
+            m = pd.Categorical(results['column'].astype(str), categories=models).codes
+            y = np.searchsorted(years, results['year'].to_numpy().astype(int))
+            values[s, m, y] = results['value'].to_numpy()
+        return sectors, models, years, values
+
+
+_stores: OrderedDict = OrderedDict()
+_stores_lock = threading.Lock()
+
+
+def forecast_store_path(scenario_dir: Union[str, Path]) -> Path:
+    return Path(scenario_dir) / FORECAST_STORE_FILE
+
+
+def get_forecast_store(scenario_dir: Union[str, Path]) -> Optional[ForecastStore]:
+    """
+    Cached store for a scenario folder, reloaded when the file changes.
+
+    Returns:
+        ForecastStore, or None if the scenario has no store (older results)
+        or Parquet support is unavailable
+    """
+    path = forecast_store_path(scenario_dir)
+    if not STORE_AVAILABLE:
+        return None
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    key = str(path.resolve())
+    fingerprint = (stat.st_size, stat.st_mtime_ns)
+    with _stores_lock:
+        entry = _stores.get(key)
+        if entry is not None and entry[0] == fingerprint:
+            _stores.move_to_end(key)
+            return entry[1]
+
+    try:
+        store = ForecastStore.load(path)
+    except Exception as e:
+        logger.error(f"Could not read forecast store {path}: {e}")
+        return None
+
+    with _stores_lock:
+        _stores[key] = (fingerprint, store)
+        _stores.move_to_end(key)
+        while len(_stores) > MAX_CACHED_STORES:
+            _stores.popitem(last=False)
+    return store
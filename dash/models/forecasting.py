@@ -9,8 +9,9 @@ Usage:
     python forecasting.py --config config.json
 """
 
-from typing import Any, Dict, List
-import os, sys, json, argparse, warnings, numpy as np, pandas as pd, time
+from typing import Any, Dict, List, Tuple
+from collections import OrderedDict
+import os, sys, json, argparse, hashlib, warnings, numpy as np, pandas as pd, time
 from datetime import datetime
 from pathlib import Path
 
@@ -19,11 +20,28 @@ from sklearn.linear_model import LinearRegression
 from sklearn.model_selection import GridSearchCV, TimeSeriesSplit
 import xlsxwriter
 from sklearn.svm import SVR
+
+try:
+    from forecast_store import FORECAST_STORE_FILE, STORE_AVAILABLE, sector_to_long, write_forecast_store
+except ImportError:
+    STORE_AVAILABLE = False
+
+try:
+    from forecast_backtest import BACKTEST_ERRORS_FILE, run_backtest
+    BACKTEST_AVAILABLE = True
+except ImportError:
+    BACKTEST_AVAILABLE = False
+
 warnings.filterwarnings('ignore')
 CONFIG = {}
 TOTAL_STEPS = 0
 CURRENT_STEP = 0
+STORE_FRAMES = []  # long-format tables of completed sectors for the results store
 DEFAULT_CV_SPLITS = 3  # Default number of cross-validation splits for time series
+SECTOR_CACHE_FILE = 'sector_fingerprints.json'  # input fingerprint + result of each forecast sector
+SECTOR_CACHE_VERSION = 1  # bump when the forecasting logic changes, to invalidate cached sectors
+PREPARED_DATA = OrderedDict()  # prepared sector frames by input hash; persists across runs in a worker process
+MAX_PREPARED_DATA = 256
 
 
 # ------------------------------------------------------------------------------
@@ -89,6 +107,22 @@ class ProgressReporter:
         self.current_sector = None
         self.sector_start_time = None
 
+    def cache_sector(self, sector_name):
+        self.current_sector_index = self.processed_sectors
+        self.processed_sectors += 1
+        data = dict(type="sector_completed",
+                    status="cached",
+                    sector=sector_name,
+                    processed_sectors=self.processed_sectors,
+                    total_sectors=self.total_sectors,
+                    sector_progress=100,
+                    progress=(self.processed_sectors / self.total_sectors) * 100,
+                    sector_duration=0,
+                    message=f"{sector_name} unchanged, reused previous results",
+                    step="Sector Cached",
+                    timestamp=datetime.now().isoformat())
+        self.emit_progress(data)
+
     def emit_progress(self, progress_data):
         try:
             print(f"PROGRESS:{json.dumps(progress_data)}", flush=True)
@@ -152,7 +186,13 @@ def load_config(path):
         config['global_models'] = raw.get('global_models', ['SLR', 'MLR'])
         config.setdefault('covid_years', [2020, 2021, 2022])
         config.setdefault('output_format', 'excel')
+        # Per-sector workbooks are optional once the columnar store is written
+        config['export_excel'] = raw.get('exportExcel', raw.get('export_excel', True)) or not STORE_AVAILABLE
         config.setdefault('include_charts', True)
+        config['force_rerun'] = bool(raw.get('forceRerun', raw.get('force_rerun', False)))
+        config['backtest'] = bool(raw.get('backtest', False))
+        config['backtest_cutoffs'] = int(raw.get('backtestCutoffs', raw.get('backtest_cutoffs', 10)))
+        config['backtest_horizon'] = int(raw.get('backtestHorizon', raw.get('backtest_horizon', 5)))
 
         # sectors section: convert array → dict keyed by name
         sectors_in = raw.get('sectors', [])
@@ -212,6 +252,20 @@ def validate_sector_data(sector_name, sector_config):
 
 
 def prepare_sector_data(sector_name, sector_config):
+    key = hashlib.sha256(json.dumps([sector_name, sector_config.get('data')], sort_keys=True,
+                                    default=str).encode('utf-8')).hexdigest()
+    if key in PREPARED_DATA:
+        PREPARED_DATA.move_to_end(key)
+        log_info(f"Reusing prepared data for {sector_name}")
+        return PREPARED_DATA[key].copy()
+    df = _prepare_sector_data(sector_name, sector_config)
+    PREPARED_DATA[key] = df.copy()
+    while len(PREPARED_DATA) > MAX_PREPARED_DATA:
+        PREPARED_DATA.popitem(last=False)
+    return df
+
+
+def _prepare_sector_data(sector_name, sector_config):
     try:
         validate_sector_data(sector_name, sector_config)
         data = sector_config['data']
@@ -391,7 +445,7 @@ def time_series_forecast(df, col, target_year):
         return np.zeros(max(0, int(target_year) - 2023))
 
 
-def save_results(sector_name, main_df, result_df_final, models, forecast_path):
+def save_results(sector_name, main_df, result_df_final, models, forecast_path, evaluation=None):
     output_dir = Path(forecast_path)
     output_dir.mkdir(parents=True, exist_ok=True)
     file_path = output_dir / f"{sector_name}.xlsx"
@@ -402,17 +456,98 @@ def save_results(sector_name, main_df, result_df_final, models, forecast_path):
         'Std': main_df['Electricity'].std(),
         'Count': len(main_df)
     }
+    models_df = pd.DataFrame([{'Model': k, 'Type': type(v).__name__, 'Parameters': str(v.get_params())}
+                              for k, v in models.items()]) if models else None
+
+    if STORE_AVAILABLE:
+        STORE_FRAMES.append(sector_to_long(sector_name, {
+            'inputs': main_df,
+            'results': result_df_final,
+            'models': models_df,
+            'statistics': pd.DataFrame([stats]),
+            'evaluation': pd.DataFrame(evaluation) if evaluation else None,
+        }))
+
+    if not CONFIG.get('export_excel', True):
+        return str(output_dir / FORECAST_STORE_FILE)
+
     with pd.ExcelWriter(file_path, engine='xlsxwriter') as writer:
         main_df.to_excel(writer, sheet_name='Inputs', index=False)
         result_df_final.to_excel(writer, sheet_name='Results', index=False)
-        if models:
-            pd.DataFrame([{'Model': k, 'Type': type(v).__name__, 'Parameters': str(v.get_params())}
-                          for k, v in models.items()]).to_excel(writer, sheet_name='Models', index=False)
+        if models_df is not None:
+            models_df.to_excel(writer, sheet_name='Models', index=False)
         pd.DataFrame([stats]).to_excel(writer, sheet_name='Statistics', index=False)
     log_info(f"Results saved to {file_path}")
     return str(file_path)
 
 
+# ------------------------------------------------------------------------------
+# Incremental re-runs: sectors whose inputs did not change reuse their results
+# ------------------------------------------------------------------------------
+def sector_fingerprint(sector_config):
+    """Hash of everything a sector's forecast depends on."""
+    payload = {
+        'version': SECTOR_CACHE_VERSION,
+        'data': sector_config.get('data', []),
+        'models': sector_config.get('models', CONFIG.get('global_models', ['SLR'])),
+        'parameters': sector_config.get('parameters', {}),
+        'target_year': CONFIG.get('target_year'),
+        'exclude_covid': CONFIG.get('exclude_covid', True),
+        'covid_years': CONFIG.get('covid_years'),
+        'export_excel': CONFIG.get('export_excel', True),
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def load_sector_cache(forecast_path):
+    """Fingerprints and results of the previous runs, keyed by sector."""
+    cache_path = Path(forecast_path) / SECTOR_CACHE_FILE
+    if not cache_path.exists():
+        return {}
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            cache = json.load(f)
+        return cache.get('sectors', {}) if cache.get('version') == SECTOR_CACHE_VERSION else {}
+    except Exception as e:
+        log_warning(f"Ignoring unreadable sector cache {cache_path}: {e}")
+        return {}
+
+
+def save_sector_cache(forecast_path, sectors):
+    cache_path = Path(forecast_path) / SECTOR_CACHE_FILE
+    tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': SECTOR_CACHE_VERSION, 'sectors': sectors}, f, indent=2, default=str)
+    os.replace(tmp_path, cache_path)
+
+
+def stored_sectors(forecast_path):
+    """Sectors present in the scenario's results store (empty without one)."""
+    if not STORE_AVAILABLE:
+        return set()
+    store_path = Path(forecast_path) / FORECAST_STORE_FILE
+    if not store_path.exists():
+        return set()
+    try:
+        return set(pd.read_parquet(store_path, columns=['sector'])['sector'].astype(str).unique())
+    except Exception as e:
+        log_warning(f"Could not read results store {store_path}: {e}")
+        return set()
+
+
+def cached_sector_result(sector_name, fingerprint, cache, forecast_path, in_store):
+    """Previous result of a sector if its inputs are unchanged and its outputs still exist."""
+    entry = cache.get(sector_name)
+    if not entry or entry.get('fingerprint') != fingerprint:
+        return None
+    if STORE_AVAILABLE and sector_name not in in_store:
+        return None
+    if CONFIG.get('export_excel', True) and not (Path(forecast_path) / f"{sector_name}.xlsx").exists():
+        return None
+    return entry.get('result')
+
+
 def process_sector(sector_name, sector_config, step_offset, total_steps, progress_reporter=None):
     try:
         log_info(f"Processing sector: {sector_name}")
@@ -499,7 +634,8 @@ def process_sector(sector_name, sector_config, step_offset, total_steps, progres
             progress_reporter.update_sector_progress(90, "Saving results", "Results Export")
         output_file = save_results(sector_name, main_df, result_df,
                                    models if not has_user_future else {},
-                                   CONFIG.get('forecast_path', CONFIG['scenario_name']))
+                                   CONFIG.get('forecast_path', CONFIG['scenario_name']),
+                                   evaluation)
         
         if progress_reporter:
             progress_reporter.update_sector_progress(100, "Sector completed", "Completed")
@@ -513,12 +649,63 @@ def process_sector(sector_name, sector_config, step_offset, total_steps, progres
                        "timestamp": datetime.now().isoformat()})
         raise
 
-def main():
-    global CONFIG, TOTAL_STEPS, CURRENT_STEP
-    parser = argparse.ArgumentParser(description="KSEB Demand Forecasting Script")
-    parser.add_argument('--config', required=True, help="Path to JSON configuration file")
-    args = parser.parse_args()
-    CONFIG = load_config(args.config)
+def backtest(enabled_sectors):
+    """Rolling-origin backtest of every enabled sector; see forecast_backtest."""
+    if not BACKTEST_AVAILABLE:
+        raise RuntimeError("Backtesting module not available")
+
+    sectors, results = {}, []
+    for name, cfg in enabled_sectors.items():
+        try:
+            parameters = cfg.get('parameters', {})
+            sectors[name] = (prepare_sector_data(name, cfg), {
+                'models': cfg.get('models', CONFIG.get('global_models', ['SLR'])),
+                'independent_vars': parameters.get('MLR', {}).get('independent_vars', []),
+                'window_size': parameters.get('WAM', {}).get('window_size', 10),
+            })
+        except Exception as e:
+            results.append({"sector": name, "status": "failed", "error": str(e)})
+
+    emit_progress(dict(type="progress", progress=10, message=f"Backtesting {len(sectors)} sectors",
+                       step="Backtest", timestamp=datetime.now().isoformat()))
+    started = time.time()
+    forecasts, errors, failed = run_backtest(
+        sectors, cutoffs=CONFIG['backtest_cutoffs'], horizon=CONFIG['backtest_horizon'],
+        covid_years=CONFIG.get('covid_years', [2020, 2021, 2022]), exclude_covid=CONFIG.get('exclude_covid', True))
+    log_info(f"Backtest of {len(sectors)} sectors: {len(forecasts)} forecasts in {time.time() - started:.2f}s")
+
+    for name in sectors:
+        if name in failed:
+            log_error(f"Backtest failed for {name}: {failed[name]}")
+            results.append({"sector": name, "status": "failed", "error": failed[name]})
+        else:
+            results.append({"sector": name, "status": "completed",
+                            "forecasts": int((forecasts['Sector'] == name).sum())})
+
+    output_dir = Path(CONFIG.get('forecast_path', CONFIG['scenario_name']))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    errors_file = output_dir / BACKTEST_ERRORS_FILE
+    errors.to_csv(errors_file, index=False)
+    log_info(f"Backtest errors saved to {errors_file}")
+
+    emit_progress(dict(type="progress", progress=100, message="Backtest completed",
+                       step="Backtest", timestamp=datetime.now().isoformat()))
+    return results, errors, errors_file
+
+
+def run(config_path, backtest_mode=False) -> Tuple[int, Dict[str, Any]]:
+    """
+    Run one forecast (or backtest) and print its result JSON.
+
+    Used by the command line and by the persistent worker processes, so all
+    per-run state is reset here.
+
+    Returns:
+        (exit code, result dict)
+    """
+    global CONFIG, TOTAL_STEPS, CURRENT_STEP, STORE_FRAMES
+    TOTAL_STEPS, CURRENT_STEP, STORE_FRAMES = 0, 0, []
+    CONFIG = load_config(config_path)
 
     log_info("=" * 60)
     log_info("KSEB DEMAND FORECASTING SYSTEM")
@@ -532,13 +719,45 @@ def main():
         raise ValueError("No enabled sectors")
     log_info(f"Processing {len(enabled_sectors)} sectors: {list(enabled_sectors.keys())}")
 
+    if backtest_mode or CONFIG.get('backtest'):
+        results, errors, errors_file = backtest(enabled_sectors)
+        failed = [r for r in results if r['status'] == 'failed']
+        final = dict(status="completed",
+                     mode="backtest",
+                     scenario_name=CONFIG['scenario_name'],
+                     cutoffs=CONFIG['backtest_cutoffs'],
+                     horizon=CONFIG['backtest_horizon'],
+                     total_sectors=len(enabled_sectors),
+                     successful_sectors=len(results) - len(failed),
+                     failed_sectors=len(failed),
+                     results=results,
+                     errors=json.loads(errors.to_json(orient='records')),
+                     errors_file=str(errors_file),
+                     timestamp=datetime.now().isoformat())
+        print(json.dumps(final, indent=2))
+        sys.stdout.flush()
+        return (0 if not failed else 1), final
+
     steps_per_sector = 7
     TOTAL_STEPS = len(enabled_sectors) * steps_per_sector
     report_progress(0, TOTAL_STEPS, "Initializing forecast", "Overall")
     progress_reporter = ProgressReporter(len(enabled_sectors))
     results, CURRENT_STEP = [], 0
 
+    forecast_path = CONFIG.get('forecast_path', CONFIG['scenario_name'])
+    sector_cache = {} if CONFIG.get('force_rerun') else load_sector_cache(forecast_path)
+    in_store = stored_sectors(forecast_path) if sector_cache else set()
+    fingerprints = {}
+
     for i, (sector_name, cfg) in enumerate(enabled_sectors.items()):
+        fingerprints[sector_name] = sector_fingerprint(cfg)
+        cached = cached_sector_result(sector_name, fingerprints[sector_name], sector_cache, forecast_path, in_store)
+        if cached is not None:
+            log_info(f"\n--- Sector {i+1}/{len(enabled_sectors)}: {sector_name} (unchanged, cached) ---")
+            results.append({**cached, 'cached': True})
+            CURRENT_STEP += steps_per_sector
+            progress_reporter.cache_sector(sector_name)
+            continue
         try:
             log_info(f"\n--- Sector {i+1}/{len(enabled_sectors)}: {sector_name} ---")
             progress_reporter.start_sector(sector_name)
@@ -555,8 +774,35 @@ def main():
     log_info("=" * 60)
     log_info("FORECAST SUMMARY")
     log_info("=" * 60)
-    log_info(f"Total sectors: {len(enabled_sectors)} | Successful: {len(successful)} | Failed: {len(failed)}")
-    
+    log_info(f"Total sectors: {len(enabled_sectors)} | Successful: {len(successful)} | Failed: {len(failed)} | "
+             f"Cached: {sum(1 for r in successful if r.get('cached'))}")
+
+    # One columnar results file for all sectors (read by the API instead of the workbooks)
+    results_store = None
+    store_written = not (STORE_AVAILABLE and STORE_FRAMES)
+    if STORE_AVAILABLE and STORE_FRAMES:
+        try:
+            results_store = write_forecast_store(CONFIG.get('forecast_path', CONFIG['scenario_name']), STORE_FRAMES)
+            if results_store:
+                log_info(f"Results store saved to {results_store}")
+                store_written = True
+        except Exception as e:
+            log_error(f"Failed to save results store: {e}")
+
+    # Remember the inputs of every sector whose outputs are now on disk
+    if store_written:
+        try:
+            sector_cache = load_sector_cache(forecast_path)
+            for r in results:
+                if r['status'] == 'completed':
+                    sector_cache[r['sector']] = {'fingerprint': fingerprints[r['sector']],
+                                                 'result': {k: v for k, v in r.items() if k != 'cached'}}
+                else:
+                    sector_cache.pop(r['sector'], None)
+            save_sector_cache(forecast_path, sector_cache)
+        except Exception as e:
+            log_error(f"Failed to save sector cache: {e}")
+
     # --- ⭐ ADDED: Save scenario metadata on successful completion ---
     if not failed:
         try:
@@ -577,10 +823,20 @@ def main():
                  failed_sectors=len(failed),
                  results=results,
                  output_directory=CONFIG.get('forecast_path', CONFIG['scenario_name']),
+                 results_store=str(results_store) if results_store else None,
                  timestamp=datetime.now().isoformat())
     print(json.dumps(final, indent=2))
     sys.stdout.flush()
-    sys.exit(0 if len(failed) == 0 else 1)
+    return (0 if len(failed) == 0 else 1), final
+
+
+def main():
+    parser = argparse.ArgumentParser(description="KSEB Demand Forecasting Script")
+    parser.add_argument('--config', required=True, help="Path to JSON configuration file")
+    parser.add_argument('--backtest', action='store_true', help="Run a rolling-origin backtest instead of the forecast")
+    args = parser.parse_args()
+    exit_code, _ = run(args.config, args.backtest)
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -37,6 +37,11 @@ if sys.platform.startswith('win'):
     except:
         pass
 
+try:
+    from .profile_constraints import apply_profile_constraints, format_constraint_report
+except ImportError:
+    from profile_constraints import apply_profile_constraints, format_constraint_report
+
 # Optional library imports with availability flags
 SCIPY_AVAILABLE = False
 STL_AVAILABLE = False
@@ -1177,68 +1182,20 @@ class EnhancedLoadProfileGenerator:
         """
         Apply constraints while PRESERVING shape (CRITICAL FOR REALISM)
         
-        Key: Scale uniformly, don't clip or flatten
+        Key: Scale uniformly, don't clip or flatten. Yearly targets and, in
+        'excel' mode, monthly max constraints are solved together per month.
         """
         print("\n  Applying shape-preserving constraints...", file=sys.stderr)
         
-        # Apply yearly constraints first
-        for year in range(self.start_year, self.end_year + 1):
-            if year not in self.demand_targets:
-                continue
-            
-            year_mask = profile_df['Fiscal_Year'] == year
-            if not year_mask.any():
-                continue
-            
-            current_total = profile_df.loc[year_mask, 'Demand_MW'].sum()
-            target_total = self.demand_targets[year]
-            
-            if current_total > 0:
-                scale_factor = target_total / current_total
-                profile_df.loc[year_mask, 'Demand_MW'] *= scale_factor
-                print(f"    FY{year}: Scaled by {scale_factor:.4f} to meet yearly target", file=sys.stderr)
-        
-        # Apply monthly constraints if provided
+        peak_limits = load_factors = None
         if self.monthly_constraints == 'excel':
-            self._apply_excel_constraints_shape_preserving(profile_df)
-        
-        return profile_df
-    
-    def _apply_excel_constraints_shape_preserving(self, profile_df):
-        """Apply Excel constraints while preserving shape"""
-        max_demand_constraints = self.template_data.get('max_demand', pd.DataFrame())
+            peak_limits = self.template_data.get('max_demand')
+            load_factors = self.template_data.get('load_factor')
         
-        if max_demand_constraints.empty:
-            return profile_df
-        
-        print("  Applying monthly max constraints (shape-preserving)...", file=sys.stderr)
-        
-        for year in range(self.start_year, self.end_year + 1):
-            year_row = max_demand_constraints[
-                max_demand_constraints.get('financial_year', max_demand_constraints.get('Year', 0)) == year
-            ]
-            
-            if year_row.empty:
-                continue
-            
-            for month in range(1, 13):
-                month_name = self.fiscal_month_names[month]
-                
-                if month_name not in year_row.columns:
-                    continue
-                
-                constraint_value = year_row[month_name].iloc[0]
-                if pd.isna(constraint_value) or constraint_value <= 0:
-                    continue
-                
-                mask = (profile_df['Fiscal_Year'] == year) & (profile_df['fiscal_month'] == month)
-                if mask.any():
-                    current_max = profile_df.loc[mask, 'Demand_MW'].max()
-                    if current_max > constraint_value:
-                        # Scale entire month uniformly (preserves shape!)
-                        scale_factor = constraint_value / current_max
-                        profile_df.loc[mask, 'Demand_MW'] *= scale_factor
-                        print(f"      FY{year}-{month_name}: Scaled by {scale_factor:.4f}", file=sys.stderr)
+        self.constraint_report = apply_profile_constraints(
+            profile_df, self.demand_targets, peak_limits, load_factors
+        )
+        print(f"    {format_constraint_report(self.constraint_report)}", file=sys.stderr)
         
         return profile_df
     
@@ -1754,7 +1711,8 @@ def main():
             'method': 'fixed_smooth_' + generator.method,
             'base_year': int(generator.base_year),
             'generation_timestamp': datetime.now().isoformat(),
-            'profile_name': generator.profile_name
+            'profile_name': generator.profile_name,
+            'constraints': {key: value for key, value in generator.constraint_report.items() if key != 'years'}
         }
         
         # Add validation metrics to result
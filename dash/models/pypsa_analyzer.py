@@ -23,6 +23,7 @@ import gc
 import time
 import hashlib
 import re
+import weakref
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Tuple, Any
 from datetime import datetime
@@ -30,6 +31,7 @@ from collections import OrderedDict
 from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
+from scipy import sparse
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -576,6 +578,198 @@ def get_snapshot_weights(network: pypsa.Network, snapshots_idx: Union[pd.Datetim
         return pd.Series(1.0, index=snapshots_idx)
 
 
+def _period_to_year(period) -> Optional[int]:
+    """Map a snapshot period label (int, Timestamp or numeric string) to a year."""
+    if isinstance(period, (int, np.integer)):
+        return int(period)
+    if isinstance(period, pd.Timestamp):
+        return period.year
+    if isinstance(period, str):
+        try:
+            return int(period)
+        except ValueError:
+            return None
+    return None
+
+
+# =============================================================================
+# CARRIER × PERIOD AGGREGATION KERNEL
+# =============================================================================
+
+class CarrierPeriodKernel:
+    """
+    Sparse aggregation operators for per-carrier / per-period metrics.
+
+    Built once per network:
+    - ``incidence``: generator → carrier matrix (n_generators × n_carriers)
+    - ``period_onehot``: snapshot → period (year) matrix (n_snapshots × n_periods)
+    - ``weighted_period_onehot``: same, scaled by snapshot weightings
+
+    Energy per (period, carrier) is then ``P.T @ X @ C`` for any generator
+    time series ``X`` (e.g. ``generators_t.p``), replacing per-carrier column
+    filtering and per-year snapshot masks.
+
+    Period sums are memoized per input frame, so analyses run back to back on
+    the same network (e.g. a batch request) aggregate ``generators_t.p`` once.
+    """
+
+    def __init__(self, network: pypsa.Network):
+        n = network
+        self.snapshots = n.snapshots
+
+        if has_component(n, 'generators') and 'carrier' in n.generators.columns:
+            generators = n.generators
+            self.generators = generators.index
+            self.carriers = sorted(generators['carrier'].dropna().unique().tolist())
+            carrier_codes = pd.Categorical(generators['carrier'], categories=self.carriers).codes
+        else:
+            self.generators = pd.Index([])
+            self.carriers = []
+            carrier_codes = np.array([], dtype=int)
+
+        rows = np.flatnonzero(carrier_codes >= 0)
+        self.incidence = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, carrier_codes[rows])),
+            shape=(len(self.generators), len(self.carriers))
+        )
+
+        # Snapshot → year mapping (period level for multi-period, timestamp year otherwise)
+        if is_multi_period(n):
+            period_labels = self.snapshots.get_level_values(0)
+        else:
+            period_labels = get_time_index(self.snapshots).year if len(self.snapshots) > 0 else pd.Index([])
+        label_codes, label_uniques = pd.factorize(period_labels, sort=True)
+        label_years = np.array([
+            year if year is not None else -1
+            for year in (_period_to_year(label) for label in label_uniques)
+        ], dtype=int)
+        snapshot_years = label_years[label_codes] if len(label_codes) else np.array([], dtype=int)
+
+        self.years = sorted(int(y) for y in set(snapshot_years.tolist()) if y >= 0)
+        year_pos = {year: i for i, year in enumerate(self.years)}
+        snap_rows = np.flatnonzero(snapshot_years >= 0)
+        snap_cols = np.array([year_pos[y] for y in snapshot_years[snap_rows]], dtype=int)
+
+        self.weights = get_snapshot_weights(n, self.snapshots).to_numpy(dtype=float)
+        shape = (len(self.snapshots), len(self.years))
+        self.period_onehot = sparse.csr_matrix((np.ones(len(snap_rows)), (snap_rows, snap_cols)), shape=shape)
+        self.weighted_period_onehot = sparse.csr_matrix(
+            (self.weights[snap_rows], (snap_rows, snap_cols)), shape=shape
+        )
+        self.period_hours = np.asarray(self.weighted_period_onehot.sum(axis=0)).ravel()
+        self._sums: Dict[Tuple[str, int, bool], Tuple[weakref.ref, Tuple[int, int], np.ndarray]] = {}
+
+    def _operator(self, index: pd.Index, weighted: bool) -> sparse.csr_matrix:
+        """Period operator restricted (and ordered) to the rows of ``index``."""
+        onehot = self.weighted_period_onehot if weighted else self.period_onehot
+        if index.equals(self.snapshots):
+            return onehot
+        positions = self.snapshots.get_indexer(index)
+        result = sparse.lil_matrix((len(index), onehot.shape[1]))
+        valid = np.flatnonzero(positions >= 0)
+        if len(valid):
+            result[valid] = onehot[positions[valid]]
+        return result.tocsr()
+
+    def present(self, df: pd.DataFrame) -> np.ndarray:
+        """Boolean mask over generators that have a column in ``df``."""
+        return self.generators.isin(df.columns)
+
+    def row_weights(self, index: pd.Index) -> np.ndarray:
+        """Snapshot weighting for each row of ``index`` (1.0 for rows not in the network's snapshots)."""
+        if index.equals(self.snapshots):
+            return self.weights
+        if len(self.snapshots) == 0:
+            return np.ones(len(index))
+        positions = self.snapshots.get_indexer(index)
+        return np.where(positions >= 0, self.weights[positions], 1.0)
+
+    def _memoized(self, kind: str, df: pd.DataFrame, weighted: bool, reduce) -> np.ndarray:
+        """Reduce ``df`` (aligned to the generators, NaN as 0) once per frame object."""
+        key = (kind, id(df), weighted)
+        cached = self._sums.get(key)
+        if cached is not None and cached[0]() is df and cached[1] == df.shape:
+            return cached[2]
+
+        values = df.reindex(columns=self.generators).to_numpy(dtype=float, na_value=0.0)
+        values = np.nan_to_num(values, nan=0.0)
+        result = np.asarray(reduce(values))
+        result.flags.writeable = False
+        self._sums = {k: v for k, v in self._sums.items() if v[0]() is not None}
+        self._sums[key] = (weakref.ref(df), df.shape, result)
+        return result
+
+    def period_by_generator(self, df: pd.DataFrame, weighted: bool = True) -> np.ndarray:
+        """Sum a generator time series per period: returns (n_periods × n_generators)."""
+        return self._memoized('period', df, weighted,
+                              lambda values: self._operator(df.index, weighted).T @ values)
+
+    def total_by_generator(self, df: pd.DataFrame, weighted: bool = True) -> np.ndarray:
+        """Sum a generator time series over all rows: returns (n_generators,)."""
+        if weighted:
+            return self._memoized('total', df, True, lambda values: self.row_weights(df.index) @ values)
+        return self._memoized('total', df, False, lambda values: values.sum(axis=0))
+
+    def to_carriers(self, period_by_generator: np.ndarray) -> np.ndarray:
+        """Aggregate a (… × n_generators) array to (… × n_carriers)."""
+        return np.asarray(self.incidence.T @ np.asarray(period_by_generator).T).T
+
+    def carrier_period(self, df: pd.DataFrame, weighted: bool = True) -> np.ndarray:
+        """Weighted (or plain) sums per (period, carrier): returns (n_periods × n_carriers)."""
+        return self.to_carriers(self.period_by_generator(df, weighted=weighted))
+
+    def carriers_present(self, df: pd.DataFrame) -> np.ndarray:
+        """Boolean mask over carriers that have at least one generator column in ``df``."""
+        return (self.incidence.T @ self.present(df).astype(float)) > 0
+
+    def carrier_sum(self, values: pd.Series) -> np.ndarray:
+        """Sum a per-generator static attribute (e.g. p_nom_opt) by carrier."""
+        aligned = values.reindex(self.generators).astype(float).fillna(0.0).to_numpy()
+        return self.incidence.T @ aligned
+
+    def hours_in(self, index: pd.Index) -> float:
+        """Total snapshot weighting over the rows of ``index``."""
+        return float(np.asarray(self._operator(index, weighted=True).sum()))
+
+
+# Keyed by id(network); pypsa.Network is unhashable, so a weak reference guards against id reuse
+_kernel_cache: Dict[int, Tuple[weakref.ref, Tuple, CarrierPeriodKernel]] = {}
+_kernel_lock = threading.Lock()
+
+
+def _kernel_signature(network: pypsa.Network) -> Tuple:
+    """Cheap signature used to detect structural changes to a cached network."""
+    generators = network.generators if has_component(network, 'generators') else pd.DataFrame()
+    carriers = tuple(generators['carrier'].tolist()) if 'carrier' in generators.columns else ()
+    return (len(network.snapshots), tuple(generators.index), carriers)
+
+
+def get_carrier_period_kernel(network: pypsa.Network) -> CarrierPeriodKernel:
+    """
+    Get the aggregation kernel for a network, building it once per network object.
+
+    Args:
+        network: PyPSA network
+
+    Returns:
+        CarrierPeriodKernel shared by every analyzer built on this network
+    """
+    key = id(network)
+    signature = _kernel_signature(network)
+    with _kernel_lock:
+        cached = _kernel_cache.get(key)
+        if cached is not None and cached[0]() is network and cached[1] == signature:
+            return cached[2]
+
+    kernel = CarrierPeriodKernel(network)
+    with _kernel_lock:
+        # Drop entries whose networks have been garbage collected
+        for stale in [k for k, (ref, _, _) in _kernel_cache.items() if ref() is None]:
+            del _kernel_cache[stale]
+        _kernel_cache[key] = (weakref.ref(network), signature, kernel)
+    return kernel
+
+
 # =============================================================================
 # NETWORK INSPECTOR
 # =============================================================================
@@ -1070,6 +1264,11 @@ class PyPSASingleNetworkAnalyzer:
         self.network = network
         self.n = network
         self.inspector = NetworkInspector(network)
+
+    @property
+    def kernel(self) -> CarrierPeriodKernel:
+        """Shared carrier × period aggregation kernel for this network."""
+        return get_carrier_period_kernel(self.n)
     
     def run_all_analyses(self) -> Dict[str, Any]:
         """Run all available analyses."""
@@ -1100,6 +1299,45 @@ class PyPSASingleNetworkAnalyzer:
         
         return results
     
+    def _carrier_capacity_rows(self, component: str, value_key: str) -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
+        """Capacity rows for one component, aggregated with a single groupby over carriers."""
+        n = self.n
+        if not (has_component(n, component) and 'carrier' in getattr(n, component).columns):
+            return [], {}
+
+        df = getattr(n, component)
+        capacity_col = get_capacity_column(n, component)
+        grouped = df.groupby('carrier', sort=True)
+        counts = grouped.size()
+        if capacity_col:
+            capacity = grouped[capacity_col].sum()
+        else:
+            capacity = pd.Series(0, index=counts.index)
+            logger.warning(f"No capacity column for {component}, showing count only")
+
+        # Technology of each carrier's first row (falls back to the carrier name)
+        if 'technology' in df.columns:
+            technology = df.drop_duplicates('carrier').set_index('carrier')['technology']
+        else:
+            technology = pd.Series(counts.index, index=counts.index)
+
+        rows: List[Dict[str, Any]] = []
+        totals: Dict[str, float] = {}
+        for carrier, count in counts.items():
+            value = capacity[carrier]
+            totals[carrier] = float(value)
+            rows.append({
+                'Carrier': carrier,
+                'carrier': carrier,
+                'Technology': technology[carrier],
+                'technology': technology[carrier],
+                value_key: safe_float(value) or 0.0,
+                f'{value_key}_value': safe_float(value) or 0.0,
+                'Count': int(count),
+                'capacity_column': capacity_col if capacity_col else 'none'
+            })
+        return rows, totals
+
     def get_total_capacities(self) -> Dict[str, Any]:
         """
         Get total installed capacities by carrier using dynamic column detection.
@@ -1107,96 +1345,10 @@ class PyPSASingleNetworkAnalyzer:
         Handles both optimized (p_nom_opt) and non-optimized (p_nom) networks gracefully.
         Returns data even if only component count exists.
         """
-        n = self.n
-
-        generator_rows: List[Dict[str, Any]] = []
-        storage_unit_rows: List[Dict[str, Any]] = []
-        store_rows: List[Dict[str, Any]] = []
-
-        gen_totals = {}
-        storage_power_totals = {}
-        storage_energy_totals = {}
-
-        # Generators - handle even without capacity column
-        if has_component(n, 'generators') and 'carrier' in n.generators.columns:
-            capacity_col = get_capacity_column(n, 'generators')
-
-            for carrier in sorted(n.generators['carrier'].dropna().unique().tolist()):
-                carrier_gens = n.generators[n.generators['carrier'] == carrier]
-
-                # Try to get capacity, default to 0 if no capacity column
-                if capacity_col:
-                    capacity = carrier_gens[capacity_col].sum()
-                else:
-                    capacity = 0
-                    logger.warning(f"No capacity column for generators, showing count only")
-
-                gen_totals[carrier] = float(capacity)
-
-                generator_rows.append({
-                    'Carrier': carrier,
-                    'carrier': carrier,
-                    'Technology': carrier_gens['technology'].iloc[0] if 'technology' in carrier_gens.columns else carrier,
-                    'technology': carrier_gens['technology'].iloc[0] if 'technology' in carrier_gens.columns else carrier,
-                    'Capacity_MW': safe_float(capacity) or 0.0,
-                    'Capacity_MW_value': safe_float(capacity) or 0.0,
-                    'Count': int(len(carrier_gens)),
-                    'capacity_column': capacity_col if capacity_col else 'none'
-                })
-
-        # Storage Units (PHS - power capacity) - handle even without capacity column
-        if has_component(n, 'storage_units') and 'carrier' in n.storage_units.columns:
-            capacity_col = get_capacity_column(n, 'storage_units')
-
-            for carrier in sorted(n.storage_units['carrier'].dropna().unique().tolist()):
-                carrier_units = n.storage_units[n.storage_units['carrier'] == carrier]
-
-                # Try to get capacity, default to 0 if no capacity column
-                if capacity_col:
-                    capacity = carrier_units[capacity_col].sum()
-                else:
-                    capacity = 0
-                    logger.warning(f"No capacity column for storage_units, showing count only")
-
-                storage_power_totals[carrier] = float(capacity)
-
-                storage_unit_rows.append({
-                    'Carrier': carrier,
-                    'carrier': carrier,
-                    'Technology': carrier_units['technology'].iloc[0] if 'technology' in carrier_units.columns else carrier,
-                    'technology': carrier_units['technology'].iloc[0] if 'technology' in carrier_units.columns else carrier,
-                    'Power_Capacity_MW': safe_float(capacity) or 0.0,
-                    'Power_Capacity_MW_value': safe_float(capacity) or 0.0,
-                    'Count': int(len(carrier_units)),
-                    'capacity_column': capacity_col if capacity_col else 'none'
-                })
-
-        # Stores (BESS - energy capacity) - handle even without capacity column
-        if has_component(n, 'stores') and 'carrier' in n.stores.columns:
-            capacity_col = get_capacity_column(n, 'stores')
-
-            for carrier in sorted(n.stores['carrier'].dropna().unique().tolist()):
-                carrier_stores = n.stores[n.stores['carrier'] == carrier]
-
-                # Try to get capacity, default to 0 if no capacity column
-                if capacity_col:
-                    energy_capacity = carrier_stores[capacity_col].sum()
-                else:
-                    energy_capacity = 0
-                    logger.warning(f"No capacity column for stores, showing count only")
-
-                storage_energy_totals[carrier] = float(energy_capacity)
-
-                store_rows.append({
-                    'Carrier': carrier,
-                    'carrier': carrier,
-                    'Technology': carrier_stores['technology'].iloc[0] if 'technology' in carrier_stores.columns else carrier,
-                    'technology': carrier_stores['technology'].iloc[0] if 'technology' in carrier_stores.columns else carrier,
-                    'Energy_Capacity_MWh': safe_float(energy_capacity) or 0.0,
-                    'Energy_Capacity_MWh_value': safe_float(energy_capacity) or 0.0,
-                    'Count': int(len(carrier_stores)),
-                    'capacity_column': capacity_col if capacity_col else 'none'
-                })
+        # Generators, storage units (PHS - power capacity) and stores (BESS - energy capacity)
+        generator_rows, gen_totals = self._carrier_capacity_rows('generators', 'Capacity_MW')
+        storage_unit_rows, storage_power_totals = self._carrier_capacity_rows('storage_units', 'Power_Capacity_MW')
+        store_rows, storage_energy_totals = self._carrier_capacity_rows('stores', 'Energy_Capacity_MWh')
 
         return {
             'capacities': {
@@ -1283,16 +1435,13 @@ class PyPSASingleNetworkAnalyzer:
                     'message': 'No data available for the selected date range'
                 }
 
-        weights = get_snapshot_weights(n, gen_p.index)
-        energy_by_carrier = {}
-        if hasattr(n, 'generators') and 'carrier' in n.generators.columns:
-            for carrier in sorted(n.generators['carrier'].dropna().unique().tolist()):
-                carrier_gens = n.generators[n.generators['carrier'] == carrier].index
-                cols = gen_p.columns.intersection(carrier_gens)
-                if len(cols) > 0:
-                    carrier_gen_p = gen_p[cols]
-                    weighted_energy = (carrier_gen_p.T * weights).T.sum().sum()
-                    energy_by_carrier[carrier] = float(weighted_energy)
+        kernel = self.kernel
+        carrier_energy = kernel.carrier_period(gen_p).sum(axis=0)
+        present = kernel.carriers_present(gen_p)
+        energy_by_carrier = {
+            carrier: float(carrier_energy[i])
+            for i, carrier in enumerate(kernel.carriers) if present[i]
+        }
         
         total_energy = sum(energy_by_carrier.values())
         energy_percentages = {}
@@ -1314,8 +1463,14 @@ class PyPSASingleNetworkAnalyzer:
             'percentages': energy_percentages
         }
 
-    def get_dispatch_data(self, resolution: str = '1H', start_date: str = None, end_date: str = None) -> Dict[str, Any]:
-        """Get time-series dispatch data for stacked area chart.
+    def get_dispatch_columns(
+        self,
+        resolution: str = '1H',
+        start_date: str = None,
+        end_date: str = None,
+        max_points: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Get dispatch time series as NumPy columns (used by JSON and streamed responses).
 
         Parameters
         ----------
@@ -1325,35 +1480,33 @@ class PyPSASingleNetworkAnalyzer:
             Start date for filtering (YYYY-MM-DD format)
         end_date : str, optional
             End date for filtering (YYYY-MM-DD format)
+        max_points : int, optional
+            Evenly sample down to at most this many points (None keeps every point)
 
         Returns
         -------
         Dict[str, Any]
-            Dispatch data with timestamps and power values by carrier
+            'timestamps' (datetime64 array), 'load' array, and dicts of carrier ->
+            array for 'generation', 'storage_discharge' and 'storage_charge', plus
+            'source_points' (rows before resampling/sampling) and optional 'message'
         """
         n = self.n
+        empty = {
+            'timestamps': np.array([], dtype='datetime64[ns]'),
+            'generation': {},
+            'load': np.array([], dtype=float),
+            'storage_charge': {},
+            'storage_discharge': {},
+            'source_points': 0
+        }
 
         if not (hasattr(n, 'generators_t') and hasattr(n.generators_t, 'p')):
-            return {
-                'timestamps': [],
-                'generation': {},
-                'load': [],
-                'storage_charge': {},
-                'storage_discharge': {},
-                'message': 'No generation data available'
-            }
+            return {**empty, 'message': 'No generation data available'}
 
         # Get generation data
-        gen_p = n.generators_t.p.copy()
+        gen_p = n.generators_t.p
         if gen_p.empty:
-            return {
-                'timestamps': [],
-                'generation': {},
-                'load': [],
-                'storage_charge': {},
-                'storage_discharge': {},
-                'message': 'Generation data is empty'
-            }
+            return {**empty, 'message': 'Generation data is empty'}
 
         # Get time index
         if isinstance(gen_p.index, pd.MultiIndex):
@@ -1382,152 +1535,153 @@ class PyPSASingleNetworkAnalyzer:
             time_index = time_index[mask]
 
         if gen_p.empty:
-            return {
-                'timestamps': [],
-                'generation': {},
-                'load': [],
-                'storage_charge': {},
-                'storage_discharge': {},
-                'message': 'No data available for selected date range'
-            }
+            return {**empty, 'message': 'No data available for selected date range'}
 
-        # Aggregate generation by carrier
+        # Aggregate generation by carrier with one incidence product
+        kernel = self.kernel
+        gen_values = gen_p.reindex(columns=kernel.generators).to_numpy(dtype=float, na_value=0.0)
+        carrier_values = kernel.to_carriers(np.nan_to_num(gen_values, nan=0.0))
+        present = kernel.carriers_present(gen_p)
         gen_by_carrier = {}
-        if hasattr(n, 'generators') and 'carrier' in n.generators.columns:
-            for carrier in sorted(n.generators['carrier'].dropna().unique().tolist()):
-                carrier_gens = n.generators[n.generators['carrier'] == carrier].index
-                cols = gen_p.columns.intersection(carrier_gens)
-                if len(cols) > 0:
-                    carrier_series = gen_p[cols].sum(axis=1)
-                    # Only include if there's significant generation
-                    if carrier_series.abs().sum() > 1e-3:
-                        gen_by_carrier[carrier] = carrier_series
+        for c, carrier in enumerate(kernel.carriers):
+            # Only include if there's significant generation
+            if present[c] and np.abs(carrier_values[:, c]).sum() > 1e-3:
+                gen_by_carrier[carrier] = carrier_values[:, c]
 
         # Get load data
-        load_series = pd.Series(0.0, index=gen_p.index)
+        load_values = np.zeros(len(gen_p))
         if hasattr(n, 'loads_t'):
             if hasattr(n.loads_t, 'p'):
                 load_series = n.loads_t.p.sum(axis=1)
             elif hasattr(n.loads_t, 'p_set'):
                 load_series = n.loads_t.p_set.sum(axis=1)
-
-        # Filter load by date range
-        if start_date or end_date:
-            load_series = load_series[mask]
+            else:
+                load_series = None
+            if load_series is not None:
+                # Filter load by date range
+                if start_date or end_date:
+                    load_series = load_series[mask]
+                load_values = load_series.to_numpy(dtype=float)
 
         # Get storage data
         storage_charge = {}
         storage_discharge = {}
 
-        # Storage units
-        if hasattr(n, 'storage_units_t') and hasattr(n.storage_units_t, 'p'):
-            storage_p = n.storage_units_t.p.copy()
+        storage_sources = [
+            ('storage_units', 'storage_units_t', '{} Discharge', '{} Charge'),  # Storage units
+            ('stores', 'stores_t', '{} Store Discharge', '{} Store Charge'),    # Stores (BESS, H2, etc.)
+        ]
+        for component, component_t, discharge_label, charge_label in storage_sources:
+            if not (hasattr(n, component_t) and hasattr(getattr(n, component_t), 'p')):
+                continue
+            storage_p = getattr(n, component_t).p
             if start_date or end_date:
                 storage_p = storage_p[mask]
 
-            if hasattr(n, 'storage_units') and 'carrier' in n.storage_units.columns:
-                for carrier in n.storage_units['carrier'].unique():
-                    carrier_units = n.storage_units[n.storage_units['carrier'] == carrier].index
-                    cols = storage_p.columns.intersection(carrier_units)
-                    if len(cols) > 0:
-                        carrier_p = storage_p[cols].sum(axis=1)
-                        # Discharge (positive values)
-                        discharge = carrier_p.clip(lower=0)
-                        if discharge.sum() > 1e-3:
-                            storage_discharge[f"{carrier} Discharge"] = discharge
-                        # Charge (negative values)
-                        charge = carrier_p.clip(upper=0)
-                        if charge.sum() < -1e-3:
-                            storage_charge[f"{carrier} Charge"] = charge
-
-        # Stores (BESS, H2, etc.)
-        if hasattr(n, 'stores_t') and hasattr(n.stores_t, 'p'):
-            stores_p = n.stores_t.p.copy()
-            if start_date or end_date:
-                stores_p = stores_p[mask]
-
-            if hasattr(n, 'stores') and 'carrier' in n.stores.columns:
-                for carrier in n.stores['carrier'].unique():
-                    carrier_stores = n.stores[n.stores['carrier'] == carrier].index
-                    cols = stores_p.columns.intersection(carrier_stores)
-                    if len(cols) > 0:
-                        carrier_p = stores_p[cols].sum(axis=1)
-                        # Discharge (positive values)
-                        discharge = carrier_p.clip(lower=0)
-                        if discharge.sum() > 1e-3:
-                            storage_discharge[f"{carrier} Store Discharge"] = discharge
-                        # Charge (negative values)
-                        charge = carrier_p.clip(upper=0)
-                        if charge.sum() < -1e-3:
-                            storage_charge[f"{carrier} Store Charge"] = charge
+            static = getattr(n, component, None)
+            if static is None or 'carrier' not in static.columns:
+                continue
+            for carrier in static['carrier'].unique():
+                carrier_units = static[static['carrier'] == carrier].index
+                cols = storage_p.columns.intersection(carrier_units)
+                if len(cols) > 0:
+                    carrier_p = storage_p[cols].sum(axis=1).to_numpy(dtype=float)
+                    # Discharge (positive values)
+                    discharge = np.clip(carrier_p, 0, None)
+                    if discharge.sum() > 1e-3:
+                        storage_discharge[discharge_label.format(carrier)] = discharge
+                    # Charge (negative values)
+                    charge = np.clip(carrier_p, None, 0)
+                    if charge.sum() < -1e-3:
+                        storage_charge[charge_label.format(carrier)] = charge
 
         # Resample if needed
         if resolution != '1H':
             # Create a combined DataFrame for resampling
             all_data = pd.DataFrame(index=time_index)
-            for carrier, series in gen_by_carrier.items():
-                all_data[f"gen_{carrier}"] = series.values
-            for carrier, series in storage_discharge.items():
-                all_data[f"discharge_{carrier}"] = series.values
-            for carrier, series in storage_charge.items():
-                all_data[f"charge_{carrier}"] = series.values
-            all_data['load'] = load_series.values
+            for carrier, values in gen_by_carrier.items():
+                all_data[f"gen_{carrier}"] = values
+            for carrier, values in storage_discharge.items():
+                all_data[f"discharge_{carrier}"] = values
+            for carrier, values in storage_charge.items():
+                all_data[f"charge_{carrier}"] = values
+            all_data['load'] = load_values
 
             # Resample
             all_data = all_data.resample(resolution).mean()
 
             # Extract back
-            gen_by_carrier = {k: all_data[f"gen_{k}"] for k in gen_by_carrier.keys()}
-            storage_discharge = {k: all_data[f"discharge_{k}"] for k in storage_discharge.keys()}
-            storage_charge = {k: all_data[f"charge_{k}"] for k in storage_charge.keys()}
-            load_series = all_data['load']
+            gen_by_carrier = {k: all_data[f"gen_{k}"].to_numpy() for k in gen_by_carrier.keys()}
+            storage_discharge = {k: all_data[f"discharge_{k}"].to_numpy() for k in storage_discharge.keys()}
+            storage_charge = {k: all_data[f"charge_{k}"].to_numpy() for k in storage_charge.keys()}
+            load_values = all_data['load'].to_numpy()
             time_index = all_data.index
 
         # Intelligent sampling to prevent browser freeze
-        # Maximum 2000 points for visualization (enough for detail, small enough for performance)
-        MAX_POINTS = 2000
-        if len(time_index) > MAX_POINTS:
-            logger.info(f"Sampling dispatch data from {len(time_index)} to {MAX_POINTS} points")
+        if max_points is not None and len(time_index) > max_points:
+            logger.info(f"Sampling dispatch data from {len(time_index)} to {max_points} points")
 
-            # Use intelligent sampling - keep more points at start/end, sample middle
-            sample_indices = np.linspace(0, len(time_index) - 1, MAX_POINTS, dtype=int)
+            sample_indices = np.linspace(0, len(time_index) - 1, max_points, dtype=int)
 
             # Sample all data
             time_index = time_index[sample_indices]
-            gen_by_carrier = {k: series.iloc[sample_indices] for k, series in gen_by_carrier.items()}
-            storage_discharge = {k: series.iloc[sample_indices] for k, series in storage_discharge.items()}
-            storage_charge = {k: series.iloc[sample_indices] for k, series in storage_charge.items()}
-            load_series = load_series.iloc[sample_indices]
+            gen_by_carrier = {k: values[sample_indices] for k, values in gen_by_carrier.items()}
+            storage_discharge = {k: values[sample_indices] for k, values in storage_discharge.items()}
+            storage_charge = {k: values[sample_indices] for k, values in storage_charge.items()}
+            load_values = load_values[sample_indices]
 
-        # Convert to JSON-serializable format
-        timestamps = [t.isoformat() for t in time_index]
-
-        generation_data = {
-            carrier: [float(v) for v in series.values]
-            for carrier, series in gen_by_carrier.items()
+        return {
+            'timestamps': np.asarray(time_index, dtype='datetime64[ns]'),
+            'generation': gen_by_carrier,
+            'storage_discharge': storage_discharge,
+            'storage_charge': storage_charge,
+            'load': load_values,
+            'source_points': len(gen_p)
         }
 
-        storage_discharge_data = {
-            carrier: [float(v) for v in series.values]
-            for carrier, series in storage_discharge.items()
-        }
+    def get_dispatch_data(self, resolution: str = '1H', start_date: str = None, end_date: str = None) -> Dict[str, Any]:
+        """Get time-series dispatch data for stacked area chart.
 
-        storage_charge_data = {
-            carrier: [float(v) for v in series.values]
-            for carrier, series in storage_charge.items()
-        }
+        Parameters
+        ----------
+        resolution : str
+            Time resolution for resampling (e.g., '1H', '3H', '6H', '12H', '1D', '1W')
+        start_date : str, optional
+            Start date for filtering (YYYY-MM-DD format)
+        end_date : str, optional
+            End date for filtering (YYYY-MM-DD format)
+
+        Returns
+        -------
+        Dict[str, Any]
+            Dispatch data with timestamps and power values by carrier
+        """
+        # Maximum 2000 points for visualization (enough for detail, small enough for performance)
+        MAX_POINTS = 2000
+        columns = self.get_dispatch_columns(resolution, start_date, end_date, max_points=MAX_POINTS)
+
+        if 'message' in columns:
+            return {
+                'timestamps': [],
+                'generation': {},
+                'load': [],
+                'storage_charge': {},
+                'storage_discharge': {},
+                'message': columns['message']
+            }
 
-        load_data = [float(v) for v in load_series.values]
+        # Convert to JSON-serializable format
+        timestamps = [t.isoformat() for t in pd.DatetimeIndex(columns['timestamps'])]
 
         return {
             'timestamps': timestamps,
-            'generation': generation_data,
-            'storage_discharge': storage_discharge_data,
-            'storage_charge': storage_charge_data,
-            'load': load_data,
+            'generation': {k: v.astype(float).tolist() for k, v in columns['generation'].items()},
+            'storage_discharge': {k: v.astype(float).tolist() for k, v in columns['storage_discharge'].items()},
+            'storage_charge': {k: v.astype(float).tolist() for k, v in columns['storage_charge'].items()},
+            'load': columns['load'].astype(float).tolist(),
             'resolution': resolution,
             'total_points': len(timestamps),
-            'sampled': len(timestamps) < len(gen_p)
+            'sampled': len(timestamps) < columns['source_points']
         }
 
     def get_network_metadata(self) -> Dict[str, Any]:
@@ -1592,37 +1746,28 @@ class PyPSASingleNetworkAnalyzer:
                 'overall_capacity_factor_percent': 0.0
             }
         
-        weights = get_snapshot_weights(n, gen_p.index)
-        weighted_hours = weights.sum()
+        kernel = self.kernel
+        weighted_hours = kernel.hours_in(gen_p.index)
+        carrier_energy = kernel.carrier_period(gen_p).sum(axis=0)
+        present = kernel.carriers_present(gen_p)
+
+        if 'p_nom_opt' in n.generators.columns:
+            carrier_capacity = kernel.carrier_sum(n.generators['p_nom_opt'])
+        elif 'p_nom' in n.generators.columns:
+            carrier_capacity = kernel.carrier_sum(n.generators['p_nom'])
+        else:
+            carrier_capacity = np.zeros(len(kernel.carriers))
         
         capacity_factors = {}
         total_energy = 0
         total_potential = 0
         
-        if 'carrier' in n.generators.columns:
-            for carrier in sorted(n.generators['carrier'].dropna().unique().tolist()):
-                carrier_gens = n.generators[n.generators['carrier'] == carrier]
-                carrier_gen_names = carrier_gens.index
-                cols = gen_p.columns.intersection(carrier_gen_names)
-                
-                if len(cols) > 0:
-                    carrier_gen_p = gen_p[cols]
-                    weighted_energy = (carrier_gen_p.T * weights).T.sum().sum()
-                    
-                    if 'p_nom_opt' in carrier_gens.columns:
-                        capacity = carrier_gens['p_nom_opt'].sum()
-                    elif 'p_nom' in carrier_gens.columns:
-                        capacity = carrier_gens['p_nom'].sum()
-                    else:
-                        capacity = 0
-                    
-                    potential = capacity * weighted_hours
-                    
-                    if potential > 0:
-                        cf = weighted_energy / potential
-                        capacity_factors[carrier] = float(cf)
-                        total_energy += weighted_energy
-                        total_potential += potential
+        for i, carrier in enumerate(kernel.carriers):
+            potential = carrier_capacity[i] * weighted_hours
+            if present[i] and potential > 0:
+                capacity_factors[carrier] = float(carrier_energy[i] / potential)
+                total_energy += carrier_energy[i]
+                total_potential += potential
         
         overall_cf = (total_energy / total_potential) if total_potential > 0 else 0
         utilization_rows: List[Dict[str, Any]] = []
@@ -1728,35 +1873,32 @@ class PyPSASingleNetworkAnalyzer:
                 'emission_intensity_tco2_per_mwh': 0.0
             }
         
-        weights = get_snapshot_weights(n, gen_p.index)
+        kernel = self.kernel
+        carrier_energy = kernel.carrier_period(gen_p).sum(axis=0)
+        present = kernel.carriers_present(gen_p)
         emissions_rows: List[Dict[str, Any]] = []
         total_emissions = 0.0
         total_energy = 0.0
         
-        if hasattr(n, 'generators') and 'carrier' in n.generators.columns:
-            for carrier in sorted(n.generators['carrier'].dropna().unique().tolist()):
-                emission_factor = 0.0
-                if carrier in n.carriers.index and 'co2_emissions' in n.carriers.columns:
-                    emission_factor = float(n.carriers.loc[carrier, 'co2_emissions'] or 0.0)
-                
-                carrier_gens = n.generators[n.generators['carrier'] == carrier]
-                carrier_gen_names = carrier_gens.index
-                cols = gen_p.columns.intersection(carrier_gen_names)
-                
-                if len(cols) > 0:
-                    carrier_gen_p = gen_p[cols]
-                    weighted_generation = (carrier_gen_p.T * weights).T.sum().sum()
-                    energy = float(weighted_generation)
-                    emissions = energy * emission_factor
-                    
-                    total_emissions += emissions
-                    total_energy += energy
-                    emissions_rows.append({
-                        'Carrier': carrier,
-                        'CO2_Emissions_tCO2': safe_float(emissions) or 0.0,
-                        'Energy_MWh': safe_float(energy) or 0.0,
-                        'Emission_Factor_tCO2_per_MWh': emission_factor
-                    })
+        for i, carrier in enumerate(kernel.carriers):
+            if not present[i]:
+                continue
+
+            emission_factor = 0.0
+            if carrier in n.carriers.index:
+                emission_factor = float(n.carriers.loc[carrier, 'co2_emissions'] or 0.0)
+
+            energy = float(carrier_energy[i])
+            emissions = energy * emission_factor
+            
+            total_emissions += emissions
+            total_energy += energy
+            emissions_rows.append({
+                'Carrier': carrier,
+                'CO2_Emissions_tCO2': safe_float(emissions) or 0.0,
+                'Energy_MWh': safe_float(energy) or 0.0,
+                'Emission_Factor_tCO2_per_MWh': emission_factor
+            })
         
         emission_intensity = (total_emissions / total_energy) if total_energy > 0 else 0.0
         
@@ -1767,40 +1909,37 @@ class PyPSASingleNetworkAnalyzer:
         }
     
     def get_system_costs(self) -> Dict[str, Any]:
-        """Get system cost breakdown."""
+        """Get system cost breakdown (operating costs weighted by snapshot weights)."""
         n = self.n
 
         if not hasattr(n, 'generators') or n.generators.empty:
             return {'total_capex': 0, 'total_opex': 0, 'total_cost': 0}
 
-        total_capex = 0
-        total_opex = 0
         capex_by_carrier = {}
         opex_by_carrier = {}
 
         if 'carrier' in n.generators.columns:
-            for carrier in sorted(n.generators['carrier'].dropna().unique().tolist()):
-                carrier_gens = n.generators[n.generators['carrier'] == carrier]
-
-                if 'capital_cost' in carrier_gens.columns and 'p_nom_opt' in carrier_gens.columns:
-                    capex = (carrier_gens['capital_cost'] * carrier_gens['p_nom_opt']).sum()
-                    capex_by_carrier[carrier] = float(capex)
-                    total_capex += capex
-
-                if 'marginal_cost' in carrier_gens.columns:
-                    if hasattr(n, 'generators_t') and hasattr(n.generators_t, 'p'):
-                        gen_p = n.generators_t.p
-                        cols = gen_p.columns.intersection(carrier_gens.index)
-                        if len(cols) > 0:
-                            for gen in cols:
-                                if gen in gen_p.columns:
-                                    energy = gen_p[gen].sum()
-                                    mc = carrier_gens.loc[gen, 'marginal_cost']
-                                    opex = energy * mc
-                                    if carrier not in opex_by_carrier:
-                                        opex_by_carrier[carrier] = 0
-                                    opex_by_carrier[carrier] += float(opex)
-                                    total_opex += opex
+            kernel = self.kernel
+            generators = n.generators.reindex(kernel.generators)
+
+            if 'capital_cost' in generators.columns and 'p_nom_opt' in generators.columns:
+                carrier_capex = kernel.carrier_sum(generators['capital_cost'] * generators['p_nom_opt'])
+                capex_by_carrier = {carrier: float(carrier_capex[i]) for i, carrier in enumerate(kernel.carriers)}
+
+            if 'marginal_cost' in generators.columns and hasattr(n, 'generators_t') and hasattr(n.generators_t, 'p'):
+                gen_p = n.generators_t.p
+                present = kernel.present(gen_p)
+                # Weighted energy per generator × marginal cost, reduced to carriers in one product
+                generator_opex = kernel.total_by_generator(gen_p) * generators['marginal_cost'].to_numpy(dtype=float)
+                carrier_opex = kernel.to_carriers(np.where(present, generator_opex, 0.0))
+                carriers_present = kernel.carriers_present(gen_p)
+                opex_by_carrier = {
+                    carrier: float(carrier_opex[i])
+                    for i, carrier in enumerate(kernel.carriers) if carriers_present[i]
+                }
+
+        total_capex = sum(capex_by_carrier.values())
+        total_opex = sum(opex_by_carrier.values())
 
         cost_rows = []
         for carrier in sorted(set(list(capex_by_carrier.keys()) + list(opex_by_carrier.keys()))):
@@ -1994,39 +2133,36 @@ class PyPSASingleNetworkAnalyzer:
             }
 
         if hasattr(n, 'generators') and 'carrier' in n.generators.columns:
-            for carrier in n.generators['carrier'].unique():
-                # Only analyze renewable carriers
-                if carrier not in renewable_carriers_list:
-                    continue
-
-                carrier_gens = n.generators[n.generators['carrier'] == carrier]
-
-                for gen_name in carrier_gens.index:
-                    if gen_name in gen_p.columns and gen_name in gen_p_max_pu.columns:
-                        actual_gen = gen_p[gen_name].sum()
-
-                        # Get capacity using dynamic column
-                        capacity = carrier_gens.loc[gen_name, capacity_col]
-
-                        # Calculate potential generation
-                        potential_gen = (gen_p_max_pu[gen_name] * capacity).sum()
-
-                        curtailed = potential_gen - actual_gen
-
-                        if curtailed > 0.01:  # Small threshold to avoid rounding errors
-                            curtailment_pct = (curtailed / potential_gen * 100) if potential_gen > 0 else 0
-
-                            curtailment_rows.append({
-                                'carrier': carrier,
-                                'generator': gen_name,
-                                'curtailment_mwh': safe_float(curtailed),
-                                'curtailment_percent': safe_float(curtailment_pct),
-                                'actual_generation': safe_float(actual_gen),
-                                'potential_generation': safe_float(potential_gen)
-                            })
+            kernel = self.kernel
+            carriers = n.generators['carrier'].reindex(kernel.generators)
+            analyzed = (carriers.isin(renewable_carriers_list).to_numpy()
+                        & kernel.present(gen_p) & kernel.present(gen_p_max_pu))
+
+            # Weighted actual and potential energy for every generator at once
+            capacity = n.generators[capacity_col].reindex(kernel.generators).astype(float).to_numpy()
+            actual = kernel.total_by_generator(gen_p)
+            potential = kernel.total_by_generator(gen_p_max_pu) * capacity
+            curtailed = potential - actual
+            # Small threshold to avoid rounding errors
+            counted = np.flatnonzero(analyzed & (curtailed > 0.01))
+
+            # Rows grouped by carrier in order of appearance, generators in network order
+            carrier_order = pd.factorize(carriers)[0]
+            counted = counted[np.argsort(carrier_order[counted], kind='stable')]
+
+            for i in counted:
+                curtailment_pct = (curtailed[i] / potential[i] * 100) if potential[i] > 0 else 0
+                curtailment_rows.append({
+                    'carrier': carriers.iloc[i],
+                    'generator': kernel.generators[i],
+                    'curtailment_mwh': safe_float(curtailed[i]),
+                    'curtailment_percent': safe_float(curtailment_pct),
+                    'actual_generation': safe_float(actual[i]),
+                    'potential_generation': safe_float(potential[i])
+                })
 
-                            total_curtailed += curtailed
-                            total_potential += potential_gen
+            total_curtailed = float(curtailed[counted].sum())
+            total_potential = float(potential[counted].sum())
 
         curtailment_rate = (total_curtailed / total_potential * 100) if total_potential > 0 else 0
 
@@ -2131,47 +2267,28 @@ class PyPSASingleNetworkAnalyzer:
         if capacity_col not in n.generators.columns:
             return {'capacity_factors': [], 'years': years}
 
-        # Group by carrier and year
-        carrier_year_cuf = {}
-        period_index = get_period_index(n.snapshots)
-
-        for carrier in sorted(n.generators['carrier'].dropna().unique().tolist()):
-            carrier_gens = n.generators[n.generators['carrier'] == carrier]
-            carrier_gen_names = carrier_gens.index
-            cols = gen_p.columns.intersection(carrier_gen_names)
+        # Weighted energy per (year, carrier) and weighted hours per year from the shared kernel
+        kernel = self.kernel
+        energy = kernel.carrier_period(gen_p)
+        present = kernel.carriers_present(gen_p)
+        carrier_capacity = kernel.carrier_sum(n.generators[capacity_col])
+        year_pos = {year: i for i, year in enumerate(kernel.years)}
 
-            if len(cols) == 0:
+        carrier_year_cuf = {}
+        for c, carrier in enumerate(kernel.carriers):
+            if not present[c]:
                 continue
 
             carrier_data = {}
-
             for year in years:
-                try:
-                    # Filter snapshots for this year
-                    year_mask = [p == year or (isinstance(p, pd.Timestamp) and p.year == year) for p in period_index]
-                    year_snapshots = n.snapshots[year_mask]
-
-                    if len(year_snapshots) == 0:
-                        continue
-
-                    # Get generation data for this year
-                    year_gen_p = gen_p.loc[year_snapshots, cols]
-                    weights = get_snapshot_weights(n, year_snapshots)
-                    weighted_hours = weights.sum()
-
-                    # Calculate energy and potential
-                    weighted_energy = (year_gen_p.T * weights).T.sum().sum()
-                    capacity = carrier_gens[capacity_col].sum()
-                    potential = capacity * weighted_hours
-
-                    if potential > 0:
-                        cf = (weighted_energy / potential) * 100  # As percentage
-                        carrier_data[str(year)] = safe_float(cf) or 0.0
-                    else:
-                        carrier_data[str(year)] = 0.0
-
-                except Exception as e:
-                    logger.error(f"Error calculating CUF for {carrier} in year {year}: {e}")
+                if year not in year_pos:
+                    continue
+                y = year_pos[year]
+                potential = carrier_capacity[c] * kernel.period_hours[y]
+                if potential > 0:
+                    cf = (energy[y, c] / potential) * 100  # As percentage
+                    carrier_data[str(year)] = safe_float(cf) or 0.0
+                else:
                     carrier_data[str(year)] = 0.0
 
             if carrier_data:
@@ -2265,64 +2382,38 @@ class PyPSASingleNetworkAnalyzer:
                 'years': years
             }
 
-        period_index = get_period_index(n.snapshots)
+        kernel = self.kernel
+        energy = kernel.carrier_period(gen_p)
+        present = kernel.carriers_present(gen_p)
+        renewable_mask = np.array([c in renewable_carriers_list for c in kernel.carriers], dtype=bool)
+        year_pos = {year: i for i, year in enumerate(kernel.years)}
 
         # Aggregate data by year
         year_data = {}
         carrier_year_data = {}
 
         for year in years:
-            try:
-                # Filter snapshots for this year
-                year_mask = [p == year or (isinstance(p, pd.Timestamp) and p.year == year) for p in period_index]
-                year_snapshots = n.snapshots[year_mask]
-
-                if len(year_snapshots) == 0:
-                    continue
-
-                year_gen_p = gen_p.loc[year_snapshots]
-                weights = get_snapshot_weights(n, year_snapshots)
-
-                total_energy = 0
-                renewable_energy = 0
-                carrier_energies = {}
-
-                for carrier in n.generators['carrier'].dropna().unique():
-                    carrier_gens = n.generators[n.generators['carrier'] == carrier]
-                    cols = year_gen_p.columns.intersection(carrier_gens.index)
-
-                    if len(cols) > 0:
-                        weighted_energy = (year_gen_p[cols].T * weights).T.sum().sum()
-                        total_energy += weighted_energy
-                        carrier_energies[carrier] = weighted_energy
-
-                        if carrier in renewable_carriers_list:
-                            renewable_energy += weighted_energy
-
-                renewable_share = (renewable_energy / total_energy * 100) if total_energy > 0 else 0
+            if year not in year_pos:
+                continue
+            year_energy = energy[year_pos[year]]
 
-                year_data[str(year)] = {
-                    'renewable_share_percent': safe_float(renewable_share) or 0.0,
-                    'renewable_energy_mwh': safe_float(renewable_energy) or 0.0,
-                    'total_energy_mwh': safe_float(total_energy) or 0.0
-                }
+            total_energy = year_energy[present].sum()
+            renewable_energy = year_energy[present & renewable_mask].sum()
+            renewable_share = (renewable_energy / total_energy * 100) if total_energy > 0 else 0
 
-                # Store carrier data for this year
-                for carrier, energy in carrier_energies.items():
-                    if carrier not in carrier_year_data:
-                        carrier_year_data[carrier] = {}
-                    share_pct = (energy / total_energy * 100) if total_energy > 0 else 0
-                    carrier_year_data[carrier][str(year)] = {
-                        'energy': safe_float(energy) or 0.0,
-                        'share': safe_float(share_pct) or 0.0
-                    }
+            year_data[str(year)] = {
+                'renewable_share_percent': safe_float(renewable_share) or 0.0,
+                'renewable_energy_mwh': safe_float(renewable_energy) or 0.0,
+                'total_energy_mwh': safe_float(total_energy) or 0.0
+            }
 
-            except Exception as e:
-                logger.error(f"Error processing year {year}: {e}")
-                year_data[str(year)] = {
-                    'renewable_share_percent': 0.0,
-                    'renewable_energy_mwh': 0.0,
-                    'total_energy_mwh': 0.0
+            # Store carrier data for this year
+            for c in np.flatnonzero(present):
+                carrier = kernel.carriers[c]
+                share_pct = (year_energy[c] / total_energy * 100) if total_energy > 0 else 0
+                carrier_year_data.setdefault(carrier, {})[str(year)] = {
+                    'energy': safe_float(year_energy[c]) or 0.0,
+                    'share': safe_float(share_pct) or 0.0
                 }
 
         # Format breakdown
@@ -2423,48 +2514,37 @@ class PyPSASingleNetworkAnalyzer:
         if not capacity_col:
             return {'curtailment': [], 'years': years}
 
-        period_index = get_period_index(n.snapshots)
-        carrier_year_curtailment = {}
+        kernel = self.kernel
+        renewable_mask = np.array([c in renewable_carriers_list for c in kernel.carriers], dtype=bool)
+        renewable_gens = np.asarray(kernel.incidence[:, np.flatnonzero(renewable_mask)].sum(axis=1)).ravel() > 0
+        analyzed = renewable_gens & kernel.present(gen_p) & kernel.present(gen_p_max_pu)
 
-        for year in years:
-            try:
-                # Filter snapshots for this year
-                year_mask = [p == year or (isinstance(p, pd.Timestamp) and p.year == year) for p in period_index]
-                year_snapshots = n.snapshots[year_mask]
-
-                if len(year_snapshots) == 0:
-                    continue
+        # Per (year, generator) weighted actual and potential generation, then per-generator threshold
+        capacity = n.generators[capacity_col].reindex(kernel.generators).astype(float).to_numpy()
+        actual = kernel.period_by_generator(gen_p)
+        potential = kernel.period_by_generator(gen_p_max_pu) * capacity
+        curtailed = potential - actual
+        counted = analyzed & (curtailed > 0.01)
 
-                year_gen_p = gen_p.loc[year_snapshots]
-                year_gen_p_max_pu = gen_p_max_pu.loc[year_snapshots]
-                weights = get_snapshot_weights(n, year_snapshots)
-                weights_mean = weights.mean()
+        carrier_curtailed = kernel.to_carriers(np.where(counted, curtailed, 0.0))
+        carrier_potential = kernel.to_carriers(np.where(counted, potential, 0.0))
+        carrier_counted = kernel.to_carriers(counted.astype(float)) > 0
 
-                for carrier in renewable_carriers_list:
-                    carrier_gens = n.generators[n.generators['carrier'] == carrier]
-
-                    for gen_name in carrier_gens.index:
-                        if gen_name in year_gen_p.columns and gen_name in year_gen_p_max_pu.columns:
-                            actual_gen = year_gen_p[gen_name].sum()
-                            capacity = carrier_gens.loc[gen_name, capacity_col]
-                            potential_gen = (year_gen_p_max_pu[gen_name] * capacity).sum()
-                            curtailed = potential_gen - actual_gen
-
-                            if curtailed > 0.01:
-                                if carrier not in carrier_year_curtailment:
-                                    carrier_year_curtailment[carrier] = {}
-
-                                if str(year) not in carrier_year_curtailment[carrier]:
-                                    carrier_year_curtailment[carrier][str(year)] = {
-                                        'curtailment': 0,
-                                        'potential': 0
-                                    }
-
-                                carrier_year_curtailment[carrier][str(year)]['curtailment'] += curtailed
-                                carrier_year_curtailment[carrier][str(year)]['potential'] += potential_gen
-
-            except Exception as e:
-                logger.error(f"Error calculating curtailment for year {year}: {e}")
+        year_pos = {year: i for i, year in enumerate(kernel.years)}
+        carrier_pos = {carrier: i for i, carrier in enumerate(kernel.carriers)}
+        carrier_year_curtailment = {}
+        for year in years:
+            if year not in year_pos:
+                continue
+            y = year_pos[year]
+            for carrier in renewable_carriers_list:
+                c = carrier_pos.get(carrier)
+                if c is None or not carrier_counted[y, c]:
+                    continue
+                carrier_year_curtailment.setdefault(carrier, {})[str(year)] = {
+                    'curtailment': carrier_curtailed[y, c],
+                    'potential': carrier_potential[y, c]
+                }
 
         # Format output
         curtailment = []
@@ -2490,20 +2570,52 @@ class PyPSASingleNetworkAnalyzer:
             'years': years
         }
 
-    def get_daily_profiles(self) -> Dict[str, Any]:
-        """Get average generation profiles by hour of day."""
+    def get_daily_profile_columns(self) -> Dict[str, Any]:
+        """Get average generation by hour of day as NumPy columns.
+
+        Returns
+        -------
+        Dict[str, Any]
+            'hour' (0-23 array) and 'carriers' dict of carrier -> 24-value array of the
+            average per-generator output (NaN for hours without data)
+        """
         n = self.n
+        hours = np.arange(24)
 
         if not (hasattr(n, 'generators_t') and hasattr(n.generators_t, 'p')):
-            return {
-                'profiles': [],
-                'by_hour': {},
-                'peak_hour': None,
-                'off_peak_hour': None
-            }
+            return {'hour': hours, 'carriers': {}}
 
         gen_p = n.generators_t.p
-        if gen_p.empty:
+        if gen_p.empty or not hasattr(n, 'generators') or 'carrier' not in n.generators.columns:
+            return {'hour': hours, 'carriers': {}}
+
+        # Per-generator mean for each hour of day, then averaged over each carrier's generators
+        kernel = self.kernel
+        time_index = get_time_index(n.snapshots)
+        hourly = gen_p.reindex(columns=kernel.generators).groupby(np.asarray(time_index.hour)).mean()
+        hourly = hourly.reindex(hours).to_numpy(dtype=float)
+
+        present = kernel.present(gen_p)
+        generator_counts = kernel.to_carriers(present.astype(float))
+        carrier_sums = kernel.to_carriers(np.where(present, np.nan_to_num(hourly, nan=0.0), 0.0))
+        has_data = kernel.to_carriers(np.where(present, ~np.isnan(hourly), False).astype(float))
+        with np.errstate(invalid='ignore', divide='ignore'):
+            carrier_avg = np.where(has_data > 0, carrier_sums / has_data, np.nan)
+
+        carrier_pos = {carrier: i for i, carrier in enumerate(kernel.carriers)}
+        carriers = {}
+        for carrier in n.generators['carrier'].dropna().unique():
+            c = carrier_pos[carrier]
+            if generator_counts[c] > 0:
+                carriers[carrier] = carrier_avg[:, c]
+
+        return {'hour': hours, 'carriers': carriers}
+
+    def get_daily_profiles(self) -> Dict[str, Any]:
+        """Get average generation profiles by hour of day."""
+        columns = self.get_daily_profile_columns()
+
+        if not columns['carriers']:
             return {
                 'profiles': [],
                 'by_hour': {},
@@ -2511,39 +2623,25 @@ class PyPSASingleNetworkAnalyzer:
                 'off_peak_hour': None
             }
 
-        # Extract time index
-        time_index = get_time_index(n.snapshots)
-
-        # Create DataFrame with hour of day
-        hourly_data = gen_p.copy()
-        hourly_data.index = time_index
-        hourly_data['hour'] = hourly_data.index.hour
-
         # Group by hour and carrier
         profiles = []
         by_hour = {}
-
-        if hasattr(n, 'generators') and 'carrier' in n.generators.columns:
-            for hour in range(24):
-                hour_data = hourly_data[hourly_data['hour'] == hour]
-                by_hour[hour] = {}
-
-                for carrier in n.generators['carrier'].unique():
-                    carrier_gens = n.generators[n.generators['carrier'] == carrier].index
-                    cols = hour_data.columns.intersection(carrier_gens)
-
-                    if len(cols) > 0:
-                        avg_gen = hour_data[cols].mean().mean()
-                        by_hour[hour][carrier] = safe_float(avg_gen)
-
-                        profiles.append({
-                            'hour': hour,
-                            'carrier': carrier,
-                            'avg_generation': safe_float(avg_gen)
-                        })
+        for hour in columns['hour'].tolist():
+            by_hour[hour] = {}
+            for carrier, values in columns['carriers'].items():
+                avg_gen = safe_float(values[hour])
+                by_hour[hour][carrier] = avg_gen
+                profiles.append({
+                    'hour': hour,
+                    'carrier': carrier,
+                    'avg_generation': avg_gen
+                })
 
         # Find peak and off-peak hours
-        hourly_totals = {hour: sum(by_hour.get(hour, {}).values()) for hour in range(24)}
+        hourly_totals = {
+            hour: sum(v for v in by_hour.get(hour, {}).values() if v is not None)
+            for hour in range(24)
+        }
         peak_hour = max(hourly_totals, key=hourly_totals.get) if hourly_totals else None
         off_peak_hour = min(hourly_totals, key=hourly_totals.get) if hourly_totals else None
 
@@ -2555,44 +2653,49 @@ class PyPSASingleNetworkAnalyzer:
             'daily_range': safe_float(hourly_totals[peak_hour] - hourly_totals[off_peak_hour]) if peak_hour and off_peak_hour else 0
         }
 
-    def get_duration_curves(self) -> Dict[str, Any]:
-        """Get load and generation duration curves."""
-        n = self.n
+    def get_duration_curve_columns(self) -> Dict[str, np.ndarray]:
+        """Get generation and load duration curves as descending NumPy arrays.
 
-        duration_data = []
+        Returns
+        -------
+        Dict[str, np.ndarray]
+            'generation' and/or 'load' (total system power sorted high to low)
+        """
+        n = self.n
+        curves = {}
 
         # Generation duration curve
         if hasattr(n, 'generators_t') and hasattr(n.generators_t, 'p'):
             gen_p = n.generators_t.p
             if not gen_p.empty:
-                total_gen = gen_p.sum(axis=1).sort_values(ascending=False).reset_index(drop=True)
-                for i, value in enumerate(total_gen):
-                    duration_data.append({
-                        'hours': i,
-                        'type': 'generation',
-                        'power_mw': safe_float(value)
-                    })
+                curves['generation'] = -np.sort(-gen_p.sum(axis=1).to_numpy(dtype=float))
 
         # Load duration curve
         if hasattr(n, 'loads_t') and hasattr(n.loads_t, 'p'):
             load_p = n.loads_t.p
             if not load_p.empty:
-                total_load = load_p.sum(axis=1).sort_values(ascending=False).reset_index(drop=True)
-                for i, value in enumerate(total_load):
-                    duration_data.append({
-                        'hours': i,
-                        'type': 'load',
-                        'power_mw': safe_float(value)
-                    })
+                curves['load'] = -np.sort(-load_p.sum(axis=1).to_numpy(dtype=float))
+
+        return curves
+
+    def get_duration_curves(self) -> Dict[str, Any]:
+        """Get load and generation duration curves."""
+        curves = self.get_duration_curve_columns()
+
+        duration_data = []
+        for curve_type, values in curves.items():
+            duration_data.extend(
+                {'hours': i, 'type': curve_type, 'power_mw': safe_float(value)}
+                for i, value in enumerate(values.tolist())
+            )
 
         # Calculate metrics
         peak_value = None
         baseload = None
-        if duration_data:
-            gen_data = [d for d in duration_data if d['type'] == 'generation']
-            if gen_data:
-                peak_value = max(d['power_mw'] for d in gen_data)
-                baseload = min(d['power_mw'] for d in gen_data)
+        generation = curves.get('generation')
+        if generation is not None and len(generation) > 0:
+            peak_value = float(generation[0])
+            baseload = float(generation[-1])
 
         return {
             'duration_curves': duration_data,
@@ -2640,52 +2743,67 @@ class PyPSASingleNetworkAnalyzer:
 
         return storage_data
 
+    def get_transmission_flow_columns(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """Get per-branch flow statistics as NumPy columns.
+
+        Returns
+        -------
+        Dict[str, Dict[str, np.ndarray]]
+            'lines' and 'links', each with 'name', 'avg_flow_mw', 'max_flow_mw',
+            'capacity_mw' and 'avg_utilization_pct' arrays
+        """
+        n = self.n
+        branches = [
+            ('lines', 'lines_t', 's_nom_opt', 's_nom'),  # AC lines
+            ('links', 'links_t', 'p_nom_opt', 'p_nom'),  # DC links
+        ]
+
+        result = {}
+        for component, component_t, opt_col, nom_col in branches:
+            result[component] = {}
+            if not (hasattr(n, component_t) and hasattr(getattr(n, component_t), 'p0')):
+                continue
+            flows = getattr(n, component_t).p0
+            static = getattr(n, component, None)
+            if flows.empty or static is None:
+                continue
+
+            flows = flows[[name for name in flows.columns if name in static.index]]
+            capacity_col = opt_col if opt_col in static.columns else nom_col
+            capacity = static.loc[flows.columns, capacity_col].to_numpy(dtype=float)
+            abs_mean = flows.abs().mean().to_numpy(dtype=float)
+            utilization = np.zeros(len(capacity))
+            np.divide(abs_mean * 100, capacity, out=utilization, where=capacity > 0)
+
+            result[component] = {
+                'name': flows.columns.to_numpy(dtype=object),
+                'avg_flow_mw': flows.mean().to_numpy(dtype=float),
+                'max_flow_mw': flows.max().to_numpy(dtype=float),
+                'capacity_mw': capacity,
+                'avg_utilization_pct': utilization
+            }
+
+        return result
+
     def get_transmission_flows(self) -> Dict[str, Any]:
         """Get transmission line flows and utilization."""
-        n = self.n
+        columns = self.get_transmission_flow_columns()
 
         transmission_data = {
             'lines': [],
             'links': []
         }
 
-        # AC lines
-        if hasattr(n, 'lines_t') and hasattr(n.lines_t, 'p0'):
-            line_flows = n.lines_t.p0
-            if not line_flows.empty and hasattr(n, 'lines'):
-                for line in line_flows.columns:
-                    if line in n.lines.index:
-                        flow_series = line_flows[line]
-                        s_nom = n.lines.loc[line, 's_nom_opt'] if 's_nom_opt' in n.lines.columns else n.lines.loc[line, 's_nom']
-
-                        avg_utilization = (abs(flow_series).mean() / s_nom * 100) if s_nom > 0 else 0
-
-                        transmission_data['lines'].append({
-                            'line': line,
-                            'avg_flow_mw': safe_float(flow_series.mean()),
-                            'max_flow_mw': safe_float(flow_series.max()),
-                            'capacity_mw': safe_float(s_nom),
-                            'avg_utilization_pct': safe_float(avg_utilization)
-                        })
-
-        # DC links
-        if hasattr(n, 'links_t') and hasattr(n.links_t, 'p0'):
-            link_flows = n.links_t.p0
-            if not link_flows.empty and hasattr(n, 'links'):
-                for link in link_flows.columns:
-                    if link in n.links.index:
-                        flow_series = link_flows[link]
-                        p_nom = n.links.loc[link, 'p_nom_opt'] if 'p_nom_opt' in n.links.columns else n.links.loc[link, 'p_nom']
-
-                        avg_utilization = (abs(flow_series).mean() / p_nom * 100) if p_nom > 0 else 0
-
-                        transmission_data['links'].append({
-                            'link': link,
-                            'avg_flow_mw': safe_float(flow_series.mean()),
-                            'max_flow_mw': safe_float(flow_series.max()),
-                            'capacity_mw': safe_float(p_nom),
-                            'avg_utilization_pct': safe_float(avg_utilization)
-                        })
+        for component, key in [('lines', 'line'), ('links', 'link')]:
+            table = columns.get(component) or {}
+            for i, name in enumerate(table.get('name', [])):
+                transmission_data[component].append({
+                    key: name,
+                    'avg_flow_mw': safe_float(table['avg_flow_mw'][i]),
+                    'max_flow_mw': safe_float(table['max_flow_mw'][i]),
+                    'capacity_mw': safe_float(table['capacity_mw'][i]),
+                    'avg_utilization_pct': safe_float(table['avg_utilization_pct'][i])
+                })
 
         return transmission_data
 
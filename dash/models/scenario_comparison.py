@@ -0,0 +1,275 @@
+"""
+Scenario Comparison Engine
+==========================
+
+Aligns N demand forecast scenarios on a common ``(sector, model, year)``
+grid and computes, in one vectorized pass over an
+``N x sector x model x year`` array:
+
+- absolute and percent differences of every scenario against the base
+- CAGR of every series over the requested window (first to last value)
+- cumulative energy over the window and its delta against the base
+
+Scenarios are read from the columnar results store (falling back to the
+sector workbooks for older scenarios). Comparisons are cached keyed by the
+scenario fingerprints, the base scenario and the year window, so switching
+sector tabs or re-opening the comparison is served from memory.
+
+Usage::
+
+    comparison = compare_scenarios({'Base': dir1, 'High': dir2}, 'Base', 2024, 2040)
+    payload = comparison.to_payload()
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import openpyxl
+
+try:
+    from .forecast_cube import ForecastCube, scenario_fingerprint, sector_files
+    from .forecast_store import get_forecast_store
+except ImportError:
+    from forecast_cube import ForecastCube, scenario_fingerprint, sector_files
+    from forecast_store import get_forecast_store
+
+logger = logging.getLogger(__name__)
+
+MAX_CACHED_COMPARISONS = 16
+
+
+# =============================================================================
+# LOADING
+# =============================================================================
+
+def _workbook_forecast_start(file_path: Path) -> Optional[int]:
+    """Last Inputs year with an Electricity value from a sector workbook."""
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        if 'Inputs' not in workbook.sheetnames:
+            return None
+        rows = workbook['Inputs'].iter_rows(values_only=True)
+        headers = list(next(rows, None) or [])
+        if 'Year' not in headers or 'Electricity' not in headers:
+            return None
+        year_idx, elec_idx = headers.index('Year'), headers.index('Electricity')
+        years = []
+        for row in rows:
+            if row and len(row) > max(year_idx, elec_idx) and row[elec_idx] is not None:
+                try:
+                    years.append(int(float(row[year_idx])))
+                except (TypeError, ValueError):
+                    continue
+        return max(years) if years else None
+    finally:
+        workbook.close()
+
+
+def load_scenario(scenario_dir: Union[str, Path]) -> Dict:
+    """
+    One scenario's results as arrays plus per-sector forecast start years.
+
+    Returns:
+        dict with sectors, models, years, values[sector, model, year] and
+        forecast_start {sector: year or None}
+    """
+    store = get_forecast_store(scenario_dir)
+    if store is not None:
+        sectors, models, years, values = store.results_matrix()
+        forecast_start = {sector: store.forecast_start_year(sector) for sector in sectors}
+    else:
+        cube = ForecastCube.load(scenario_dir)
+        sectors, models, years, values = cube.sectors, cube.models, cube.years, cube.values
+        forecast_start = {}
+        for file_path in sector_files(scenario_dir):
+            try:
+                forecast_start[file_path.stem] = _workbook_forecast_start(file_path)
+            except Exception as e:
+                logger.warning(f"Could not determine forecast start year for {file_path.stem}: {e}")
+                forecast_start[file_path.stem] = None
+    return {'sectors': list(sectors), 'models': list(models), 'years': np.asarray(years, dtype=int),
+            'values': values, 'forecast_start': forecast_start}
+
+
+def _align(loaded: List[Dict], years: np.ndarray, sectors: Optional[Sequence[str]]) -> Tuple[List[str], List[str], np.ndarray]:
+    """Stack scenarios onto the union sector/model axes and the requested years."""
+    sector_axis = list(sectors) if sectors else list(dict.fromkeys(s for d in loaded for s in d['sectors']))
+    model_axis = list(dict.fromkeys(m for d in loaded for m in d['models']))
+    sector_pos = {s: i for i, s in enumerate(sector_axis)}
+    model_pos = {m: i for i, m in enumerate(model_axis)}
+
+    aligned = np.full((len(loaded), len(sector_axis), len(model_axis), len(years)), np.nan)
+    for n, data in enumerate(loaded):
+        src_s = [i for i, s in enumerate(data['sectors']) if s in sector_pos]
+        dst_s = [sector_pos[data['sectors'][i]] for i in src_s]
+        dst_m = [model_pos[m] for m in data['models']]
+        # Year positions inside the requested window
+        src_y = np.nonzero(np.isin(data['years'], years))[0]
+        dst_y = np.searchsorted(years, data['years'][src_y])
+        if src_s and dst_m and len(src_y):
+            block = data['values'][np.ix_(src_s, range(len(dst_m)), src_y)]
+            aligned[np.ix_([n], dst_s, dst_m, dst_y)] = block[np.newaxis]
+    return sector_axis, model_axis, aligned
+
+
+# =============================================================================
+# COMPARISON
+# =============================================================================
+
+class ScenarioComparison:
+    """Aligned values and diffs for N scenarios (axis 0 follows ``scenarios``)."""
+
+    def __init__(self, scenarios: List[str], base: str, sectors: List[str], models: List[str],
+                 years: np.ndarray, values: np.ndarray, forecast_start: Dict[str, Dict[str, Optional[int]]]):
+        self.scenarios = scenarios
+        self.base = base
+        self.sectors = sectors
+        self.models = models
+        self.years = years
+        self.values = values
+        self.forecast_start = forecast_start
+
+        base_values = values[scenarios.index(base)]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.abs_diff = values - base_values
+            self.pct_diff = np.where(base_values != 0, self.abs_diff / np.abs(base_values) * 100, np.nan)
+
+        self.cagr, self.cagr_span = self._cagr(values, years)
+        valid = ~np.isnan(values)
+        self.cumulative = np.where(valid.any(axis=-1), np.nansum(values, axis=-1), np.nan)
+        self.cumulative_delta = self.cumulative - self.cumulative[scenarios.index(base)]
+
+    @staticmethod
+    def _cagr(values: np.ndarray, years: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """CAGR between the first and last valid value of every series (NaN if undefined)."""
+        if values.shape[-1] == 0:
+            return np.full(values.shape[:-1], np.nan), np.zeros(values.shape[:-1])
+
+        valid = ~np.isnan(values)
+        has_data = valid.any(axis=-1)
+        first = np.argmax(valid, axis=-1)
+        last = values.shape[-1] - 1 - np.argmax(valid[..., ::-1], axis=-1)
+
+        start = np.take_along_axis(values, first[..., None], axis=-1)[..., 0]
+        end = np.take_along_axis(values, last[..., None], axis=-1)[..., 0]
+        span = (years[last] - years[first]).astype(float) if len(years) else np.zeros(first.shape)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cagr = np.power(end / start, 1.0 / span) - 1
+        cagr = np.where(has_data & (span > 0) & (start > 0) & (end >= 0), cagr * 100, np.nan)
+        return cagr, np.where(has_data, span, 0)
+
+    def series_mask(self) -> np.ndarray:
+        """``sector x model`` mask of series present in at least one scenario."""
+        return (~np.isnan(self.values)).any(axis=(0, -1))
+
+    def to_payload(self, sectors: Optional[Sequence[str]] = None) -> Dict:
+        """
+        JSON-ready nested structure for the UI.
+
+        Per-year arrays are keyed ``[scenario][sector][model]``; per-series
+        summaries (CAGR, cumulative energy and its delta) likewise. Series
+        that no scenario has are omitted. ``NaN`` becomes ``None``.
+        """
+        wanted = set(sectors) if sectors else None
+        mask = self.series_mask()
+
+        def clean(array: np.ndarray) -> List:
+            return [None if np.isnan(v) else float(v) for v in array]
+
+        def scalar(v: float) -> Optional[float]:
+            return None if np.isnan(v) else float(v)
+
+        values, abs_diff, pct_diff, summary = {}, {}, {}, {}
+        for n, scenario in enumerate(self.scenarios):
+            values[scenario], abs_diff[scenario], pct_diff[scenario], summary[scenario] = {}, {}, {}, {}
+            for s, sector in enumerate(self.sectors):
+                if wanted is not None and sector not in wanted:
+                    continue
+                for m in np.nonzero(mask[s])[0]:
+                    model = self.models[m]
+                    values[scenario].setdefault(sector, {})[model] = clean(self.values[n, s, m])
+                    summary[scenario].setdefault(sector, {})[model] = {
+                        'cagr': scalar(self.cagr[n, s, m]),
+                        'cumulative': scalar(self.cumulative[n, s, m]),
+                        'cumulativeDelta': scalar(self.cumulative_delta[n, s, m]),
+                    }
+                    if scenario != self.base:
+                        abs_diff[scenario].setdefault(sector, {})[model] = clean(self.abs_diff[n, s, m])
+                        pct_diff[scenario].setdefault(sector, {})[model] = clean(self.pct_diff[n, s, m])
+
+        return {
+            'scenarios': self.scenarios,
+            'base': self.base,
+            'years': self.years.tolist(),
+            'sectors': [s for s in self.sectors if wanted is None or s in wanted],
+            'models': self.models,
+            'forecastStartYear': self.forecast_start,
+            'values': values,
+            'absDiff': abs_diff,
+            'pctDiff': pct_diff,
+            'summary': summary,
+        }
+
+
+_comparisons: OrderedDict = OrderedDict()
+_comparisons_lock = threading.Lock()
+
+
+def compare_scenarios(scenario_dirs: Dict[str, Union[str, Path]], base: Optional[str] = None,
+                      start_year: Optional[int] = None, end_year: Optional[int] = None,
+                      sectors: Optional[Sequence[str]] = None) -> ScenarioComparison:
+    """
+    Compare scenarios (cached per scenario fingerprints and window).
+
+    Args:
+        scenario_dirs: Ordered ``{scenario name: scenario folder}``
+        base: Scenario the diffs are taken against (default: the first)
+        start_year, end_year: Year window (default: union of all years)
+        sectors: Restrict the sector axis (default: union of all sectors)
+
+    Raises:
+        ValueError: For fewer than two scenarios, an unknown base, scenarios
+            without forecast data or a window containing no years
+    """
+    names = list(scenario_dirs)
+    if len(names) < 2:
+        raise ValueError("At least two scenarios are required for a comparison")
+    base = base or names[0]
+    if base not in scenario_dirs:
+        raise ValueError(f"Base scenario '{base}' is not among the compared scenarios")
+
+    key = (
+        tuple((name, str(Path(path).resolve()), scenario_fingerprint(path)) for name, path in scenario_dirs.items()),
+        base, start_year, end_year, tuple(sectors) if sectors else None,
+    )
+    with _comparisons_lock:
+        cached = _comparisons.get(key)
+        if cached is not None:
+            _comparisons.move_to_end(key)
+            return cached
+
+    loaded = [load_scenario(path) for path in scenario_dirs.values()]
+    all_years = np.unique(np.concatenate([d['years'] for d in loaded])) if loaded else np.array([], dtype=int)
+    if not len(all_years):
+        raise ValueError("The selected scenarios have no forecast data to compare")
+    lo = start_year if start_year is not None else int(all_years.min())
+    hi = end_year if end_year is not None else int(all_years.max())
+    if lo > hi:
+        raise ValueError(f"No years to compare: the window starts at {lo} but ends at {hi} "
+                         f"(forecast years {int(all_years.min())}-{int(all_years.max())})")
+    years = np.arange(lo, hi + 1, dtype=int)
+
+    sector_axis, model_axis, aligned = _align(loaded, years, sectors)
+    forecast_start = {name: data['forecast_start'] for name, data in zip(names, loaded)}
+    comparison = ScenarioComparison(names, base, sector_axis, model_axis, years, aligned, forecast_start)
+
+    with _comparisons_lock:
+        _comparisons[key] = comparison
+        while len(_comparisons) > MAX_CACHED_COMPARISONS:
+            _comparisons.popitem(last=False)
+    return comparison
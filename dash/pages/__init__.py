@@ -1,20 +1,9 @@
 """
 Pages module - All page layouts for the Dash app
-"""
 
-from . import (
-    home,
-    create_project,
-    load_project,
-    demand_projection,
-    demand_visualization,
-    generate_profiles,
-    analyze_profiles,
-    model_config,
-    view_results,
-    settings_page,
-    other_tools
-)
+Page modules are imported by app.py (register_pages) rather than here, so
+importing one page does not pull in all the others.
+"""
 
 __all__ = [
     'home',
@@ -13,13 +13,15 @@ IMPROVEMENTS:
 from dash import html, dcc, callback, Input, Output, State, no_update, callback_context
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
-import pandas as pd
 from datetime import datetime, timedelta
 import sys, os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from services.local_service import service as api
 from utils.state_manager import StateManager
+from utils.lazy_imports import lazy_import
+
+pd = lazy_import('pandas')
 
 # Default state for a single profile
 def get_default_profile_state():
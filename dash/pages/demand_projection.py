@@ -15,8 +15,6 @@ Features:
 from dash import html, dcc, callback, Input, Output, State, ALL, MATCH, callback_context, no_update
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
-import pandas as pd
-import numpy as np
 import sys
 import os
 
@@ -35,6 +33,10 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from services.local_service import service as api
 from utils.state_manager import StateManager, ConversionFactors, safe_numeric, safe_multiply
+from utils.lazy_imports import lazy_import
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
 
 
 def layout(active_project=None):
@@ -16,9 +16,6 @@ React exceeds by: 336 lines (27% larger due to Dash verbosity + comparison featu
 from dash import html, dcc, callback, Input, Output, State, ALL, MATCH, callback_context, no_update
 import dash_bootstrap_components as dbc
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import pandas as pd
-import numpy as np
 import sys
 import os
 from datetime import datetime
@@ -38,6 +35,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from services.local_service import service as api
 from utils.state_manager import StateManager, ConversionFactors, safe_numeric, safe_multiply
+from utils.lazy_imports import lazy_import, lazy_object
+from utils.export import create_export_panel
+
+pd = lazy_import('pandas')
+np = lazy_import('numpy')
+make_subplots = lazy_object('plotly.subplots', 'make_subplots')
 
 
 # ===================================================
@@ -336,6 +339,7 @@ def layout(active_project=None):
         dcc.Store(id='viz-sector-data', data=None),
         dcc.Store(id='viz-consolidated-data', data=None),
         dcc.Store(id='viz-comparison-sector-data', data=None),
+        dcc.Store(id='viz-comparison-store', data=None),
         dcc.Store(id='viz-td-losses', data={}),
         dcc.Store(id='viz-saved-state', data={'isSaved': False}),
         # Add sectors-store to prevent callback errors from demand_projection page
@@ -1729,9 +1733,10 @@ def get_displayable_columns_for_demand_type(all_cols, sectors, demand_type):
     Input('viz-consolidated-data', 'data'),
     State('viz-unit-selector', 'value'),
     State('viz-sectors-list', 'data'),
-    State('demand-viz-state', 'data')
+    State('demand-viz-state', 'data'),
+    State('viz-scenario-selector', 'value')
 )
-def render_consolidated_table(data, unit, sectors, state):
+def render_consolidated_table(data, unit, sectors, state, scenario=None):
     """Render consolidated data table with demand-type-aware column filtering"""
     if not data or not sectors:
         return dbc.Alert([
@@ -1766,6 +1771,7 @@ def render_consolidated_table(data, unit, sectors, state):
 
         # Select only displayable columns
         df_display = df[display_cols].copy()
+        export_df = df_display.copy()
 
         # Format numbers
         for col in df_display.columns:
@@ -1805,7 +1811,13 @@ def render_consolidated_table(data, unit, sectors, state):
                 className='text-muted mb-3',
                 style={'fontSize': '0.875rem'}
             ),
-            html.Div([table], style={'maxHeight': '400px', 'overflowY': 'auto'})
+            html.Div([table], style={'maxHeight': '400px', 'overflowY': 'auto'}),
+            create_export_panel(
+                export_df,
+                prefix=f'{scenario or "consolidated"}_{demand_type}_demand',
+                formats=['excel', 'csv', 'json'],
+                key=f'demand-viz/consolidated/{scenario}'
+            )
         ])
 
     except Exception as e:
@@ -1998,10 +2010,26 @@ def toggle_compare_modal(open_n, cancel_n, apply_n, is_open, scenarios, current_
     return no_update, no_update
 
 
+def comparison_sector_data(comparison, scenario, sector):
+    """Slice one scenario/sector out of a comparison payload in get_sector_data's shape"""
+    if not comparison or not scenario or not sector:
+        return None
+    models = comparison.get('values', {}).get(scenario, {}).get(sector)
+    if not models:
+        return None
+    return {
+        'years': comparison.get('years', []),
+        'models': models,
+        'forecastStartYear': comparison.get('forecastStartYear', {}).get(scenario, {}).get(sector),
+        'summary': comparison.get('summary', {}).get(scenario, {}).get(sector, {})
+    }
+
+
 # Enable comparison mode and load comparison data
 @callback(
     Output('demand-viz-state', 'data', allow_duplicate=True),
     Output('viz-comparison-sector-data', 'data'),
+    Output('viz-comparison-store', 'data'),
     Input('apply-compare-btn', 'n_clicks'),
     State('compare-scenario-selector', 'value'),
     State('viz-scenario-selector', 'value'),
@@ -2012,30 +2040,30 @@ def toggle_compare_modal(open_n, cancel_n, apply_n, is_open, scenarios, current_
     prevent_initial_call=True
 )
 def enable_comparison_mode(n_clicks, compare_scenario, base_scenario, start_year, end_year, active_project, state):
-    """Enable comparison mode and load comparison data"""
+    """Enable comparison mode and load all sectors of both scenarios in one aligned comparison"""
     if not n_clicks or not compare_scenario:
-        return no_update, no_update
+        return no_update, no_update, no_update
 
     if not base_scenario or not active_project:
-        return no_update, no_update
+        return no_update, no_update, no_update
 
     try:
         # Get selected sector from state (selected via tabs, not dropdown)
         sector = state.get('selectedSector') if state else None
 
-        # Load comparison sector data if sector is selected
-        comparison_data = None
-        if sector and start_year and end_year:
-            response = api.get_sector_data(
-                active_project['path'],
-                compare_scenario,
-                sector,
-                start_year=start_year,
-                end_year=end_year
-            )
-            # Response now contains years, models, and forecastStartYear directly
-            if response.get('success') is not False:
-                comparison_data = response
+        # One comparison covers every sector; tab switches slice it client-side
+        comparison = api.compare_scenarios(
+            active_project['path'],
+            [base_scenario, compare_scenario],
+            base_scenario=base_scenario,
+            start_year=start_year,
+            end_year=end_year
+        )
+        if comparison.get('success') is False:
+            print(f"Error comparing scenarios: {comparison.get('error')}")
+            comparison = None
+
+        comparison_data = comparison_sector_data(comparison, compare_scenario, sector)
 
         # Update state with comparison info
         updated_state = StateManager.merge_state(state, {
@@ -2046,17 +2074,18 @@ def enable_comparison_mode(n_clicks, compare_scenario, base_scenario, start_year
             }
         })
 
-        return updated_state, comparison_data
+        return updated_state, comparison_data, comparison
 
     except Exception as e:
         print(f"Error enabling comparison mode: {e}")
-        return no_update, no_update
+        return no_update, no_update, no_update
 
 
 # Disable comparison mode
 @callback(
     Output('demand-viz-state', 'data', allow_duplicate=True),
     Output('viz-comparison-sector-data', 'data', allow_duplicate=True),
+    Output('viz-comparison-store', 'data', allow_duplicate=True),
     Input('stop-comparison-btn', 'n_clicks'),
     State('demand-viz-state', 'data'),
     prevent_initial_call=True
@@ -2064,14 +2093,14 @@ def enable_comparison_mode(n_clicks, compare_scenario, base_scenario, start_year
 def disable_comparison_mode(n_clicks, state):
     """Disable comparison mode"""
     if not n_clicks:
-        return no_update, no_update
+        return no_update, no_update, no_update
 
     updated_state = StateManager.merge_state(state, {
         'comparisonMode': False,
         'scenariosToCompare': {'scenario1': None, 'scenario2': None}
     })
 
-    return updated_state, None
+    return updated_state, None, None
 
 
 # Render comparison banner
@@ -2115,13 +2144,11 @@ def render_comparison_banner(state):
     Output('viz-comparison-sector-data', 'data', allow_duplicate=True),
     Input('viz-main-tabs', 'active_tab'),
     State('demand-viz-state', 'data'),
-    State('viz-start-year', 'value'),
-    State('viz-end-year', 'value'),
-    State('active-project-store', 'data'),
+    State('viz-comparison-store', 'data'),
     prevent_initial_call=True
 )
-def update_comparison_sector_data(active_tab, state, start_year, end_year, active_project):
-    """Load comparison data when active tab changes"""
+def update_comparison_sector_data(active_tab, state, comparison):
+    """Slice the stored comparison when active tab changes"""
     if not state or not state.get('comparisonMode'):
         return no_update
 
@@ -2134,21 +2161,11 @@ def update_comparison_sector_data(active_tab, state, start_year, end_year, activ
     scenarios = state.get('scenariosToCompare', {})
     compare_scenario = scenarios.get('scenario2')
 
-    if not compare_scenario or not sector or not start_year or not end_year:
+    if not compare_scenario or not sector or not comparison:
         return no_update
 
     try:
-        response = api.get_sector_data(
-            active_project['path'],
-            compare_scenario,
-            sector,
-            start_year=start_year,
-            end_year=end_year
-        )
-        # Response now contains years, models, and forecastStartYear directly
-        if response.get('success') is False:
-            return None
-        return response
+        return comparison_sector_data(comparison, compare_scenario, sector)
     except Exception as e:
         print(f"Error loading comparison sector data: {e}")
         return no_update
@@ -2340,10 +2357,37 @@ def render_sector_data_table_with_comparison(base_data, comparison_data, unit, s
     table1 = render_sector_data_table_single(base_data, unit, sector, title_prefix=scenario1)
     table2 = render_sector_data_table_single(comparison_data, unit, sector, title_prefix=scenario2)
 
-    return dbc.Row([
-        dbc.Col([table1], width=6),
-        dbc.Col([table2], width=6)
-    ], className='mt-3')
+    return html.Div([
+        dbc.Row([
+            dbc.Col([table1], width=6),
+            dbc.Col([table2], width=6)
+        ], className='mt-3'),
+        render_comparison_summary(comparison_data.get('summary'), unit, scenario1, scenario2)
+    ])
+
+
+def render_comparison_summary(summary, unit, scenario1, scenario2):
+    """Per-model CAGR and cumulative energy delta of the compared scenario (helper function)"""
+    if not summary:
+        return None
+
+    factor = ConversionFactors.FACTORS.get(unit, 1)
+
+    def fmt(value, scale=1):
+        return f'{value * scale:,.2f}' if isinstance(value, (int, float)) else 'N/A'
+
+    rows = [{
+        'Model': model,
+        f'CAGR {scenario2} (%)': fmt(stats.get('cagr')),
+        f'Cumulative {scenario2}': fmt(stats.get('cumulative'), factor),
+        f'Δ vs {scenario1}': fmt(stats.get('cumulativeDelta'), factor)
+    } for model, stats in summary.items()]
+
+    return html.Div([
+        html.H6(f'Summary ({ConversionFactors.get_label(unit)})', className='mt-3 mb-2'),
+        dbc.Table.from_dataframe(pd.DataFrame(rows), striped=True, bordered=True, hover=True,
+                                 responsive=True, size='sm', className='mb-0')
+    ])
 
 
 def render_sector_data_table_single(data, unit, sector, title_prefix=''):
@@ -2367,6 +2411,7 @@ def render_sector_data_table_single(data, unit, sector, title_prefix=''):
             table_data[model_name] = [safe_multiply(v, factor) if v is not None else 'N/A' for v in model_data]
 
         df = pd.DataFrame(table_data)
+        export_df = df.replace('N/A', None)
 
         # Format numbers
         for col in df.columns:
@@ -2393,6 +2438,11 @@ def render_sector_data_table_single(data, unit, sector, title_prefix=''):
                 f'{ConversionFactors.get_label(unit)} | Models: {len(models)}',
                 className='text-muted mt-2 mb-0',
                 style={'fontSize': '0.8rem'}
+            ),
+            create_export_panel(
+                export_df,
+                prefix=f'{title_prefix}_{sector}' if title_prefix else sector,
+                key=f'demand-viz/sector/{title_prefix}/{sector}'
             )
         ])
 
@@ -24,12 +24,15 @@ import dash_bootstrap_components as dbc
 from dash.exceptions import PreventUpdate
 import plotly.graph_objects as go
 import json
-import pandas as pd
 import sys, os
 
 # Import local service instead of API client
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from services.local_service import service as api
+from utils.lazy_imports import lazy_import
+from utils.export import create_export_panel
+
+pd = lazy_import('pandas')
 
 # Note: This page uses manual routing in app.py, not dash.register_page()
 
@@ -1157,7 +1160,12 @@ def render_network_tab(results_state, active_project):
 
         return html.Div([
             html.H5('Transmission Lines', className='mb-3'),
-            html.Div([table], className='bg-white rounded shadow-sm border p-4')
+            html.Div([table], className='bg-white rounded shadow-sm border p-4'),
+            create_export_panel(
+                df,
+                prefix=f'{scenario}_{network}_lines',
+                key=f'view-results/lines/{active_project["path"]}/{scenario}/{network}'
+            )
         ])
 
     except Exception as e:
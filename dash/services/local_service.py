@@ -5,11 +5,9 @@ Replaces api_client.py for fully self-contained Dash webapp
 
 import os
 import json
-import pandas as pd
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Tuple
 import logging
-import openpyxl
 import subprocess
 import threading
 import queue
@@ -43,6 +41,11 @@ from app_config import (
     get_project_results_path
 )
 
+# pandas/openpyxl - LAZY LOADED (every page imports this service at startup)
+from utils.lazy_imports import lazy_import
+pd = lazy_import('pandas')
+openpyxl = lazy_import('openpyxl')
+
 # PyPSA imports - LAZY LOADED (only when needed to avoid initialization on app start)
 # This prevents NetworkCache from initializing when not on PyPSA pages
 _network_cache_module = None
@@ -1685,6 +1688,12 @@ class LocalService:
             # Filter out Consolidated_Results
             sectors = [s for s in sectors if s != 'Consolidated_Results']
 
+            # Sectors written only to the columnar results store (Excel export disabled)
+            from forecast_store import get_forecast_store
+            store = get_forecast_store(scenario_dir)
+            if store is not None:
+                sectors += [s for s in store.sectors if s not in sectors]
+
             logger.info(f"Found {len(sectors)} sectors in scenario '{scenario_name}': {sectors}")
             return {'sectors': sectors}
 
@@ -1695,8 +1704,8 @@ class LocalService:
     def get_sector_data(self, project_path: str, scenario_name: str, sector_name: str,
                         start_year: int = None, end_year: int = None) -> Dict:
         """
-        Get forecast data for specific sector from individual Excel file
-        Reads from {sector_name}.xlsx in the scenario directory
+        Get forecast data for specific sector from the scenario's columnar
+        results store, or from {sector_name}.xlsx for scenarios without one
 
         Returns data in format expected by demand_visualization page:
         {
@@ -1713,6 +1722,21 @@ class LocalService:
             scenario_dir = os.path.join(project_path, DirectoryStructure.RESULTS, DirectoryStructure.DEMAND_FORECASTS, scenario_name)
             excel_path = os.path.join(scenario_dir, f'{sector_name}.xlsx')
 
+            from forecast_store import get_forecast_store
+            store = get_forecast_store(scenario_dir)
+            if store is not None and store.has_sector(sector_name):
+                df = store.results(sector_name)
+                if start_year is not None and 'Year' in df.columns:
+                    df = df[df['Year'] >= start_year]
+                if end_year is not None and 'Year' in df.columns:
+                    df = df[df['Year'] <= end_year]
+
+                return {
+                    'years': df['Year'].tolist() if 'Year' in df.columns else [],
+                    'forecastStartYear': store.forecast_start_year(sector_name),
+                    'models': {model: df[model].tolist() for model in df.columns if model != 'Year'}
+                }
+
             if not os.path.exists(excel_path):
                 logger.error(f"Sector file not found: {excel_path}")
                 return {'success': False, 'error': f'Results file not found for sector {sector_name}'}
@@ -1765,6 +1789,34 @@ class LocalService:
             traceback.print_exc()
             return {'success': False, 'error': str(e)}
 
+    def compare_scenarios(self, project_path: str, scenarios: List[str], base_scenario: str = None,
+                          start_year: int = None, end_year: int = None, sectors: List[str] = None) -> Dict:
+        """
+        Compare demand forecast scenarios in one call.
+
+        Aligns all scenarios on (sector, model, year) and returns their values,
+        absolute/percent differences against the base, CAGR and cumulative
+        energy deltas (see models/scenario_comparison.py). Cached by scenario
+        fingerprints, so switching sector tabs is served from memory.
+        """
+        try:
+            from scenario_comparison import compare_scenarios
+
+            forecasts_dir = os.path.join(project_path, DirectoryStructure.RESULTS, DirectoryStructure.DEMAND_FORECASTS)
+            scenario_dirs = {}
+            for name in scenarios:
+                scenario_dir = os.path.join(forecasts_dir, name)
+                if not os.path.exists(scenario_dir):
+                    return {'success': False, 'error': f'Scenario folder not found: {name}'}
+                scenario_dirs[name] = scenario_dir
+
+            comparison = compare_scenarios(scenario_dirs, base_scenario, start_year, end_year, sectors)
+            return {'success': True, **comparison.to_payload()}
+
+        except Exception as e:
+            logger.error(f"Error comparing scenarios {scenarios}: {e}")
+            return {'success': False, 'error': str(e)}
+
     # ==================== LOAD PROFILES ====================
 
     def get_load_profiles(self, project_path: str) -> Dict:
@@ -2424,53 +2476,6 @@ class LocalService:
         name_lower = sector_name.lower()
         return 'solar' in name_lower and 'rooftop' in name_lower
 
-    def _calculate_td_loss_percentage(self, target_year: int, loss_points: List[Dict]) -> float:
-        """
-        Calculate T&D loss percentage for a given year using linear interpolation.
-
-        Returns:
-            Loss percentage as decimal (e.g., 0.10 for 10%)
-        """
-        DEFAULT_LOSS = 0.10  # 10%
-
-        if not loss_points or len(loss_points) == 0:
-            return DEFAULT_LOSS
-
-        # Filter and sort points
-        sorted_points = sorted(
-            [p for p in loss_points if 'year' in p and 'loss' in p],
-            key=lambda p: p['year']
-        )
-
-        if len(sorted_points) == 0:
-            return DEFAULT_LOSS
-        if len(sorted_points) == 1:
-            return sorted_points[0]['loss'] / 100
-
-        first_point = sorted_points[0]
-        last_point = sorted_points[-1]
-
-        # Extrapolation
-        if target_year <= first_point['year']:
-            return first_point['loss'] / 100
-        if target_year >= last_point['year']:
-            return last_point['loss'] / 100
-
-        # Interpolation
-        for i in range(len(sorted_points) - 1):
-            p1 = sorted_points[i]
-            p2 = sorted_points[i + 1]
-
-            if target_year >= p1['year'] and target_year <= p2['year']:
-                if p2['year'] - p1['year'] == 0:
-                    return p1['loss'] / 100
-
-                # Linear interpolation
-                interpolated_loss = p1['loss'] + (target_year - p1['year']) * (p2['loss'] - p1['loss']) / (p2['year'] - p1['year'])
-                return interpolated_loss / 100
-
-        return DEFAULT_LOSS
-
     def calculate_consolidated(self, project_path: str, scenario_name: str, start_year: int,
                               end_year: int, model_selections: Dict[str, str],
                               demand_type: str = 'gross') -> Dict:
@@ -2494,137 +2499,36 @@ class LocalService:
             if not os.path.exists(scenario_dir):
                 return {'success': False, 'error': 'Scenario folder not found'}
 
-            # Get all Excel files except Consolidated_Results and temporary files
-            excel_files = [
-                f for f in os.listdir(scenario_dir)
-                if f.endswith('.xlsx') and f != 'Consolidated_Results.xlsx' and not f.startswith('~$')
-            ]
-            sectors = [os.path.splitext(f)[0] for f in excel_files]
-
-            # Create year range
-            years = list(range(start_year, end_year + 1))
-
-            # Initialize consolidated data
-            consolidated_data = []
-            data_map = {}
-            for year in years:
-                row_data = {"Year": year}
-                for sector in sectors:
-                    row_data[sector] = None
-                consolidated_data.append(row_data)
-                data_map[year] = row_data
-
-            # Read data from each sector
-            for sector in sectors:
-                selected_model = model_selections.get(sector)
-                if not selected_model:
-                    continue
+            # Sector forecasts, solar shares and T&D losses are loaded once per
+            # scenario fingerprint; all demand types are computed together, so
+            # toggling gross/net/onGrid only re-slices the cached result
+            from forecast_cube import get_forecast_cube
 
-                file_path = os.path.join(scenario_dir, f"{sector}.xlsx")
-                if not os.path.exists(file_path):
-                    continue
-
-                try:
-                    df = pd.read_excel(file_path, sheet_name='Results')
-
-                    for _, row in df.iterrows():
-                        year = row.get('Year')
-                        if year and int(year) in data_map:
-                            value = row.get(selected_model)
-                            if value is not None:
-                                data_map[int(year)][sector] = value
-
-                except Exception as e:
-                    logger.error(f"Error reading sector {sector}: {e}")
-                    continue
-
-            # Load solar share data for net demand calculation
-            solar_shares = {}
-            if demand_type in ["net", "onGrid"]:
-                solar_shares = self._read_solar_share_data(project_path)
-                logger.info(f"[calculate_consolidated] Loaded solar shares: {solar_shares}")
-
-            # Load T&D losses
-            td_loss_points = []
-            losses_file_path = os.path.join(scenario_dir, 'td_losses.json')
-            if os.path.exists(losses_file_path):
-                try:
-                    with open(losses_file_path, 'r') as f:
-                        td_loss_points = json.load(f)
-                except Exception as e:
-                    logger.error(f"Could not parse td_losses.json: {e}")
-
-            # Calculate totals based on demand type
-            for row in consolidated_data:
-                year = row['Year']
-
-                # Apply solar sector abs() transformation
-                for sector in sectors:
-                    if row[sector] is not None and self._is_solar_sector(sector):
-                        row[sector] = abs(float(row[sector]))
-
-                if demand_type == "gross":
-                    # GROSS DEMAND: Sector values (original) + Total ONLY
-                    # NO intermediate columns, NO T&D breakdown
-                    gross_total = sum(
-                        float(row[sector]) if row[sector] is not None else 0
-                        for sector in sectors
-                    )
-                    row['Total'] = gross_total
-
-                elif demand_type == "net":
-                    # NET DEMAND: Subtract solar rooftop share from each sector
-                    # Solar rooftop sector will be HIDDEN in frontend (already subtracted)
-                    # Show: Sectors (solar-adjusted) + Total ONLY
-                    net_total = 0
-
-                    for sector in sectors:
-                        if row[sector] is not None:
-                            sector_value = float(row[sector])
-
-                            # For non-solar sectors, subtract their solar share
-                            if not self._is_solar_sector(sector):
-                                solar_share_pct = solar_shares.get(sector, 0.0)
-                                net_value = sector_value - (sector_value * solar_share_pct / 100.0)
-                                row[sector] = net_value
-                                net_total += net_value
-                            else:
-                                # For solar sectors, keep the absolute value (will be hidden in UI)
-                                row[sector] = abs(sector_value)
-                                net_total += abs(sector_value)
-
-                    row['Total'] = net_total
-
-                elif demand_type == "onGrid":
-                    # ON GRID DEMAND: Net demand + T&D losses
-                    # Solar rooftop sector will be HIDDEN in frontend
-                    # Show: Sectors (solar-adjusted) + T&D Loss (%) + T&D Losses + Total
-                    net_total = 0
-
-                    for sector in sectors:
-                        if row[sector] is not None:
-                            sector_value = float(row[sector])
-
-                            # For non-solar sectors, subtract their solar share
-                            if not self._is_solar_sector(sector):
-                                solar_share_pct = solar_shares.get(sector, 0.0)
-                                net_value = sector_value - (sector_value * solar_share_pct / 100.0)
-                                row[sector] = net_value
-                                net_total += net_value
-                            else:
-                                # For solar sectors, keep the absolute value (will be hidden in UI)
-                                row[sector] = abs(sector_value)
-                                net_total += abs(sector_value)
-
-                    # Apply T&D losses to net demand
-                    td_percentage = self._calculate_td_loss_percentage(year, td_loss_points)
-                    td_losses = net_total * (td_percentage / (1 - td_percentage))
-                    final_total = net_total + td_losses
+            cube = get_forecast_cube(
+                scenario_dir,
+                solar_share_file=os.path.join(project_path, DirectoryStructure.INPUTS, TemplateFiles.INPUT_DEMAND_FILE),
+                read_solar_shares=lambda: self._read_solar_share_data(project_path)
+            )
+            result = cube.consolidate(start_year, end_year, model_selections or {}, self._is_solar_sector)
+
+            if demand_type in ("gross", "net"):
+                # GROSS: Sector values (original) + Total ONLY
+                # NET: Sectors (solar-adjusted) + Total ONLY
+                # Solar rooftop sector will be HIDDEN in frontend for net
+                total = result.gross_total if demand_type == "gross" else result.net_total
+                extra_columns = {'Total': total}
+            elif demand_type == "onGrid":
+                # ON GRID DEMAND: Net demand + T&D losses
+                # Show: Sectors (solar-adjusted) + T&D Loss (%) + T&D Losses + Total
+                extra_columns = {
+                    'T&D Loss (%)': result.td_fraction,
+                    'T&D Losses': result.net_td_losses,
+                    'Total': result.net_total + result.net_td_losses,
+                }
+            else:
+                extra_columns = {}
 
-                    # Add T&D breakdown columns
-                    row['T&D Loss (%)'] = td_percentage
-                    row['T&D Losses'] = td_losses
-                    row['Total'] = final_total
+            consolidated_data = result.records(demand_type, extra_columns)
 
             return {'success': True, 'data': consolidated_data}
 
@@ -4057,19 +3961,26 @@ class LocalService:
 
             models_per_sector = {}
 
+            scenario_dir = os.path.join(project_path, DirectoryStructure.RESULTS, DirectoryStructure.DEMAND_FORECASTS, scenario)
+            from forecast_store import get_forecast_store
+            store = get_forecast_store(scenario_dir)
+
             for sector in sectors:
                 try:
-                    # Read the actual Excel file to see what models exist
-                    scenario_dir = os.path.join(project_path, DirectoryStructure.RESULTS, DirectoryStructure.DEMAND_FORECASTS, scenario)
-                    excel_path = os.path.join(scenario_dir, f'{sector}.xlsx')
+                    if store is not None and store.has_sector(sector):
+                        # One columnar file holds the results of all sectors
+                        df = store.results(sector)
+                    else:
+                        # Read the actual Excel file to see what models exist
+                        excel_path = os.path.join(scenario_dir, f'{sector}.xlsx')
 
-                    if not os.path.exists(excel_path):
-                        logger.warning(f"Excel file not found: {excel_path}")
-                        models_per_sector[sector] = []
-                        continue
+                        if not os.path.exists(excel_path):
+                            logger.warning(f"Excel file not found: {excel_path}")
+                            models_per_sector[sector] = []
+                            continue
 
-                    # Read Results sheet to get column names (= model names)
-                    df = pd.read_excel(excel_path, sheet_name='Results')
+                        # Read Results sheet to get column names (= model names)
+                        df = pd.read_excel(excel_path, sheet_name='Results')
 
                     # Get all columns except 'Year'
                     model_names = [col for col in df.columns if col.lower() != 'year']
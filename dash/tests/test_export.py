@@ -0,0 +1,143 @@
+"""
+Test On-Demand Export Route
+===========================
+
+Checks the ``/api/export/<token>/<format>`` downloads for each format, token
+reuse per dataset key, expired and unknown tokens, and that requested file
+names cannot inject into the ``Content-Disposition`` header.
+"""
+
+import io
+import json
+import os
+import sys
+
+import pytest
+import pandas as pd
+from flask import Flask
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import export
+from utils.export import (MAX_EXPORT_DATASETS, create_export_panel, export_url,
+                          register_export_dataset, register_export_routes)
+
+
+@pytest.fixture(scope="module")
+def client():
+    server = Flask(__name__)
+    register_export_routes(server)
+    return server.test_client()
+
+
+def build_frame():
+    return pd.DataFrame({
+        'Year': [2025, 2026, 2027],
+        'Domestic': [1200.5, 1310.25, None],
+        'Date': pd.to_datetime(['2025-04-01', '2026-04-01', '2027-04-01']),
+    })
+
+
+class TestExportFormats:
+    """Test each download format"""
+
+    def test_csv(self, client):
+        token = register_export_dataset(build_frame(), "demand")
+        response = client.get(export_url(token, 'csv'))
+
+        assert response.status_code == 200
+        assert response.mimetype == 'text/csv'
+        assert 'filename="demand.csv"' in response.headers['Content-Disposition']
+        df = pd.read_csv(io.StringIO(response.get_data(as_text=True)))
+        assert df['Year'].tolist() == [2025, 2026, 2027]
+        assert df['Domestic'].isna().tolist() == [False, False, True]
+
+    def test_json(self, client):
+        token = register_export_dataset(build_frame(), "demand")
+        records = json.loads(client.get(export_url(token, 'json')).get_data(as_text=True))
+
+        assert [r['Year'] for r in records] == [2025, 2026, 2027]
+        assert records[2]['Domestic'] is None
+
+    def test_xlsx_from_loader(self, client):
+        calls = []
+        token = register_export_dataset(lambda: calls.append(1) or build_frame(), "demand")
+        assert not calls
+
+        response = client.get(export_url(token, 'xlsx', 'Demand 2025.xlsx'))
+        assert response.status_code == 200 and calls == [1]
+        df = pd.read_excel(io.BytesIO(response.get_data()))
+        assert df['Domestic'].tolist()[:2] == [1200.5, 1310.25]
+        assert df['Date'].iloc[0] == pd.Timestamp('2025-04-01')
+
+    def test_unknown_format_returns_404(self, client):
+        token = register_export_dataset(build_frame(), "demand")
+        assert client.get(f"/api/export/{token}/pdf").status_code == 404
+
+
+class TestExportTokens:
+    """Test token reuse and expiry"""
+
+    def test_unknown_token_returns_410(self, client):
+        assert client.get(export_url('0' * 32, 'csv')).status_code == 410
+
+    def test_keyed_dataset_reuses_token(self, client):
+        first = register_export_dataset(build_frame(), "demand", key="page/sector/Domestic")
+        updated = build_frame().assign(Year=[2030, 2031, 2032])
+        second = register_export_dataset(updated, "demand", key="page/sector/Domestic")
+        assert first == second
+
+        # Re-rendering one view many times keeps other datasets alive
+        other = register_export_dataset(build_frame(), "other", key="page/consolidated")
+        for _ in range(MAX_EXPORT_DATASETS * 2):
+            register_export_dataset(build_frame(), "demand", key="page/sector/Domestic")
+        assert client.get(export_url(other, 'csv')).status_code == 200
+
+        body = client.get(export_url(first, 'csv')).get_data(as_text=True)
+        assert body.splitlines()[1].startswith('2025')
+
+    def test_evicted_token_returns_410(self, client):
+        token = register_export_dataset(build_frame(), "old", key="evicted")
+        for i in range(MAX_EXPORT_DATASETS):
+            register_export_dataset(build_frame(), "new", key=f"filler/{i}")
+
+        assert client.get(export_url(token, 'csv')).status_code == 410
+        assert "evicted" not in export._dataset_tokens
+        assert register_export_dataset(build_frame(), "old", key="evicted") != token
+
+    def test_panel_reuses_token_per_key(self):
+        hrefs = [
+            create_export_panel(build_frame(), "demand", key="panel/consolidated").children[1].children[0]
+            .children[0].href
+            for _ in range(2)
+        ]
+        assert hrefs[0] == hrefs[1]
+
+
+class TestExportFilename:
+    """Test sanitizing of requested download names"""
+
+    @pytest.mark.parametrize('fmt', ['csv', 'json', 'xlsx'])
+    def test_hostile_filename_is_sanitized(self, client, fmt):
+        token = register_export_dataset(build_frame(), "demand")
+        hostile = 'x.csv"\r\nSet-Cookie: a=b; filename="../../evil.sh'
+        response = client.get(export_url(token, fmt, hostile))
+
+        assert response.status_code == 200
+        assert 'Set-Cookie' not in response.headers
+        disposition = response.headers['Content-Disposition']
+        assert '\r' not in disposition and '\n' not in disposition
+        assert disposition.count('"') <= 2
+        assert '/' not in disposition.split("filename*=")[0]
+
+    def test_unicode_filename_uses_rfc5987(self, client):
+        token = register_export_dataset(build_frame(), "demand")
+        response = client.get(export_url(token, 'csv', 'Nachfrage_ü.csv'))
+
+        disposition = response.headers['Content-Disposition']
+        assert "filename*=UTF-8''Nachfrage_%C3%BC.csv" in disposition
+        assert disposition.encode('latin-1').decode('ascii')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
@@ -1,88 +1,263 @@
 """
 Data Export Utilities
 Functions to export data in various formats
+
+Exports are generated on click. Rendering a download button only registers
+the dataset (a DataFrame reference or a loader callable) in a small
+server-side cache and links to ``/api/export/<token>/<format>``; the file is
+written when that route is requested. CSV and JSON are streamed in chunks,
+xlsx is written with xlsxwriter's constant-memory mode to a temporary file
+that is deleted once sent.
+
+Call ``register_export_routes(server)`` once on the Flask server (app.py).
 """
-import pandas as pd
-import io
-import base64
+import os
+import json
+import re
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from urllib.parse import quote
 from dash import html, dcc
 import dash_bootstrap_components as dbc
-import json
 
-def create_excel_download_link(df, filename="data.xlsx", button_text="📥 Download Excel"):
+from utils.lazy_imports import lazy_import
+
+pd = lazy_import('pandas')
+
+# Number of datasets kept for download; the oldest registrations are evicted first
+MAX_EXPORT_DATASETS = 32
+# Rows converted to Python objects at a time while streaming
+EXPORT_CHUNK_ROWS = 10000
+
+EXPORT_ROUTE = '/api/export'
+
+MIME_TYPES = {
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'csv': 'text/csv',
+    'json': 'application/json',
+}
+
+# Characters dropped from requested download names
+_UNSAFE_FILENAME_CHARS = re.compile(r'[\x00-\x1f\x7f"\\/:*?<>|;]')
+MAX_FILENAME_LENGTH = 150
+
+_datasets = OrderedDict()
+_dataset_tokens = {}
+_datasets_lock = threading.Lock()
+
+
+def register_export_dataset(data, filename_prefix="data", key=None):
+    """
+    Keep a dataset available for on-demand export.
+
+    Args:
+        data: DataFrame, JSON-serializable object, or a zero-argument callable
+              returning either (evaluated only when a download is requested)
+        filename_prefix: Default download filename without extension
+        key: Stable identity of the dataset (e.g. page + selection). Renders
+             with the same key replace the data under one token, so links
+             already on the page keep working and re-renders do not evict
+             other datasets.
+
+    Returns:
+        Token used in the export URL
+    """
+    with _datasets_lock:
+        token = _dataset_tokens.get(key) if key is not None else None
+        if token is None:
+            token = uuid.uuid4().hex
+        _datasets[token] = (data, filename_prefix, key)
+        _datasets.move_to_end(token)
+        if key is not None:
+            _dataset_tokens[key] = token
+        while len(_datasets) > MAX_EXPORT_DATASETS:
+            _, (_, _, evicted_key) = _datasets.popitem(last=False)
+            _dataset_tokens.pop(evicted_key, None)
+    return token
+
+
+def _get_dataset(token):
+    with _datasets_lock:
+        entry = _datasets.get(token)
+        if entry is not None:
+            _datasets.move_to_end(token)
+    if entry is None:
+        return None, None
+    data, prefix, _ = entry
+    return (data() if callable(data) else data), prefix
+
+
+def safe_filename(filename, default="data"):
+    """Reduce a requested download name to a plain file name (no paths, quotes or control characters)."""
+    name = os.path.basename(str(filename).replace('\\', '/'))
+    name = _UNSAFE_FILENAME_CHARS.sub('_', name).strip(' .')
+    return name[:MAX_FILENAME_LENGTH] or default
+
+
+def content_disposition(filename):
+    """``attachment`` header value with an ASCII fallback and an RFC 5987 UTF-8 name."""
+    ascii_name = filename.encode('ascii', 'replace').decode('ascii').replace('?', '_')
+    return f"attachment; filename=\"{ascii_name}\"; filename*=UTF-8''{quote(filename, safe='')}"
+
+
+def export_url(token, fmt, filename=None):
+    """URL of the export route for a registered dataset."""
+    url = f"{EXPORT_ROUTE}/{token}/{fmt}"
+    if filename:
+        url += f"?filename={quote(filename)}"
+    return url
+
+
+def _records_chunks(df):
+    """Yield row chunks with NaN/NaT replaced by None."""
+    for start in range(0, len(df), EXPORT_CHUNK_ROWS):
+        chunk = df.iloc[start:start + EXPORT_CHUNK_ROWS]
+        yield chunk.astype(object).where(chunk.notna(), None)
+
+
+def iter_csv(df):
+    """Stream a DataFrame as CSV text chunks."""
+    yield df.iloc[:0].to_csv(index=False)
+    for start in range(0, len(df), EXPORT_CHUNK_ROWS):
+        yield df.iloc[start:start + EXPORT_CHUNK_ROWS].to_csv(index=False, header=False)
+
+
+def iter_json(data):
+    """Stream a DataFrame (as records) or a JSON-serializable object."""
+    if not isinstance(data, pd.DataFrame):
+        yield json.dumps(data, indent=2, default=str)
+        return
+
+    yield '['
+    first = True
+    for chunk in _records_chunks(data):
+        for record in chunk.to_dict(orient='records'):
+            yield ('\n  ' if first else ',\n  ') + json.dumps(record, default=str)
+            first = False
+    yield '\n]'
+
+
+def write_excel(df, path, sheet_name='Data'):
+    """
+    Write a DataFrame to xlsx in constant-memory mode (rows are flushed to
+    disk as they are written, so memory does not grow with the row count).
+    """
+    import xlsxwriter
+
+    workbook = xlsxwriter.Workbook(path, {
+        'constant_memory': True,
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+        'remove_timezone': True,
+    })
+    try:
+        worksheet = workbook.add_worksheet(sheet_name)
+        header_format = workbook.add_format({
+            'bold': True,
+            'bg_color': '#4f46e5',
+            'font_color': 'white'
+        })
+        worksheet.write_row(0, 0, [str(c) for c in df.columns], header_format)
+
+        row = 1
+        for chunk in _records_chunks(df):
+            for values in chunk.itertuples(index=False, name=None):
+                worksheet.write_row(row, 0, values)
+                row += 1
+    finally:
+        workbook.close()
+
+
+def register_export_routes(server):
+    """Add the on-demand export route to the Flask server."""
+    from flask import Response, abort, request, send_file, stream_with_context
+
+    @server.route(f'{EXPORT_ROUTE}/<token>/<fmt>')
+    def export_dataset(token, fmt):
+        if fmt not in MIME_TYPES:
+            abort(404)
+        data, prefix = _get_dataset(token)
+        if data is None:
+            abort(410, description="Export expired; reload the page and try again.")
+
+        default_name = safe_filename(f"{prefix}.{fmt}", f"data.{fmt}")
+        filename = safe_filename(request.args.get('filename') or default_name, default_name)
+        headers = {'Content-Disposition': content_disposition(filename)}
+
+        if fmt == 'json':
+            return Response(stream_with_context(iter_json(data)), mimetype=MIME_TYPES[fmt], headers=headers)
+
+        df = data if isinstance(data, pd.DataFrame) else pd.DataFrame(data)
+        if fmt == 'csv':
+            return Response(stream_with_context(iter_csv(df)), mimetype=MIME_TYPES[fmt], headers=headers)
+
+        handle, path = tempfile.mkstemp(suffix='.xlsx')
+        os.close(handle)
+        try:
+            write_excel(df, path)
+            response = send_file(path, mimetype=MIME_TYPES[fmt], as_attachment=True, download_name=filename)
+        except Exception:
+            os.remove(path)
+            raise
+        response.call_on_close(lambda: os.path.exists(path) and os.remove(path))
+        return response
+
+
+def _download_button(data, filename, button_text, color, fmt, key=None):
+    token = register_export_dataset(data, os.path.splitext(filename)[0], key)
+    return html.A(
+        dbc.Button(button_text, color=color, size='sm', className='me-2'),
+        href=export_url(token, fmt, filename),
+        download=filename
+    )
+
+
+def create_excel_download_link(df, filename="data.xlsx", button_text="📥 Download Excel", key=None):
     """
     Create a download button for Excel file
 
     Args:
-        df: pandas DataFrame
+        df: pandas DataFrame (or callable returning one)
         filename: Name of file
         button_text: Text for button
+        key: Stable dataset key, so re-renders reuse one export token
 
     Returns:
-        html.A component with download link
+        html.A component linking to the on-demand export route
     """
     try:
-        output = io.BytesIO()
-        with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-            df.to_excel(writer, index=False, sheet_name='Data')
-            # Add formatting
-            workbook = writer.book
-            worksheet = writer.sheets['Data']
-            header_format = workbook.add_format({
-                'bold': True,
-                'bg_color': '#4f46e5',
-                'font_color': 'white'
-            })
-            for col_num, value in enumerate(df.columns.values):
-                worksheet.write(0, col_num, value, header_format)
-
-        output.seek(0)
-        b64 = base64.b64encode(output.read()).decode()
-
-        return html.A(
-            dbc.Button(button_text, color='success', size='sm', className='me-2'),
-            href=f"data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,{b64}",
-            download=filename
-        )
+        return _download_button(df, filename, button_text, 'success', 'xlsx', key)
     except Exception as e:
         return dbc.Alert(f"Error creating Excel: {str(e)}", color='warning')
 
-def create_csv_download_link(df, filename="data.csv", button_text="📥 Download CSV"):
+def create_csv_download_link(df, filename="data.csv", button_text="📥 Download CSV", key=None):
     """Create a download button for CSV file"""
     try:
-        csv_string = df.to_csv(index=False, encoding='utf-8')
-        b64 = base64.b64encode(csv_string.encode()).decode()
-
-        return html.A(
-            dbc.Button(button_text, color='info', size='sm', className='me-2'),
-            href=f"data:text/csv;base64,{b64}",
-            download=filename
-        )
+        return _download_button(df, filename, button_text, 'info', 'csv', key)
     except Exception as e:
         return dbc.Alert(f"Error creating CSV: {str(e)}", color='warning')
 
-def create_json_download_link(data, filename="data.json", button_text="📥 Download JSON"):
+def create_json_download_link(data, filename="data.json", button_text="📥 Download JSON", key=None):
     """Create a download button for JSON file"""
     try:
-        json_string = json.dumps(data, indent=2)
-        b64 = base64.b64encode(json_string.encode()).decode()
-
-        return html.A(
-            dbc.Button(button_text, color='warning', size='sm', className='me-2'),
-            href=f"data:application/json;base64,{b64}",
-            download=filename
-        )
+        return _download_button(data, filename, button_text, 'warning', 'json', key)
     except Exception as e:
         return dbc.Alert(f"Error creating JSON: {str(e)}", color='warning')
 
-def create_export_panel(df, prefix="export", formats=['excel', 'csv']):
+def create_export_panel(df, prefix="export", formats=['excel', 'csv'], key=None):
     """
     Create a complete export panel with multiple format options
 
+    All formats share one registered dataset; nothing is serialized until a
+    button is clicked.
+
     Args:
         df: pandas DataFrame to export
         prefix: Filename prefix
         formats: List of formats to include ['excel', 'csv', 'json']
+        key: Stable dataset key (e.g. page + selection); re-rendering the
+             same view replaces its data instead of registering a new token
 
     Returns:
         dbc.Card with export buttons
@@ -90,17 +265,26 @@ def create_export_panel(df, prefix="export", formats=['excel', 'csv']):
     if df is None or df.empty:
         return dbc.Alert("No data available to export", color='info')
 
+    token = register_export_dataset(df, prefix, key)
     buttons = []
 
     if 'excel' in formats:
-        buttons.append(create_excel_download_link(df, f"{prefix}.xlsx"))
+        buttons.append(html.A(
+            dbc.Button("📥 Download Excel", color='success', size='sm', className='me-2'),
+            href=export_url(token, 'xlsx'), download=f"{prefix}.xlsx"
+        ))
 
     if 'csv' in formats:
-        buttons.append(create_csv_download_link(df, f"{prefix}.csv"))
+        buttons.append(html.A(
+            dbc.Button("📥 Download CSV", color='info', size='sm', className='me-2'),
+            href=export_url(token, 'csv'), download=f"{prefix}.csv"
+        ))
 
     if 'json' in formats:
-        data_dict = df.to_dict(orient='records')
-        buttons.append(create_json_download_link(data_dict, f"{prefix}.json"))
+        buttons.append(html.A(
+            dbc.Button("📥 Download JSON", color='warning', size='sm', className='me-2'),
+            href=export_url(token, 'json'), download=f"{prefix}.json"
+        ))
 
     return dbc.Card([
         dbc.CardHeader(html.H6("📤 Export Data", className='mb-0')),
@@ -0,0 +1,82 @@
+"""
+Lazy module binding for page modules.
+
+Dash needs every page's callbacks registered before the first request, so
+``app.py`` imports all page modules at startup. To keep that cheap, pages
+bind their heavy dependencies (pandas, plotly, openpyxl) through the helpers
+below instead of importing them at the top; the real import happens the
+first time a callback or layout touches the name.
+
+    pd = lazy_import('pandas')
+    make_subplots = lazy_object('plotly.subplots', 'make_subplots')
+"""
+
+import importlib
+import sys
+import threading
+import types
+from typing import Any, Callable
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports ``name`` on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__['_lazy_module'] = None
+        self.__dict__['_lazy_lock'] = threading.Lock()
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__['_lazy_module']
+        if module is None:
+            with self.__dict__['_lazy_lock']:
+                module = self.__dict__['_lazy_module']
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__['_lazy_module'] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self.__dict__['_lazy_module'] is not None else 'not loaded'
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+class LazyObject:
+    """Proxy for a single object (function, class, instance) built on first use."""
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._target = None
+        self._lock = threading.Lock()
+
+    def _resolve(self) -> Any:
+        if self._target is None:
+            with self._lock:
+                if self._target is None:
+                    self._target = self._factory()
+        return self._target
+
+    def __getattr__(self, attr: str):
+        return getattr(self._resolve(), attr)
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """Module ``name``; a ``LazyModule`` proxy unless it is already imported."""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    return LazyModule(name)
+
+
+def lazy_object(module: str, attr: str) -> LazyObject:
+    """``module.attr``, imported on first use."""
+    return LazyObject(lambda: getattr(importlib.import_module(module), attr))
@@ -560,6 +560,61 @@ export const clearPyPSACache = () => {
   console.log('[PyPSA] All caches cleared');
 };
 
+/**
+ * Fetch several analyses of one network in a single request.
+ *
+ * Posts to /pypsa/batch and reads the NDJSON response as it streams, calling
+ * onResult(name, data) as each analysis completes (data is the same body the
+ * individual GET endpoint returns).
+ *
+ * @param {object} params - { projectPath, scenarioName, networkFile }
+ * @param {Array<string|{name: string, params: object}>} analyses - e.g. ['energy-mix', 'emissions']
+ * @param {object} handlers - { onResult, onError, signal }
+ * @returns {Promise<object>} Map of analysis name to result body
+ */
+export const fetchPyPSABatch = async (params, analyses, { onResult = null, onError = null, signal } = {}) => {
+  const { projectPath, scenarioName, networkFile } = params;
+  const response = await fetch('/project/pypsa/batch', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json', Accept: 'application/x-ndjson' },
+    body: JSON.stringify({ projectPath, scenarioName, networkFile, analyses }),
+    signal,
+  });
+
+  if (!response.ok) {
+    const body = await response.json().catch(() => ({}));
+    throw new Error(body.detail || `Batch request failed (${response.status})`);
+  }
+
+  const results = {};
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+
+  const handleLine = (line) => {
+    if (!line.trim()) return;
+    const record = JSON.parse(line);
+    if (record.type === 'result') {
+      results[record.name] = record.data;
+      onResult?.(record.name, record.data, record);
+    } else if (record.type === 'error') {
+      onError?.(record.name, record.detail, record);
+    }
+  };
+
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    const lines = buffer.split('\n');
+    buffer = lines.pop();
+    lines.forEach(handleLine);
+  }
+  handleLine(buffer);
+
+  return results;
+};
+
 /**
  * Get cache statistics
  */
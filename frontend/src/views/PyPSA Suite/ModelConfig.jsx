@@ -19,10 +19,17 @@ const DEFAULT_SCENARIO_NAME = 'PyPSA_Scenario_V1';
 const SOLVER_OPTIONS = [
   { value: 'highs', label: 'Highs', description: 'Fast and reliable open-source solver (Default)' },
 ];
+const AUTO_SOLVER_PROFILE = {
+  name: 'auto',
+  label: 'Default (HiGHS)',
+  description: 'HiGHS default algorithm and settings, no time limit',
+};
 
 const ModelConfig = () => {
   const [scenarioName, setScenarioName] = useState(DEFAULT_SCENARIO_NAME);
   const [selectedSolver, setSelectedSolver] = useState('highs');
+  const [solverProfiles, setSolverProfiles] = useState([AUTO_SOLVER_PROFILE]);
+  const [selectedProfile, setSelectedProfile] = useState(AUTO_SOLVER_PROFILE.name);
   const [existingScenarios, setExistingScenarios] = useState([]);
   const [error, setError] = useState('');
   const [projectPath, setProjectPath] = useState('');
@@ -102,6 +109,16 @@ const ModelConfig = () => {
       // Pre-fill default solver
       setSelectedSolver('highs');
 
+      // Fetch HiGHS solver profiles
+      axios
+        .get('/project/pypsa/solver-profiles')
+        .then((res) => {
+          setSolverProfiles([AUTO_SOLVER_PROFILE, ...(res.data.profiles || [])]);
+        })
+        .catch((err) => {
+          console.error('[ModelConfig] Could not fetch solver profiles', err);
+        });
+
       // Clear any previous errors
       setError('');
     } catch (parseError) {
@@ -127,10 +144,11 @@ const ModelConfig = () => {
     // Use default name if input is empty
     const finalScenarioName = scenarioName.trim() || DEFAULT_SCENARIO_NAME;
 
-    // Simplified payload - only projectPath and scenarioName
+    // Simplified payload - projectPath, scenarioName and solver profile
     const configPayload = {
       projectPath: projectPath,
       scenarioName: finalScenarioName,
+      solverProfile: selectedProfile,
     };
 
     try {
@@ -146,6 +164,7 @@ const ModelConfig = () => {
         metadata: {
           projectPath: projectPath,
           solver: selectedSolver,
+          solverProfile: selectedProfile,
         },
       });
 
@@ -406,6 +425,27 @@ const ModelConfig = () => {
                   {SOLVER_OPTIONS.find((s) => s.value === selectedSolver)?.description}
                 </p>
               </div>
+
+              {/* Solver Profile Selection */}
+              <div className="space-y-2">
+                <label className="block text-sm font-bold text-slate-700">
+                  Solver Profile
+                </label>
+                <select
+                  value={selectedProfile}
+                  onChange={(e) => setSelectedProfile(e.target.value)}
+                  className="w-full text-base px-4 py-2.5 bg-white border-2 border-slate-300 rounded-lg focus:border-indigo-500 focus:ring-2 focus:ring-indigo-500/20 transition-all cursor-pointer"
+                >
+                  {solverProfiles.map((profile) => (
+                    <option key={profile.name} value={profile.name}>
+                      {profile.label}
+                    </option>
+                  ))}
+                </select>
+                <p className="text-xs text-slate-500">
+                  {solverProfiles.find((p) => p.name === selectedProfile)?.description}
+                </p>
+              </div>
             </div>
           </div>
 
@@ -463,6 +503,8 @@ const ModelConfig = () => {
                 </div>
                 <span className="text-sm font-bold text-slate-800">
                   {SOLVER_OPTIONS.find((s) => s.value === selectedSolver)?.label || selectedSolver}
+                  {' · '}
+                  {solverProfiles.find((p) => p.name === selectedProfile)?.label || selectedProfile}
                 </span>
               </div>
               <div className="flex items-center justify-between bg-white rounded-lg px-4 py-3 shadow-sm">
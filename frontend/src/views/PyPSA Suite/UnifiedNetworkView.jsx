@@ -25,7 +25,7 @@ import {
   XAxis, YAxis, CartesianGrid, Tooltip, Legend,
   ResponsiveContainer, Cell, PieChart, Pie
 } from 'recharts';
-import usePyPSAData from '../../hooks/usePyPSAData';
+import { fetchPyPSABatch } from '../../hooks/usePyPSAData';
 import useNetworkDetection from '../../hooks/useNetworkDetection';
 import {
   transformCapacityData,
@@ -47,49 +47,49 @@ const TABS = [
     id: 'dispatch',
     label: 'Dispatch & Load',
     icon: Activity,
-    endpoint: '/pypsa/dispatch',
+    analysis: 'dispatch',
     description: 'Power generation and load dispatch over time'
   },
   {
     id: 'capacity',
     label: 'Capacity',
     icon: BarChart3,
-    endpoint: '/pypsa/total-capacities',
+    analysis: 'total-capacities',
     description: 'Installed capacity by technology and year'
   },
   {
     id: 'metrics',
     label: 'Metrics',
     icon: TrendingUp,
-    endpoint: '/pypsa/renewable-share',
+    analysis: 'renewable-share',
     description: 'System performance metrics and renewable share'
   },
   {
     id: 'storage',
     label: 'Storage',
     icon: Battery,
-    endpoint: '/pypsa/storage-units',
+    analysis: 'storage-units',
     description: 'Energy storage systems and stores'
   },
   {
     id: 'emissions',
     label: 'Emissions',
     icon: CloudOff,
-    endpoint: '/pypsa/emissions',
+    analysis: 'emissions',
     description: 'CO2 emissions tracking and intensity'
   },
   {
     id: 'costs',
     label: 'Costs',
     icon: DollarSign,
-    endpoint: '/pypsa/system-costs',
+    analysis: 'system-costs',
     description: 'System cost breakdown by carrier'
   },
   {
     id: 'network',
     label: 'Network',
     icon: Network,
-    endpoint: '/pypsa/lines',
+    analysis: 'lines',
     description: 'Transmission network lines'
   }
 ];
@@ -1359,57 +1359,121 @@ const UnifiedNetworkView = ({ projectPath, selectedScenario, selectedNetwork })
     [activeTab]
   );
 
-  // Build data parameters
-  const dataParams = useMemo(() => {
-    const params = {
-      projectPath,
-      scenarioName: selectedScenario,
-      networkFile: selectedNetwork
-    };
-
-    if (activeTab === 'dispatch') {
-      params.resolution = resolution;
-      if (startDate) params.start_date = startDate;
-      if (endDate) params.end_date = endDate;
-    }
+  // Dispatch query parameters (the only analysis with options)
+  const dispatchParams = useMemo(() => ({
+    resolution,
+    ...(startDate && { start_date: startDate }),
+    ...(endDate && { end_date: endDate }),
+  }), [resolution, startDate, endDate]);
+
+  // Results of every tab, filled in as the batch streams them
+  const [results, setResults] = useState({});
+  const [errors, setErrors] = useState({});
+  const [pending, setPending] = useState(() => new Set());
+  const dispatchKeyRef = useRef(null);
+
+  const runBatch = useCallback((analyses, signal) => {
+    const names = analyses.map(a => (typeof a === 'string' ? a : a.name));
+    const settle = (name) => setPending(prev => {
+      const next = new Set(prev);
+      next.delete(name);
+      return next;
+    });
 
-    return params;
-  }, [projectPath, selectedScenario, selectedNetwork, activeTab, resolution, startDate, endDate]);
+    setPending(prev => new Set([...prev, ...names]));
+    setErrors(prev => {
+      const next = { ...prev };
+      names.forEach(name => delete next[name]);
+      return next;
+    });
 
-  // Fetch metadata for dispatch tab
-  const shouldFetchMetadata = activeTab === 'dispatch' && !metadataFetchedRef.current;
+    return fetchPyPSABatch(
+      { projectPath, scenarioName: selectedScenario, networkFile: selectedNetwork },
+      analyses,
+      {
+        signal,
+        onResult: (name, body) => {
+          if (body?.success === false) {
+            setErrors(prev => ({ ...prev, [name]: body.message || 'Failed to fetch data' }));
+          } else {
+            setResults(prev => ({ ...prev, [name]: body?.data ?? body }));
+          }
+          settle(name);
+        },
+        onError: (name, detail) => {
+          setErrors(prev => ({ ...prev, [name]: detail || 'Failed to fetch data' }));
+          settle(name);
+        },
+      }
+    ).catch(err => {
+      if (err.name === 'AbortError') return;
+      console.error('[PyPSA] Batch request failed:', err);
+      setErrors(prev => {
+        const next = { ...prev };
+        names.forEach(name => { next[name] = err.message || 'Failed to fetch data'; });
+        return next;
+      });
+    }).finally(() => {
+      if (!signal.aborted) setPending(prev => new Set([...prev].filter(name => !names.includes(name))));
+    });
+  }, [projectPath, selectedScenario, selectedNetwork]);
 
-  const { data: metadataData } = usePyPSAData(
-    '/pypsa/network-metadata',
-    { projectPath, scenarioName: selectedScenario, networkFile: selectedNetwork },
-    shouldFetchMetadata
-  );
+  // Reset metadata flag on network change (before the batch below reads it)
+  useEffect(() => {
+    metadataFetchedRef.current = false;
+  }, [selectedNetwork]);
+
+  // Load every tab of the selected network in one request (active tab first)
+  useEffect(() => {
+    if (!detection || !projectPath || !selectedScenario || !selectedNetwork) return;
+
+    const controller = new AbortController();
+    const ordered = [...TABS].sort((a, b) => (a.id === activeTab ? -1 : b.id === activeTab ? 1 : 0));
+    const analyses = ordered.map(tab => (
+      tab.analysis === 'dispatch' ? { name: 'dispatch', params: dispatchParams } : tab.analysis
+    ));
+    if (!metadataFetchedRef.current) analyses.splice(1, 0, 'network-metadata');
+
+    setResults({});
+    setErrors({});
+    setPending(new Set());
+    dispatchKeyRef.current = JSON.stringify(dispatchParams);
+    runBatch(analyses, controller.signal);
+
+    return () => controller.abort();
+    // Tab switches and dispatch controls do not reload the other tabs
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [detection, runBatch]);
+
+  // Re-fetch only dispatch when its resolution or date range changes
+  useEffect(() => {
+    const key = JSON.stringify(dispatchParams);
+    if (dispatchKeyRef.current === null || dispatchKeyRef.current === key) return;
+
+    const controller = new AbortController();
+    dispatchKeyRef.current = key;
+    runBatch([{ name: 'dispatch', params: dispatchParams }], controller.signal);
+    return () => controller.abort();
+  }, [dispatchParams, runBatch]);
 
   // Auto-populate dates from metadata
+  const metadataData = results['network-metadata'];
   useEffect(() => {
     if (metadataData && metadataData.start_date && metadataData.end_date && !metadataFetchedRef.current) {
-      setStartDate(metadataData.start_date.split('T')[0]);
-      setEndDate(metadataData.end_date.split('T')[0]);
+      const start = metadataData.start_date.split('T')[0];
+      const end = metadataData.end_date.split('T')[0];
+      // The full range is what the unfiltered dispatch already covers
+      dispatchKeyRef.current = JSON.stringify({ resolution, start_date: start, end_date: end });
+      setStartDate(start);
+      setEndDate(end);
       metadataFetchedRef.current = true;
     }
+    // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [metadataData]);
 
-  // Reset metadata flag on network change
-  useEffect(() => {
-    metadataFetchedRef.current = false;
-  }, [selectedNetwork]);
-
-  // Fetch main data
-  const {
-    data: rawData,
-    loading: dataLoading,
-    error: dataError,
-    refetch
-  } = usePyPSAData(
-    activeTabConfig?.endpoint,
-    dataParams,
-    !!activeTabConfig && !!detection
-  );
+  const rawData = results[activeTabConfig?.analysis] ?? null;
+  const dataLoading = pending.has(activeTabConfig?.analysis);
+  const dataError = errors[activeTabConfig?.analysis] ?? null;
 
   // Transform data based on active tab
   const transformedData = useMemo(() => {